@@ -0,0 +1,85 @@
+"""
+로컬 IVF 근사 검색 벤치마크
+
+임시 디렉토리의 LocalVectorStore에 군집 구조가 있는 무작위 벡터 --rows개를 저장하고 IVF 인덱스를
+학습한 뒤, 전체 검색 대비 리스트 탐색 비율(leaf_nodes_to_search_percent)별 지연 시간과 recall@k를
+비교합니다.
+
+사용법:
+    python benchmarks/bench_ann_search.py [--rows 200000] [--dimensions 768] [--percents 2,7,15]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from src.vector_search.ivf_index import IVFIndex
+from src.vector_search.local_vector_store import LocalVectorStore
+
+UPSERT_BATCH_SIZE = 50000
+
+
+def _clustered_batch(rng, centers, count, noise):
+    """중심점 주변에 흩어진 벡터 묶음"""
+    labels = rng.integers(len(centers), size=count)
+    return centers[labels] + noise * rng.standard_normal((count, centers.shape[1]), dtype=np.float32)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument('--rows', type=int, default=200000, help='저장할 벡터 수')
+    arg_parser.add_argument('--dimensions', type=int, default=768, help='벡터 차원')
+    arg_parser.add_argument('--clusters', type=int, default=1000, help='생성 데이터의 군집 수')
+    arg_parser.add_argument('--noise', type=float, default=0.5, help='군집 내 잡음 크기')
+    arg_parser.add_argument('--queries', type=int, default=50, help='측정할 쿼리 수')
+    arg_parser.add_argument('--top-k', type=int, default=10, help='검색 결과 수')
+    arg_parser.add_argument('--leaf-size', type=int, default=500, help='leaf_node_embedding_count')
+    arg_parser.add_argument('--percents', default='2,7,15', help='leaf_nodes_to_search_percent 목록')
+    args = arg_parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    centers = rng.standard_normal((args.clusters, args.dimensions), dtype=np.float32)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        store = LocalVectorStore(tmp_dir, initial_capacity=args.rows)
+        for offset in range(0, args.rows, UPSERT_BATCH_SIZE):
+            count = min(UPSERT_BATCH_SIZE, args.rows - offset)
+            store.upsert([str(offset + i) for i in range(count)],
+                         _clustered_batch(rng, centers, count, args.noise))
+
+        index = IVFIndex(store, leaf_node_embedding_count=args.leaf_size)
+        start = time.perf_counter()
+        index.train()
+        print(f"벡터 {args.rows}x{args.dimensions}, 리스트 {index.n_lists}개 학습: "
+              f"{time.perf_counter() - start:.1f} s")
+
+        queries = _clustered_batch(rng, centers, args.queries, args.noise)
+        store.search(queries[0], args.top_k)
+
+        start = time.perf_counter()
+        exact = [{r['id'] for r in store.search(query, args.top_k)} for query in queries]
+        exact_time = (time.perf_counter() - start) / len(queries)
+        print(f"전체 검색: {exact_time * 1000:.1f} ms/query")
+
+        print(f"{'탐색 비율':>8} {'nprobe':>7} {'ms/query':>9} {f'recall@{args.top_k}':>10} {'속도 향상':>8}")
+        for percent in (float(value) for value in args.percents.split(',')):
+            index.leaf_nodes_to_search_percent = percent
+            start = time.perf_counter()
+            approximate = [{r['id'] for r in index.search(query, args.top_k)} for query in queries]
+            ann_time = (time.perf_counter() - start) / len(queries)
+            recall = sum(len(a & e) for a, e in zip(approximate, exact)) / (len(queries) * args.top_k)
+            print(f"{percent:>7g}% {index.nprobe:>7} {ann_time * 1000:>9.1f} {recall:>10.3f} "
+                  f"{exact_time / ann_time:>7.1f}x")
+        store.close()
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,118 @@
+"""
+XMLProcessor 기사 저장 처리량 벤치마크
+
+기사별 저장(_save_to_database + _log_processing)과 배치 저장(_save_batch_to_database)의
+초당 저장 행 수를 비교합니다. 기본값은 임시 SQLite 파일이며 --database-url로
+PostgreSQL 등 다른 데이터베이스를 지정할 수 있습니다 (테이블이 생성되고 데이터가 저장됩니다).
+
+사용법:
+    python benchmarks/bench_bulk_insert.py [--limit 1000] [--batch-size 200] [--database-url URL]
+"""
+import argparse
+import glob
+import os
+import sys
+import tempfile
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+import src.xml_processor as xml_processor_module
+from src.database.models import Base
+from src.xml_parser import XMLParser
+from src.xml_processor import XMLProcessor
+
+
+def _count_rows(records) -> int:
+    """기사 한 건당 저장되는 행 수 합계 (기사, 분류, 이미지, 키워드, 엔티티, 주식 코드, 로그)"""
+    total = 0
+    for record in records:
+        article_data = record['article_data']
+        total += 2
+        total += len(article_data.get('categories', []))
+        total += len(article_data.get('images', []))
+        total += len(article_data.get('keywords', []))
+        total += len(article_data.get('stock_codes', []))
+        total += sum(len(v) for v in record['metadata']['extracted_entities'].values())
+    return total
+
+
+def _bind_database(database_url: str):
+    """XMLProcessor가 사용할 세션을 지정한 데이터베이스로 교체"""
+    engine = create_engine(database_url)
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    session_factory = sessionmaker(bind=engine, autocommit=False, autoflush=False)
+
+    def get_db():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    xml_processor_module.get_db = get_db
+    return engine
+
+
+def _save_one_by_one(processor, records):
+    """기사별 저장"""
+    for record in records:
+        result = processor._save_to_database(record)
+        processor._log_processing(
+            record['article_data'].get('art_id'), 'xml_parse',
+            result['status'], result.get('message', ''), 0.0
+        )
+
+
+def _save_in_batches(processor, records, batch_size: int):
+    """배치 저장"""
+    for i in range(0, len(records), batch_size):
+        processor._save_batch_to_database(records[i:i + batch_size])
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument('--limit', type=int, default=1000, help='사용할 샘플 파일 수')
+    arg_parser.add_argument('--batch-size', type=int, default=200, help='배치 저장 크기')
+    arg_parser.add_argument('--database-url', default=None, help='벤치마크용 데이터베이스 URL')
+    args = arg_parser.parse_args()
+
+    files = sorted(glob.glob(os.path.join(ROOT_DIR, 'saltlux_T_*.xml')))[:args.limit]
+    if not files:
+        print("샘플 XML 파일을 찾을 수 없습니다.")
+        return 1
+
+    parser = XMLParser()
+    records = [record for record in map(parser.parse_xml_file, files) if record]
+    total_rows = _count_rows(records)
+    processor = XMLProcessor()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        database_url = args.database_url or f"sqlite:///{os.path.join(tmp_dir, 'bench.db')}"
+
+        engine = _bind_database(database_url)
+        start = time.perf_counter()
+        _save_one_by_one(processor, records)
+        single_rate = total_rows / (time.perf_counter() - start)
+        engine.dispose()
+
+        engine = _bind_database(database_url)
+        start = time.perf_counter()
+        _save_in_batches(processor, records, args.batch_size)
+        batch_rate = total_rows / (time.perf_counter() - start)
+        engine.dispose()
+
+    print(f"기사 수: {len(records)}, 저장 행 수: {total_rows}")
+    print(f"기사별 저장:  {single_rate:10.0f} rows/sec")
+    print(f"배치 저장:    {batch_rate:10.0f} rows/sec")
+    print(f"속도 향상:    {batch_rate / single_rate:10.2f}x")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
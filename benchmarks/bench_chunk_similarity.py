@@ -0,0 +1,111 @@
+"""
+DuplicateDetector 긴 본문 유사도 벤치마크
+
+저장소 루트의 saltlux_T_*.xml 샘플 중 정규화 후 1000자를 넘는 본문으로 통신 기사 전재 형태의
+쌍(앞 문단 추가 및 출처 문구 덧붙임), 문장 일부를 뺀 편집본 쌍, 서로 다른 기사 쌍을 만들고
+청크 쌍 SequenceMatcher 방식과 winnowing 포함도 방식의 처리 시간과 점수를 비교합니다.
+
+사용법:
+    python benchmarks/bench_chunk_similarity.py [--limit 3000] [--pairs 100]
+"""
+import argparse
+import glob
+import os
+import sys
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from src.incremental.duplicate_detector import DuplicateDetector
+from src.xml_parser import XMLParser
+
+WIRE_LEAD = "[서울=연합뉴스] 주요 경제 소식을 전해드립니다. 아래 기사는 통신사 제공 원문을 전재한 것입니다. "
+WIRE_TAIL = " (끝) 무단 전재 및 재배포 금지. 기사 제보 및 문의는 편집국으로 연락 바랍니다."
+
+
+def _load_long_bodies(files, detector, count):
+    """정규화 후 1000자를 넘는 본문"""
+    parser = XMLParser()
+    bodies = []
+    for xml_file in files:
+        parsed = parser.parse_xml_file(xml_file)
+        body = parsed and parsed['article_data'].get('body')
+        if body and len(detector._normalize_text(body)) > 1000:
+            bodies.append(body)
+            if len(bodies) > count:
+                break
+    return bodies
+
+
+def _build_pairs(bodies):
+    """유형별 비교 쌍"""
+    pairs = {'wire_copy': [], 'edited': [], 'unrelated': []}
+    for i, body in enumerate(bodies[:-1]):
+        sentences = body.split('. ')
+        pairs['wire_copy'].append((body, WIRE_LEAD + body + WIRE_TAIL))
+        pairs['edited'].append((body, '. '.join(
+            sentence for position, sentence in enumerate(sentences) if position % 5 != 2
+        )))
+        pairs['unrelated'].append((body, bodies[i + 1]))
+    return pairs
+
+
+def _score_pairs(detector, pairs):
+    """쌍별 점수와 전체 처리 시간"""
+    start = time.perf_counter()
+    scores = [detector._calculate_content_similarity(body1, body2) for body1, body2 in pairs]
+    return scores, time.perf_counter() - start
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument('--limit', type=int, default=3000, help='탐색할 샘플 파일 수')
+    arg_parser.add_argument('--pairs', type=int, default=100, help='유형별 비교 쌍 수')
+    arg_parser.add_argument('--threshold', type=float, default=0.8, help='중복 판정 임계값')
+    args = arg_parser.parse_args()
+
+    files = sorted(glob.glob(os.path.join(ROOT_DIR, 'saltlux_T_*.xml')))[:args.limit]
+    if not files:
+        print("샘플 XML 파일을 찾을 수 없습니다.")
+        return 1
+
+    sequence_matcher = DuplicateDetector(method='pairwise', chunk_similarity='sequence_matcher')
+    winnowing = DuplicateDetector(method='pairwise', chunk_similarity='winnowing')
+
+    bodies = _load_long_bodies(files, winnowing, args.pairs)
+    if len(bodies) < 2:
+        print("1000자를 넘는 본문이 부족합니다.")
+        return 1
+    print(f"본문 {len(bodies)}건, 평균 정규화 길이 "
+          f"{sum(len(winnowing._normalize_text(body)) for body in bodies) / len(bodies):.0f}자")
+
+    total_time = {'sequence_matcher': 0.0, 'winnowing': 0.0}
+    disagreements = 0
+    total_pairs = 0
+
+    print(f"{'유형':<10} {'SequenceMatcher':>16} {'winnowing':>10} {'판정 일치':>10}")
+    for pair_type, pairs in _build_pairs(bodies).items():
+        old_scores, old_time = _score_pairs(sequence_matcher, pairs)
+        new_scores, new_time = _score_pairs(winnowing, pairs)
+        total_time['sequence_matcher'] += old_time
+        total_time['winnowing'] += new_time
+
+        agreements = sum(
+            (old >= args.threshold) == (new >= args.threshold)
+            for old, new in zip(old_scores, new_scores)
+        )
+        disagreements += len(pairs) - agreements
+        total_pairs += len(pairs)
+        print(f"{pair_type:<10} {sum(old_scores) / len(pairs):>16.3f} "
+              f"{sum(new_scores) / len(pairs):>10.3f} {agreements:>6}/{len(pairs)}")
+
+    print(f"SequenceMatcher 청크 쌍: {total_time['sequence_matcher'] / total_pairs * 1000:8.2f} ms/pair")
+    print(f"winnowing 포함도:        {total_time['winnowing'] / total_pairs * 1000:8.2f} ms/pair")
+    print(f"속도 향상:               {total_time['sequence_matcher'] / total_time['winnowing']:8.1f}x")
+    print(f"판정 불일치:             {disagreements}/{total_pairs}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,77 @@
+"""
+XMLParser 엔티티 추출 벤치마크
+
+패턴별 re.findall 방식(_extract_entities_with_patterns)과 EntityExtractor 방식
+(_extract_entities)의 초당 처리 기사 수를 저장소 루트의 saltlux_T_*.xml 샘플로 비교하고,
+두 방식의 추출 결과가 같은지 확인합니다.
+
+사용법:
+    python benchmarks/bench_entity_extraction.py [--limit 2000] [--repeat 3]
+"""
+import argparse
+import glob
+import os
+import sys
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from src.xml_parser import XMLParser
+
+
+def _best_rate(extract, articles, repeat: int) -> float:
+    """repeat회 실행 중 가장 빠른 초당 처리 기사 수"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for article_data in articles:
+            extract(article_data)
+        best = min(best, time.perf_counter() - start)
+    return len(articles) / best if best > 0 else 0.0
+
+
+def _as_sets(entities):
+    """엔티티 목록 순서와 무관하게 비교하기 위한 변환"""
+    return {key: set(values) for key, values in entities.items()}
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument('--limit', type=int, default=2000, help='사용할 샘플 파일 수')
+    arg_parser.add_argument('--repeat', type=int, default=3, help='반복 측정 횟수')
+    args = arg_parser.parse_args()
+    
+    files = sorted(glob.glob(os.path.join(ROOT_DIR, 'saltlux_T_*.xml')))[:args.limit]
+    if not files:
+        print("샘플 XML 파일을 찾을 수 없습니다.")
+        return 1
+    
+    parser = XMLParser()
+    
+    # XML 파싱 비용은 제외하고 엔티티 추출만 측정
+    articles = []
+    for xml_file in files:
+        parsed = parser.parse_xml_file(xml_file)
+        if parsed:
+            articles.append(parsed['article_data'])
+    
+    mismatches = sum(
+        1 for article_data in articles
+        if _as_sets(parser._extract_entities(article_data))
+        != _as_sets(parser._extract_entities_with_patterns(article_data))
+    )
+    
+    pattern_rate = _best_rate(parser._extract_entities_with_patterns, articles, args.repeat)
+    engine_rate = _best_rate(parser._extract_entities, articles, args.repeat)
+    
+    print(f"기사 수: {len(articles)}")
+    print(f"패턴별 findall:   {pattern_rate:10.0f} articles/sec")
+    print(f"EntityExtractor:  {engine_rate:10.0f} articles/sec")
+    print(f"속도 향상:        {engine_rate / pattern_rate:10.2f}x")
+    print(f"결과 불일치:      {mismatches}")
+    return 0 if mismatches == 0 else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,85 @@
+"""
+ContentHasher 파일 해시 처리량 벤치마크
+
+저장소 루트의 saltlux_T_*.xml 샘플을 임시 디렉토리에 --files개가 되도록 반복 복사한 뒤
+기존 방식(파일 전체 읽기 + md5, 순차)과 블록 단위 해시, blake2b, 스레드 풀 배치 API의
+초당 처리 파일 수를 비교합니다.
+
+사용법:
+    python benchmarks/bench_file_hashing.py [--files 10000] [--workers 8]
+"""
+import argparse
+import glob
+import hashlib
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from src.incremental.content_hasher import ContentHasher
+
+
+def _read_all_md5(file_path: str) -> str:
+    """기존 방식: 파일 전체를 읽은 뒤 md5"""
+    with open(file_path, 'rb') as f:
+        return hashlib.md5(f.read()).hexdigest()
+
+
+def _rate(func, file_paths) -> float:
+    """초당 처리 파일 수"""
+    start = time.perf_counter()
+    func(file_paths)
+    elapsed = time.perf_counter() - start
+    return len(file_paths) / elapsed if elapsed > 0 else 0.0
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument('--files', type=int, default=10000, help='생성할 파일 수')
+    arg_parser.add_argument('--workers', type=int, default=8, help='배치 API 스레드 수')
+    args = arg_parser.parse_args()
+
+    samples = sorted(glob.glob(os.path.join(ROOT_DIR, 'saltlux_T_*.xml')))
+    if not samples:
+        print("샘플 XML 파일을 찾을 수 없습니다.")
+        return 1
+
+    hasher = ContentHasher()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_paths = []
+        for i in range(args.files):
+            file_path = os.path.join(tmp_dir, f"{i:08d}.xml")
+            shutil.copyfile(samples[i % len(samples)], file_path)
+            file_paths.append(file_path)
+
+        expected = [_read_all_md5(file_path) for file_path in file_paths]
+        assert hasher.calculate_file_hashes(file_paths, 'md5', args.workers) == expected
+
+        results = [
+            ('전체 읽기 md5 (기존)', lambda paths: [_read_all_md5(p) for p in paths]),
+            ('블록 md5', lambda paths: [hasher.calculate_file_hash(p, 'md5') for p in paths]),
+            ('블록 blake2b', lambda paths: [hasher.calculate_file_hash(p, 'blake2b') for p in paths]),
+            (f'배치 md5 ({args.workers} 스레드)',
+             lambda paths: hasher.calculate_file_hashes(paths, 'md5', args.workers)),
+            (f'배치 blake2b ({args.workers} 스레드)',
+             lambda paths: hasher.calculate_file_hashes(paths, 'blake2b', args.workers)),
+        ]
+
+        print(f"파일 수: {len(file_paths)}, 평균 크기: "
+              f"{sum(os.path.getsize(p) for p in file_paths) / len(file_paths):.0f} bytes")
+        baseline = None
+        for name, func in results:
+            rate = _rate(func, file_paths)
+            baseline = baseline or rate
+            print(f"{name:28s} {rate:10.0f} files/sec ({rate / baseline:5.2f}x)")
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,81 @@
+"""
+파일 지문 manifest 재스캔 벤치마크
+
+임시 디렉토리에 빈 XML 파일 N개를 만들고 manifest에 기록한 뒤,
+변경 없는 상태에서 재스캔(scan_changed_files)에 걸리는 시간을 측정합니다.
+
+사용법:
+    python benchmarks/bench_file_manifest_rescan.py [--files 100000]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+import src.incremental.file_manifest as file_manifest_module
+from src.database.models import Base
+from src.incremental.file_manifest import FileManifestManager
+
+
+def _bind_database(database_url: str):
+    """FileManifestManager가 사용할 세션을 지정한 데이터베이스로 교체"""
+    engine = create_engine(database_url)
+    Base.metadata.create_all(bind=engine)
+    session_factory = sessionmaker(bind=engine, autocommit=False, autoflush=False)
+
+    def get_db():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    file_manifest_module.get_db = get_db
+    return engine
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument('--files', type=int, default=100000, help='생성할 파일 수')
+    args = arg_parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        xml_dir = os.path.join(tmp_dir, 'xml')
+        os.mkdir(xml_dir)
+        for i in range(args.files):
+            open(os.path.join(xml_dir, f"article_{i:08d}.xml"), 'wb').close()
+
+        engine = _bind_database(f"sqlite:///{os.path.join(tmp_dir, 'manifest.db')}")
+        manifest = FileManifestManager(flush_size=10000)
+
+        start = time.perf_counter()
+        changed = manifest.scan_changed_files(xml_dir)
+        first_scan = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for file_path in changed:
+            manifest.record(file_path, 'd41d8cd98f00b204e9800998ecf8427e')
+        manifest.flush()
+        record_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        unchanged = manifest.scan_changed_files(xml_dir)
+        rescan = time.perf_counter() - start
+        engine.dispose()
+
+    print(f"파일 수: {args.files}")
+    print(f"최초 스캔:   {first_scan:8.2f}s ({len(changed)}개 변경)")
+    print(f"manifest 기록: {record_time:8.2f}s")
+    print(f"재스캔:      {rescan:8.2f}s ({len(unchanged)}개 변경)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,144 @@
+"""
+한국어 임베딩 모델 CPU 처리량 벤치마크
+
+저장소 루트의 saltlux_T_*.xml 샘플 본문을 문장으로 나누고 KoreanEmbeddingModel로 인코딩할 때
+초당 문장 수를 비교합니다.
+- 한 건씩: 문장마다 토크나이징과 모델 호출 (기존 방식)
+- 배치: 길이순으로 정렬한 문장을 --batch-sizes 크기로 묶어 한 번에 모델 호출
+두 방식의 임베딩 최대 차이도 함께 출력합니다. torch와 transformers가 필요합니다.
+--offline을 지정하면 모델을 내려받지 않고 같은 구조(BERT-base)의 임의 가중치 모델과
+샘플 문장 글자로 만든 어휘를 사용합니다.
+
+사용법:
+    python benchmarks/bench_korean_embedding.py [--sentences 512] [--batch-sizes 8,16,32] [--threads 4] [--offline]
+"""
+import argparse
+import glob
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from src.embedding import korean_embedding_model
+from src.embedding.korean_embedding_model import KoreanEmbeddingModel
+from src.xml_parser import XMLParser
+
+
+def _load_sentences(files, count):
+    """샘플 본문 문장 (10자 이상)"""
+    parser = XMLParser()
+    sentences = []
+    for xml_file in files:
+        parsed = parser.parse_xml_file(xml_file)
+        body = parsed and parsed['article_data'].get('body')
+        if not body:
+            continue
+        for sentence in body.split('. '):
+            sentence = sentence.strip()
+            if len(sentence) >= 10:
+                sentences.append(sentence)
+                if len(sentences) >= count:
+                    return sentences
+    return sentences
+
+
+def _build_offline_model(sentences, directory, threads):
+    """임의 가중치 BERT-base와 글자 단위 어휘를 사용하는 모델"""
+    from transformers import BertConfig, BertModel, BertTokenizer
+
+    characters = sorted({character for sentence in sentences for character in sentence if not character.isspace()})
+    vocab_file = os.path.join(directory, 'vocab.txt')
+    with open(vocab_file, 'w', encoding='utf-8') as f:
+        f.write('\n'.join(['[PAD]', '[UNK]', '[CLS]', '[SEP]', '[MASK]'] + characters +
+                          [f"##{character}" for character in characters]))
+
+    model = KoreanEmbeddingModel.__new__(KoreanEmbeddingModel)
+    model.model_name = 'offline-bert-base'
+    model.batch_size = korean_embedding_model.DEFAULT_BATCH_SIZE
+    model.num_threads = threads
+    if threads:
+        korean_embedding_model.torch.set_num_threads(threads)
+    model.tokenizer = BertTokenizer(vocab_file)
+    model.model = BertModel(BertConfig(vocab_size=len(characters) * 2 + 5)).eval()
+    return model
+
+
+def _encode_one_by_one(model, texts):
+    """기존 방식: 문장마다 토크나이징과 모델 호출"""
+    torch = korean_embedding_model.torch
+    embeddings = []
+    for text in texts:
+        inputs = model.tokenizer(
+            model._preprocess_korean_text(text),
+            return_tensors='pt',
+            padding=True,
+            truncation=True,
+            max_length=512
+        )
+        with torch.no_grad():
+            outputs = model.model(**inputs)
+            embeddings.append(outputs.last_hidden_state[:, 0, :].squeeze().numpy().tolist())
+    return embeddings
+
+
+def _run(model, sentences, args):
+    """한 건씩 인코딩과 배치 인코딩 처리량 비교"""
+    lengths = [len(sentence) for sentence in sentences]
+    print(f"문장 {len(sentences)}개, 평균 {np.mean(lengths):.0f}자 (최대 {max(lengths)}자), "
+          f"스레드 {korean_embedding_model.torch.get_num_threads()}개")
+
+    _encode_one_by_one(model, sentences[:8])
+    start = time.perf_counter()
+    baseline = np.array(_encode_one_by_one(model, sentences))
+    elapsed = time.perf_counter() - start
+    print(f"한 건씩:         {len(sentences) / elapsed:8.1f} 문장/초")
+
+    for batch_size in [int(size) for size in args.batch_sizes.split(',')]:
+        start = time.perf_counter()
+        batched = np.array(model._encode_with_korean_model(sentences, batch_size=batch_size))
+        elapsed = time.perf_counter() - start
+        print(f"배치 {batch_size:4d}개:     {len(sentences) / elapsed:8.1f} 문장/초 "
+              f"(최대 차이 {np.abs(batched - baseline).max():.2e})")
+
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument('--limit', type=int, default=500, help='탐색할 샘플 파일 수')
+    arg_parser.add_argument('--sentences', type=int, default=512, help='인코딩할 문장 수')
+    arg_parser.add_argument('--batch-sizes', default='8,16,32', help='비교할 배치 크기 (쉼표 구분)')
+    arg_parser.add_argument('--threads', type=int, default=None, help='torch 스레드 수 (기본값: torch 기본값)')
+    arg_parser.add_argument('--model', default='jhgan/ko-sbert-nli', help='모델 이름')
+    arg_parser.add_argument('--offline', action='store_true', help='임의 가중치 BERT-base 사용')
+    args = arg_parser.parse_args()
+
+    if not korean_embedding_model.TORCH_AVAILABLE:
+        print("torch 또는 transformers 패키지가 없습니다.")
+        return 1
+
+    files = sorted(glob.glob(os.path.join(ROOT_DIR, 'saltlux_T_*.xml')))[:args.limit]
+    if not files:
+        print("샘플 XML 파일을 찾을 수 없습니다.")
+        return 1
+
+    sentences = _load_sentences(files, args.sentences)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        if args.offline:
+            model = _build_offline_model(sentences, tmp_dir, args.threads)
+        else:
+            model = KoreanEmbeddingModel(args.model, num_threads=args.threads)
+        if model.tokenizer is None:
+            print(f"{args.model} 모델을 불러오지 못했습니다.")
+            return 1
+        _run(model, sentences, args)
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,105 @@
+"""
+DuplicateDetector 유사 중복 감지 벤치마크
+
+저장소 루트의 saltlux_T_*.xml 샘플 기사에 일부 문장을 바꾼 유사 중복 기사를 섞은 뒤,
+모든 쌍을 SequenceMatcher로 비교하는 기존 방식(pairwise)과 MinHash/LSH 방식의
+유사/콘텐츠 중복 감지 시간을 비교합니다. pairwise는 O(n²)이므로 --pairwise-limit개
+기사에서만 측정하고, MinHash는 --limit개 전체 배치에서도 측정합니다.
+
+사용법:
+    python benchmarks/bench_minhash_duplicates.py [--limit 5000] [--pairwise-limit 200]
+"""
+import argparse
+import glob
+import os
+import sys
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from src.incremental.duplicate_detector import DuplicateDetector
+from src.xml_parser import XMLParser
+
+
+def _load_articles(files):
+    """샘플 기사를 읽고 10건마다 문장 일부를 바꾼 유사 중복 기사를 추가"""
+    parser = XMLParser()
+    articles = []
+    injected = set()
+
+    for xml_file in files:
+        parsed = parser.parse_xml_file(xml_file)
+        if not parsed:
+            continue
+        data = parsed['article_data']
+        article = {
+            'id': data['art_id'],
+            'title': data.get('title') or '',
+            'summary': data.get('summary') or '',
+            'body': data.get('body') or '',
+            'created_at': str(data.get('service_daytime') or '')
+        }
+        articles.append(article)
+
+        if len(articles) % 10 == 0 and len(article['body']) > 200:
+            copy_id = f"{article['id']}-copy"
+            articles.append(dict(article, id=copy_id, body=article['body'] + ' (매경닷컴 제공)'))
+            injected.add((article['id'], copy_id))
+
+    return articles, injected
+
+
+def _measure(detector, articles):
+    """유사/콘텐츠 중복 감지 시간과 감지된 쌍"""
+    start = time.perf_counter()
+    similar = detector._detect_similar_duplicates(articles)
+    content = detector._detect_content_duplicates(articles)
+    elapsed = time.perf_counter() - start
+
+    pairs = {
+        (pair['article1']['id'], pair['article2']['id'])
+        for pair in similar + content
+    }
+    return elapsed, pairs
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument('--limit', type=int, default=5000, help='사용할 샘플 파일 수')
+    arg_parser.add_argument('--pairwise-limit', type=int, default=200,
+                            help='pairwise 방식과 비교할 기사 수')
+    arg_parser.add_argument('--threshold', type=float, default=0.8, help='유사도 임계값')
+    args = arg_parser.parse_args()
+
+    files = sorted(glob.glob(os.path.join(ROOT_DIR, 'saltlux_T_*.xml')))[:args.limit]
+    if not files:
+        print("샘플 XML 파일을 찾을 수 없습니다.")
+        return 1
+
+    articles, injected = _load_articles(files)
+    subset = articles[:args.pairwise_limit]
+    subset_ids = {article['id'] for article in subset}
+    subset_injected = {pair for pair in injected if set(pair) <= subset_ids}
+
+    pairwise = DuplicateDetector(args.threshold, method='pairwise')
+    minhash = DuplicateDetector(args.threshold, method='minhash')
+
+    pairwise_time, pairwise_pairs = _measure(pairwise, subset)
+    minhash_time, minhash_pairs = _measure(minhash, subset)
+    full_time, full_pairs = _measure(minhash, articles)
+
+    print(f"[{len(subset)}건 비교]")
+    print(f"pairwise:  {pairwise_time:10.2f} s  감지 쌍 {len(pairwise_pairs)}")
+    print(f"minhash:   {minhash_time:10.2f} s  감지 쌍 {len(minhash_pairs)}")
+    print(f"속도 향상: {pairwise_time / minhash_time:10.1f}x")
+    print(f"삽입한 유사 중복 감지: pairwise {len(subset_injected & pairwise_pairs)}/{len(subset_injected)}, "
+          f"minhash {len(subset_injected & minhash_pairs)}/{len(subset_injected)}")
+    print(f"[{len(articles)}건 전체 배치]")
+    print(f"minhash:   {full_time:10.2f} s  감지 쌍 {len(full_pairs)}, "
+          f"삽입한 유사 중복 {len(injected & full_pairs)}/{len(injected)}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,66 @@
+"""
+XMLProcessor 프로세스 풀 파싱 처리량 벤치마크
+
+DB 저장을 제외한 파싱 단계(XML 파싱 + 엔티티 추출)의 초당 처리 파일 수를 워커 수별로 측정합니다.
+워커 1개는 단일 프로세스 순차 파싱 기준값입니다.
+
+사용법:
+    python benchmarks/bench_parallel_parse.py [--limit 2000] [--workers 1,2,4] [--chunk-size 32]
+"""
+import argparse
+import glob
+import os
+import sys
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from src.xml_processor import XMLProcessor, _init_parse_worker, _parse_file_chunk
+
+
+def _sequential_rate(files) -> float:
+    """단일 프로세스 순차 파싱의 초당 처리 파일 수"""
+    _init_parse_worker()
+    start = time.perf_counter()
+    _parse_file_chunk(files)
+    elapsed = time.perf_counter() - start
+    return len(files) / elapsed if elapsed > 0 else 0.0
+
+
+def _parallel_rate(files, workers: int, chunk_size: int) -> float:
+    """프로세스 풀 파싱의 초당 처리 파일 수"""
+    processor = XMLProcessor(parse_workers=workers, parse_chunk_size=chunk_size)
+    start = time.perf_counter()
+    parsed = sum(len(batch) for batch in processor.iter_parsed_batches(files, batch_size=500))
+    elapsed = time.perf_counter() - start
+    assert parsed == len(files)
+    return len(files) / elapsed if elapsed > 0 else 0.0
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument('--limit', type=int, default=2000, help='사용할 샘플 파일 수')
+    arg_parser.add_argument('--workers', default='1,2,4', help='측정할 워커 수 목록 (쉼표 구분)')
+    arg_parser.add_argument('--chunk-size', type=int, default=32, help='워커에 전달할 파일 묶음 크기')
+    args = arg_parser.parse_args()
+
+    files = sorted(glob.glob(os.path.join(ROOT_DIR, 'saltlux_T_*.xml')))[:args.limit]
+    if not files:
+        print("샘플 XML 파일을 찾을 수 없습니다.")
+        return 1
+
+    print(f"파일 수: {len(files)}, CPU 수: {os.cpu_count()}")
+
+    baseline = _sequential_rate(files)
+    print(f"순차 파싱:        {baseline:10.0f} files/sec")
+
+    for workers in [int(w) for w in args.workers.split(',') if w.strip()]:
+        rate = _parallel_rate(files, workers, args.chunk_size)
+        print(f"프로세스 {workers:2d}개:     {rate:10.0f} files/sec ({rate / baseline:5.2f}x)")
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,101 @@
+"""
+로컬 벡터 저장소 양자화 벤치마크
+
+군집 구조가 있는 무작위 벡터 --rows개를 float32, int8, pq 방식 LocalVectorStore에 각각 저장하고
+벡터당 코드 바이트 수(후보 검색 시 읽는 크기)와 저장 바이트 수(다시 정렬용 float32 포함), 검색 지연 시간,
+float32 전체 검색 대비 recall@k를 비교합니다.
+recall은 코드 점수만 사용한 경우(rerank x1)와 float32로 다시 정렬한 경우를 함께 보여줍니다.
+
+사용법:
+    python benchmarks/bench_quantization.py [--rows 100000] [--dimensions 768] [--rerank-factor 10]
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from src.vector_search.local_vector_store import LocalVectorStore
+
+UPSERT_BATCH_SIZE = 50000
+
+
+def _build_store(directory, vectors, quantization, params):
+    """벡터를 저장하고 코덱 학습 시간 반환"""
+    store = LocalVectorStore(directory, initial_capacity=len(vectors), quantization=quantization,
+                             quantization_params=params, quantizer_train_size=len(vectors) + 1)
+    for offset in range(0, len(vectors), UPSERT_BATCH_SIZE):
+        batch = vectors[offset:offset + UPSERT_BATCH_SIZE]
+        store.upsert([str(offset + i) for i in range(len(batch))], batch)
+    start = time.perf_counter()
+    if quantization:
+        store.train_quantizer()
+    return store, time.perf_counter() - start
+
+
+def _measure(store, queries, exact, top_k, rerank_factor):
+    """쿼리당 지연 시간과 recall@k"""
+    store.rerank_factor = rerank_factor
+    store.search(queries[0], top_k)
+    start = time.perf_counter()
+    results = [{r['id'] for r in store.search(query, top_k)} for query in queries]
+    elapsed = (time.perf_counter() - start) / len(queries)
+    recall = sum(len(r & e) for r, e in zip(results, exact)) / (len(queries) * top_k)
+    return elapsed, recall
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument('--rows', type=int, default=100000, help='저장할 벡터 수')
+    arg_parser.add_argument('--dimensions', type=int, default=768, help='벡터 차원')
+    arg_parser.add_argument('--clusters', type=int, default=1000, help='생성 데이터의 군집 수')
+    arg_parser.add_argument('--noise', type=float, default=1.0, help='군집 내 잡음 크기')
+    arg_parser.add_argument('--queries', type=int, default=50, help='측정할 쿼리 수')
+    arg_parser.add_argument('--top-k', type=int, default=10, help='검색 결과 수')
+    arg_parser.add_argument('--rerank-factor', type=int, default=10, help='float32로 다시 정렬할 후보 배수')
+    arg_parser.add_argument('--subspaces', type=int, default=96, help='pq 구간 수')
+    args = arg_parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    centers = rng.standard_normal((args.clusters, args.dimensions), dtype=np.float32)
+    labels = rng.integers(args.clusters, size=args.rows + args.queries)
+    vectors = centers[labels] + args.noise * rng.standard_normal(
+        (args.rows + args.queries, args.dimensions), dtype=np.float32)
+    vectors, queries = vectors[:args.rows], vectors[args.rows:]
+
+    json_bytes = len(json.dumps(vectors[0].astype(float).tolist()))
+    print(f"벡터 {args.rows}x{args.dimensions}, JSON float 리스트 {json_bytes}바이트/벡터")
+
+    codecs = [(None, {}), ('int8', {}), ('pq', {'subspaces': args.subspaces})]
+    exact = None
+    print(f"{'방식':<7} {'코드':>6} {'저장':>6} {'float32 대비':>10} {'JSON 대비':>8} {'학습 s':>7} "
+          f"{'ms(x1)':>7} {f'R@{args.top_k}(x1)':>9} {'ms':>7} {f'R@{args.top_k}':>7}")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for quantization, params in codecs:
+            store, train_time = _build_store(os.path.join(tmp_dir, quantization or 'float32'),
+                                             vectors, quantization, params)
+            if exact is None:
+                exact = [{r['id'] for r in store.search(query, args.top_k)} for query in queries]
+
+            stats = store.get_stats()
+            # float32 방식은 행렬 자체를 검색하므로 코드 크기 대신 float32 크기
+            scan_bytes = stats['code_bytes_per_vector'] or stats['float32_bytes_per_vector']
+            codes_time, codes_recall = _measure(store, queries, exact, args.top_k, 1)
+            rerank_time, rerank_recall = _measure(store, queries, exact, args.top_k, args.rerank_factor)
+            print(f"{quantization or 'float32':<7} {scan_bytes:>6} {stats['bytes_per_vector']:>6} "
+                  f"{args.dimensions * 4 / scan_bytes:>10.0f}x {json_bytes / stats['bytes_per_vector']:>8.1f}x "
+                  f"{train_time:>7.1f} "
+                  f"{codes_time * 1000:>7.1f} {codes_recall:>9.3f} {rerank_time * 1000:>7.1f} {rerank_recall:>7.3f}")
+            store.close()
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
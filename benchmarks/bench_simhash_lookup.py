@@ -0,0 +1,105 @@
+"""
+SimHash 해밍 거리 조회 벤치마크
+
+임시 SQLite 데이터베이스의 articles 테이블에 --rows개의 무작위 SimHash 지문을 저장한 뒤,
+저장된 지문에서 최대 3비트를 바꾼 지문으로 블록 인덱스 조회(find_similar_article)의 지연 시간과
+찾은 비율을 측정하고, 전체 지문을 읽어 거리를 계산하는 방식과 비교합니다.
+
+사용법:
+    python benchmarks/bench_simhash_lookup.py [--rows 1000000] [--queries 200]
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.orm import sessionmaker
+
+from src.database.models import Article, Base
+from src.simhash import (
+    find_similar_article, hamming_distance, simhash_columns, to_unsigned64
+)
+
+INSERT_BATCH_SIZE = 10000
+
+
+def _flip_bits(fingerprint: int, rng: random.Random, max_bits: int) -> int:
+    """무작위 비트를 최대 max_bits개 바꾼 지문"""
+    for bit in rng.sample(range(64), rng.randint(0, max_bits)):
+        fingerprint ^= 1 << bit
+    return fingerprint
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument('--rows', type=int, default=1000000, help='저장할 지문 수')
+    arg_parser.add_argument('--queries', type=int, default=200, help='조회 횟수')
+    arg_parser.add_argument('--distance', type=int, default=3, help='최대 해밍 거리')
+    args = arg_parser.parse_args()
+
+    rng = random.Random(42)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp_dir, 'simhash.db')}")
+        Base.metadata.create_all(bind=engine)
+        session_factory = sessionmaker(bind=engine)
+
+        fingerprints = []
+        start = time.perf_counter()
+        with engine.begin() as connection:
+            for offset in range(0, args.rows, INSERT_BATCH_SIZE):
+                rows = []
+                for number in range(offset, min(offset + INSERT_BATCH_SIZE, args.rows)):
+                    fingerprint = rng.getrandbits(64)
+                    fingerprints.append(fingerprint)
+                    rows.append({
+                        'id': str(number), 'art_id': str(number), 'art_year': 2024,
+                        'title': '', **simhash_columns(fingerprint)
+                    })
+                connection.execute(insert(Article.__table__), rows)
+        print(f"지문 {args.rows}개 저장: {time.perf_counter() - start:.1f} s")
+
+        queries = [
+            (str(target), _flip_bits(fingerprints[target], rng, args.distance))
+            for target in rng.sample(range(args.rows), args.queries)
+        ]
+
+        db = session_factory()
+        try:
+            found = 0
+            latencies = []
+            for target_id, fingerprint in queries:
+                start = time.perf_counter()
+                matches = find_similar_article(db, fingerprint, args.distance)
+                latencies.append(time.perf_counter() - start)
+                found += any(article_id == target_id for article_id, _ in matches)
+
+            latencies.sort()
+            print(f"블록 인덱스 조회: 평균 {sum(latencies) / len(latencies) * 1000:.2f} ms, "
+                  f"p99 {latencies[int(len(latencies) * 0.99) - 1] * 1000:.2f} ms, "
+                  f"찾은 비율 {found}/{len(queries)}")
+
+            start = time.perf_counter()
+            target_id, fingerprint = queries[0]
+            scan_matches = [
+                article_id
+                for article_id, simhash in db.connection().execute(select(Article.id, Article.simhash))
+                if hamming_distance(fingerprint, to_unsigned64(simhash)) <= args.distance
+            ]
+            print(f"전체 스캔 조회 1회: {(time.perf_counter() - start) * 1000:.0f} ms "
+                  f"(찾음: {target_id in scan_matches})")
+        finally:
+            db.close()
+            engine.dispose()
+
+    return 0 if found == len(queries) else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
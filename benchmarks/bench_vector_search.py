@@ -0,0 +1,109 @@
+"""
+로컬 벡터 검색 지연 시간 벤치마크
+
+임시 디렉토리의 LocalVectorStore에 무작위 벡터 --rows개를 저장한 뒤 다음을 비교합니다.
+- 기존 방식: 벡터마다 _calculate_cosine_similarity를 호출하고 전체 정렬 (--legacy-rows개에서 측정)
+- 쿼리 하나 검색: 정규화 행렬 곱 + argpartition
+- 여러 쿼리 일괄 검색 (--batch개씩)
+
+사용법:
+    python benchmarks/bench_vector_search.py [--rows 1000000] [--dimensions 768] [--queries 20]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from src.vector_search.local_vector_store import LocalVectorStore
+
+UPSERT_BATCH_SIZE = 50000
+
+
+def _legacy_cosine(embedding1, embedding2) -> float:
+    """VertexAIVectorSearchClient._calculate_cosine_similarity와 같은 계산"""
+    embedding1 = np.array(embedding1)
+    embedding2 = np.array(embedding2)
+    norm1 = np.linalg.norm(embedding1)
+    norm2 = np.linalg.norm(embedding2)
+    if norm1 == 0 or norm2 == 0:
+        return 0.0
+    return float(np.dot(embedding1, embedding2) / (norm1 * norm2))
+
+
+def _legacy_search(vector_data, query, top_k):
+    """기존 로컬 검색 루프"""
+    similarities = [
+        {'id': item['id'], 'similarity': _legacy_cosine(query, item['embedding'])}
+        for item in vector_data
+    ]
+    similarities.sort(key=lambda x: x['similarity'], reverse=True)
+    return similarities[:top_k]
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument('--rows', type=int, default=1000000, help='저장할 벡터 수')
+    arg_parser.add_argument('--dimensions', type=int, default=768, help='벡터 차원')
+    arg_parser.add_argument('--queries', type=int, default=20, help='측정할 쿼리 수')
+    arg_parser.add_argument('--batch', type=int, default=32, help='일괄 검색 쿼리 수')
+    arg_parser.add_argument('--legacy-rows', type=int, default=20000, help='기존 방식 측정 벡터 수')
+    arg_parser.add_argument('--top-k', type=int, default=10, help='검색 결과 수')
+    args = arg_parser.parse_args()
+
+    rng = np.random.default_rng(0)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        store = LocalVectorStore(tmp_dir, initial_capacity=args.rows)
+        start = time.perf_counter()
+        for offset in range(0, args.rows, UPSERT_BATCH_SIZE):
+            count = min(UPSERT_BATCH_SIZE, args.rows - offset)
+            store.upsert([str(offset + i) for i in range(count)],
+                         rng.standard_normal((count, args.dimensions), dtype=np.float32))
+        print(f"벡터 {args.rows}x{args.dimensions} 저장: {time.perf_counter() - start:.1f} s")
+
+        queries = rng.standard_normal((max(args.queries, args.batch), args.dimensions), dtype=np.float32)
+
+        # 기존 방식 (벡터 목록을 Python float 리스트로 들고 있는 형태)
+        legacy_data = [
+            {'id': str(i), 'embedding': store.get(str(i)).tolist()}
+            for i in range(min(args.legacy_rows, args.rows))
+        ]
+        start = time.perf_counter()
+        _legacy_search(legacy_data, queries[0].tolist(), args.top_k)
+        legacy_time = time.perf_counter() - start
+        legacy_estimate = legacy_time * args.rows / len(legacy_data)
+        print(f"기존 루프 ({len(legacy_data)}개): {legacy_time * 1000:.0f} ms "
+              f"-> {args.rows}개 환산 {legacy_estimate * 1000:.0f} ms")
+
+        # 페이지 캐시 적재
+        store.search(queries[0], args.top_k)
+
+        latencies = []
+        for query in queries[:args.queries]:
+            start = time.perf_counter()
+            store.search(query, args.top_k)
+            latencies.append(time.perf_counter() - start)
+        latencies.sort()
+        single = sum(latencies) / len(latencies)
+        print(f"쿼리 하나 검색: 평균 {single * 1000:.1f} ms, 중앙값 {latencies[len(latencies) // 2] * 1000:.1f} ms")
+
+        start = time.perf_counter()
+        store.search_batch(queries[:args.batch], args.top_k)
+        batch_time = time.perf_counter() - start
+        print(f"일괄 검색 ({args.batch}개): {batch_time * 1000:.0f} ms, "
+              f"쿼리당 {batch_time / args.batch * 1000:.1f} ms")
+        print(f"기존 루프 대비: {legacy_estimate / single:.0f}x (쿼리 하나), "
+              f"{legacy_estimate / (batch_time / args.batch):.0f}x (일괄)")
+        store.close()
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,116 @@
+"""
+로컬 벡터 업서트 지연 시간 벤치마크
+
+--base개 벡터가 있는 IVF 인덱스에 --batch개씩 업서트할 때 배치당 지연 시간을 비교합니다.
+- 직접 반영: IVFIndex.upsert (저장소, 메타데이터, 리스트 배정 파일 갱신)
+- 델타 로그: BufferedVectorIndex.upsert (로그 추가, 병합은 --delta-rows마다 백그라운드 수행)
+델타 로그 방식에서 업서트 사이의 검색 지연 시간도 함께 측정합니다.
+
+사용법:
+    python benchmarks/bench_vector_upsert.py [--base 200000] [--batch 100] [--batches 50]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+import numpy as np
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from src.vector_search.delta_log import BufferedVectorIndex
+from src.vector_search.ivf_index import IVFIndex
+from src.vector_search.local_vector_store import LocalVectorStore
+
+BUILD_BATCH_SIZE = 50000
+CATEGORIES = ['경제', '증권', '부동산', '정치', '사회', '스포츠']
+
+
+def _metadata(start, count):
+    return [
+        {
+            'service_daytime': datetime(2024, 1 + i % 12, 1 + i % 28),
+            'large_code_nm': [CATEGORIES[i % len(CATEGORIES)]],
+            'stock_code': [f"{i % 2000:06d}"],
+            'writers': f"기자{i % 500} 기자(reporter{i % 500}@mk.co.kr)"
+        }
+        for i in range(start, start + count)
+    ]
+
+
+def _build_index(directory, rng, args):
+    """기본 벡터를 저장하고 IVF 인덱스 학습"""
+    store = LocalVectorStore(directory, initial_capacity=args.base + args.batch * args.batches)
+    for offset in range(0, args.base, BUILD_BATCH_SIZE):
+        count = min(BUILD_BATCH_SIZE, args.base - offset)
+        store.upsert([str(offset + i) for i in range(count)],
+                     rng.standard_normal((count, args.dimensions), dtype=np.float32),
+                     _metadata(offset, count))
+    index = IVFIndex(store)
+    index.train()
+    return index
+
+
+def _run_batches(target, rng, args, query=None):
+    """배치 업서트 지연 시간 (및 업서트 사이 검색 지연 시간)"""
+    upsert_times = []
+    search_times = []
+    for batch in range(args.batches):
+        start_id = args.base + batch * args.batch
+        embeddings = rng.standard_normal((args.batch, args.dimensions), dtype=np.float32)
+        start = time.perf_counter()
+        target.upsert([str(start_id + i) for i in range(args.batch)], embeddings,
+                      _metadata(start_id, args.batch))
+        upsert_times.append(time.perf_counter() - start)
+
+        if query is not None:
+            start = time.perf_counter()
+            target.search(query, 10)
+            search_times.append(time.perf_counter() - start)
+    return upsert_times, search_times
+
+
+def _summary(times):
+    times = sorted(times)
+    return f"평균 {sum(times) / len(times) * 1000:7.1f} ms, p95 {times[int(len(times) * 0.95)] * 1000:7.1f} ms"
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument('--base', type=int, default=200000, help='기존 벡터 수')
+    arg_parser.add_argument('--dimensions', type=int, default=768, help='벡터 차원')
+    arg_parser.add_argument('--batch', type=int, default=100, help='업서트 배치 크기')
+    arg_parser.add_argument('--batches', type=int, default=50, help='업서트 배치 수')
+    arg_parser.add_argument('--delta-rows', type=int, default=2000, help='병합을 시작하는 델타 수')
+    args = arg_parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        index = _build_index(os.path.join(tmp_dir, 'direct'), rng, args)
+        print(f"기본 벡터 {args.base}x{args.dimensions}, 리스트 {index.n_lists}개")
+        direct_times, _ = _run_batches(index, rng, args)
+        print(f"직접 반영 업서트 ({args.batch}개): {_summary(direct_times)}")
+        index.store.close()
+
+        index = _build_index(os.path.join(tmp_dir, 'delta'), rng, args)
+        buffered = BufferedVectorIndex(index, max_delta_rows=args.delta_rows)
+        query = rng.standard_normal(args.dimensions, dtype=np.float32)
+        delta_times, search_times = _run_batches(buffered, rng, args, query)
+        print(f"델타 로그 업서트 ({args.batch}개): {_summary(delta_times)}")
+        print(f"델타 포함 검색:            {_summary(search_times)}")
+
+        start = time.perf_counter()
+        buffered.wait_for_merge()
+        buffered.compact()
+        print(f"남은 델타 병합: {(time.perf_counter() - start) * 1000:.0f} ms, "
+              f"저장소 벡터 {len(index.store)}개")
+        index.store.close()
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,71 @@
+"""
+XMLParser 필드 추출 마이크로 벤치마크
+
+필드별 find() 방식(_extract_article_element_with_find)과 필드 스펙 테이블 방식
+(_extract_article_element)의 초당 처리 기사 수를 저장소 루트의 saltlux_T_*.xml 샘플로 비교합니다.
+
+사용법:
+    python benchmarks/bench_xml_field_extraction.py [--limit 2000] [--repeat 5]
+"""
+import argparse
+import glob
+import os
+import sys
+import time
+import xml.etree.ElementTree as ET
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from src.xml_parser import XMLParser
+
+
+def _best_rate(extract, articles, repeat: int) -> float:
+    """repeat회 실행 중 가장 빠른 초당 처리 기사 수"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for article in articles:
+            extract(article)
+        best = min(best, time.perf_counter() - start)
+    return len(articles) / best if best > 0 else 0.0
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument('--limit', type=int, default=2000, help='사용할 샘플 파일 수')
+    arg_parser.add_argument('--repeat', type=int, default=5, help='반복 측정 횟수')
+    args = arg_parser.parse_args()
+    
+    files = sorted(glob.glob(os.path.join(ROOT_DIR, 'saltlux_T_*.xml')))[:args.limit]
+    if not files:
+        print("샘플 XML 파일을 찾을 수 없습니다.")
+        return 1
+    
+    # XML 파싱 비용은 제외하고 필드 추출만 측정
+    articles = []
+    for xml_file in files:
+        article = ET.parse(xml_file).getroot().find('article')
+        if article is not None:
+            articles.append(article)
+    
+    parser = XMLParser()
+    
+    mismatches = sum(
+        1 for article in articles
+        if parser._extract_article_element(article) != parser._extract_article_element_with_find(article)
+    )
+    
+    find_rate = _best_rate(parser._extract_article_element_with_find, articles, args.repeat)
+    table_rate = _best_rate(parser._extract_article_element, articles, args.repeat)
+    
+    print(f"기사 수: {len(articles)}")
+    print(f"find() 방식:       {find_rate:10.0f} articles/sec")
+    print(f"필드 스펙 테이블:  {table_rate:10.0f} articles/sec")
+    print(f"속도 향상:         {table_rate / find_rate:10.2f}x")
+    print(f"결과 불일치:       {mismatches}")
+    return 0 if mismatches == 0 else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -2,7 +2,7 @@
 데이터베이스 연결 및 세션 관리
 """
 import os
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, inspect, text
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import QueuePool
 # from google.cloud.sql.connector import Connector  # 테스트용으로 주석 처리
@@ -99,15 +99,58 @@ class DatabaseManager:
         return self.SessionLocal()
     
     def create_tables(self):
-        """테이블 생성"""
+        """테이블 생성 (기존 테이블에는 새 nullable 컬럼 추가, _add_missing_columns 참고)"""
         try:
             from .models import Base
             Base.metadata.create_all(bind=self.engine)
+            self._add_missing_columns(Base.metadata)
             logger.info("데이터베이스 테이블이 성공적으로 생성되었습니다.")
         except Exception as e:
             logger.error(f"테이블 생성 중 오류 발생: {e}")
             raise
     
+    def _add_missing_columns(self, metadata):
+        """
+        기존 테이블에 모델에 새로 추가된 nullable 컬럼과 인덱스 추가 (간단한 스키마 마이그레이션)
+        
+        create_all은 이미 있는 테이블을 변경하지 않으므로, 기존 데이터베이스에 articles.simhash 및
+        simhash_block0~3 컬럼과 블록 인덱스가 생기도록 create_tables에서 매번 호출합니다.
+        없는 nullable 컬럼만 ALTER TABLE ... ADD COLUMN으로 추가하고(기존 행은 NULL, 이후
+        XMLProcessor.backfill_simhashes로 채움), 컬럼 타입 변경이나 삭제, NOT NULL 컬럼은 다루지
+        않습니다. 추가할 컬럼이 없으면 스키마 조회만 하고 아무것도 변경하지 않습니다.
+        """
+        inspector = inspect(self.engine)
+        preparer = self.engine.dialect.identifier_preparer
+        
+        with self.engine.begin() as connection:
+            for table in metadata.sorted_tables:
+                if not inspector.has_table(table.name):
+                    continue
+                
+                existing_columns = {column['name'] for column in inspector.get_columns(table.name)}
+                missing_columns = [
+                    column for column in table.columns
+                    if column.name not in existing_columns and column.nullable
+                ]
+                if not missing_columns:
+                    continue
+                
+                logger.info(
+                    f"스키마 마이그레이션: {table.name} 테이블에 컬럼 {len(missing_columns)}개 추가 "
+                    f"({', '.join(column.name for column in missing_columns)})"
+                )
+                for column in missing_columns:
+                    column_type = column.type.compile(dialect=self.engine.dialect)
+                    connection.execute(text(
+                        f'ALTER TABLE {preparer.format_table(table)} '
+                        f'ADD COLUMN {preparer.format_column(column)} {column_type}'
+                    ))
+                    logger.info(f"컬럼 추가: {table.name}.{column.name} {column_type}")
+                
+                for index in table.indexes:
+                    index.create(bind=connection, checkfirst=True)
+                logger.info(f"스키마 마이그레이션 완료: {table.name} 인덱스 확인 {len(table.indexes)}개")
+    
     def close(self):
         """데이터베이스 연결 종료"""
         if self.engine:
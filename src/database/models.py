@@ -1,7 +1,7 @@
 """
 매일경제 신문기사 데이터베이스 모델
 """
-from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, Float, JSON
+from sqlalchemy import Column, Integer, BigInteger, String, Text, DateTime, Boolean, Float, JSON, LargeBinary
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.dialects.postgresql import UUID
 import uuid
@@ -44,6 +44,13 @@ class Article(Base):
     # 중복 체크용 해시
     content_hash = Column(String, nullable=True, index=True)
     
+    # 유사 중복 조회용 64비트 SimHash (부호 있는 값으로 저장) 및 16비트 블록
+    simhash = Column(BigInteger, nullable=True, index=True)
+    simhash_block0 = Column(Integer, nullable=True, index=True)
+    simhash_block1 = Column(Integer, nullable=True, index=True)
+    simhash_block2 = Column(Integer, nullable=True, index=True)
+    simhash_block3 = Column(Integer, nullable=True, index=True)
+    
     # 처리 상태
     is_processed = Column(Boolean, default=False)
     is_embedded = Column(Boolean, default=False)
@@ -116,6 +123,36 @@ class ProcessingLog(Base):
     
     created_at = Column(DateTime, default=datetime.utcnow)
 
+class FileManifest(Base):
+    """증분 처리용 파일 지문 목록"""
+    __tablename__ = 'file_manifest'
+    
+    file_path = Column(String, primary_key=True)
+    file_size = Column(BigInteger, nullable=False)
+    mtime_ns = Column(BigInteger, nullable=False)
+    content_hash = Column(String, nullable=False, index=True)  # 파일 내용 해시
+    
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+class ArticleMinHash(Base):
+    """유사 중복 탐지용 기사 MinHash 서명"""
+    __tablename__ = 'article_minhashes'
+    
+    article_id = Column(String, primary_key=True)
+    signature = Column(LargeBinary, nullable=False)  # uint32 배열 바이트
+    num_perm = Column(Integer, nullable=False)
+    
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+class MinHashBucket(Base):
+    """MinHash LSH 밴드 버킷"""
+    __tablename__ = 'minhash_buckets'
+    
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    bucket_key = Column(String, nullable=False, index=True)  # "밴드 번호:밴드 해시"
+    article_id = Column(String, nullable=False, index=True)
+
 class VectorIndex(Base):
     """벡터 인덱스 관리"""
     __tablename__ = 'vector_indexes'
@@ -0,0 +1,152 @@
+"""
+텍스트 해시 기반 영구 임베딩 캐시
+
+기사 인덱싱 텍스트의 MD5 해시(text_hash)를 키로 임베딩을 로컬 SQLite 파일에 저장합니다.
+같은 기사를 다시 적재하거나 중단된 증분 처리를 다시 실행할 때 내용이 바뀌지 않은 텍스트는
+모델 추론 없이 저장된 임베딩을 사용합니다. 모델별로 버전(모델 식별자)을 함께 저장하고,
+버전이 바뀌면 해당 모델의 임베딩을 모두 삭제합니다.
+"""
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, List
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# IN (...) 조회 시 한 번에 넘기는 해시 수 (SQLite 바인드 변수 제한 고려)
+CACHE_CHUNK_SIZE = 500
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS embedding_models (
+    model_name TEXT PRIMARY KEY,
+    model_version TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS embeddings (
+    model_name TEXT NOT NULL,
+    text_hash TEXT NOT NULL,
+    dimensions INTEGER NOT NULL,
+    vector BLOB NOT NULL,
+    created_at REAL NOT NULL,
+    PRIMARY KEY (model_name, text_hash)
+) WITHOUT ROWID;
+"""
+
+
+class PersistentEmbeddingCache:
+    """(모델 이름, 텍스트 해시) -> 임베딩 SQLite 캐시"""
+
+    def __init__(self, db_path: str):
+        """
+        초기화
+
+        Args:
+            db_path: SQLite 파일 경로
+        """
+        self.db_path = db_path
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.executescript(SCHEMA)
+        self._lock = threading.Lock()
+        # 이번 실행에서 확인한 모델 버전
+        self._checked_versions: Dict[str, str] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def _ensure_version(self, model_name: str, model_version: str):
+        """저장된 모델 버전이 다르면 해당 모델의 임베딩 삭제"""
+        if self._checked_versions.get(model_name) == model_version:
+            return
+
+        row = self._conn.execute(
+            'SELECT model_version FROM embedding_models WHERE model_name = ?', (model_name,)
+        ).fetchone()
+        if row is None or row[0] != model_version:
+            with self._conn:
+                deleted = self._conn.execute(
+                    'DELETE FROM embeddings WHERE model_name = ?', (model_name,)
+                ).rowcount
+                self._conn.execute(
+                    'INSERT OR REPLACE INTO embedding_models (model_name, model_version) VALUES (?, ?)',
+                    (model_name, model_version)
+                )
+            if row is not None:
+                logger.info(f"임베딩 모델 버전 변경으로 캐시 삭제: {model_name} "
+                            f"({row[0]} -> {model_version}, {deleted}개)")
+        self._checked_versions[model_name] = model_version
+
+    def get_many(self, model_name: str, model_version: str,
+                 text_hashes: List[str]) -> Dict[str, np.ndarray]:
+        """
+        저장된 임베딩 조회
+
+        Args:
+            model_name: 모델 이름 (모델 유형)
+            model_version: 모델 버전 (저장된 버전과 다르면 캐시 삭제)
+            text_hashes: 텍스트 해시 목록
+
+        Returns:
+            Dict[str, np.ndarray]: 텍스트 해시 -> float32 임베딩 (없는 해시는 제외)
+        """
+        unique_hashes = list(dict.fromkeys(text_hashes))
+        found = {}
+        with self._lock:
+            self._ensure_version(model_name, model_version)
+            for i in range(0, len(unique_hashes), CACHE_CHUNK_SIZE):
+                chunk = unique_hashes[i:i + CACHE_CHUNK_SIZE]
+                placeholders = ','.join('?' * len(chunk))
+                rows = self._conn.execute(
+                    f'SELECT text_hash, vector FROM embeddings '
+                    f'WHERE model_name = ? AND text_hash IN ({placeholders})',
+                    [model_name, *chunk]
+                )
+                for text_hash, vector in rows:
+                    found[text_hash] = np.frombuffer(vector, dtype=np.float32)
+            self.hits += len(found)
+            self.misses += len(unique_hashes) - len(found)
+        return found
+
+    def put_many(self, model_name: str, model_version: str, text_hashes: List[str], embeddings):
+        """임베딩을 float32로 저장"""
+        now = time.time()
+        rows = []
+        for text_hash, embedding in zip(text_hashes, embeddings):
+            vector = np.asarray(embedding, dtype=np.float32)
+            rows.append((model_name, text_hash, vector.shape[0], vector.tobytes(), now))
+
+        with self._lock:
+            self._ensure_version(model_name, model_version)
+            with self._conn:
+                self._conn.executemany(
+                    'INSERT OR REPLACE INTO embeddings '
+                    '(model_name, text_hash, dimensions, vector, created_at) VALUES (?, ?, ?, ?, ?)',
+                    rows
+                )
+
+    def get_stats(self) -> Dict:
+        """캐시 통계"""
+        with self._lock:
+            counts = dict(self._conn.execute(
+                'SELECT model_name, COUNT(*) FROM embeddings GROUP BY model_name'
+            ).fetchall())
+            total = self.hits + self.misses
+            return {
+                'db_path': self.db_path,
+                'entries': counts,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / total if total else 0.0
+            }
+
+    def close(self):
+        """연결 종료"""
+        with self._lock:
+            self._conn.close()
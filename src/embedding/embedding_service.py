@@ -28,6 +28,14 @@ from google.cloud.aiplatform import gapic as aip
 from .korean_embedding_model import KoreanEmbeddingModel
 from .article_metadata_extractor import ArticleMetadataExtractor
 from .text_chunker import TextChunker, get_text_chunker
+from .query_embedding_cache import QueryEmbeddingCache, normalize_query
+from .embedding_cache import PersistentEmbeddingCache
+from ..text_normalizer import clean_text
+
+# Vertex AI 텍스트 임베딩 모델
+VERTEX_EMBEDDING_MODEL = "textembedding-gecko@003"
+# 모델이 없을 때 사용하는 해시 기반 임베딩 식별자
+HASH_EMBEDDING_MODEL = "md5-seeded-normal-768"
 
 class EmbeddingService:
     """벡터 임베딩 서비스"""
@@ -39,6 +47,14 @@ class EmbeddingService:
         self.vertex_ai_client = None
         self.metadata_extractor = ArticleMetadataExtractor()
         self.text_chunker = get_text_chunker(chunk_size=500, chunk_overlap=50, strategy="sentence")
+        self.query_cache = QueryEmbeddingCache(
+            max_entries=int(os.getenv('QUERY_EMBEDDING_CACHE_SIZE', '4096')),
+            ttl_seconds=float(os.getenv('QUERY_EMBEDDING_CACHE_TTL', '3600')),
+            cache_dir=os.getenv('QUERY_EMBEDDING_CACHE_DIR') or None
+        )
+        # 기사 임베딩 영구 캐시 (빈 문자열이면 사용 안 함, 처음 사용할 때 열기)
+        self.embedding_cache_path = os.getenv('EMBEDDING_CACHE_PATH', 'data/embedding_cache.db')
+        self.embedding_cache = None
         self._initialize_models()
     
     def _initialize_models(self):
@@ -69,20 +85,133 @@ class EmbeddingService:
             logger.error(f"임베딩 모델 초기화 중 오류 발생: {e}")
             raise
     
-    def generate_embeddings(self, texts: List[str], model_type: str = "multilingual") -> List[List[float]]:
-        """텍스트 임베딩 생성"""
+    def generate_embeddings(self, texts: List[str], model_type: str = "multilingual",
+                            use_cache: bool = False) -> List[List[float]]:
+        """
+        텍스트 임베딩 생성
+
+        Args:
+            texts: 텍스트 목록
+            model_type: 'multilingual', 'korean', 'vertex_ai' 중 하나
+            use_cache: 검색어 임베딩 캐시 사용 여부 (검색어처럼 반복되는 짧은 텍스트에 사용)
+        """
         try:
-            if model_type == "korean":
-                return self._generate_korean_embeddings(texts)
-            elif model_type == "vertex_ai":
-                return self._generate_vertex_ai_embeddings(texts)
-            else:
-                return self._generate_multilingual_embeddings(texts)
+            if use_cache:
+                return self._generate_cached_embeddings(texts, model_type)
+            return self._generate_embeddings_by_type(texts, model_type)
                 
         except Exception as e:
             logger.error(f"임베딩 생성 중 오류 발생: {e}")
             raise
     
+    def _generate_embeddings_by_type(self, texts: List[str], model_type: str) -> List[List[float]]:
+        """모델 유형별 임베딩 생성"""
+        if model_type == "korean":
+            return self._generate_korean_embeddings(texts)
+        elif model_type == "vertex_ai":
+            return self._generate_vertex_ai_embeddings(texts)
+        else:
+            return self._generate_multilingual_embeddings(texts)
+    
+    def _get_embedding_cache(self) -> Optional[PersistentEmbeddingCache]:
+        """기사 임베딩 영구 캐시 (열기 실패 시 None)"""
+        if self.embedding_cache is None and self.embedding_cache_path:
+            try:
+                self.embedding_cache = PersistentEmbeddingCache(self.embedding_cache_path)
+            except Exception as e:
+                logger.warning(f"임베딩 캐시 열기 실패, 캐시 없이 진행: {e}")
+                self.embedding_cache_path = None
+        return self.embedding_cache
+    
+    def _get_model_version(self, model_type: str) -> Optional[str]:
+        """모델 유형별 캐시 버전 (모델 식별자, 알 수 없으면 None)"""
+        if model_type == "vertex_ai":
+            version = VERTEX_EMBEDDING_MODEL
+        elif model_type == "korean":
+            if self.korean_model is None:
+                return None
+            version = self.korean_model.model_name
+        else:
+            version = self.model_name if self.model is not None else HASH_EMBEDDING_MODEL
+        
+        revision = os.getenv('EMBEDDING_MODEL_REVISION')
+        return f"{version}#{revision}" if revision else version
+    
+    def _generate_embeddings_with_source(self, texts: List[str], model_type: str) -> Tuple[List[List[float]], str]:
+        """임베딩 생성 후 실제로 사용한 모델 유형과 함께 반환 (Vertex AI 실패 시 'multilingual')"""
+        if model_type != "vertex_ai":
+            return self._generate_embeddings_by_type(texts, model_type), model_type
+        
+        try:
+            return self._request_vertex_ai_embeddings(texts), model_type
+        except Exception as e:
+            logger.warning(f"Vertex AI 임베딩 실패, 로컬 모델 사용: {e}")
+            return self._generate_multilingual_embeddings(texts), "multilingual"
+    
+    def _generate_stored_embeddings(self, texts: List[str], model_type: str = "multilingual",
+                                    text_hashes: Optional[List[str]] = None) -> List[List[float]]:
+        """
+        영구 캐시에 없는 텍스트만 임베딩 생성
+        
+        Args:
+            texts: 텍스트 목록
+            model_type: 모델 유형
+            text_hashes: 텍스트별 MD5 해시 (없으면 계산)
+        """
+        if text_hashes is None:
+            text_hashes = [hashlib.md5(text.encode('utf-8')).hexdigest() for text in texts]
+        
+        cache = self._get_embedding_cache()
+        version = self._get_model_version(model_type)
+        if cache is None or version is None:
+            return self.generate_embeddings(texts, model_type=model_type)
+        
+        found = cache.get_many(model_type, version, text_hashes)
+        missing = {}
+        for text_hash, text in zip(text_hashes, texts):
+            if text_hash not in found:
+                missing.setdefault(text_hash, text)
+        
+        computed = {}
+        if missing:
+            embeddings, source_type = self._generate_embeddings_with_source(list(missing.values()), model_type)
+            computed = dict(zip(missing, embeddings))
+            source_version = self._get_model_version(source_type)
+            if source_version is not None:
+                cache.put_many(source_type, source_version, list(computed), embeddings)
+        
+        return [
+            computed[text_hash] if text_hash in computed else found[text_hash].tolist()
+            for text_hash in text_hashes
+        ]
+    
+    def _generate_cached_embeddings(self, texts: List[str], model_type: str) -> List[List[float]]:
+        """
+        캐시에 없는 검색어만 인코딩 (정규화한 검색어로 인코딩해 캐시 키와 결과를 일치시킴)
+        
+        캐시 키에 모델 버전(_get_model_version)을 포함하므로 모델이 바뀌면 이전 모델의 벡터를 사용하지 않고,
+        Vertex AI 실패로 로컬 모델을 사용한 벡터는 실제 사용한 모델 유형으로 저장합니다.
+        """
+        queries = [normalize_query(text) for text in texts]
+        version = self._get_model_version(model_type)
+        if version is None:
+            return self._generate_embeddings_by_type(queries, model_type)
+        vectors = self.query_cache.get_many(model_type, version, queries)
+        
+        missing = list(dict.fromkeys(query for query, vector in zip(queries, vectors) if vector is None))
+        if missing:
+            embeddings, source_type = self._generate_embeddings_with_source(missing, model_type)
+            source_version = self._get_model_version(source_type)
+            if source_version is not None:
+                self.query_cache.put_many(source_type, source_version, missing, embeddings)
+            computed = dict(zip(missing, embeddings))
+            return [
+                computed[query] if vector is None else vector.tolist()
+                for query, vector in zip(queries, vectors)
+            ]
+        
+        return [vector.tolist() for vector in vectors]
+    
     def _generate_multilingual_embeddings(self, texts: List[str]) -> List[List[float]]:
         """다국어 모델로 임베딩 생성"""
         try:
@@ -129,22 +258,7 @@ class EmbeddingService:
     def _generate_vertex_ai_embeddings(self, texts: List[str]) -> List[List[float]]:
         """Vertex AI Text Embeddings API로 임베딩 생성"""
         try:
-            from vertexai.preview.language_models import TextEmbeddingModel
-            
-            # Vertex AI Text Embedding 모델 초기화
-            model = TextEmbeddingModel.from_pretrained("textembedding-gecko@003")
-            
-            # 배치 임베딩 생성 (최대 5개씩 배치 처리)
-            embeddings = []
-            batch_size = 5
-            for i in range(0, len(texts), batch_size):
-                batch_texts = texts[i:i + batch_size]
-                results = model.get_embeddings(batch_texts)
-                for question in results:
-                    embeddings.append(question.values)
-            
-            logger.info(f"Vertex AI 임베딩 생성 완료: {len(texts)}개")
-            return embeddings
+            return self._request_vertex_ai_embeddings(texts)
             
         except ImportError as e:
             logger.warning(f"Vertex AI 라이브러리 없음: {e}")
@@ -155,6 +269,25 @@ class EmbeddingService:
             # Vertex AI 실패 시 로컬 모델 사용
             return self._generate_multilingual_embeddings(texts)
     
+    def _request_vertex_ai_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """Vertex AI Text Embeddings API 호출 (실패 시 예외 발생)"""
+        from vertexai.preview.language_models import TextEmbeddingModel
+        
+        # Vertex AI Text Embedding 모델 초기화
+        model = TextEmbeddingModel.from_pretrained(VERTEX_EMBEDDING_MODEL)
+        
+        # 배치 임베딩 생성 (최대 5개씩 배치 처리)
+        embeddings = []
+        batch_size = 5
+        for i in range(0, len(texts), batch_size):
+            batch_texts = texts[i:i + batch_size]
+            results = model.get_embeddings(batch_texts)
+            for question in results:
+                embeddings.append(question.values)
+        
+        logger.info(f"Vertex AI 임베딩 생성 완료: {len(texts)}개")
+        return embeddings
+    
     def generate_article_embedding(self, article_data: Dict, use_chunking: bool = False, 
                                    chunk_size: int = 500, chunk_overlap: int = 50) -> Dict:
         """
@@ -190,7 +323,7 @@ class EmbeddingService:
                 
                 # 각 청크에 대한 임베딩 생성
                 chunk_texts = [chunk.text for chunk in chunks]
-                chunk_embeddings = self.generate_embeddings(chunk_texts, model_type="vertex_ai")
+                chunk_embeddings = self._generate_stored_embeddings(chunk_texts, model_type="vertex_ai")
                 
                 # 청크별 임베딩 정보 구성
                 chunk_embeddings_data = []
@@ -232,7 +365,10 @@ class EmbeddingService:
                 }
             else:
                 # 기존 방식: 전체 텍스트 임베딩
-                embedding = self.generate_embeddings([indexing_text], model_type="vertex_ai")[0]
+                text_hash = hashlib.md5(indexing_text.encode('utf-8')).hexdigest()
+                embedding = self._generate_stored_embeddings(
+                    [indexing_text], model_type="vertex_ai", text_hashes=[text_hash]
+                )[0]
                 
                 embedding_metadata = {
                     'model_name': self.model_name,
@@ -247,7 +383,7 @@ class EmbeddingService:
                 return {
                     'embedding': embedding,
                     'metadata': embedding_metadata,
-                    'text_hash': hashlib.md5(indexing_text.encode('utf-8')).hexdigest(),
+                    'text_hash': text_hash,
                     'metadata_hash': self.metadata_extractor.generate_metadata_hash(article_data, metadata),
                     'is_chunked': False
                 }
@@ -258,22 +394,10 @@ class EmbeddingService:
     
     def _preprocess_text(self, title: str, body: str, summary: str) -> str:
         """텍스트 전처리"""
-        import re
-        
-        # HTML 태그 제거
-        title = re.sub(r'<[^>]+>', '', title)
-        body = re.sub(r'<[^>]+>', '', body)
-        summary = re.sub(r'<[^>]+>', '', summary)
-        
-        # 특수 문자 정리
-        title = re.sub(r'[^\w\s가-힣]', ' ', title)
-        body = re.sub(r'[^\w\s가-힣]', ' ', body)
-        summary = re.sub(r'[^\w\s가-힣]', ' ', summary)
-        
-        # 공백 정리
-        title = ' '.join(title.split())
-        body = ' '.join(body.split())
-        summary = ' '.join(summary.split())
+        # HTML 태그 제거, 특수 문자 및 공백 정리
+        title = clean_text(title)
+        body = clean_text(body)
+        summary = clean_text(summary)
         
         # 텍스트 조합 (가중치 적용)
         combined = f"{title} {title} {summary} {body}"  # 제목에 가중치 2배
@@ -301,8 +425,9 @@ class EmbeddingService:
                 )
                 batch_texts.append(combined_text)
             
-            # 배치 임베딩 생성
-            batch_embeddings = self.generate_embeddings(batch_texts)
+            # 배치 임베딩 생성 (캐시에 없는 텍스트만)
+            text_hashes = [hashlib.md5(text.encode('utf-8')).hexdigest() for text in batch_texts]
+            batch_embeddings = self._generate_stored_embeddings(batch_texts, text_hashes=text_hashes)
             
             # 결과 구성
             for j, article in enumerate(batch):
@@ -310,7 +435,7 @@ class EmbeddingService:
                     'article_id': article.get('id'),
                     'art_id': article.get('art_id'),
                     'embedding': batch_embeddings[j],
-                    'text_hash': hashlib.md5(batch_texts[j].encode('utf-8')).hexdigest(),
+                    'text_hash': text_hashes[j],
                     'created_at': datetime.utcnow().isoformat()
                 }
                 results.append(result)
@@ -5,7 +5,7 @@ import os
 import logging
 import numpy as np
 from typing import List, Dict, Optional
-import re
+from ..text_normalizer import clean_text
 
 try:
     import torch
@@ -18,11 +18,26 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# 한 번에 모델에 넣는 기본 문장 수
+DEFAULT_BATCH_SIZE = 16
+
 class KoreanEmbeddingModel:
     """한국어 특화 임베딩 모델"""
     
-    def __init__(self, model_name: str = "jhgan/ko-sbert-nli"):
+    def __init__(self, model_name: str = "jhgan/ko-sbert-nli", batch_size: Optional[int] = None,
+                 num_threads: Optional[int] = None):
+        """
+        초기화
+        
+        Args:
+            model_name: 모델 이름
+            batch_size: 배치 크기 (기본값: KOREAN_EMBEDDING_BATCH_SIZE 또는 16)
+            num_threads: torch 연산 스레드 수 (기본값: KOREAN_EMBEDDING_THREADS, 둘 다 없으면 torch 기본값 유지)
+        """
         self.model_name = model_name
+        self.batch_size = batch_size or int(os.getenv('KOREAN_EMBEDDING_BATCH_SIZE', str(DEFAULT_BATCH_SIZE)))
+        threads_env = os.getenv('KOREAN_EMBEDDING_THREADS')
+        self.num_threads = num_threads or (int(threads_env) if threads_env else None)
         self.tokenizer = None
         self.model = None
         self._initialize_model()
@@ -34,6 +49,10 @@ class KoreanEmbeddingModel:
             return
             
         try:
+            # set_num_threads는 프로세스 전역 설정이라 같은 프로세스의 다른 모델에도 적용되므로,
+            # os.cpu_count()(논리 CPU 수, cgroup 제한 무시)로 정하지 않고 명시한 경우에만 변경
+            if self.num_threads:
+                torch.set_num_threads(self.num_threads)
             self.tokenizer = AutoTokenizer.from_pretrained(self.model_name)
             self.model = AutoModel.from_pretrained(self.model_name)
             self.model.eval()
@@ -73,30 +92,42 @@ class KoreanEmbeddingModel:
             logger.error(f"한국어 임베딩 생성 중 오류 발생: {e}")
             raise
     
-    def _encode_with_korean_model(self, texts: List[str]) -> List[List[float]]:
-        """한국어 모델로 임베딩 생성"""
+    def _encode_with_korean_model(self, texts: List[str], batch_size: Optional[int] = None) -> List[List[float]]:
+        """
+        한국어 모델로 임베딩 생성
+        
+        길이가 비슷한 텍스트끼리 배치를 묶어 패딩을 줄이고, 결과는 입력 순서대로 반환합니다.
+        
+        Args:
+            texts: 텍스트 목록
+            batch_size: 배치 크기 (기본값: self.batch_size)
+        """
         try:
-            embeddings = []
-            
-            for text in texts:
-                # 텍스트 전처리
-                processed_text = self._preprocess_korean_text(text)
-                
-                # 토크나이징
-                inputs = self.tokenizer(
-                    processed_text,
-                    return_tensors='pt',
-                    padding=True,
-                    truncation=True,
-                    max_length=512
-                )
-                
-                # 임베딩 생성
-                with torch.no_grad():
+            batch_size = batch_size or self.batch_size
+            
+            # 텍스트 전처리
+            processed_texts = [self._preprocess_korean_text(text) for text in texts]
+            order = sorted(range(len(processed_texts)), key=lambda i: len(processed_texts[i]))
+            embeddings = [None] * len(processed_texts)
+            
+            with torch.inference_mode():
+                for start in range(0, len(order), batch_size):
+                    batch_indices = order[start:start + batch_size]
+                    
+                    # 토크나이징
+                    inputs = self.tokenizer(
+                        [processed_texts[i] for i in batch_indices],
+                        return_tensors='pt',
+                        padding=True,
+                        truncation=True,
+                        max_length=512
+                    )
+                    
+                    # 임베딩 생성 (CLS 토큰의 임베딩 사용)
                     outputs = self.model(**inputs)
-                    # CLS 토큰의 임베딩 사용
-                    embedding = outputs.last_hidden_state[:, 0, :].squeeze().numpy()
-                    embeddings.append(embedding.tolist())
+                    batch_embeddings = outputs.last_hidden_state[:, 0, :].float().numpy()
+                    for i, embedding in zip(batch_indices, batch_embeddings):
+                        embeddings[i] = embedding.tolist()
             
             return embeddings
             
@@ -107,21 +138,8 @@ class KoreanEmbeddingModel:
     def _preprocess_korean_text(self, text: str) -> str:
         """한국어 텍스트 전처리"""
         try:
-            # HTML 태그 제거
-            text = re.sub(r'<[^>]+>', '', text)
-            
-            # 특수 문자 정리
-            text = re.sub(r'[^\w\s가-힣]', ' ', text)
-            
-            # 공백 정리
-            text = ' '.join(text.split())
-            
-            # 최대 길이 제한
-            max_length = 512
-            if len(text) > max_length:
-                text = text[:max_length]
-            
-            return text
+            # HTML 태그 제거, 특수 문자 및 공백 정리, 최대 길이 제한
+            return clean_text(text, max_length=512)
             
         except Exception as e:
             logger.error(f"한국어 텍스트 전처리 중 오류 발생: {e}")
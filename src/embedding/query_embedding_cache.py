@@ -0,0 +1,187 @@
+"""
+검색어 임베딩 캐시
+
+자주 들어오는 검색어("삼성전자 실적", "금리 인상" 등)를 매번 다시 인코딩하지 않도록 (모델 유형, 모델 버전,
+정규화한 검색어)를 키로 float32 벡터를 LRU/TTL 캐시에 보관합니다. 디렉터리를 지정하면 벡터를 .npy 파일로도 저장해
+재시작 후에도 캐시를 사용할 수 있습니다.
+"""
+import hashlib
+import logging
+import os
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_query(text: str) -> str:
+    """캐시 키용 검색어 정규화 (NFC 변환 → 공백 정리)"""
+    return ' '.join(unicodedata.normalize('NFC', text).split())
+
+
+class QueryEmbeddingCache:
+    """검색어 임베딩 LRU/TTL 캐시"""
+
+    def __init__(self, max_entries: int = 4096, ttl_seconds: float = 3600,
+                 cache_dir: Optional[str] = None):
+        """
+        초기화
+
+        Args:
+            max_entries: 메모리에 보관할 최대 벡터 수
+            ttl_seconds: 벡터 유효 시간 (0 이하면 만료 없음)
+            cache_dir: 디스크 캐시 디렉터리 (None이면 메모리만 사용)
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.cache_dir = cache_dir
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+            self.prune_disk()
+
+    def get_many(self, model_type: str, model_version: str, texts: List[str]) -> List[Optional[np.ndarray]]:
+        """
+        캐시된 벡터 조회
+
+        디스크 파일 읽기는 잠금 밖에서 하므로 다른 검색어 조회가 파일 I/O를 기다리지 않습니다.
+
+        Args:
+            model_type: 임베딩 모델 유형
+            model_version: 모델 버전 (모델이 바뀌면 이전 벡터를 사용하지 않도록 키에 포함)
+            texts: 정규화한 검색어 목록
+
+        Returns:
+            List[Optional[np.ndarray]]: 입력 순서와 같은 벡터 목록 (캐시에 없으면 None)
+        """
+        now = time.time()
+        keys = [(model_type, model_version, text) for text in texts]
+        vectors: List[Optional[np.ndarray]] = [None] * len(keys)
+        missing = []
+        with self._lock:
+            for i, key in enumerate(keys):
+                entry = self._entries.get(key)
+                if entry is not None and self._is_expired(entry[1], now):
+                    del self._entries[key]
+                    entry = None
+                if entry is None:
+                    missing.append(i)
+                else:
+                    self._entries.move_to_end(key)
+                    vectors[i] = entry[0]
+
+        disk_entries = {}
+        if self.cache_dir:
+            for i in missing:
+                entry = self._read_disk(keys[i], now)
+                if entry is not None:
+                    disk_entries[i] = entry
+                    vectors[i] = entry[0]
+
+        with self._lock:
+            for i, entry in disk_entries.items():
+                self._remember(keys[i], entry)
+            self.disk_hits += len(disk_entries)
+            self.misses += len(missing) - len(disk_entries)
+            self.hits += len(keys) - len(missing) + len(disk_entries)
+        return vectors
+
+    def put_many(self, model_type: str, model_version: str, texts: List[str], embeddings):
+        """벡터를 float32로 변환해 저장 (디스크 쓰기는 잠금 밖에서 수행)"""
+        now = time.time()
+        entries = [
+            ((model_type, model_version, text), (np.asarray(embedding, dtype=np.float32), now))
+            for text, embedding in zip(texts, embeddings)
+        ]
+        with self._lock:
+            for key, entry in entries:
+                self._remember(key, entry)
+        if self.cache_dir:
+            for key, entry in entries:
+                self._write_disk(key, entry[0])
+
+    def _remember(self, key: Tuple[str, str, str], entry: Tuple[np.ndarray, float]):
+        if self.max_entries <= 0:
+            return
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _is_expired(self, created_at: float, now: float) -> bool:
+        return self.ttl_seconds > 0 and now - created_at > self.ttl_seconds
+
+    def _disk_path(self, key: Tuple[str, str, str]) -> str:
+        digest = hashlib.sha1('\x00'.join(key).encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, f"{digest}.npy")
+
+    def _read_disk(self, key: Tuple[str, str, str], now: float) -> Optional[Tuple[np.ndarray, float]]:
+        path = self._disk_path(key)
+        try:
+            created_at = os.path.getmtime(path)
+            if self._is_expired(created_at, now):
+                os.remove(path)
+                return None
+            return np.load(path), created_at
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"검색어 임베딩 캐시 파일 읽기 실패: {e}")
+            return None
+
+    def _write_disk(self, key: Tuple[str, str, str], vector: np.ndarray):
+        path = self._disk_path(key)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(temp_path, 'wb') as f:
+                np.save(f, vector)
+            os.replace(temp_path, path)
+        except Exception as e:
+            logger.warning(f"검색어 임베딩 캐시 파일 저장 실패: {e}")
+
+    def prune_disk(self) -> int:
+        """만료된 디스크 캐시 파일 삭제"""
+        if not self.cache_dir or self.ttl_seconds <= 0:
+            return 0
+
+        removed = 0
+        now = time.time()
+        for name in os.listdir(self.cache_dir):
+            path = os.path.join(self.cache_dir, name)
+            try:
+                if self._is_expired(os.path.getmtime(path), now):
+                    os.remove(path)
+                    removed += 1
+            except OSError:
+                continue
+        return removed
+
+    def clear(self):
+        """메모리 캐시 비우기"""
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict:
+        """캐시 통계"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'ttl_seconds': self.ttl_seconds,
+                'disk_enabled': bool(self.cache_dir),
+                'hits': self.hits,
+                'disk_hits': self.disk_hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / total if total else 0.0
+            }
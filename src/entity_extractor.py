@@ -0,0 +1,116 @@
+"""
+기사 본문 엔티티 추출 엔진
+
+XMLParser._extract_persons/_companies/_locations/_dates/_numbers와 동일한 결과를 내도록
+패턴을 모듈 로드 시 한 번만 컴파일하고, 본문 전체를 반복해서 훑는 비용을 줄입니다.
+"""
+import re
+import logging
+from typing import Dict, List
+
+logger = logging.getLogger(__name__)
+
+# 기업명 패턴이 공유하는 문자 구간 ([가-힣\w\s]+)
+COMPANY_RUN_PATTERN = re.compile(r'[가-힣\w\s]+')
+
+COMPANY_PATTERNS = [
+    re.compile(r'([가-힣\w\s]+(?:주식회사|유한회사|㈜|\(주\)|\(유\)))'),
+    re.compile(r'([가-힣\w\s]+(?:그룹|그룹사|홀딩스|인베스트먼트))'),
+    re.compile(r'([가-힣\w\s]+(?:은행|증권|보험|카드))')
+]
+
+PERSON_PATTERNS = [
+    re.compile(r'[가-힣]{2,4}(?=\s|,|\.|이다|라고|씨|님)'),
+    re.compile(r'([가-힣]{2,4})\s*기자')
+]
+
+LOCATION_PATTERNS = [
+    re.compile(r'([가-힣]+(?:시|도|구|군|동|읍|면))'),
+    re.compile(r'([가-힣]+(?:서울|부산|대구|인천|광주|대전|울산|세종))'),
+    re.compile(r'([가-힣]+(?:강남|강북|서초|송파|마포|용산|영등포))')
+]
+
+# (패턴, 매치에 반드시 포함되는 문자열) - 해당 문자열이 없으면 스캔 생략
+DATE_PATTERNS = [
+    (re.compile(r'\d{4}년\s*\d{1,2}월\s*\d{1,2}일'), '년'),
+    (re.compile(r'\d{4}-\d{2}-\d{2}'), '-'),
+    (re.compile(r'\d{2}/\d{2}/\d{4}'), '/'),
+    (re.compile(r'\d{4}\.\d{2}\.\d{2}'), '.')
+]
+
+NUMBER_PATTERNS = [
+    (re.compile(r'\d+조\s*\d+억\s*\d+만'), '조'),
+    (re.compile(r'\d+억\s*\d+만'), '억'),
+    (re.compile(r'\d+만\s*원'), '만'),
+    (re.compile(r'\d+%'), '%'),
+    (re.compile(r'\d+\.\d+%'), '%')
+]
+
+
+class EntityExtractor:
+    """기사 본문 엔티티 추출기"""
+
+    def extract(self, text: str) -> Dict[str, List[str]]:
+        """
+        엔티티 추출
+
+        Args:
+            text: 제목과 본문을 합친 텍스트
+
+        Returns:
+            Dict: persons, companies, locations, dates, numbers별 엔티티 목록
+        """
+        return {
+            'persons': self.extract_persons(text),
+            'companies': self.extract_companies(text),
+            'locations': self.extract_locations(text),
+            'dates': self._findall_with_literal(DATE_PATTERNS, text),
+            'numbers': self._findall_with_literal(NUMBER_PATTERNS, text)
+        }
+
+    def extract_persons(self, text: str) -> List[str]:
+        """인물명 추출"""
+        names = set()
+        for pattern in PERSON_PATTERNS:
+            names.update(pattern.findall(text))
+        return list(names)
+
+    def extract_companies(self, text: str) -> List[str]:
+        """
+        기업명 추출
+
+        [가-힣\\w\\s]+ 로 시작하는 패턴을 re.findall로 돌리면 접미사가 없는 긴 구간에서
+        시작 위치마다 역추적을 반복해 본문 길이의 제곱에 비례하는 시간이 걸립니다.
+        구간 시작에서 매치가 실패하면 같은 구간의 이후 위치에서도 반드시 실패하므로,
+        구간을 한 번만 나눠 두고 패턴별로 구간(또는 직전 매치 끝) 위치에서만 매치를 시도합니다.
+        결과는 re.findall과 동일합니다.
+        """
+        runs = [match.span() for match in COMPANY_RUN_PATTERN.finditer(text)]
+        companies = set()
+
+        for pattern in COMPANY_PATTERNS:
+            pos = 0
+            for run_start, run_end in runs:
+                if run_end <= pos:
+                    continue
+                match = pattern.match(text, run_start if run_start > pos else pos)
+                if match:
+                    companies.add(match.group(1))
+                    pos = match.end()
+
+        return list(companies)
+
+    def extract_locations(self, text: str) -> List[str]:
+        """지역명 추출"""
+        locations = set()
+        for pattern in LOCATION_PATTERNS:
+            locations.update(pattern.findall(text))
+        return list(locations)
+
+    def _findall_with_literal(self, pattern_specs, text: str) -> List[str]:
+        """필수 문자열이 있는 패턴만 findall 실행"""
+        found = set()
+        for pattern, literal in pattern_specs:
+            if literal in text:
+                found.update(pattern.findall(text))
+        return list(found)
@@ -3,13 +3,46 @@
 """
 import hashlib
 import logging
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Dict, List, Optional, Set, Tuple, Union
 from datetime import datetime
 import re
 import os
+from concurrent.futures import ThreadPoolExecutor
+
+from ..simhash import SIMHASH_BITS, compute_simhash
+from ..text_normalizer import normalize_for_hash
 
 logger = logging.getLogger(__name__)
 
+# 파일 해시 계산 시 한 번에 읽는 크기
+FILE_HASH_BLOCK_SIZE = 64 * 1024
+
+# 파일 해시 알고리즘별 해시 객체 생성 함수 (blake2b는 16바이트 다이제스트로 md5보다 빠름)
+FILE_HASH_FACTORIES = {
+    'md5': hashlib.md5,
+    'sha1': hashlib.sha1,
+    'sha256': hashlib.sha256,
+    'blake2b': lambda: hashlib.blake2b(digest_size=16)
+}
+
+
+def get_file_hash_factory(algorithm: str):
+    """
+    파일 해시 알고리즘의 해시 객체 생성 함수
+
+    알 수 없는 이름을 md5로 대신하면 manifest에 서로 다른 해시가 섞여 모든 파일이 바뀐 것으로
+    보이므로 오류로 처리합니다.
+
+    Raises:
+        ValueError: 지원하지 않는 알고리즘
+    """
+    factory = FILE_HASH_FACTORIES.get(algorithm)
+    if factory is None:
+        raise ValueError(
+            f"지원하지 않는 파일 해시 알고리즘입니다: {algorithm} (사용 가능: {', '.join(FILE_HASH_FACTORIES)})"
+        )
+    return factory
+
 class ContentHasher:
     """콘텐츠 해싱 시스템"""
     
@@ -23,17 +56,74 @@ class ContentHasher:
             self._remove_punctuation
         ]
     
-    def calculate_file_hash(self, file_path: str) -> str:
-        """파일 해시 계산"""
+    def calculate_file_hash(self, file_path: str, algorithm: str = 'md5') -> str:
+        """
+        파일 해시 계산
+        
+        파일 전체를 메모리에 올리지 않고 블록 단위로 읽어 해시를 계산합니다.
+        
+        Args:
+            file_path: 파일 경로
+            algorithm: 해시 알고리즘 ('md5', 'sha1', 'sha256', 'blake2b')
+            
+        Returns:
+            str: 16진수 해시 문자열 (실패 시 빈 문자열)
+            
+        Raises:
+            ValueError: 지원하지 않는 알고리즘
+        """
+        factory = get_file_hash_factory(algorithm)
         try:
-            with open(file_path, 'rb') as f:
-                file_content = f.read()
-                return hashlib.md5(file_content).hexdigest()
+            file_hash = factory()
+            
+            # 기사 XML은 대부분 한 블록보다 작으므로 버퍼 없는 raw 읽기로 복사를 줄임
+            with open(file_path, 'rb', buffering=0) as f:
+                while True:
+                    block = f.read(FILE_HASH_BLOCK_SIZE)
+                    if not block:
+                        break
+                    file_hash.update(block)
+            
+            return file_hash.hexdigest()
                 
         except Exception as e:
             logger.error(f"파일 해시 계산 중 오류 발생: {file_path}, {e}")
             return ""
     
+    def calculate_file_hashes(self, file_paths: List[str], algorithm: str = 'md5',
+                              max_workers: int = 8) -> List[str]:
+        """
+        여러 파일의 해시를 스레드 풀로 병렬 계산
+        
+        파일 읽기는 I/O 대기가 대부분이고 hashlib은 큰 블록 해시 계산 중 GIL을 놓으므로 스레드로 병렬화합니다.
+        작은 파일이 많으므로 파일마다 작업을 제출하지 않고 스레드별로 파일 묶음을 나눠 처리합니다.
+        
+        Args:
+            file_paths: 파일 경로 목록
+            algorithm: 해시 알고리즘
+            max_workers: 스레드 수
+            
+        Returns:
+            List[str]: 입력 순서와 같은 해시 목록 (실패한 파일은 빈 문자열)
+            
+        Raises:
+            ValueError: 지원하지 않는 알고리즘
+        """
+        get_file_hash_factory(algorithm)
+        if len(file_paths) <= 1 or max_workers <= 1:
+            return [self.calculate_file_hash(file_path, algorithm) for file_path in file_paths]
+        
+        workers = min(max_workers, len(file_paths))
+        chunk_size = (len(file_paths) + workers - 1) // workers
+        chunks = [file_paths[i:i + chunk_size] for i in range(0, len(file_paths), chunk_size)]
+        
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            chunk_hashes = executor.map(
+                lambda chunk: [self.calculate_file_hash(file_path, algorithm) for file_path in chunk],
+                chunks
+            )
+            return [file_hash for hashes in chunk_hashes for file_hash in hashes]
+    
     def calculate_content_hash(self, content: str, algorithm: str = 'md5') -> str:
         """콘텐츠 해시 계산"""
         try:
@@ -54,6 +144,14 @@ class ContentHasher:
             logger.error(f"콘텐츠 해시 계산 중 오류 발생: {e}")
             return ""
     
+    def calculate_simhash(self, content: str) -> int:
+        """SimHash 지문 계산 (내용이 비슷하면 해밍 거리가 작은 64비트 정수)"""
+        try:
+            return compute_simhash(content)
+        except Exception as e:
+            logger.error(f"SimHash 계산 중 오류 발생: {e}")
+            return 0
+    
     def calculate_article_hash(self, article: Dict) -> Dict:
         """기사 해시 계산"""
         try:
@@ -106,7 +204,16 @@ class ContentHasher:
             return {}
     
     def _normalize_content(self, content: str) -> str:
-        """콘텐츠 정규화"""
+        """콘텐츠 정규화 (normalization_rules를 차례로 적용한 결과와 동일)"""
+        try:
+            return normalize_for_hash(content)
+            
+        except Exception as e:
+            logger.error(f"콘텐츠 정규화 중 오류 발생: {e}")
+            return content
+    
+    def _normalize_content_with_rules(self, content: str) -> str:
+        """콘텐츠 정규화 (규칙 함수 순차 적용 방식, _normalize_content 결과 검증용)"""
         try:
             normalized = content
             
@@ -167,9 +274,14 @@ class ContentHasher:
             logger.error(f"해시 비교 중 오류 발생: {e}")
             return False
     
-    def find_similar_hashes(self, target_hash: str, hash_list: List[str], 
-                           threshold: float = 0.8) -> List[Tuple[str, float]]:
-        """유사한 해시 찾기"""
+    def find_similar_hashes(self, target_hash: Union[str, int], hash_list: List[Union[str, int]],
+                           threshold: float = 0.8) -> List[Tuple[Union[str, int], float]]:
+        """
+        유사한 해시 찾기
+        
+        유사도는 비트 단위 해밍 유사도이므로 calculate_simhash 지문에서 의미가 있습니다.
+        (md5 등 암호 해시는 내용이 조금만 달라도 비트가 무작위로 바뀜)
+        """
         try:
             similar_hashes = []
             
@@ -187,17 +299,20 @@ class ContentHasher:
             logger.error(f"유사한 해시 찾기 중 오류 발생: {e}")
             return []
     
-    def _calculate_hash_similarity(self, hash1: str, hash2: str) -> float:
-        """해시 유사도 계산"""
+    def _calculate_hash_similarity(self, hash1: Union[str, int], hash2: Union[str, int]) -> float:
+        """해시 유사도 계산 (1 - 해밍 거리 / 비트 수, 정수는 64비트 SimHash, 문자열은 16진수 해시)"""
         try:
-            if len(hash1) != len(hash2):
-                return 0.0
-            
-            # 해시 문자열의 문자별 유사도 계산
-            matches = sum(1 for c1, c2 in zip(hash1, hash2) if c1 == c2)
-            similarity = matches / len(hash1)
+            if isinstance(hash1, int) and isinstance(hash2, int):
+                bits = SIMHASH_BITS
+                value1, value2 = hash1, hash2
+            else:
+                if not hash1 or len(hash1) != len(hash2):
+                    return 0.0
+                bits = len(hash1) * 4
+                value1, value2 = int(hash1, 16), int(hash2, 16)
             
-            return similarity
+            distance = ((value1 ^ value2) & ((1 << bits) - 1)).bit_count()
+            return 1.0 - distance / bits
             
         except Exception as e:
             logger.error(f"해시 유사도 계산 중 오류 발생: {e}")
@@ -3,20 +3,83 @@
 """
 import hashlib
 import logging
-from typing import List, Dict, Set, Tuple, Optional
+from typing import List, Dict, Set, Tuple, Optional, Iterable
 from datetime import datetime
 import difflib
-import re
+
+from ..text_normalizer import normalize_for_comparison
+from .minhash_lsh import MinHasher, MinHashLSHIndex, MinHashSignatureStore
+from .winnowing import mutual_containment, winnow_fingerprints
 
 logger = logging.getLogger(__name__)
 
+# 감지기 이름 -> (감지 메서드, 중복 쌍의 첫 번째 기사 키, 두 번째 기사 키)
+DUPLICATE_DETECTORS = {
+    'exact': ('_detect_exact_duplicates', 'original', 'duplicate'),
+    'similar': ('_detect_similar_duplicates', 'article1', 'article2'),
+    'title': ('_detect_title_duplicates', 'original', 'duplicate'),
+    'content': ('_detect_content_duplicates', 'article1', 'article2')
+}
+
+
+class UnionFind:
+    """중복 그룹 구성용 union-find (경로 압축, 크기 기준 합치기)"""
+    
+    def __init__(self, size: int):
+        self.parents = list(range(size))
+        self.sizes = [1] * size
+    
+    def find(self, item: int) -> int:
+        """item이 속한 그룹의 루트"""
+        root = item
+        while self.parents[root] != root:
+            root = self.parents[root]
+        while self.parents[item] != root:
+            self.parents[item], item = root, self.parents[item]
+        return root
+    
+    def union(self, item1: int, item2: int):
+        """두 항목의 그룹 합치기"""
+        root1, root2 = self.find(item1), self.find(item2)
+        if root1 == root2:
+            return
+        if self.sizes[root1] < self.sizes[root2]:
+            root1, root2 = root2, root1
+        self.parents[root2] = root1
+        self.sizes[root1] += self.sizes[root2]
+    
+    def groups(self) -> List[List[int]]:
+        """그룹 목록 (그룹과 그룹 내 항목은 첫 항목 순서)"""
+        groups = {}
+        for item in range(len(self.parents)):
+            groups.setdefault(self.find(item), []).append(item)
+        return list(groups.values())
+
 class DuplicateDetector:
     """중복 감지기"""
     
-    def __init__(self, similarity_threshold: float = 0.8):
+    def __init__(self, similarity_threshold: float = 0.8, method: str = 'minhash',
+                 num_perm: int = 128, shingle_size: int = 5,
+                 chunk_similarity: str = 'winnowing'):
+        """
+        초기화
+
+        Args:
+            similarity_threshold: 유사 중복 임계값 (minhash 방식에서는 Jaccard 추정치 기준)
+            method: 유사/콘텐츠 중복 감지 방식 ('minhash' 또는 모든 쌍을 비교하는 'pairwise')
+            num_perm: MinHash 서명 길이
+            shingle_size: MinHash shingle 문자 수
+            chunk_similarity: 긴 본문 유사도 계산 방식 ('winnowing' 포함도 또는 청크 쌍 'sequence_matcher')
+        """
         self.similarity_threshold = similarity_threshold
+        self.method = method
+        self.chunk_similarity = chunk_similarity
         self.content_hashes = set()
         self.title_hashes = set()
+        self.minhasher = MinHasher(num_perm=num_perm, shingle_size=shingle_size)
+        self.signature_store = MinHashSignatureStore(
+            MinHashLSHIndex(similarity_threshold, num_perm)
+        )
     
     def detect_duplicates(self, articles: List[Dict]) -> Dict:
         """중복 기사 감지"""
@@ -84,6 +147,14 @@ class DuplicateDetector:
     
     def _detect_similar_duplicates(self, articles: List[Dict]) -> List[Dict]:
         """유사한 중복 감지"""
+        if self.method == 'minhash':
+            return self._detect_minhash_duplicates(
+                articles, [self._article_text(article) for article in articles], 'similar'
+            )
+        return self._detect_similar_duplicates_pairwise(articles)
+    
+    def _detect_similar_duplicates_pairwise(self, articles: List[Dict]) -> List[Dict]:
+        """유사한 중복 감지 (모든 쌍 비교, 검증용)"""
         try:
             similar_duplicates = []
             
@@ -138,6 +209,14 @@ class DuplicateDetector:
     
     def _detect_content_duplicates(self, articles: List[Dict]) -> List[Dict]:
         """콘텐츠 중복 감지"""
+        if self.method == 'minhash':
+            return self._detect_minhash_duplicates(
+                articles, [article.get('body', '') or '' for article in articles], 'content'
+            )
+        return self._detect_content_duplicates_pairwise(articles)
+    
+    def _detect_content_duplicates_pairwise(self, articles: List[Dict]) -> List[Dict]:
+        """콘텐츠 중복 감지 (모든 쌍 비교, 검증용)"""
         try:
             content_duplicates = []
             
@@ -163,6 +242,87 @@ class DuplicateDetector:
             logger.error(f"콘텐츠 중복 감지 중 오류 발생: {e}")
             return []
     
+    def _detect_minhash_duplicates(self, articles: List[Dict], texts: List[str],
+                                   duplicate_type: str) -> List[Dict]:
+        """MinHash LSH 버킷을 공유하는 후보 쌍만 비교해 유사 중복 감지"""
+        try:
+            index = MinHashLSHIndex(self.similarity_threshold, self.minhasher.num_perm,
+                                    params=(self.signature_store.index.bands,
+                                            self.signature_store.index.rows))
+            for position, text in enumerate(texts):
+                index.add(position, self.minhasher.signature(self._normalize_text(text)))
+            
+            return [
+                {
+                    'article1': articles[i],
+                    'article2': articles[j],
+                    'similarity': similarity,
+                    'type': duplicate_type
+                }
+                for i, j, similarity in index.similar_pairs()
+            ]
+            
+        except Exception as e:
+            logger.error(f"MinHash 중복 감지 중 오류 발생: {e}")
+            return []
+    
+    def _article_text(self, article: Dict) -> str:
+        """유사 중복 비교용 기사 전체 텍스트 (제목, 요약, 본문)"""
+        return ' '.join(
+            article.get(field, '') or '' for field in ('title', 'summary', 'body')
+        )
+    
+    def index_articles(self, articles: List[Dict]) -> int:
+        """
+        기사 MinHash 서명을 아카이브에 저장
+        
+        Args:
+            articles: 'id'가 있는 기사 목록
+            
+        Returns:
+            int: 저장한 서명 수
+        """
+        entries = [
+            (article['id'], self.minhasher.signature(self._normalize_text(self._article_text(article))))
+            for article in articles
+        ]
+        return self.signature_store.save_signatures(entries)
+    
+    def find_archive_duplicates(self, articles: List[Dict]) -> List[Dict]:
+        """
+        저장된 전체 아카이브에서 유사 기사 조회
+        
+        Args:
+            articles: 확인할 기사 목록
+            
+        Returns:
+            List[Dict]: {'article', 'archived_article_id', 'similarity', 'type'} 목록
+        """
+        try:
+            signatures = {
+                position: self.minhasher.signature(self._normalize_text(self._article_text(article)))
+                for position, article in enumerate(articles)
+            }
+            matches = self.signature_store.find_similar(signatures)
+            
+            archive_duplicates = []
+            for position, article in enumerate(articles):
+                for archived_article_id, similarity in matches.get(position, []):
+                    if archived_article_id == article.get('id'):
+                        continue
+                    archive_duplicates.append({
+                        'article': article,
+                        'archived_article_id': archived_article_id,
+                        'similarity': similarity,
+                        'type': 'archive'
+                    })
+            
+            return archive_duplicates
+            
+        except Exception as e:
+            logger.error(f"아카이브 중복 조회 중 오류 발생: {e}")
+            return []
+    
     def _calculate_content_hash(self, article: Dict) -> str:
         """콘텐츠 해시 계산"""
         try:
@@ -267,6 +427,26 @@ class DuplicateDetector:
     
     def _calculate_chunk_similarity(self, content1: str, content2: str) -> float:
         """청크 단위 유사도 계산"""
+        if self.chunk_similarity == 'winnowing':
+            return self._calculate_containment_similarity(content1, content2)
+        return self._calculate_chunk_similarity_with_sequence_matcher(content1, content2)
+    
+    def _calculate_containment_similarity(self, content1: str, content2: str) -> float:
+        """
+        winnowing 지문 포함도 계산 (정규화된 두 본문)
+        
+        청크 쌍마다 SequenceMatcher를 실행하는 대신 두 본문의 지문을 한 번씩 만들어 비교하므로
+        본문 길이에 비례하는 시간이 걸립니다.
+        """
+        try:
+            return mutual_containment(winnow_fingerprints(content1), winnow_fingerprints(content2))
+            
+        except Exception as e:
+            logger.error(f"포함도 계산 중 오류 발생: {e}")
+            return 0.0
+    
+    def _calculate_chunk_similarity_with_sequence_matcher(self, content1: str, content2: str) -> float:
+        """청크 단위 유사도 계산 (청크 쌍 SequenceMatcher 방식, 검증용)"""
         try:
             chunk_size = 500
             max_similarity = 0.0
@@ -290,84 +470,81 @@ class DuplicateDetector:
             return 0.0
     
     def _normalize_text(self, text: str) -> str:
-        """텍스트 정규화"""
+        """텍스트 정규화 (태그 제거, 특수 문자 공백 변환, 공백 정리, 소문자 변환)"""
         try:
-            # HTML 태그 제거
-            text = re.sub(r'<[^>]+>', '', text)
-            
-            # 특수 문자 제거
-            text = re.sub(r'[^\w\s가-힣]', ' ', text)
-            
-            # 공백 정리
-            text = re.sub(r'\s+', ' ', text)
-            
-            # 소문자 변환
-            text = text.lower()
-            
-            # 앞뒤 공백 제거
-            text = text.strip()
-            
-            return text
+            return normalize_for_comparison(text)
             
         except Exception as e:
             logger.error(f"텍스트 정규화 중 오류 발생: {e}")
             return text
     
-    def filter_duplicates(self, articles: List[Dict], 
-                         keep_strategy: str = 'latest') -> List[Dict]:
-        """중복 필터링"""
+    def filter_duplicates(self, articles: List[Dict], keep_strategy: str = 'latest',
+                          detectors: Iterable[str] = ('exact', 'similar')) -> List[Dict]:
+        """
+        중복 필터링
+        
+        중복 쌍을 묶은 그룹마다 대표 기사 하나만 남기므로, 세 건 이상이 서로 중복인 경우에도
+        그룹 전체에서 한 건만 유지됩니다.
+        
+        Args:
+            articles: 기사 목록
+            keep_strategy: 'latest'(created_at이 가장 늦은 기사) 또는 'first'(목록에서 가장 앞선 기사)
+            detectors: 사용할 감지기 ('exact', 'similar', 'title', 'content')
+            
+        Returns:
+            List[Dict]: 입력 순서를 유지한 필터링 결과
+        """
         try:
-            # 중복 감지
-            duplicates = self.detect_duplicates(articles)
-            
-            # 유지할 기사 결정
-            keep_articles = set()
-            remove_articles = set()
-            
-            # 정확한 중복 처리
-            for duplicate in duplicates['exact_duplicates']:
-                original = duplicate['original']
-                duplicate_article = duplicate['duplicate']
-                
-                if keep_strategy == 'latest':
-                    if original.get('created_at', '') < duplicate_article.get('created_at', ''):
-                        keep_articles.add(duplicate_article['id'])
-                        remove_articles.add(original['id'])
-                    else:
-                        keep_articles.add(original['id'])
-                        remove_articles.add(duplicate_article['id'])
-                else:  # 'first'
-                    keep_articles.add(original['id'])
-                    remove_articles.add(duplicate_article['id'])
-            
-            # 유사한 중복 처리
-            for duplicate in duplicates['similar_duplicates']:
-                article1 = duplicate['article1']
-                article2 = duplicate['article2']
-                
-                if keep_strategy == 'latest':
-                    if article1.get('created_at', '') < article2.get('created_at', ''):
-                        keep_articles.add(article2['id'])
-                        remove_articles.add(article1['id'])
-                    else:
-                        keep_articles.add(article1['id'])
-                        remove_articles.add(article2['id'])
-                else:  # 'first'
-                    keep_articles.add(article1['id'])
-                    remove_articles.add(article2['id'])
-            
-            # 필터링된 기사 반환
-            filtered_articles = [
-                article for article in articles 
-                if article['id'] not in remove_articles
-            ]
+            keep_positions = set()
+            for cluster in self._cluster_positions(articles, detectors):
+                keep_positions.add(self._select_representative(articles, cluster, keep_strategy))
             
-            return filtered_articles
+            return [article for position, article in enumerate(articles) if position in keep_positions]
             
         except Exception as e:
             logger.error(f"중복 필터링 중 오류 발생: {e}")
             return articles
     
+    def cluster_duplicates(self, articles: List[Dict],
+                           detectors: Iterable[str] = ('exact', 'similar')) -> List[List[Dict]]:
+        """
+        중복 쌍을 연결해 중복 그룹 구성 (중복이 없는 기사는 한 건짜리 그룹)
+        
+        Args:
+            articles: 기사 목록
+            detectors: 사용할 감지기 ('exact', 'similar', 'title', 'content')
+            
+        Returns:
+            List[List[Dict]]: 그룹 목록 (그룹과 그룹 내 기사는 입력 순서)
+        """
+        return [
+            [articles[position] for position in cluster]
+            for cluster in self._cluster_positions(articles, detectors)
+        ]
+    
+    def _cluster_positions(self, articles: List[Dict], detectors: Iterable[str]) -> List[List[int]]:
+        """선택한 감지기의 중복 쌍을 union-find로 묶은 기사 위치 그룹"""
+        positions = {id(article): position for position, article in enumerate(articles)}
+        clusters = UnionFind(len(articles))
+        
+        for detector in detectors:
+            if detector not in DUPLICATE_DETECTORS:
+                raise ValueError(f"알 수 없는 중복 감지기: {detector}")
+            
+            method_name, first_key, second_key = DUPLICATE_DETECTORS[detector]
+            for duplicate in getattr(self, method_name)(articles):
+                clusters.union(positions[id(duplicate[first_key])],
+                               positions[id(duplicate[second_key])])
+        
+        return clusters.groups()
+    
+    def _select_representative(self, articles: List[Dict], cluster: List[int],
+                               keep_strategy: str) -> int:
+        """그룹에서 유지할 기사 위치 (latest는 created_at이 같으면 앞선 기사)"""
+        if keep_strategy == 'latest':
+            return max(cluster, key=lambda position: (articles[position].get('created_at', ''), -position))
+        return cluster[0]
+    
     def get_duplicate_statistics(self, articles: List[Dict]) -> Dict:
         """중복 통계 조회"""
         try:
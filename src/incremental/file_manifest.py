@@ -0,0 +1,200 @@
+"""
+증분 처리용 파일 지문(manifest) 관리
+
+파일 경로별 크기, 수정 시간(ns), 내용 해시를 저장해 두고 다시 스캔할 때
+크기와 수정 시간이 같은 파일은 읽지 않고 건너뜁니다. 내용 해시는 인덱스로 조회하므로
+이전 실행에서 처리한 파일과 내용이 같은 파일도 바로 찾을 수 있습니다.
+"""
+import os
+import logging
+import threading
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import delete, insert, select
+
+from ..database.connection import get_db
+from ..database.models import FileManifest
+
+logger = logging.getLogger(__name__)
+
+# IN (...) 조회 및 저장 시 한 번에 넘기는 값 수 (SQLite 바인드 변수 제한 고려)
+MANIFEST_CHUNK_SIZE = 500
+
+
+class FileManifestManager:
+    """파일 지문 목록 관리자"""
+
+    def __init__(self, flush_size: int = 500):
+        """
+        초기화
+
+        Args:
+            flush_size: 기록 대기 항목이 이 수에 도달하면 DB에 저장
+        """
+        self.flush_size = flush_size
+        # 스캔 시 조회한 파일 상태: 경로 -> (크기, 수정 시간 ns)
+        self._scanned_stats: Dict[str, Tuple[int, int]] = {}
+        # 해시 계산 후 처리 완료를 기다리는 항목: 경로 -> 해시
+        self._pending_hashes: Dict[str, str] = {}
+        # DB 저장 대기 항목: 경로 -> (크기, 수정 시간 ns, 해시)
+        self._unflushed: Dict[str, Tuple[int, int, str]] = {}
+        self._lock = threading.Lock()
+
+    def scan_changed_files(self, directory: str,
+                           min_mtime_ns: Optional[int] = None) -> List[str]:
+        """
+        manifest와 크기 또는 수정 시간이 다른 XML 파일 목록 조회
+
+        Args:
+            directory: XML 디렉토리 경로
+            min_mtime_ns: manifest에 없는 파일은 이 시간 이후 수정된 경우만 포함
+
+        Returns:
+            List[str]: 새로 추가되었거나 변경된 파일 경로
+        """
+        known = self.load_entries(directory)
+        changed_files = []
+
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if not entry.name.endswith('.xml') or not entry.is_file():
+                    continue
+
+                stat = entry.stat()
+                file_stat = (stat.st_size, stat.st_mtime_ns)
+                known_entry = known.get(entry.path)
+
+                if known_entry is not None:
+                    if known_entry == file_stat:
+                        continue
+                elif min_mtime_ns is not None and stat.st_mtime_ns <= min_mtime_ns:
+                    continue
+
+                self._scanned_stats[entry.path] = file_stat
+                changed_files.append(entry.path)
+
+        logger.info(f"manifest 비교 결과 변경 파일 {len(changed_files)}개 (기존 {len(known)}개)")
+        return changed_files
+
+    def load_entries(self, directory: str) -> Dict[str, Tuple[int, int]]:
+        """디렉토리 아래 파일의 manifest 항목 조회 (경로 -> (크기, 수정 시간 ns))"""
+        prefix = os.path.join(directory, '')
+        db = next(get_db())
+        try:
+            # 행 수가 많으므로 ORM 조회 대신 Core select로 튜플만 읽음
+            rows = db.connection().execute(
+                select(FileManifest.file_path, FileManifest.file_size, FileManifest.mtime_ns)
+                .where(FileManifest.file_path.startswith(prefix, autoescape=True))
+            )
+
+            return {file_path: (file_size, mtime_ns) for file_path, file_size, mtime_ns in rows}
+
+        except Exception as e:
+            logger.error(f"manifest 조회 중 오류 발생: {e}")
+            return {}
+        finally:
+            db.close()
+
+    def find_known_hashes(self, content_hashes: Iterable[str]) -> Set[str]:
+        """이미 manifest에 기록된 내용 해시 조회"""
+        hash_set = set(content_hashes)
+        content_hashes = list(hash_set)
+        known = set()
+
+        with self._lock:
+            known.update(h for _, _, h in self._unflushed.values() if h in hash_set)
+
+        db = next(get_db())
+        try:
+            for i in range(0, len(content_hashes), MANIFEST_CHUNK_SIZE):
+                chunk = content_hashes[i:i + MANIFEST_CHUNK_SIZE]
+                known.update(
+                    row[0] for row in db.query(FileManifest.content_hash).filter(
+                        FileManifest.content_hash.in_(chunk)
+                    ).distinct()
+                )
+            return known
+
+        except Exception as e:
+            logger.error(f"manifest 해시 조회 중 오류 발생: {e}")
+            return known
+        finally:
+            db.close()
+
+    def set_pending_hash(self, file_path: str, content_hash: str):
+        """해시를 계산했지만 아직 처리되지 않은 파일 등록"""
+        with self._lock:
+            self._pending_hashes[file_path] = content_hash
+
+    def record(self, file_path: str, content_hash: Optional[str] = None):
+        """
+        처리가 끝난 파일을 manifest에 기록 (flush_size마다 DB에 저장)
+
+        content_hash를 생략하면 set_pending_hash로 등록한 해시를 사용합니다.
+        """
+        with self._lock:
+            if content_hash is None:
+                content_hash = self._pending_hashes.pop(file_path, None)
+            else:
+                self._pending_hashes.pop(file_path, None)
+
+            if content_hash is None:
+                return
+
+            file_stat = self._scanned_stats.pop(file_path, None)
+            if file_stat is None:
+                try:
+                    stat = os.stat(file_path)
+                    file_stat = (stat.st_size, stat.st_mtime_ns)
+                except OSError as e:
+                    logger.error(f"파일 상태 조회 중 오류 발생: {file_path}, {e}")
+                    return
+
+            self._unflushed[file_path] = (file_stat[0], file_stat[1], content_hash)
+            should_flush = len(self._unflushed) >= self.flush_size
+
+        if should_flush:
+            self.flush()
+
+    def flush(self) -> int:
+        """기록 대기 항목을 DB에 저장 (같은 경로의 기존 항목은 교체)"""
+        with self._lock:
+            entries = self._unflushed
+            self._unflushed = {}
+
+        if not entries:
+            return 0
+
+        db = next(get_db())
+        try:
+            connection = db.connection()
+            file_paths = list(entries)
+
+            for i in range(0, len(file_paths), MANIFEST_CHUNK_SIZE):
+                chunk = file_paths[i:i + MANIFEST_CHUNK_SIZE]
+                connection.execute(
+                    delete(FileManifest.__table__).where(FileManifest.file_path.in_(chunk))
+                )
+                connection.execute(insert(FileManifest.__table__), [
+                    {
+                        'file_path': file_path,
+                        'file_size': entries[file_path][0],
+                        'mtime_ns': entries[file_path][1],
+                        'content_hash': entries[file_path][2]
+                    }
+                    for file_path in chunk
+                ])
+
+            db.commit()
+            return len(entries)
+
+        except Exception as e:
+            db.rollback()
+            logger.error(f"manifest 저장 중 오류 발생: {e}")
+            # 다음 flush에서 다시 시도
+            with self._lock:
+                for file_path, entry in entries.items():
+                    self._unflushed.setdefault(file_path, entry)
+            return 0
+        finally:
+            db.close()
@@ -8,14 +8,18 @@ from typing import List, Dict, Optional, Tuple, Set
 from datetime import datetime, timedelta
 import json
 import asyncio
+import threading
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from ..database.connection import get_db
 from ..database.models import Article, ProcessingLog, VectorIndex
 from ..embedding.embedding_service import EmbeddingService
 from ..vector_search.vector_indexer import VectorIndexer
+from ..vector_search.article_hydrator import get_article_hydrator
 from .duplicate_detector import DuplicateDetector
-from .content_hasher import ContentHasher
+from .content_hasher import ContentHasher, get_file_hash_factory
+from .pipeline import StagedPipeline, PipelineStage
+from .file_manifest import FileManifestManager
 
 logger = logging.getLogger(__name__)
 
@@ -31,10 +35,26 @@ class IncrementalProcessor:
         self.content_hasher = ContentHasher()
         self.batch_size = 50
         self.max_workers = 4
+        # 파이프라인 단계 사이 큐 크기 (단계별로 대기 가능한 최대 항목 수)
+        self.pipeline_queue_size = 200
+        self.pipeline = None
+        # 파일 지문 manifest (크기/수정 시간이 같은 파일은 다시 읽지 않음)
+        self.use_file_manifest = True
+        self.file_manifest = FileManifestManager()
+        # 파일 해시 알고리즘 (변경 시 이전 manifest 해시와는 비교되지 않음) 및 해시 계산 스레드 수
+        self.file_hash_algorithm = os.getenv('FILE_HASH_ALGORITHM', 'md5')
+        get_file_hash_factory(self.file_hash_algorithm)  # 잘못된 설정은 시작할 때 바로 오류
+        self.hash_workers = int(os.getenv('FILE_HASH_WORKERS', '8'))
     
     def process_incremental_articles(self, xml_directory: str, 
                                    last_processed_time: Optional[datetime] = None) -> Dict:
-        """증분형 기사 처리"""
+        """
+        증분형 기사 처리
+        
+        중복 파일 필터링 → 파싱/저장 → 임베딩 → 벡터 인덱스 업데이트를 크기가 제한된 큐로 연결한
+        파이프라인으로 실행하므로 단계들이 동시에 진행됩니다. 단계별 처리량과 큐 깊이는
+        결과의 pipeline_stats 또는 실행 중 get_pipeline_stats()로 확인할 수 있습니다.
+        """
         try:
             start_time = datetime.utcnow()
             
@@ -50,17 +70,67 @@ class IncrementalProcessor:
                     'error_count': 0
                 }
             
-            # 2. 중복 파일 필터링
-            unique_files = self._filter_duplicate_files(new_files)
-            
-            # 3. 배치 처리
-            results = self._process_batch_files(unique_files)
-            
-            # 4. 벡터 임베딩 생성
-            embedding_results = self._process_embeddings(results['processed_articles'])
+            # 2~5. 중복 필터링, 파싱/저장, 임베딩, 인덱스 업데이트 파이프라인
+            counts = {
+                'unique_files': 0,
+                'processed_count': 0,
+                'duplicate_count': 0,
+                'error_count': 0,
+                'embedded_count': 0,
+                'indexed_count': 0
+            }
+            counts_lock = threading.Lock()
+            processed_hashes = set()
             
-            # 5. 벡터 인덱스 업데이트
-            index_results = self._update_vector_index(embedding_results)
+            def filter_stage(file_paths):
+                unique_files = self._filter_duplicate_files(file_paths, processed_hashes)
+                with counts_lock:
+                    counts['unique_files'] += len(unique_files)
+                return unique_files
+            
+            def parse_stage(file_paths):
+                articles = []
+                for file_path in file_paths:
+                    result = self._process_single_file(file_path)
+                    # 오류가 난 파일은 manifest에 기록하지 않아 다음 실행에서 다시 처리
+                    if self.use_file_manifest and result['status'] in ('success', 'duplicate'):
+                        self.file_manifest.record(file_path)
+                    with counts_lock:
+                        if result['status'] == 'success':
+                            counts['processed_count'] += 1
+                            articles.append(result['article'])
+                        elif result['status'] == 'duplicate':
+                            counts['duplicate_count'] += 1
+                        else:
+                            counts['error_count'] += 1
+                return articles
+            
+            def embedding_stage(articles):
+                embedding_results = self._process_embeddings(articles)
+                with counts_lock:
+                    counts['embedded_count'] += embedding_results['embedded_count']
+                # 인덱스 단계가 배치 단위로 받도록 임베딩 목록 하나를 항목으로 전달
+                return [embedding_results['embeddings']] if embedding_results['embeddings'] else []
+            
+            def index_stage(embedding_batches):
+                for embeddings in embedding_batches:
+                    index_results = self._update_vector_index(embeddings)
+                    with counts_lock:
+                        counts['indexed_count'] += index_results['indexed_count']
+            
+            self.pipeline = StagedPipeline([
+                PipelineStage('filter_duplicates', filter_stage,
+                              batch_size=self.batch_size, queue_size=self.pipeline_queue_size),
+                PipelineStage('parse_and_save', parse_stage, workers=self.max_workers,
+                              queue_size=self.pipeline_queue_size),
+                PipelineStage('embedding', embedding_stage,
+                              batch_size=self.batch_size, queue_size=self.pipeline_queue_size),
+                PipelineStage('vector_index', index_stage,
+                              queue_size=max(1, self.pipeline_queue_size // self.batch_size))
+            ])
+            pipeline_stats = self.pipeline.run(new_files)
+            if self.use_file_manifest:
+                self.file_manifest.flush()
             
             processing_time = (datetime.utcnow() - start_time).total_seconds()
             
@@ -68,13 +138,14 @@ class IncrementalProcessor:
                 'status': 'success',
                 'message': '증분형 처리 완료',
                 'total_files': len(new_files),
-                'unique_files': len(unique_files),
-                'processed_count': results['processed_count'],
-                'duplicate_count': results['duplicate_count'],
-                'error_count': results['error_count'],
-                'embedded_count': embedding_results['embedded_count'],
-                'indexed_count': index_results['indexed_count'],
+                'unique_files': counts['unique_files'],
+                'processed_count': counts['processed_count'],
+                'duplicate_count': counts['duplicate_count'],
+                'error_count': counts['error_count'],
+                'embedded_count': counts['embedded_count'],
+                'indexed_count': counts['indexed_count'],
                 'processing_time': processing_time,
+                'pipeline_stats': pipeline_stats,
                 'timestamp': datetime.utcnow().isoformat()
             }
             
@@ -88,9 +159,20 @@ class IncrementalProcessor:
                 'error_count': 0
             }
     
+    def get_pipeline_stats(self) -> Dict:
+        """현재(또는 마지막) 파이프라인의 단계별 처리량 및 큐 깊이 조회"""
+        if self.pipeline is None:
+            return {}
+        return self.pipeline.get_stats()
+    
     def _detect_new_files(self, xml_directory: str, 
                          last_processed_time: Optional[datetime]) -> List[str]:
-        """새로운 파일 감지"""
+        """
+        새로운 파일 감지
+        
+        manifest를 사용하면 크기와 수정 시간이 기록과 같은 파일은 건너뛰고,
+        manifest에 없는 파일은 기존처럼 last_processed_time 이후 수정된 경우만 포함합니다.
+        """
         try:
             from pathlib import Path
             
@@ -98,6 +180,15 @@ class IncrementalProcessor:
             if not xml_path.exists():
                 return []
             
+            if self.use_file_manifest:
+                min_mtime_ns = (
+                    int(last_processed_time.timestamp() * 1_000_000_000)
+                    if last_processed_time else None
+                )
+                new_files = self.file_manifest.scan_changed_files(str(xml_path), min_mtime_ns)
+                logger.info(f"새로운 파일 {len(new_files)}개 감지")
+                return new_files
+            
             # 모든 XML 파일 조회
             all_files = list(xml_path.glob("*.xml"))
             
@@ -118,21 +209,40 @@ class IncrementalProcessor:
             logger.error(f"새로운 파일 감지 중 오류 발생: {e}")
             return []
     
-    def _filter_duplicate_files(self, file_paths: List[str]) -> List[str]:
-        """중복 파일 필터링"""
+    def _filter_duplicate_files(self, file_paths: List[str],
+                                processed_hashes: Optional[Set[str]] = None) -> List[str]:
+        """
+        중복 파일 필터링 (processed_hashes를 넘기면 호출 간에 해시 집합 공유)
+        
+        manifest를 사용하면 이전 실행에서 기록된 내용 해시와도 비교하며,
+        중복 파일은 바로 manifest에 기록해 다음 스캔에서 읽지 않도록 합니다.
+        """
         try:
             unique_files = []
-            processed_hashes = set()
-            
-            for file_path in file_paths:
-                # 파일 해시 계산
-                file_hash = self.content_hasher.calculate_file_hash(file_path)
-                
-                if file_hash not in processed_hashes:
+            if processed_hashes is None:
+                processed_hashes = set()
+            
+            # 파일 해시 병렬 계산
+            file_hashes = list(zip(file_paths, self.content_hasher.calculate_file_hashes(
+                file_paths, self.file_hash_algorithm, self.hash_workers
+            )))
+            
+            known_hashes = set()
+            if self.use_file_manifest:
+                known_hashes = self.file_manifest.find_known_hashes(
+                    file_hash for _, file_hash in file_hashes if file_hash
+                )
+            
+            for file_path, file_hash in file_hashes:
+                if file_hash not in processed_hashes and file_hash not in known_hashes:
                     processed_hashes.add(file_hash)
                     unique_files.append(file_path)
+                    if self.use_file_manifest and file_hash:
+                        self.file_manifest.set_pending_hash(file_path, file_hash)
                 else:
                     logger.info(f"중복 파일 제외: {file_path}")
+                    if self.use_file_manifest and file_hash:
+                        self.file_manifest.record(file_path, file_hash)
             
             logger.info(f"중복 제거 후 {len(unique_files)}개 파일")
             return unique_files
@@ -340,6 +450,8 @@ class IncrementalProcessor:
                     article.is_embedded = True
                     
                     db.commit()
+                    # 다시 임베딩된 기사는 캐시된 검색 결과 카드가 오래되었을 수 있음
+                    get_article_hydrator().invalidate([article.id])
                 
             finally:
                 db.close()
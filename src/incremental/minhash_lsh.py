@@ -0,0 +1,318 @@
+"""
+MinHash/LSH 유사 중복 탐지 엔진
+
+정규화된 텍스트의 문자 n-gram(shingle) 집합으로 MinHash 서명을 만들고, 서명을 밴드로 나눠
+LSH 버킷에 넣습니다. 같은 버킷을 공유하는 기사 쌍만 후보로 비교하고, 유사도는 두 서명에서
+일치하는 위치의 비율(Jaccard 추정치)로 계산합니다.
+서명과 버킷은 DB에도 저장하므로 새 기사를 현재 배치뿐 아니라 전체 아카이브와 비교할 수 있습니다.
+"""
+import hashlib
+import logging
+from collections import defaultdict
+from typing import Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+from sqlalchemy import delete, insert, select
+
+from ..database.connection import get_db
+from ..database.models import ArticleMinHash, MinHashBucket
+from ..simhash import char_shingle_hashes
+
+logger = logging.getLogger(__name__)
+
+# shingle이 없는 (빈) 텍스트의 서명 값
+MAX_HASH = np.uint32(0xFFFFFFFF)
+# IN (...) 조회 및 저장 시 한 번에 넘기는 값 수 (SQLite 바인드 변수 제한 고려)
+MINHASH_CHUNK_SIZE = 500
+
+
+def estimate_jaccard(signature1: np.ndarray, signature2: np.ndarray) -> float:
+    """두 MinHash 서명의 Jaccard 유사도 추정치"""
+    return float(np.count_nonzero(signature1 == signature2)) / len(signature1)
+
+
+def optimal_lsh_params(threshold: float, num_perm: int) -> Tuple[int, int]:
+    """
+    임계값에서 거짓 양성/거짓 음성 확률 합이 최소가 되는 (밴드 수, 밴드당 행 수)
+
+    Args:
+        threshold: Jaccard 유사도 임계값
+        num_perm: 서명 길이
+
+    Returns:
+        Tuple[int, int]: (bands, rows)
+    """
+    similarities = np.linspace(0.0, 1.0, 201)
+    step = similarities[1] - similarities[0]
+    best_params = (num_perm, 1)
+    best_error = float('inf')
+
+    for bands in range(1, num_perm + 1):
+        rows = num_perm // bands
+        # 후보가 될 확률: 하나 이상의 밴드가 모두 일치
+        probability = 1.0 - (1.0 - similarities ** rows) ** bands
+        below = similarities <= threshold
+        false_positive = probability[below].sum() * step
+        false_negative = (1.0 - probability[~below]).sum() * step
+        error = false_positive + false_negative
+
+        if error < best_error:
+            best_error = error
+            best_params = (bands, rows)
+
+    return best_params
+
+
+class MinHasher:
+    """문자 n-gram MinHash 서명 생성기"""
+
+    def __init__(self, num_perm: int = 128, shingle_size: int = 5, seed: int = 1):
+        """
+        초기화
+
+        Args:
+            num_perm: 서명 길이 (해시 함수 수)
+            shingle_size: shingle 문자 수
+            seed: 해시 함수 계수 시드 (저장된 서명과 비교하려면 같은 값을 사용)
+        """
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+
+        # 곱셈-시프트 해시 h(x) = ((a * x + b) mod 2^64) >> 32, a는 홀수
+        rng = np.random.RandomState(seed)
+        self._a = (rng.randint(0, 1 << 62, size=num_perm, dtype=np.uint64) << np.uint64(1)) | np.uint64(1)
+        self._b = rng.randint(0, 1 << 62, size=num_perm, dtype=np.uint64)
+
+    def shingle_hashes(self, text: str) -> np.ndarray:
+        """정규화된 텍스트의 고유 shingle 해시 배열"""
+        return np.unique(char_shingle_hashes(text, self.shingle_size))
+
+    def signature(self, text: str) -> np.ndarray:
+        """정규화된 텍스트의 MinHash 서명 (uint32 배열)"""
+        shingles = self.shingle_hashes(text)
+        if len(shingles) == 0:
+            return np.full(self.num_perm, MAX_HASH, dtype=np.uint32)
+
+        hashed = (self._a[:, None] * shingles[None, :] + self._b[:, None]) >> np.uint64(32)
+        return hashed.min(axis=1).astype(np.uint32)
+
+    def signatures(self, texts: Iterable[str]) -> List[np.ndarray]:
+        """여러 텍스트의 MinHash 서명"""
+        return [self.signature(text) for text in texts]
+
+
+def is_empty_signature(signature: np.ndarray) -> bool:
+    """shingle이 없는 텍스트의 서명인지 여부"""
+    return bool(signature[0] == MAX_HASH) and bool((signature == MAX_HASH).all())
+
+
+class MinHashLSHIndex:
+    """밴드 LSH 메모리 인덱스"""
+
+    def __init__(self, threshold: float = 0.8, num_perm: int = 128,
+                 params: Optional[Tuple[int, int]] = None):
+        """
+        초기화
+
+        Args:
+            threshold: Jaccard 유사도 임계값
+            num_perm: 서명 길이
+            params: (밴드 수, 밴드당 행 수), 생략 시 임계값에 맞춰 계산
+        """
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands, self.rows = params or optimal_lsh_params(threshold, num_perm)
+        self.buckets: Dict[str, List[Hashable]] = defaultdict(list)
+        self.signatures: Dict[Hashable, np.ndarray] = {}
+
+    def band_keys(self, signature: np.ndarray) -> List[str]:
+        """서명의 밴드별 버킷 키 ("밴드 설정:밴드 번호:밴드 해시")"""
+        keys = []
+        for band in range(self.bands):
+            start = band * self.rows
+            digest = hashlib.blake2b(
+                signature[start:start + self.rows].tobytes(), digest_size=8
+            ).hexdigest()
+            keys.append(f"{self.bands}x{self.rows}:{band}:{digest}")
+        return keys
+
+    def add(self, key: Hashable, signature: np.ndarray):
+        """서명 추가 (빈 텍스트 서명은 후보를 만들지 않도록 버킷에 넣지 않음)"""
+        self.signatures[key] = signature
+        if is_empty_signature(signature):
+            return
+        for band_key in self.band_keys(signature):
+            self.buckets[band_key].append(key)
+
+    def query(self, signature: np.ndarray) -> Set[Hashable]:
+        """서명과 버킷을 공유하는 키 집합"""
+        if is_empty_signature(signature):
+            return set()
+        candidates = set()
+        for band_key in self.band_keys(signature):
+            candidates.update(self.buckets.get(band_key, ()))
+        return candidates
+
+    def candidate_pairs(self) -> Set[Tuple[Hashable, Hashable]]:
+        """버킷을 하나 이상 공유하는 키 쌍 (추가 순서대로 정렬된 쌍)"""
+        order = {key: position for position, key in enumerate(self.signatures)}
+        pairs = set()
+        for members in self.buckets.values():
+            if len(members) < 2:
+                continue
+            for i, key1 in enumerate(members):
+                for key2 in members[i + 1:]:
+                    if order[key1] > order[key2]:
+                        key1, key2 = key2, key1
+                    pairs.add((key1, key2))
+        return pairs
+
+    def similar_pairs(self) -> List[Tuple[Hashable, Hashable, float]]:
+        """후보 쌍 중 Jaccard 추정치가 임계값 이상인 쌍 (키1, 키2, 유사도)"""
+        order = {key: position for position, key in enumerate(self.signatures)}
+        results = []
+        for key1, key2 in sorted(self.candidate_pairs(), key=lambda pair: (order[pair[0]], order[pair[1]])):
+            similarity = estimate_jaccard(self.signatures[key1], self.signatures[key2])
+            if similarity >= self.threshold:
+                results.append((key1, key2, similarity))
+        return results
+
+
+class MinHashSignatureStore:
+    """기사 MinHash 서명 및 LSH 버킷 DB 저장소"""
+
+    def __init__(self, index: MinHashLSHIndex):
+        """
+        초기화
+
+        Args:
+            index: 버킷 키 계산에 사용할 LSH 설정 (저장 시와 조회 시 같은 설정 사용)
+        """
+        self.index = index
+
+    def save_signatures(self, entries: List[Tuple[str, np.ndarray]]) -> int:
+        """
+        기사 서명 저장 (같은 기사의 기존 서명과 버킷은 교체)
+
+        Args:
+            entries: (기사 ID, 서명) 목록
+
+        Returns:
+            int: 저장한 서명 수
+        """
+        if not entries:
+            return 0
+
+        db = next(get_db())
+        try:
+            connection = db.connection()
+
+            for i in range(0, len(entries), MINHASH_CHUNK_SIZE):
+                chunk = entries[i:i + MINHASH_CHUNK_SIZE]
+                article_ids = [article_id for article_id, _ in chunk]
+
+                connection.execute(
+                    delete(ArticleMinHash.__table__).where(ArticleMinHash.article_id.in_(article_ids))
+                )
+                connection.execute(
+                    delete(MinHashBucket.__table__).where(MinHashBucket.article_id.in_(article_ids))
+                )
+                connection.execute(insert(ArticleMinHash.__table__), [
+                    {
+                        'article_id': article_id,
+                        'signature': signature.astype(np.uint32).tobytes(),
+                        'num_perm': len(signature)
+                    }
+                    for article_id, signature in chunk
+                ])
+
+                bucket_rows = [
+                    {'bucket_key': band_key, 'article_id': article_id}
+                    for article_id, signature in chunk
+                    if not is_empty_signature(signature)
+                    for band_key in self.index.band_keys(signature)
+                ]
+                if bucket_rows:
+                    connection.execute(insert(MinHashBucket.__table__), bucket_rows)
+
+            db.commit()
+            return len(entries)
+
+        except Exception as e:
+            db.rollback()
+            logger.error(f"MinHash 서명 저장 중 오류 발생: {e}")
+            return 0
+        finally:
+            db.close()
+
+    def find_similar(self, signatures: Dict[Hashable, np.ndarray],
+                     threshold: Optional[float] = None) -> Dict[Hashable, List[Tuple[str, float]]]:
+        """
+        저장된 기사 중 서명별 유사 기사 조회
+
+        Args:
+            signatures: 조회 키 -> 서명
+            threshold: Jaccard 유사도 임계값 (생략 시 인덱스 임계값)
+
+        Returns:
+            Dict: 조회 키 -> [(기사 ID, 유사도)] (유사도 내림차순)
+        """
+        threshold = self.index.threshold if threshold is None else threshold
+        query_keys = {
+            key: self.index.band_keys(signature)
+            for key, signature in signatures.items()
+            if not is_empty_signature(signature)
+        }
+        results = {key: [] for key in signatures}
+        if not query_keys:
+            return results
+
+        db = next(get_db())
+        try:
+            connection = db.connection()
+
+            # 1. 밴드 버킷으로 후보 기사 조회
+            bucket_members = defaultdict(set)
+            all_band_keys = list({band_key for keys in query_keys.values() for band_key in keys})
+            for i in range(0, len(all_band_keys), MINHASH_CHUNK_SIZE):
+                chunk = all_band_keys[i:i + MINHASH_CHUNK_SIZE]
+                for bucket_key, article_id in connection.execute(
+                    select(MinHashBucket.bucket_key, MinHashBucket.article_id)
+                    .where(MinHashBucket.bucket_key.in_(chunk))
+                ):
+                    bucket_members[bucket_key].add(article_id)
+
+            candidates = {
+                key: set().union(*(bucket_members.get(band_key, ()) for band_key in keys))
+                for key, keys in query_keys.items()
+            }
+
+            # 2. 후보 기사 서명만 읽어 Jaccard 추정
+            candidate_ids = list(set().union(*candidates.values()))
+            stored = {}
+            for i in range(0, len(candidate_ids), MINHASH_CHUNK_SIZE):
+                chunk = candidate_ids[i:i + MINHASH_CHUNK_SIZE]
+                for article_id, signature in connection.execute(
+                    select(ArticleMinHash.article_id, ArticleMinHash.signature)
+                    .where(ArticleMinHash.article_id.in_(chunk))
+                ):
+                    stored[article_id] = np.frombuffer(signature, dtype=np.uint32)
+
+            for key, article_ids in candidates.items():
+                matches = []
+                for article_id in article_ids:
+                    stored_signature = stored.get(article_id)
+                    if stored_signature is None or len(stored_signature) != len(signatures[key]):
+                        continue
+                    similarity = estimate_jaccard(signatures[key], stored_signature)
+                    if similarity >= threshold:
+                        matches.append((article_id, similarity))
+                results[key] = sorted(matches, key=lambda match: (-match[1], match[0]))
+
+            return results
+
+        except Exception as e:
+            logger.error(f"MinHash 유사 기사 조회 중 오류 발생: {e}")
+            return results
+        finally:
+            db.close()
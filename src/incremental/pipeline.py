@@ -0,0 +1,210 @@
+"""
+단계별 파이프라인 실행기
+
+각 단계를 별도 스레드에서 실행하고 단계 사이를 크기가 제한된 큐로 연결합니다.
+앞 단계가 전체 작업을 끝내기 전에 다음 단계가 시작되며, 느린 단계 앞에 쌓이는
+항목 수는 큐 크기로 제한됩니다 (큐가 가득 차면 앞 단계가 대기).
+"""
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# 스트림 종료 표시
+_END_OF_STREAM = object()
+
+
+@dataclass
+class PipelineStage:
+    """파이프라인 단계 정의"""
+    name: str
+    # 입력 항목 배치를 받아 다음 단계로 넘길 항목들을 반환
+    func: Callable[[List], Optional[Iterable]]
+    workers: int = 1
+    batch_size: int = 1
+    queue_size: int = 100
+
+
+class StagedPipeline:
+    """단계별 파이프라인"""
+
+    def __init__(self, stages: List[PipelineStage], batch_timeout: float = 1.0):
+        """
+        초기화
+
+        Args:
+            stages: 순서대로 연결할 단계 목록
+            batch_timeout: 배치를 채우기 위해 다음 항목을 기다리는 최대 시간 (초)
+        """
+        self.stages = stages
+        self.batch_timeout = batch_timeout
+        self.queues = [queue.Queue(maxsize=stage.queue_size) for stage in stages]
+        self._lock = threading.Lock()
+        self._remaining_workers = [stage.workers for stage in stages]
+        self._stats = [
+            {
+                'items_in': 0,
+                'items_out': 0,
+                'errors': 0,
+                'batches': 0,
+                'busy_time': 0.0,
+                'max_queue_depth': 0
+            }
+            for _ in stages
+        ]
+        self.start_time = None
+        self.end_time = None
+
+    def run(self, items: Iterable) -> Dict:
+        """
+        파이프라인 실행
+
+        Args:
+            items: 첫 번째 단계에 넣을 항목 (지연 이터러블 가능)
+
+        Returns:
+            Dict: 단계별 처리 통계
+        """
+        self.start_time = time.monotonic()
+        threads = []
+
+        for index, stage in enumerate(self.stages):
+            for worker_number in range(stage.workers):
+                thread = threading.Thread(
+                    target=self._run_worker,
+                    args=(index,),
+                    name=f"pipeline-{stage.name}-{worker_number}",
+                    daemon=True
+                )
+                thread.start()
+                threads.append(thread)
+
+        # 첫 번째 큐가 가득 차면 여기서 대기하므로 입력도 필요한 만큼만 읽음
+        try:
+            for item in items:
+                self.queues[0].put(item)
+        except Exception as e:
+            logger.error(f"파이프라인 입력 처리 중 오류 발생: {e}")
+        finally:
+            for _ in range(self.stages[0].workers):
+                self.queues[0].put(_END_OF_STREAM)
+
+        for thread in threads:
+            thread.join()
+
+        self.end_time = time.monotonic()
+        stats = self.get_stats()
+        logger.info(f"파이프라인 처리 완료: {stats}")
+        return stats
+
+    def get_stats(self) -> Dict:
+        """단계별 처리량, 큐 깊이 및 병목 단계 조회 (실행 중에도 호출 가능)"""
+        if self.start_time is None:
+            elapsed = 0.0
+        else:
+            elapsed = (self.end_time or time.monotonic()) - self.start_time
+
+        stages = {}
+        bottleneck = None
+        max_utilization = -1.0
+
+        with self._lock:
+            for index, stage in enumerate(self.stages):
+                stats = dict(self._stats[index])
+                stats['queue_depth'] = self.queues[index].qsize()
+                stats['queue_size'] = stage.queue_size
+                stats['workers'] = stage.workers
+                stats['items_per_second'] = (
+                    stats['items_in'] / stats['busy_time'] * stage.workers
+                    if stats['busy_time'] > 0 else 0.0
+                )
+                # 단계 워커들이 실제로 작업한 시간 비율
+                stats['utilization'] = (
+                    stats['busy_time'] / (elapsed * stage.workers) if elapsed > 0 else 0.0
+                )
+                stages[stage.name] = stats
+
+                if stats['utilization'] > max_utilization:
+                    max_utilization = stats['utilization']
+                    bottleneck = stage.name
+
+        return {
+            'elapsed_time': elapsed,
+            'bottleneck': bottleneck,
+            'stages': stages
+        }
+
+    def _run_worker(self, index: int):
+        """단계 워커: 입력 큐에서 배치를 꺼내 처리하고 결과를 다음 큐에 넣음"""
+        stage = self.stages[index]
+        input_queue = self.queues[index]
+        output_queue = self.queues[index + 1] if index + 1 < len(self.stages) else None
+
+        finished = False
+        while not finished:
+            batch, finished = self._next_batch(index, input_queue, stage.batch_size)
+            if not batch:
+                continue
+
+            start = time.monotonic()
+            try:
+                outputs = list(stage.func(batch) or [])
+                errors = 0
+            except Exception as e:
+                logger.error(f"파이프라인 단계 처리 중 오류 발생: {stage.name}, {e}")
+                outputs = []
+                errors = len(batch)
+            busy_time = time.monotonic() - start
+
+            with self._lock:
+                stats = self._stats[index]
+                stats['items_in'] += len(batch)
+                stats['items_out'] += len(outputs)
+                stats['errors'] += errors
+                stats['batches'] += 1
+                stats['busy_time'] += busy_time
+
+            if output_queue is not None:
+                for output in outputs:
+                    output_queue.put(output)
+
+        # 단계의 마지막 워커가 종료되면 다음 단계 워커 수만큼 종료 표시 전달
+        with self._lock:
+            self._remaining_workers[index] -= 1
+            last_worker = self._remaining_workers[index] == 0
+
+        if last_worker and output_queue is not None:
+            for _ in range(self.stages[index + 1].workers):
+                output_queue.put(_END_OF_STREAM)
+
+    def _next_batch(self, index: int, input_queue: queue.Queue, batch_size: int):
+        """입력 큐에서 최대 batch_size개 항목을 꺼냄 (batch, 스트림 종료 여부)"""
+        depth = input_queue.qsize()
+        with self._lock:
+            if depth > self._stats[index]['max_queue_depth']:
+                self._stats[index]['max_queue_depth'] = depth
+
+        item = input_queue.get()
+        if item is _END_OF_STREAM:
+            return [], True
+
+        batch = [item]
+        deadline = time.monotonic() + self.batch_timeout
+
+        while len(batch) < batch_size:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                item = input_queue.get(timeout=timeout)
+            except queue.Empty:
+                break
+            if item is _END_OF_STREAM:
+                return batch, True
+            batch.append(item)
+
+        return batch, False
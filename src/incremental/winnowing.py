@@ -0,0 +1,45 @@
+"""
+Winnowing 지문 기반 콘텐츠 포함도 계산
+
+본문의 모든 문자 k-gram을 롤링 해시(Rabin-Karp 방식 다항식 해시)로 계산하고, 연속한 window개
+해시 중 최솟값만 지문으로 남깁니다 (winnowing). 두 본문이 window + k - 1자 이상 같은 구간을
+공유하면 그 구간에서 같은 지문이 선택되므로, 지문 집합의 겹침으로 두 본문이 서로 얼마나
+포함되어 있는지 텍스트 길이에 비례하는 시간에 계산할 수 있습니다.
+"""
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from ..simhash import char_shingle_hashes, mix64
+
+WINNOWING_KGRAM_SIZE = 5
+WINNOWING_WINDOW_SIZE = 4
+
+
+def winnow_fingerprints(text: str, kgram_size: int = WINNOWING_KGRAM_SIZE,
+                        window_size: int = WINNOWING_WINDOW_SIZE) -> np.ndarray:
+    """
+    정규화된 텍스트의 winnowing 지문 (정렬된 고유 해시 배열)
+
+    Args:
+        text: 정규화된 텍스트
+        kgram_size: k-gram 문자 수
+        window_size: 최솟값을 고르는 연속 해시 수
+    """
+    # 다항식 해시는 인접 k-gram끼리 값이 비슷하므로 섞은 뒤 최솟값을 고름
+    hashes = mix64(char_shingle_hashes(text, kgram_size))
+    if len(hashes) > window_size:
+        hashes = sliding_window_view(hashes, window_size).min(axis=1)
+    return np.unique(hashes)
+
+
+def mutual_containment(fingerprints1: np.ndarray, fingerprints2: np.ndarray) -> float:
+    """
+    공유 지문 수를 지문이 많은 쪽 기준으로 나눈 비율 (0.0 ~ 1.0)
+
+    통신 기사 전재처럼 앞뒤 문구만 덧붙인 본문은 1.0에 가깝고, 긴 기사에 들어 있는 짧은
+    발췌문은 길이 비율만큼만 점수를 받습니다 (짧은 쪽 기준이면 상용구 발췌도 1.0이 됨).
+    """
+    if len(fingerprints1) == 0 or len(fingerprints2) == 0:
+        return 0.0
+    shared = np.intersect1d(fingerprints1, fingerprints2, assume_unique=True)
+    return len(shared) / max(len(fingerprints1), len(fingerprints2))
@@ -487,22 +487,17 @@ URL: {article.get('article_url', '')}
                                   similarity_threshold: float = 0.7) -> List[Dict]:
         """메타데이터 필터가 적용된 벡터 검색"""
         try:
-            # 기본 벡터 검색 수행
+            # 메타데이터 필터를 검색 전에 적용한 벡터 검색 수행
             search_results = self.vector_indexer.search_similar_articles(
                 query=query,
-                top_k=top_k * 2,  # 필터링 후 결과가 부족할 수 있으므로 더 많이 가져옴
+                top_k=top_k,
+                filter_expression=filters,
                 similarity_threshold=similarity_threshold
             )
             
-            # 메타데이터 필터 적용
-            if filters:
-                filtered_results = self._apply_metadata_filters(search_results, filters)
-            else:
-                filtered_results = search_results
-            
             # 결과 변환
             vector_results = []
-            for result in filtered_results:
+            for result in search_results:
                 vector_results.append({
                     'article': result['article'],
                     'similarity': result['similarity'],
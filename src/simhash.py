@@ -0,0 +1,229 @@
+"""
+SimHash 지문 및 해밍 거리 조회
+
+정규화된 텍스트의 문자 n-gram을 64비트로 해시하고 출현 횟수로 가중 투표해 64비트 SimHash를
+만듭니다. 내용이 비슷한 기사는 지문의 해밍 거리가 작습니다.
+
+지문을 16비트 블록 4개로 나눠 블록별 인덱스 컬럼에 저장합니다. 해밍 거리가 3 이하인 두 지문은
+비둘기집 원리에 따라 최소 한 블록이 같으므로, 블록별 일치 조회로 후보만 읽은 뒤 거리를 확인합니다.
+(Manku 등의 permuted-prefix 테이블을 블록 수 4, 접두어 16비트로 구성한 것과 같습니다.)
+"""
+import logging
+from collections import defaultdict
+from typing import Dict, Hashable, List, Optional, Tuple
+
+import numpy as np
+from sqlalchemy import or_, select
+
+from .database.models import Article
+from .text_normalizer import normalize_for_comparison
+
+logger = logging.getLogger(__name__)
+
+SIMHASH_BITS = 64
+SIMHASH_BLOCK_BITS = 16
+SIMHASH_BLOCKS = SIMHASH_BITS // SIMHASH_BLOCK_BITS
+# 블록 일치 조회로 누락 없이 찾을 수 있는 최대 해밍 거리
+SIMHASH_MAX_DISTANCE = SIMHASH_BLOCKS - 1
+SIMHASH_SHINGLE_SIZE = 4
+
+# 문자 n-gram 다항식 해시의 기수
+SHINGLE_BASE = np.uint64(1000003)
+# IN (...) 조회 시 한 번에 넘기는 값 수 (SQLite 바인드 변수 제한 고려)
+SIMHASH_CHUNK_SIZE = 500
+
+_BLOCK_MASK = (1 << SIMHASH_BLOCK_BITS) - 1
+_SIGN_BIT = 1 << (SIMHASH_BITS - 1)
+
+
+def char_shingle_hashes(text: str, size: int) -> np.ndarray:
+    """
+    길이 size인 모든 문자 구간의 64비트 다항식 해시 (중복 포함, 텍스트 순서)
+
+    size보다 짧은 텍스트는 전체를 하나의 구간으로 봅니다.
+    """
+    if not text:
+        return np.empty(0, dtype=np.uint64)
+
+    codes = np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32).astype(np.uint64)
+    size = min(size, len(codes))
+    count = len(codes) - size + 1
+
+    # 구간별 해시를 벡터 연산으로 계산 (uint64 오버플로는 mod 2^64)
+    hashes = np.zeros(count, dtype=np.uint64)
+    for offset in range(size):
+        hashes = hashes * SHINGLE_BASE + codes[offset:offset + count]
+    return hashes
+
+
+def mix64(values: np.ndarray) -> np.ndarray:
+    """비트를 고르게 섞는 64비트 혼합 함수 (splitmix64 마무리 단계)"""
+    values = values ^ (values >> np.uint64(30))
+    values = values * np.uint64(0xBF58476D1CE4E5B9)
+    values = values ^ (values >> np.uint64(27))
+    values = values * np.uint64(0x94D049BB133111EB)
+    return values ^ (values >> np.uint64(31))
+
+
+def compute_simhash(text: str, shingle_size: int = SIMHASH_SHINGLE_SIZE) -> int:
+    """
+    텍스트의 64비트 SimHash 계산
+
+    Args:
+        text: 원본 텍스트 (내부에서 비교용 정규화 적용)
+        shingle_size: 문자 n-gram 길이
+
+    Returns:
+        int: 부호 없는 64비트 지문 (빈 텍스트는 0)
+    """
+    shingles = char_shingle_hashes(normalize_for_comparison(text or ''), shingle_size)
+    if len(shingles) == 0:
+        return 0
+
+    shingles, counts = np.unique(shingles, return_counts=True)
+    features = mix64(shingles).astype('<u8')
+
+    # 특징별 64비트를 펼쳐 출현 횟수로 가중 투표 (비트 i는 정수의 i번째 비트)
+    # 비트가 1인 특징의 가중치 합이 전체 가중치의 절반을 넘으면 1 (정수 행렬 곱보다 빠른 실수 BLAS 사용)
+    bits = np.unpackbits(features.view(np.uint8).reshape(-1, 8), axis=1, bitorder='little')
+    weights = counts.astype(np.float64)
+    votes = weights @ bits.astype(np.float64)
+
+    packed = np.packbits(votes * 2 > weights.sum(), bitorder='little')
+    return int(packed.view('<u8')[0])
+
+
+def hamming_distance(fingerprint1: int, fingerprint2: int) -> int:
+    """두 64비트 지문의 해밍 거리"""
+    return ((fingerprint1 ^ fingerprint2) & ((1 << SIMHASH_BITS) - 1)).bit_count()
+
+
+def to_signed64(fingerprint: int) -> int:
+    """부호 없는 지문을 DB BIGINT에 저장할 부호 있는 값으로 변환"""
+    return fingerprint - (1 << SIMHASH_BITS) if fingerprint & _SIGN_BIT else fingerprint
+
+
+def to_unsigned64(value: int) -> int:
+    """DB에 저장된 부호 있는 값을 부호 없는 지문으로 변환"""
+    return value & ((1 << SIMHASH_BITS) - 1)
+
+
+def simhash_blocks(fingerprint: int) -> List[int]:
+    """지문의 16비트 블록 목록 (하위 비트부터)"""
+    return [
+        (fingerprint >> (block * SIMHASH_BLOCK_BITS)) & _BLOCK_MASK
+        for block in range(SIMHASH_BLOCKS)
+    ]
+
+
+def simhash_columns(fingerprint: Optional[int]) -> Dict[str, Optional[int]]:
+    """Article 저장용 지문 및 블록 컬럼 값"""
+    if fingerprint is None:
+        return {'simhash': None, **{f'simhash_block{block}': None for block in range(SIMHASH_BLOCKS)}}
+
+    columns = {'simhash': to_signed64(fingerprint)}
+    for block, value in enumerate(simhash_blocks(fingerprint)):
+        columns[f'simhash_block{block}'] = value
+    return columns
+
+
+def _block_columns():
+    """Article의 블록 컬럼 목록"""
+    return [getattr(Article, f'simhash_block{block}') for block in range(SIMHASH_BLOCKS)]
+
+
+def _check_distance(max_distance: int) -> int:
+    """블록 조회로 보장되는 거리를 넘으면 경고"""
+    if max_distance > SIMHASH_MAX_DISTANCE:
+        logger.warning(
+            f"SimHash 블록 조회는 해밍 거리 {SIMHASH_MAX_DISTANCE} 이하만 보장합니다: {max_distance}"
+        )
+    return max_distance
+
+
+class SimHashIndex:
+    """블록 테이블 기반 메모리 SimHash 인덱스"""
+
+    def __init__(self, max_distance: int = SIMHASH_MAX_DISTANCE):
+        self.max_distance = _check_distance(max_distance)
+        self.tables: List[Dict[int, List[Hashable]]] = [defaultdict(list) for _ in range(SIMHASH_BLOCKS)]
+        self.fingerprints: Dict[Hashable, int] = {}
+
+    def add(self, key: Hashable, fingerprint: int):
+        """지문 추가"""
+        self.fingerprints[key] = fingerprint
+        for table, block in zip(self.tables, simhash_blocks(fingerprint)):
+            table[block].append(key)
+
+    def query(self, fingerprint: int, max_distance: Optional[int] = None) -> List[Tuple[Hashable, int]]:
+        """해밍 거리 max_distance 이내의 (키, 거리) 목록 (거리 오름차순)"""
+        max_distance = self.max_distance if max_distance is None else max_distance
+        candidates = set()
+        for table, block in zip(self.tables, simhash_blocks(fingerprint)):
+            candidates.update(table.get(block, ()))
+
+        matches = []
+        for key in candidates:
+            distance = hamming_distance(fingerprint, self.fingerprints[key])
+            if distance <= max_distance:
+                matches.append((key, distance))
+        return sorted(matches, key=lambda match: match[1])
+
+
+def find_similar_articles(db, fingerprints: Dict[Hashable, int],
+                          max_distance: int = SIMHASH_MAX_DISTANCE) -> Dict[Hashable, List[Tuple[str, int]]]:
+    """
+    저장된 기사 중 지문별 해밍 거리 max_distance 이내의 기사 조회
+
+    Args:
+        db: 데이터베이스 세션
+        fingerprints: 조회 키 -> 부호 없는 지문
+        max_distance: 최대 해밍 거리
+
+    Returns:
+        Dict: 조회 키 -> [(기사 ID, 거리)] (거리 오름차순)
+    """
+    _check_distance(max_distance)
+    results = {key: [] for key in fingerprints}
+    if not fingerprints:
+        return results
+
+    connection = db.connection()
+    stored = {}
+
+    # 블록 컬럼별로 IN 조회해 한 블록이라도 같은 기사만 읽음
+    for block, column in enumerate(_block_columns()):
+        values = list({simhash_blocks(fingerprint)[block] for fingerprint in fingerprints.values()})
+        for i in range(0, len(values), SIMHASH_CHUNK_SIZE):
+            chunk = values[i:i + SIMHASH_CHUNK_SIZE]
+            for article_id, simhash in connection.execute(
+                select(Article.id, Article.simhash).where(column.in_(chunk))
+            ):
+                stored[article_id] = to_unsigned64(simhash)
+
+    index = SimHashIndex(max_distance)
+    for article_id, fingerprint in stored.items():
+        index.add(article_id, fingerprint)
+
+    for key, fingerprint in fingerprints.items():
+        results[key] = index.query(fingerprint, max_distance)
+    return results
+
+
+def find_similar_article(db, fingerprint: int,
+                         max_distance: int = SIMHASH_MAX_DISTANCE) -> List[Tuple[str, int]]:
+    """저장된 기사 중 한 지문과 해밍 거리 max_distance 이내의 (기사 ID, 거리) 목록"""
+    _check_distance(max_distance)
+    blocks = simhash_blocks(fingerprint)
+    rows = db.connection().execute(
+        select(Article.id, Article.simhash).where(
+            or_(*(column == block for column, block in zip(_block_columns(), blocks)))
+        )
+    )
+
+    matches = []
+    for article_id, simhash in rows:
+        distance = hamming_distance(fingerprint, to_unsigned64(simhash))
+        if distance <= max_distance:
+            matches.append((article_id, distance))
+    return sorted(matches, key=lambda match: match[1])
@@ -0,0 +1,83 @@
+"""
+공통 텍스트 정규화
+
+ContentHasher, DuplicateDetector, EmbeddingService, KoreanEmbeddingModel에서 각각
+re.sub를 여러 번 호출하던 정규화를 미리 컴파일한 패턴으로 모았습니다.
+각 함수의 결과는 기존 호출 위치의 정규화 결과와 같습니다.
+"""
+import re
+from typing import Callable, Dict, List, Optional
+
+HTML_TAG_PATTERN = re.compile(r'<[^>]+>')
+SPECIAL_CHAR_PATTERN = re.compile(r'[^\w\s가-힣]')
+
+# 특수 문자 제거 후 소문자 변환 시 \w가 아닌 문자를 만드는 유일한 문자 (İ -> i + U+0307)
+_DOTTED_CAPITAL_I = '\u0130'
+_COMBINING_DOT_ABOVE = '\u0307'
+
+
+def strip_html_tags(text: str) -> str:
+    """HTML 태그 제거"""
+    if '<' not in text:
+        return text
+    return HTML_TAG_PATTERN.sub('', text)
+
+
+def normalize_for_hash(text: str) -> str:
+    """
+    해시 계산용 정규화 (ContentHasher 규칙 순서와 동일)
+
+    태그 제거 → 공백 정리 → 특수 문자 삭제 → 소문자 변환 → 남은 특수 문자를 공백으로 변환
+    """
+    text = ' '.join(strip_html_tags(text).split())
+    text = SPECIAL_CHAR_PATTERN.sub('', text)
+
+    if _DOTTED_CAPITAL_I in text:
+        return text.lower().replace(_COMBINING_DOT_ABOVE, ' ')
+    return text.lower()
+
+
+def normalize_for_comparison(text: str) -> str:
+    """
+    중복 비교용 정규화 (DuplicateDetector 규칙과 동일)
+
+    태그 제거 → 특수 문자를 공백으로 변환 → 공백 정리 → 소문자 변환
+    """
+    # str.split()/join은 re.sub(r'\s+', ' ', ...).strip()과 같은 결과를 한 번에 만듦
+    return ' '.join(SPECIAL_CHAR_PATTERN.sub(' ', strip_html_tags(text)).split()).lower()
+
+
+def clean_text(text: str, max_length: Optional[int] = None) -> str:
+    """
+    임베딩 입력용 정리 (태그 제거 → 특수 문자를 공백으로 변환 → 공백 정리)
+
+    Args:
+        text: 원본 텍스트
+        max_length: 최대 길이 (초과 시 자름)
+    """
+    text = ' '.join(SPECIAL_CHAR_PATTERN.sub(' ', strip_html_tags(text)).split())
+    if max_length is not None and len(text) > max_length:
+        return text[:max_length]
+    return text
+
+
+NORMALIZERS: Dict[str, Callable[[str], str]] = {
+    'hash': normalize_for_hash,
+    'comparison': normalize_for_comparison,
+    'clean': clean_text
+}
+
+
+def normalize_batch(texts: List[str], mode: str = 'hash') -> List[str]:
+    """
+    텍스트 목록 일괄 정규화
+
+    Args:
+        texts: 텍스트 목록
+        mode: 'hash', 'comparison', 'clean' 중 하나
+
+    Returns:
+        List[str]: 입력 순서와 같은 정규화 결과
+    """
+    normalizer = NORMALIZERS[mode]
+    return [normalizer(text) for text in texts]
@@ -0,0 +1,143 @@
+"""
+벡터 검색 결과 기사 카드 조회
+
+벡터 검색 결과 ID를 검색 결과에 필요한 기사 컬럼(카드)으로 바꿉니다. 캐시에 없는 ID만 필요한 컬럼을
+지정한 쿼리 한 번으로 조회하고, 최근 조회한 카드는 LRU 캐시에 보관해 같은 기사가 반복해서 검색되면
+데이터베이스를 조회하지 않습니다.
+
+검색과 인덱싱을 하는 여러 VectorIndexer가 같은 캐시를 쓰도록 get_article_hydrator()로 프로세스당 한
+인스턴스를 공유하며, 다른 프로세스에서 바뀐 기사도 반영되도록 카드는 TTL이 지나면 다시 조회합니다.
+"""
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, List
+
+from ..database.connection import get_db
+from ..database.models import Article
+
+logger = logging.getLogger(__name__)
+
+# 기사 카드 컬럼
+ARTICLE_CARD_COLUMNS = ('id', 'art_id', 'title', 'summary', 'service_daytime', 'article_url')
+# IN 절 하나에 넣는 최대 ID 수
+HYDRATE_CHUNK_SIZE = 500
+
+
+class ArticleHydrator:
+    """기사 카드 조회 및 LRU 캐시"""
+
+    def __init__(self, cache_size: int = 1024, ttl: float = 300.0):
+        """
+        초기화
+
+        Args:
+            cache_size: 보관할 최대 기사 카드 수 (0이면 캐시 사용 안 함)
+            ttl: 카드 유효 시간(초, 0 이하면 만료 없음)
+        """
+        self.cache_size = cache_size
+        self.ttl = ttl
+        self._cache: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def hydrate(self, article_ids: Iterable[str]) -> Dict[str, Dict]:
+        """
+        기사 ID별 카드 조회
+
+        Args:
+            article_ids: 기사 ID 목록
+
+        Returns:
+            Dict[str, Dict]: 기사 ID -> 카드 (데이터베이스에 없는 ID는 제외)
+        """
+        article_ids = list(dict.fromkeys(article_ids))
+        cards = {}
+        missing = []
+        now = time.monotonic()
+        with self._lock:
+            for article_id in article_ids:
+                entry = self._cache.get(article_id)
+                if entry is not None and self.ttl > 0 and now - entry[1] > self.ttl:
+                    del self._cache[article_id]
+                    entry = None
+                if entry is None:
+                    missing.append(article_id)
+                else:
+                    self._cache.move_to_end(article_id)
+                    cards[article_id] = dict(entry[0])
+            self.hits += len(cards)
+            self.misses += len(missing)
+
+        if missing:
+            fetched = self._fetch_cards(missing)
+            with self._lock:
+                for article_id, card in fetched.items():
+                    self._remember(article_id, card, now)
+            cards.update((article_id, dict(card)) for article_id, card in fetched.items())
+
+        return cards
+
+    def _fetch_cards(self, article_ids: List[str]) -> Dict[str, Dict]:
+        """카드 컬럼만 조회"""
+        columns = [getattr(Article, column) for column in ARTICLE_CARD_COLUMNS]
+        db = next(get_db())
+        try:
+            cards = {}
+            for i in range(0, len(article_ids), HYDRATE_CHUNK_SIZE):
+                rows = db.query(*columns).filter(
+                    Article.id.in_(article_ids[i:i + HYDRATE_CHUNK_SIZE])
+                ).all()
+                for row in rows:
+                    cards[row.id] = dict(zip(ARTICLE_CARD_COLUMNS, row))
+            return cards
+
+        finally:
+            db.close()
+
+    def _remember(self, article_id: str, card: Dict, stored_at: float):
+        if self.cache_size <= 0:
+            return
+        self._cache[article_id] = (card, stored_at)
+        self._cache.move_to_end(article_id)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def invalidate(self, article_ids: Iterable[str]):
+        """변경된 기사 카드 캐시 제거"""
+        with self._lock:
+            for article_id in article_ids:
+                self._cache.pop(article_id, None)
+
+    def get_stats(self) -> Dict:
+        """캐시 통계"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'cached': len(self._cache),
+                'cache_size': self.cache_size,
+                'ttl': self.ttl,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / total if total else 0.0
+            }
+
+
+# 프로세스 전역 인스턴스
+_article_hydrator = None
+_article_hydrator_lock = threading.Lock()
+
+
+def get_article_hydrator() -> ArticleHydrator:
+    """ArticleHydrator 싱글톤 (ARTICLE_CARD_CACHE_SIZE, ARTICLE_CARD_CACHE_TTL 환경 변수로 설정)"""
+    global _article_hydrator
+    with _article_hydrator_lock:
+        if _article_hydrator is None:
+            _article_hydrator = ArticleHydrator(
+                cache_size=int(os.getenv('ARTICLE_CARD_CACHE_SIZE', '1024')),
+                ttl=float(os.getenv('ARTICLE_CARD_CACHE_TTL', '300'))
+            )
+        return _article_hydrator
@@ -0,0 +1,93 @@
+"""
+벡터 필터용 기사 메타데이터 조회
+
+기사 ID별 service_daytime, large_code_nm, stock_code, writers 값을 데이터베이스에서 읽어
+LocalVectorStore 메타데이터 인덱스 형식의 사전으로 만듭니다. 인덱싱할 때와, 메타데이터 없이
+저장된 행(기존 vector_data.json 가져오기 등)을 채울 때 같은 함수를 사용합니다.
+"""
+import logging
+from typing import Dict, List
+
+from ..database.connection import get_db
+from ..database.models import Article, ArticleCategory, ArticleStockCode
+
+logger = logging.getLogger(__name__)
+
+# 메타데이터 조회 시 IN 절 하나에 넣는 최대 ID 수
+METADATA_CHUNK_SIZE = 500
+
+
+def load_article_metadata(article_ids: List[str]) -> Dict[str, Dict]:
+    """
+    기사 ID별 벡터 필터용 메타데이터 조회
+
+    Returns:
+        Dict[str, Dict]: 기사 ID -> {'service_daytime', 'writers', 'large_code_nm', 'stock_code'}
+            (데이터베이스에 없는 ID는 제외)
+    """
+    metadata = {}
+    db = next(get_db())
+    try:
+        for i in range(0, len(article_ids), METADATA_CHUNK_SIZE):
+            chunk = article_ids[i:i + METADATA_CHUNK_SIZE]
+
+            articles = db.query(Article.id, Article.service_daytime, Article.writers).filter(
+                Article.id.in_(chunk)
+            ).all()
+            for article_id, service_daytime, writers in articles:
+                metadata[article_id] = {
+                    'service_daytime': service_daytime,
+                    'writers': writers,
+                    'large_code_nm': [],
+                    'stock_code': []
+                }
+
+            categories = db.query(ArticleCategory.article_id, ArticleCategory.large_code_nm).filter(
+                ArticleCategory.article_id.in_(chunk)
+            ).all()
+            for article_id, large_code_nm in categories:
+                if large_code_nm and article_id in metadata:
+                    metadata[article_id]['large_code_nm'].append(large_code_nm)
+
+            stock_codes = db.query(ArticleStockCode.article_id, ArticleStockCode.stock_code).filter(
+                ArticleStockCode.article_id.in_(chunk)
+            ).all()
+            for article_id, stock_code in stock_codes:
+                if article_id in metadata:
+                    metadata[article_id]['stock_code'].append(stock_code)
+
+        return metadata
+
+    finally:
+        db.close()
+
+
+def backfill_store_metadata(store) -> int:
+    """
+    메타데이터가 없는 저장소 행을 데이터베이스 값으로 채움
+
+    메타데이터 없는 행은 필터 검색에서 항상 제외되므로, 저장소를 처음 열 때 호출합니다.
+    데이터베이스에 없는 ID는 그대로 둡니다.
+
+    Args:
+        store: LocalVectorStore
+
+    Returns:
+        int: 메타데이터를 채운 행 수
+    """
+    missing_ids = store.ids_without_metadata()
+    if not missing_ids:
+        return 0
+
+    try:
+        filled = 0
+        for i in range(0, len(missing_ids), METADATA_CHUNK_SIZE):
+            metadata = load_article_metadata(missing_ids[i:i + METADATA_CHUNK_SIZE])
+            filled += store.update_metadata(list(metadata), list(metadata.values()))
+
+        logger.info(f"벡터 메타데이터 채우기 완료: {filled}개 (대상 {len(missing_ids)}개)")
+        return filled
+
+    except Exception as e:
+        logger.error(f"벡터 메타데이터 채우기 중 오류 발생: {e}")
+        return 0
@@ -0,0 +1,383 @@
+"""
+벡터 업서트 델타 로그
+
+업서트와 삭제를 기본 인덱스(LocalVectorStore 또는 IVFIndex)에 바로 쓰지 않고 deltas.log 파일에
+이진 레코드로 추가만 합니다. 업서트 비용은 배치 크기에만 비례하고, 검색은 기본 인덱스 결과와
+메모리의 델타 벡터를 합쳐 바로 반영합니다. 델타가 쌓이면 백그라운드 스레드가 로그 파일을 교체한 뒤
+이전 로그의 내용을 기본 인덱스에 병합합니다.
+
+레코드 형식: 헤더(연산 1바이트, ID 길이, 벡터 차원, 메타데이터 길이 각 4바이트) + ID(UTF-8) +
+float32 벡터 + 메타데이터(JSON). 마지막 레코드가 잘린 경우(쓰기 중 중단)는 무시하고 잘라냅니다.
+"""
+import json
+import logging
+import os
+import struct
+import threading
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from .metadata_index import matches_filters
+
+logger = logging.getLogger(__name__)
+
+DELTA_LOG_FILE = 'deltas.log'
+MERGING_LOG_FILE = 'deltas.merging.log'
+
+RECORD_HEADER = struct.Struct('<BIII')
+OP_UPSERT = 1
+OP_DELETE = 2
+
+
+class VectorDeltaLog:
+    """추가 전용 델타 로그 파일과 메모리 델타 벡터"""
+
+    def __init__(self, path: str, dimensions: Optional[int] = None):
+        self.path = path
+        self.dimensions = dimensions
+        # ID -> 델타 행 번호 (None이면 삭제)
+        self.rows: Dict[str, Optional[int]] = {}
+        self.metadata: List[Optional[Dict]] = []
+        self.row_ids: List[str] = []
+        self._vectors = np.empty((0, dimensions or 0), dtype=np.float32)
+        self._row_count = 0
+        self._replay()
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def _replay(self):
+        """기존 로그 파일 다시 읽기"""
+        if not os.path.exists(self.path):
+            return
+
+        with open(self.path, 'rb') as f:
+            data = f.read()
+
+        offset = 0
+        upsert_ids, upsert_vectors, upsert_metadata, deleted = [], [], [], []
+        while offset + RECORD_HEADER.size <= len(data):
+            op, id_length, dimensions, metadata_length = RECORD_HEADER.unpack_from(data, offset)
+            end = offset + RECORD_HEADER.size + id_length + dimensions * 4 + metadata_length
+            if end > len(data):
+                break
+            position = offset + RECORD_HEADER.size
+            vector_id = data[position:position + id_length].decode('utf-8')
+            position += id_length
+            if op == OP_UPSERT:
+                vector = np.frombuffer(data, dtype=np.float32, count=dimensions, offset=position)
+                position += dimensions * 4
+                metadata = json.loads(data[position:end]) if metadata_length else None
+                self._apply_upserts([vector_id], vector[None, :], [metadata])
+            else:
+                self._apply_deletes([vector_id])
+            offset = end
+
+        if offset < len(data):
+            logger.warning(f"델타 로그 마지막 레코드가 잘려 있어 제거합니다: {self.path}")
+            with open(self.path, 'r+b') as f:
+                f.truncate(offset)
+
+    def _apply_upserts(self, ids: Sequence[str], matrix: np.ndarray, metadata: Sequence[Optional[Dict]]):
+        """메모리 델타에 벡터 반영 (같은 ID는 새 행을 사용)"""
+        if self.dimensions is None:
+            self.dimensions = matrix.shape[1]
+            self._vectors = np.empty((0, self.dimensions), dtype=np.float32)
+
+        needed = self._row_count + len(ids)
+        if needed > len(self._vectors):
+            grown = np.empty((max(needed, len(self._vectors) * 2, 64), self.dimensions), dtype=np.float32)
+            grown[:self._row_count] = self._vectors[:self._row_count]
+            self._vectors = grown
+
+        self._vectors[self._row_count:needed] = matrix
+        for offset, vector_id in enumerate(ids):
+            self.rows[vector_id] = self._row_count + offset
+            self.row_ids.append(vector_id)
+        self.metadata.extend(metadata)
+        self._row_count = needed
+
+    def _apply_deletes(self, ids: Iterable[str]):
+        for vector_id in ids:
+            self.rows[vector_id] = None
+
+    def append_upserts(self, ids: Sequence[str], matrix: np.ndarray,
+                       metadata: Optional[Sequence[Optional[Dict]]] = None):
+        """업서트 레코드 추가 (matrix는 정규화된 float32 행렬)"""
+        metadata = list(metadata) if metadata is not None else [None] * len(ids)
+        chunks = []
+        for vector_id, vector, row_metadata in zip(ids, matrix, metadata):
+            encoded_id = vector_id.encode('utf-8')
+            encoded_metadata = json.dumps(row_metadata, ensure_ascii=False, default=str).encode('utf-8') \
+                if row_metadata is not None else b''
+            chunks.append(RECORD_HEADER.pack(OP_UPSERT, len(encoded_id), len(vector), len(encoded_metadata)))
+            chunks.extend((encoded_id, vector.tobytes(), encoded_metadata))
+        self._write(chunks)
+        self._apply_upserts(ids, matrix, metadata)
+
+    def append_deletes(self, ids: Sequence[str]):
+        """삭제 레코드 추가"""
+        chunks = []
+        for vector_id in ids:
+            encoded_id = vector_id.encode('utf-8')
+            chunks.extend((RECORD_HEADER.pack(OP_DELETE, len(encoded_id), 0, 0), encoded_id))
+        self._write(chunks)
+        self._apply_deletes(ids)
+
+    def _write(self, chunks: List[bytes]):
+        with open(self.path, 'ab') as f:
+            f.write(b''.join(chunks))
+            f.flush()
+            os.fsync(f.fileno())
+
+    def live_entries(self):
+        """(ID 목록, 벡터 행렬, 메타데이터 목록) 최신 업서트만"""
+        ids = [vector_id for vector_id, row in self.rows.items() if row is not None]
+        rows = np.fromiter((self.rows[vector_id] for vector_id in ids), dtype=np.int64, count=len(ids))
+        return ids, self._vectors[rows], [self.metadata[row] for row in rows]
+
+    def deleted_ids(self) -> List[str]:
+        return [vector_id for vector_id, row in self.rows.items() if row is None]
+
+    def search(self, query: np.ndarray, top_k: int, filters: Optional[Dict] = None,
+               inherited_match=None) -> List[Dict]:
+        """
+        델타 벡터 전체 검색
+
+        Args:
+            query: 정규화된 쿼리 벡터
+            top_k: 반환할 결과 수
+            filters: 메타데이터 필터
+            inherited_match: 메타데이터 없이 업서트된 ID의 필터 일치 여부를 판단하는 함수
+        """
+        ids = [
+            vector_id for vector_id, row in self.rows.items()
+            if row is not None and (
+                not filters or (
+                    matches_filters(self.metadata[row], filters) if self.metadata[row] is not None
+                    else bool(inherited_match and inherited_match(vector_id))
+                )
+            )
+        ]
+        if not ids:
+            return []
+
+        rows = np.fromiter((self.rows[vector_id] for vector_id in ids), dtype=np.int64, count=len(ids))
+        scores = self._vectors[rows] @ query
+        order = np.argsort(-scores)[:top_k]
+        return [{'id': ids[index], 'similarity': float(scores[index])} for index in order]
+
+    def remove(self):
+        """로그 파일 삭제"""
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+class BufferedVectorIndex:
+    """델타 로그를 앞에 둔 로컬 벡터 인덱스"""
+
+    def __init__(self, index, max_delta_rows: int = 10000, background: bool = True):
+        """
+        초기화
+
+        Args:
+            index: 기본 인덱스 (LocalVectorStore 또는 IVFIndex, upsert/delete/search 제공)
+            max_delta_rows: 이 수만큼 델타가 쌓이면 병합 시작
+            background: 병합을 백그라운드 스레드에서 수행할지 여부
+        """
+        self.index = index
+        self.store = getattr(index, 'store', index)
+        self.max_delta_rows = max_delta_rows
+        self.background = background
+        self._lock = threading.RLock()
+        self._merge_lock = threading.Lock()
+        self._merge_thread: Optional[threading.Thread] = None
+
+        os.makedirs(self.store.directory, exist_ok=True)
+        self.merging: Optional[VectorDeltaLog] = None
+        merging_path = os.path.join(self.store.directory, MERGING_LOG_FILE)
+        if os.path.exists(merging_path):
+            # 병합 중 중단된 로그는 먼저 다시 병합 (같은 내용을 다시 반영해도 결과는 같음)
+            self.merging = VectorDeltaLog(merging_path, self.store.dimensions)
+            self._merge(self.merging)
+        self.active = VectorDeltaLog(os.path.join(self.store.directory, DELTA_LOG_FILE), self.store.dimensions)
+
+    def _normalize(self, embeddings) -> np.ndarray:
+        """벡터를 정규화된 float32 행렬로 변환 (차원은 기본 저장소 또는 델타 기준)"""
+        matrix = np.array(embeddings, dtype=np.float32, ndmin=2)
+        dimensions = self.store.dimensions or self.active.dimensions
+        if dimensions is not None and matrix.shape[1] != dimensions:
+            raise ValueError(f"벡터 차원이 맞지 않습니다: {matrix.shape[1]} != {dimensions}")
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return matrix / norms
+
+    def upsert(self, ids: Sequence[str], embeddings: Sequence[Sequence[float]],
+               metadata: Optional[Sequence[Optional[Dict]]] = None) -> int:
+        """델타 로그에 업서트 추가 (기본 인덱스 크기와 무관하게 배치 크기에 비례)"""
+        if len(ids) != len(embeddings) or (metadata is not None and len(metadata) != len(ids)):
+            raise ValueError("ID 수와 벡터 수가 다릅니다.")
+        if not ids:
+            return 0
+
+        matrix = self._normalize(embeddings)
+        with self._lock:
+            self.active.append_upserts(list(ids), matrix, metadata)
+            should_merge = len(self.active) >= self.max_delta_rows
+        if should_merge:
+            self.compact(wait=not self.background)
+        return len(ids)
+
+    def delete(self, ids: Iterable[str]) -> int:
+        """델타 로그에 삭제 추가"""
+        ids = list(ids)
+        with self._lock:
+            self.active.append_deletes(ids)
+        return len(ids)
+
+    def search(self, query_embedding: Sequence[float], top_k: int = 10,
+               filters: Optional[Dict] = None) -> List[Dict]:
+        """
+        기본 인덱스와 델타를 합친 검색
+
+        델타에 있는 ID(교체 또는 삭제)는 기본 인덱스 결과에서 제외하므로, 기본 인덱스에서는
+        그중 기본 저장소에 있는 ID 수만큼 더 많이 가져옵니다 (새로 추가된 ID는 기본 결과에 나오지 않음).
+        """
+        query = self._normalize(query_embedding)[0]
+        with self._lock:
+            deltas = [delta for delta in (self.active, self.merging) if delta is not None]
+            shadowed = set()
+            results = []
+            for delta in deltas:
+                for result in delta.search(query, top_k, filters, self._base_matches(filters)):
+                    if result['id'] not in shadowed:
+                        results.append(result)
+                shadowed.update(delta.rows)
+            positions = self.store.positions
+            shadowed_in_base = sum(vector_id in positions for vector_id in shadowed)
+
+        if len(self.store):
+            base_results = self.index.search(query_embedding, top_k + shadowed_in_base, filters)
+            results.extend(result for result in base_results if result['id'] not in shadowed)
+
+        results.sort(key=lambda result: result['similarity'], reverse=True)
+        return results[:top_k]
+
+    def _base_matches(self, filters: Optional[Dict]):
+        """메타데이터 없이 업서트된 ID는 기본 저장소의 기존 메타데이터로 필터 판단"""
+        if not filters:
+            return None
+        state = {}
+
+        def matches(vector_id: str) -> bool:
+            position = self.store.positions.get(vector_id)
+            if position is None:
+                return False
+            if 'mask' not in state:
+                state['mask'] = self.store.metadata.mask(filters, self.store.count)
+            return bool(state['mask'][position])
+
+        return matches
+
+    def compact(self, wait: bool = True) -> int:
+        """
+        델타를 기본 인덱스에 병합
+
+        현재 로그 파일을 병합용 파일로 바꾸고 새 로그로 쓰기를 계속 받으며, 병합이 끝날 때까지
+        병합 중인 델타도 검색에 포함합니다. 이전 병합이 실패해 병합용 델타가 남아 있으면 로그를
+        교체하지 않고 그 델타부터 다시 병합합니다 (교체하면 병합되지 않은 델타를 덮어씀).
+
+        Args:
+            wait: 병합이 끝날 때까지 기다릴지 여부 (False면 백그라운드 스레드에서 수행)
+
+        Returns:
+            int: 병합을 시작한 델타 ID 수 (이미 병합 중이면 0)
+        """
+        if not self._merge_lock.acquire(blocking=wait):
+            return 0
+        try:
+            with self._lock:
+                if self.merging is not None:
+                    logger.warning(f"이전에 실패한 벡터 델타 병합을 다시 시도합니다: {len(self.merging)}개")
+                    count = len(self.merging)
+                elif len(self.active) == 0:
+                    self._merge_lock.release()
+                    return 0
+                else:
+                    count = self._rotate_active()
+        except Exception:
+            self._merge_lock.release()
+            raise
+
+        if wait:
+            self._run_merge()
+        else:
+            self._merge_thread = threading.Thread(target=self._run_merge, name='vector-delta-merge', daemon=True)
+            self._merge_thread.start()
+        return count
+
+    def _rotate_active(self) -> int:
+        """현재 로그를 병합용 로그로 바꾸고 새 로그 시작 (self._lock 보유 상태에서 호출)"""
+        merging_path = os.path.join(self.store.directory, MERGING_LOG_FILE)
+        os.replace(self.active.path, merging_path)
+        self.active.path = merging_path
+        self.merging = self.active
+        self.active = VectorDeltaLog(os.path.join(self.store.directory, DELTA_LOG_FILE),
+                                     self.merging.dimensions)
+        return len(self.merging)
+
+    def _run_merge(self):
+        try:
+            self._merge(self.merging)
+        except Exception as e:
+            logger.error(f"벡터 델타 병합 중 오류 발생: {e}")
+        finally:
+            self._merge_lock.release()
+
+    def _merge(self, delta: VectorDeltaLog):
+        """병합용 델타를 기본 인덱스에 반영하고 로그 삭제"""
+        ids, vectors, metadata = delta.live_entries()
+        with_metadata = [i for i, row_metadata in enumerate(metadata) if row_metadata is not None]
+        without_metadata = [i for i, row_metadata in enumerate(metadata) if row_metadata is None]
+        if with_metadata:
+            self.index.upsert([ids[i] for i in with_metadata], vectors[with_metadata],
+                              [metadata[i] for i in with_metadata])
+        if without_metadata:
+            self.index.upsert([ids[i] for i in without_metadata], vectors[without_metadata])
+        deleted = delta.deleted_ids()
+        if deleted:
+            self.index.delete(deleted)
+
+        with self._lock:
+            delta.remove()
+            if self.merging is delta:
+                self.merging = None
+        logger.info(f"벡터 델타 병합 완료: 업서트 {len(ids)}개, 삭제 {len(deleted)}개")
+
+    def wait_for_merge(self):
+        """진행 중인 백그라운드 병합 대기"""
+        thread = self._merge_thread
+        if thread is not None:
+            thread.join()
+
+    def __len__(self) -> int:
+        with self._lock:
+            deltas = [delta for delta in (self.merging, self.active) if delta is not None]
+            added = set()
+            deleted = set()
+            for delta in deltas:
+                for vector_id, row in delta.rows.items():
+                    (added if row is not None else deleted).add(vector_id)
+                    (deleted if row is not None else added).discard(vector_id)
+        base_ids = self.store.positions
+        return len(base_ids) + sum(1 for vector_id in added if vector_id not in base_ids) - \
+            sum(1 for vector_id in deleted if vector_id in base_ids)
+
+    def get_stats(self) -> Dict:
+        """기본 저장소 통계와 델타 크기"""
+        stats = self.store.get_stats()
+        with self._lock:
+            stats['delta_rows'] = len(self.active)
+            stats['merging_rows'] = len(self.merging) if self.merging is not None else 0
+        return stats
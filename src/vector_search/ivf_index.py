@@ -0,0 +1,425 @@
+"""
+로컬 IVF-flat 근사 최근접 이웃 인덱스
+
+LocalVectorStore 위에 k-means 중심점(리스트)을 두고 각 벡터를 가장 가까운 중심점의 리스트에
+배정합니다. 검색 시에는 쿼리와 가까운 nprobe개 리스트의 벡터만 float32 원본으로 점수를 계산합니다.
+리스트 크기와 탐색 비율은 Vertex AI tree-AH 설정의 leaf_node_embedding_count,
+leaf_nodes_to_search_percent와 같은 의미로 사용합니다.
+
+k-means 학습은 검색 경로에서 하지 않습니다. 학습이 필요해지면(처음 최소 크기 도달, 벡터 수 두 배 증가)
+백그라운드 스레드에서 잠금 없이 중심점을 계산하고, 완료되면 잠금을 잡고 새 중심점으로 교체합니다.
+그동안 검색은 기존 중심점(학습 전에는 저장소 전체 검색)으로 응답합니다.
+
+행 위치별 리스트 번호(assignments)만 저장하고, 검색용 리스트별 위치 목록(CSR)은 필요할 때 다시
+만듭니다. 마지막 재구성 이후 추가/교체된 행은 대기 목록에 모았다가 일정 크기가 되면 합칩니다.
+삭제는 저장소의 tombstone 플래그로 검색 시 제외합니다.
+"""
+import json
+import logging
+import math
+import os
+import threading
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from .local_vector_store import LocalVectorStore
+
+logger = logging.getLogger(__name__)
+
+IVF_META_FILE = 'ivf_meta.json'
+IVF_CENTROIDS_FILE = 'ivf_centroids.npy'
+IVF_ASSIGNMENTS_FILE = 'ivf_assignments.npy'
+
+# 중심점 배정 시 (행 수 x 리스트 수) 점수 행렬 원소 수 상한
+ASSIGN_CHUNK_ELEMENTS = 1 << 24
+# 대기 목록을 CSR에 합치는 최소 크기
+MIN_PENDING_MERGE = 65536
+# 학습 중 행 배정 시 잠금을 잡고 한 번에 복사하는 행 수
+TRAIN_COPY_ROWS = 8192
+
+
+class IVFIndex:
+    """LocalVectorStore용 IVF-flat 인덱스"""
+
+    def __init__(self, store: LocalVectorStore, leaf_node_embedding_count: int = 500,
+                 leaf_nodes_to_search_percent: float = 7, min_train_size: Optional[int] = None,
+                 train_iterations: int = 10, max_train_samples: int = 65536, seed: int = 0,
+                 background_training: bool = True):
+        """
+        초기화
+
+        Args:
+            store: 벡터 원본 저장소 (쓰기는 이 인덱스를 통해 수행)
+            leaf_node_embedding_count: 리스트당 평균 벡터 수 (리스트 수 = 벡터 수 / 이 값)
+            leaf_nodes_to_search_percent: 검색 시 탐색할 리스트 비율(%) (nprobe)
+            min_train_size: 이 수보다 벡터가 적으면 학습하지 않고 전체 검색 (기본: 리스트 크기 x 20)
+            train_iterations: k-means 반복 횟수
+            max_train_samples: k-means 학습에 사용할 최대 표본 수
+            seed: 표본 추출 및 초기 중심점 선택 시드
+            background_training: 학습이 필요해지면 백그라운드 스레드에서 학습 (False면 train()을 직접 호출)
+        """
+        self.store = store
+        self.leaf_node_embedding_count = leaf_node_embedding_count
+        self.leaf_nodes_to_search_percent = leaf_nodes_to_search_percent
+        self.min_train_size = min_train_size or leaf_node_embedding_count * 20
+        self.train_iterations = train_iterations
+        self.max_train_samples = max_train_samples
+        self.seed = seed
+        self.background_training = background_training
+
+        self.centroids: Optional[np.ndarray] = None
+        self.assignments = np.empty(0, dtype=np.int32)
+        self.trained_rows = 0
+        # 검색용 CSR (리스트별 행 위치)과 마지막 재구성 이후 배정된 행 위치
+        self._list_offsets: Optional[np.ndarray] = None
+        self._list_positions: Optional[np.ndarray] = None
+        self._pending: List[np.ndarray] = []
+        self._pending_count = 0
+        self._lock = threading.RLock()
+        # 학습 직렬화, 백그라운드 학습 스레드, 학습 중 업서트된 행 위치, 저장소 정리 횟수
+        self._train_lock = threading.Lock()
+        self._train_thread: Optional[threading.Thread] = None
+        self._training_dirty: Optional[List[np.ndarray]] = None
+        self._generation = 0
+        self.load()
+
+    @classmethod
+    def from_tree_ah_config(cls, store: LocalVectorStore, tree_ah_config: Dict, **kwargs) -> 'IVFIndex':
+        """Vertex AI tree_ah_config 값으로 생성"""
+        return cls(
+            store,
+            leaf_node_embedding_count=tree_ah_config.get('leaf_node_embedding_count', 500),
+            leaf_nodes_to_search_percent=tree_ah_config.get('leaf_nodes_to_search_percent', 7),
+            **kwargs
+        )
+
+    @property
+    def is_trained(self) -> bool:
+        return self.centroids is not None
+
+    @property
+    def n_lists(self) -> int:
+        """학습된 리스트 수 (학습 전에는 현재 벡터 수 기준 값)"""
+        if self.centroids is not None:
+            return len(self.centroids)
+        return max(1, math.ceil(len(self.store) / self.leaf_node_embedding_count))
+
+    @property
+    def nprobe(self) -> int:
+        """검색 시 탐색할 리스트 수"""
+        return max(1, math.ceil(self.n_lists * self.leaf_nodes_to_search_percent / 100))
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.store.directory, name)
+
+    def train(self) -> int:
+        """
+        저장된 벡터로 k-means 중심점 학습 후 전체 행 배정
+
+        표본 복사와 행 읽기에만 잠시 잠금을 잡고, 중심점 계산과 배정은 잠금 없이 수행한 뒤
+        새 중심점으로 교체합니다. 학습 중 업서트된 행은 교체할 때 새 중심점으로 다시 배정합니다.
+        학습 중 저장소가 정리되면(행 위치 변경) 결과를 버립니다.
+
+        Returns:
+            int: 리스트 수 (학습하지 않았으면 0)
+        """
+        with self._train_lock:
+            with self._lock:
+                alive_positions = np.flatnonzero(self.store._alive[:self.store.count]) \
+                    if self.store._alive is not None else np.empty(0, dtype=np.int64)
+                if len(alive_positions) == 0:
+                    return 0
+
+                generation = self._generation
+                row_count = self.store.count
+                rng = np.random.default_rng(self.seed)
+                n_lists = max(1, math.ceil(len(alive_positions) / self.leaf_node_embedding_count))
+                sample_size = min(len(alive_positions), max(self.max_train_samples, n_lists))
+                sample = np.sort(rng.choice(alive_positions, sample_size, replace=False))
+                vectors = np.asarray(self.store._vectors[sample])
+                self._training_dirty = []
+
+            try:
+                centroids = self._kmeans(vectors, n_lists, rng)
+                del vectors
+
+                assignments = np.full(row_count, -1, dtype=np.int32)
+                for start in range(0, row_count, TRAIN_COPY_ROWS):
+                    end = min(start + TRAIN_COPY_ROWS, row_count)
+                    with self._lock:
+                        if self._generation != generation:
+                            break
+                        rows = np.asarray(self.store._vectors[start:end])
+                    assignments[start:end] = self._nearest_centroids(rows, centroids)
+
+                with self._lock:
+                    if self._generation != generation:
+                        logger.info("IVF 인덱스 학습 중 저장소가 정리되어 학습 결과를 버립니다.")
+                        return 0
+
+                    dirty = self._training_dirty + [np.arange(row_count, self.store.count)]
+                    self.centroids = centroids
+                    self.assignments = assignments
+                    self._assign_positions(np.unique(np.concatenate(dirty)))
+                    self.trained_rows = len(alive_positions)
+                    self._rebuild_lists()
+                    self.save()
+            finally:
+                with self._lock:
+                    self._training_dirty = None
+
+            logger.info(f"IVF 인덱스 학습 완료: 벡터 {len(alive_positions)}개, 리스트 {n_lists}개")
+            return n_lists
+
+    def _kmeans(self, vectors: np.ndarray, n_lists: int, rng: np.random.Generator) -> np.ndarray:
+        """내적 기준 k-means 중심점 (정규화된 float32)"""
+        centroids = vectors[rng.choice(len(vectors), n_lists, replace=False)].copy()
+        for _ in range(self.train_iterations):
+            labels = self._nearest_centroids(vectors, centroids)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, labels, vectors)
+            counts = np.bincount(labels, minlength=n_lists)
+
+            # 빈 리스트는 임의의 표본으로 다시 시작
+            empty = np.flatnonzero(counts == 0)
+            if len(empty):
+                sums[empty] = vectors[rng.choice(len(vectors), len(empty), replace=False)]
+
+            # 벡터가 정규화되어 있으므로 중심점도 정규화 (내적 기준 k-means)
+            norms = np.linalg.norm(sums, axis=1, keepdims=True)
+            norms[norms == 0] = 1.0
+            centroids = sums / norms
+        return centroids.astype(np.float32)
+
+    def _start_background_training(self):
+        """학습이 필요하고 진행 중인 학습이 없으면 백그라운드 학습 시작 (잠금을 잡은 상태에서 호출)"""
+        if not self.background_training or not self.needs_training():
+            return
+        if self._train_thread is not None and self._train_thread.is_alive():
+            return
+        self._train_thread = threading.Thread(target=self._train_in_background, daemon=True)
+        self._train_thread.start()
+
+    def _train_in_background(self):
+        try:
+            self.train()
+        except Exception as e:
+            logger.error(f"IVF 인덱스 백그라운드 학습 중 오류 발생: {e}")
+
+    def wait_for_training(self):
+        """진행 중인 백그라운드 학습이 끝날 때까지 대기"""
+        thread = self._train_thread
+        if thread is not None:
+            thread.join()
+
+    def _nearest_centroids(self, vectors: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+        """행별 가장 가까운(내적이 가장 큰) 중심점 번호"""
+        chunk_rows = max(1, ASSIGN_CHUNK_ELEMENTS // len(centroids))
+        labels = np.empty(len(vectors), dtype=np.int32)
+        for start in range(0, len(vectors), chunk_rows):
+            labels[start:start + chunk_rows] = np.argmax(vectors[start:start + chunk_rows] @ centroids.T, axis=1)
+        return labels
+
+    def _assign_positions(self, positions: np.ndarray):
+        """행 위치를 가장 가까운 리스트에 배정하고 대기 목록에 추가"""
+        if len(positions) == 0:
+            return
+        if len(self.assignments) < self.store.count:
+            grown = np.full(self.store.count, -1, dtype=np.int32)
+            grown[:len(self.assignments)] = self.assignments
+            self.assignments = grown
+
+        chunk_rows = max(1, ASSIGN_CHUNK_ELEMENTS // len(self.centroids))
+        for start in range(0, len(positions), chunk_rows):
+            chunk = positions[start:start + chunk_rows]
+            self.assignments[chunk] = self._nearest_centroids(np.asarray(self.store._vectors[chunk]), self.centroids)
+        self._pending.append(positions)
+        self._pending_count += len(positions)
+
+    def _rebuild_lists(self):
+        """assignments로 리스트별 위치 목록(CSR) 재구성"""
+        assigned = np.flatnonzero(self.assignments >= 0)
+        labels = self.assignments[assigned]
+        self._list_positions = assigned[np.argsort(labels, kind='stable')]
+        self._list_offsets = np.concatenate(
+            ([0], np.cumsum(np.bincount(labels, minlength=len(self.centroids))))
+        )
+        self._pending = []
+        self._pending_count = 0
+
+    def upsert(self, ids: Sequence[str], embeddings: Sequence[Sequence[float]],
+               metadata: Optional[Sequence[Optional[Dict]]] = None) -> int:
+        """저장소에 업서트하고 해당 행을 리스트에 배정"""
+        with self._lock:
+            upserted = self.store.upsert(ids, embeddings, metadata)
+            if upserted and (self.is_trained or self._training_dirty is not None):
+                positions = np.unique(np.fromiter((self.store.positions[vector_id] for vector_id in ids),
+                                                  dtype=np.int64, count=len(ids)))
+                if self._training_dirty is not None:
+                    # 학습 중인 중심점으로 교체할 때 다시 배정
+                    self._training_dirty.append(positions)
+                if self.is_trained:
+                    self._assign_positions(positions)
+                    self._save_assignments()
+            self._start_background_training()
+            return upserted
+
+    def delete(self, ids: Iterable[str]) -> int:
+        """저장소에서 삭제 (검색 시 tombstone으로 제외)"""
+        with self._lock:
+            return self.store.delete(ids)
+
+    def compact(self) -> int:
+        """저장소를 정리하고 리스트 배정을 새 행 위치에 맞춤"""
+        with self._lock:
+            alive_positions = np.flatnonzero(self.store._alive[:self.store.count]) \
+                if self.store._alive is not None else np.empty(0, dtype=np.int64)
+            removed = self.store.compact()
+            if removed:
+                self._generation += 1
+            if removed and self.is_trained:
+                self.assignments = self.assignments[alive_positions]
+                self._rebuild_lists()
+                self._save_assignments()
+            return removed
+
+    def needs_training(self) -> bool:
+        """학습이 필요한지 여부 (처음 최소 크기에 도달했거나 학습 후 벡터 수가 두 배 이상 증가)"""
+        vector_count = len(self.store)
+        if vector_count < self.min_train_size:
+            return False
+        return not self.is_trained or vector_count >= self.trained_rows * 2
+
+    def search(self, query_embedding: Sequence[float], top_k: int = 10,
+               filters: Optional[Dict] = None, nprobe: Optional[int] = None) -> List[Dict]:
+        """
+        근사 코사인 유사도 상위 top_k 검색
+
+        학습 전이면 저장소 전체 검색으로 응답하고, 학습이 필요하면 백그라운드 학습만 시작합니다.
+        필터가 있으면 탐색한 리스트의 후보 중 조건에 맞는 행만 남기고, 남은 후보가 top_k보다 적으면
+        저장소의 필터 검색(조건에 맞는 행 전체 검색)으로 대신합니다.
+
+        Args:
+            query_embedding: 쿼리 벡터
+            top_k: 반환할 결과 수
+            filters: 메타데이터 필터 (MetadataIndex.mask 참고)
+            nprobe: 탐색할 리스트 수 (생략 시 leaf_nodes_to_search_percent 기준)
+
+        Returns:
+            List[Dict]: {'id', 'similarity'} 목록 (유사도 내림차순)
+        """
+        with self._lock:
+            self._start_background_training()
+            if not self.is_trained:
+                return self.store.search(query_embedding, top_k, filters)
+
+            query = self.store._normalize(query_embedding)[0]
+            candidates = self._candidate_positions(query, nprobe or self.nprobe)
+            allowed = self.store.metadata.mask(filters, self.store.count)
+            if allowed is not None:
+                candidates = candidates[allowed[candidates]]
+                if len(candidates) < top_k:
+                    return self.store.search(query_embedding, top_k, filters)
+            if len(candidates) == 0:
+                return []
+
+            scores = np.asarray(self.store._vectors[candidates]) @ query
+            if top_k < len(scores):
+                top = np.argpartition(-scores, top_k - 1)[:top_k]
+            else:
+                top = np.arange(len(scores))
+            top = top[np.argsort(-scores[top])]
+
+            return [
+                {'id': self.store.ids[candidates[index]], 'similarity': float(scores[index])}
+                for index in top
+            ]
+
+    def _candidate_positions(self, query: np.ndarray, nprobe: int) -> np.ndarray:
+        """쿼리와 가까운 nprobe개 리스트에 속한 삭제되지 않은 행 위치"""
+        if self._list_offsets is None or \
+                self._pending_count > max(MIN_PENDING_MERGE, len(self._list_positions) // 10):
+            self._rebuild_lists()
+
+        centroid_scores = self.centroids @ query
+        nprobe = min(nprobe, len(self.centroids))
+        probed = np.argpartition(-centroid_scores, nprobe - 1)[:nprobe]
+
+        parts = []
+        for list_id in probed:
+            positions = self._list_positions[self._list_offsets[list_id]:self._list_offsets[list_id + 1]]
+            # 재구성 이후 다른 리스트로 옮겨간 행 제외
+            parts.append(positions[self.assignments[positions] == list_id])
+        candidates = np.concatenate(parts)
+        if self._pending:
+            # 대기 목록의 행은 CSR에도 같은 리스트로 남아 있을 수 있으므로 중복 제거
+            pending = np.concatenate(self._pending)
+            candidates = np.unique(np.concatenate((candidates, pending[np.isin(self.assignments[pending], probed)])))
+        return candidates[self.store._alive[candidates] == 1]
+
+    def save(self):
+        """중심점, 행 배정, 메타 정보 저장"""
+        with self._lock:
+            if not self.is_trained:
+                return
+            np.save(self._path(IVF_CENTROIDS_FILE), self.centroids)
+            self._save_assignments()
+
+    def _save_assignments(self):
+        """행 배정과 메타 정보 저장 (임시 파일 교체로 원자적으로 갱신)"""
+        temp_path = self._path(IVF_ASSIGNMENTS_FILE + '.tmp.npy')
+        np.save(temp_path, self.assignments[:self.store.count])
+        os.replace(temp_path, self._path(IVF_ASSIGNMENTS_FILE))
+
+        meta = {
+            'n_lists': len(self.centroids),
+            'trained_rows': self.trained_rows,
+            'store_count': self.store.count,
+            'leaf_node_embedding_count': self.leaf_node_embedding_count
+        }
+        temp_path = self._path(IVF_META_FILE + '.tmp')
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(meta, f)
+        os.replace(temp_path, self._path(IVF_META_FILE))
+
+    def load(self) -> bool:
+        """저장된 인덱스 불러오기 (저장 이후 저장소에 추가된 행은 다시 배정)"""
+        with self._lock:
+            if not os.path.exists(self._path(IVF_META_FILE)):
+                return False
+            try:
+                with open(self._path(IVF_META_FILE), 'r', encoding='utf-8') as f:
+                    meta = json.load(f)
+                centroids = np.load(self._path(IVF_CENTROIDS_FILE))
+                assignments = np.load(self._path(IVF_ASSIGNMENTS_FILE))
+            except Exception as e:
+                logger.error(f"IVF 인덱스 로드 중 오류 발생: {e}")
+                return False
+
+            if centroids.shape[1] != self.store.dimensions or len(assignments) > self.store.count:
+                logger.warning("IVF 인덱스가 저장소와 맞지 않아 다시 학습합니다.")
+                return False
+
+            self.centroids = centroids
+            self.assignments = assignments.astype(np.int32)
+            self.trained_rows = meta['trained_rows']
+            self._assign_positions(np.arange(len(assignments), self.store.count))
+            self._rebuild_lists()
+            logger.info(f"IVF 인덱스 로드: 리스트 {len(centroids)}개")
+            return True
+
+    def get_stats(self) -> Dict:
+        """인덱스 통계"""
+        with self._lock:
+            stats = {
+                'trained': self.is_trained,
+                'n_lists': self.n_lists,
+                'nprobe': self.nprobe,
+                'trained_rows': self.trained_rows
+            }
+            if self.is_trained:
+                sizes = np.bincount(self.assignments[self.assignments >= 0], minlength=len(self.centroids))
+                stats['max_list_size'] = int(sizes.max())
+                stats['mean_list_size'] = float(sizes.mean())
+            return stats
@@ -0,0 +1,559 @@
+"""
+메모리 매핑 로컬 벡터 저장소
+
+Vertex AI Vector Search를 사용할 수 없을 때 쓰는 로컬 저장소입니다. 벡터는 L2 정규화한
+float32 행렬 파일(vectors.f32)에 행 단위로 저장하고 np.memmap으로 열어 두므로 검색할 때마다
+파일을 다시 읽지 않습니다. 행 번호와 ID의 대응은 ids.txt에 한 줄씩 추가하고, 삭제는 alive.u8의
+행 플래그만 0으로 바꾸는 tombstone 방식입니다. 삭제된 행은 compact()에서 정리합니다.
+
+quantization을 지정하면 벡터 수가 quantizer_train_size에 도달했을 때 코덱을 학습하고, 이후 모든 행의
+코드(codes.u8)를 함께 저장합니다. 검색은 코드로 후보를 고른 뒤 float32 원본으로 다시 정렬합니다.
+
+업서트 시 메타데이터를 함께 주면 MetadataIndex에 행 위치별로 보관하고, 검색 필터를 행 마스크로 바꿔
+상위 top_k 계산 전에 적용합니다.
+"""
+import json
+import logging
+import os
+import threading
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from .metadata_index import MetadataIndex, read_lines
+from .quantization import create_codec, load_codec, save_codec
+
+logger = logging.getLogger(__name__)
+
+META_FILE = 'meta.json'
+VECTORS_FILE = 'vectors.f32'
+ALIVE_FILE = 'alive.u8'
+IDS_FILE = 'ids.txt'
+CODES_FILE = 'codes.u8'
+CODEC_FILE = 'codec.npz'
+LEGACY_JSON_FILE = 'vector_data.json'
+
+# compact() 시 한 번에 복사하는 행 수
+COPY_CHUNK_ROWS = 65536
+# 검색 시 한 번에 점수를 계산하는 행 수 (여러 쿼리의 점수 행렬 크기 제한)
+SEARCH_CHUNK_ROWS = 131072
+# 필터에 맞는 행이 전체의 이 비율 이하이면 해당 행만 모아서 계산 (행 모으기는 연속 읽기보다 행당 비용이 큼)
+FILTER_GATHER_FRACTION = 0.1
+# 코덱 학습에 사용할 최대 표본 수
+QUANTIZER_TRAIN_SAMPLES = 65536
+
+
+class LocalVectorStore:
+    """메모리 매핑 float32 로컬 벡터 저장소"""
+
+    def __init__(self, directory: str = 'data/vectors', dimensions: Optional[int] = None,
+                 initial_capacity: int = 1024, quantization: Optional[str] = None,
+                 quantization_params: Optional[Dict] = None, quantizer_train_size: int = 10000,
+                 rerank_factor: int = 10):
+        """
+        초기화
+
+        Args:
+            directory: 저장 디렉토리
+            dimensions: 벡터 차원 (생략 시 저장된 값 또는 첫 업서트 벡터의 차원)
+            initial_capacity: 처음 파일을 만들 때 확보할 행 수 (부족하면 두 배씩 확장)
+            quantization: 양자화 방식 ('int8', 'pq', None이면 float32만 사용)
+            quantization_params: 코덱 생성 인자 (예: pq의 subspaces)
+            quantizer_train_size: 코덱을 학습하는 최소 벡터 수
+            rerank_factor: 코드 점수로 고를 후보 수 (top_k의 배수, float32로 다시 정렬)
+        """
+        self.directory = directory
+        self.dimensions = dimensions
+        self.initial_capacity = initial_capacity
+        self.quantization = quantization
+        self.quantization_params = quantization_params or {}
+        self.quantizer_train_size = quantizer_train_size
+        self.rerank_factor = rerank_factor
+        self.codec = None
+        self.count = 0
+        self.capacity = 0
+        self.ids: List[str] = []
+        self.positions: Dict[str, int] = {}
+        self._vectors: Optional[np.memmap] = None
+        self._alive: Optional[np.memmap] = None
+        self._codes: Optional[np.memmap] = None
+        # 삭제된 행 위치 (검색 시 제외, 변경 시 다시 계산)
+        self._deleted_positions: Optional[np.ndarray] = None
+        self._lock = threading.RLock()
+        self.metadata = MetadataIndex(directory)
+        self._load()
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.directory, name)
+
+    def _load(self):
+        """저장된 메타 정보, ID 목록, 행렬 파일 열기"""
+        if not os.path.exists(self._path(META_FILE)):
+            return
+
+        with open(self._path(META_FILE), 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+
+        self.dimensions = meta['dimensions']
+        self.capacity = meta['capacity']
+        if meta.get('quantization') and os.path.exists(self._path(CODEC_FILE)):
+            self.codec = load_codec(self._path(CODEC_FILE))
+            self.quantization = self.codec.name
+
+        ids = []
+        if os.path.exists(self._path(IDS_FILE)):
+            ids = read_lines(self._path(IDS_FILE))
+
+        # ids.txt 추가 후 meta.json 갱신 전에 중단된 경우 meta의 행 수를 기준으로 맞춤
+        self.count = min(meta['count'], len(ids))
+        self.ids = ids[:self.count]
+        self._open_maps()
+
+        alive = np.asarray(self._alive[:self.count], dtype=bool)
+        self.positions = {
+            vector_id: position for position, vector_id in enumerate(self.ids) if alive[position]
+        }
+        logger.info(f"로컬 벡터 저장소 로드: {len(self.positions)}개 ({self.directory})")
+
+    def _open_maps(self):
+        """행렬 및 행 플래그 파일을 메모리 매핑으로 열기"""
+        self._vectors = np.memmap(self._path(VECTORS_FILE), dtype=np.float32, mode='r+',
+                                  shape=(self.capacity, self.dimensions))
+        self._alive = np.memmap(self._path(ALIVE_FILE), dtype=np.uint8, mode='r+',
+                                shape=(self.capacity,))
+        if self.codec is not None:
+            self._codes = np.memmap(self._path(CODES_FILE), dtype=np.uint8, mode='r+',
+                                    shape=(self.capacity, self.codec.code_size))
+
+    def _data_files(self):
+        """(파일 이름, 행당 바이트 수) 목록"""
+        files = [(VECTORS_FILE, self.dimensions * 4), (ALIVE_FILE, 1)]
+        if self.codec is not None:
+            files.append((CODES_FILE, self.codec.code_size))
+        return files
+
+    def _close_maps(self):
+        """메모리 매핑 닫기"""
+        if self._vectors is not None:
+            self._vectors.flush()
+            self._alive.flush()
+        if self._codes is not None:
+            self._codes.flush()
+        self._vectors = None
+        self._alive = None
+        self._codes = None
+
+    def _create_files(self, dimensions: int):
+        """빈 저장소 파일 생성"""
+        os.makedirs(self.directory, exist_ok=True)
+        self.dimensions = dimensions
+        self.capacity = self.initial_capacity
+        for name, row_bytes in self._data_files():
+            with open(self._path(name), 'wb') as f:
+                f.truncate(self.capacity * row_bytes)
+        open(self._path(IDS_FILE), 'w', encoding='utf-8').close()
+        self._open_maps()
+        self._write_meta()
+
+    def _ensure_capacity(self, rows: int):
+        """rows개 행을 저장할 수 있도록 파일 확장"""
+        if rows <= self.capacity:
+            return
+
+        new_capacity = max(rows, self.capacity * 2)
+        self._close_maps()
+        for name, row_bytes in self._data_files():
+            with open(self._path(name), 'r+b') as f:
+                f.truncate(new_capacity * row_bytes)
+        self.capacity = new_capacity
+        self._open_maps()
+
+    def _write_meta(self):
+        """메타 정보 저장 (임시 파일 교체로 원자적으로 갱신)"""
+        meta = {
+            'dimensions': self.dimensions, 'count': self.count, 'capacity': self.capacity,
+            'quantization': self.codec.name if self.codec is not None else None
+        }
+        temp_path = self._path(META_FILE + '.tmp')
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(meta, f)
+        os.replace(temp_path, self._path(META_FILE))
+
+    def _normalize(self, embeddings) -> np.ndarray:
+        """벡터를 float32 행렬로 변환하고 L2 정규화 (영벡터는 그대로)"""
+        matrix = np.array(embeddings, dtype=np.float32, ndmin=2)
+        if matrix.shape[1] != self.dimensions:
+            raise ValueError(f"벡터 차원이 맞지 않습니다: {matrix.shape[1]} != {self.dimensions}")
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return matrix / norms
+
+    def upsert(self, ids: Sequence[str], embeddings: Sequence[Sequence[float]],
+               metadata: Optional[Sequence[Optional[Dict]]] = None) -> int:
+        """
+        벡터 추가 또는 교체 (이미 있는 ID는 같은 행을 덮어씀)
+
+        Args:
+            ids: 벡터 ID 목록
+            embeddings: ids와 같은 순서의 벡터 목록
+            metadata: ids와 같은 순서의 필터용 메타데이터 (service_daytime, large_code_nm,
+                stock_code, writers), 생략하면 기존 메타데이터 유지
+
+        Returns:
+            int: 저장한 벡터 수
+        """
+        if len(ids) != len(embeddings) or (metadata is not None and len(metadata) != len(ids)):
+            raise ValueError("ID 수와 벡터 수가 다릅니다.")
+        if not ids:
+            return 0
+
+        with self._lock:
+            if self._vectors is None:
+                self._create_files(len(embeddings[0]))
+
+            matrix = self._normalize(embeddings)
+
+            # 같은 요청 안에서 중복된 ID는 마지막 벡터 사용
+            rows = {}
+            row_metadata = {}
+            new_ids = []
+            for index, (vector_id, row) in enumerate(zip(ids, matrix)):
+                if vector_id not in self.positions and vector_id not in rows:
+                    new_ids.append(vector_id)
+                rows[vector_id] = row
+                if metadata is not None:
+                    row_metadata[vector_id] = metadata[index]
+
+            self._ensure_capacity(self.count + len(new_ids))
+            for vector_id in new_ids:
+                self.positions[vector_id] = self.count
+                self.ids.append(vector_id)
+                self.count += 1
+
+            positions = np.fromiter((self.positions[vector_id] for vector_id in rows),
+                                    dtype=np.int64, count=len(rows))
+            matrix = np.stack(list(rows.values()))
+            self._vectors[positions] = matrix
+            self._alive[positions] = 1
+            self._deleted_positions = None
+            self._vectors.flush()
+            self._alive.flush()
+            if self._codes is not None:
+                self._codes[positions] = self.codec.encode(matrix)
+                self._codes.flush()
+            if metadata is not None:
+                self.metadata.update(positions, list(row_metadata.values()))
+
+            if new_ids:
+                with open(self._path(IDS_FILE), 'a', encoding='utf-8') as f:
+                    f.write(''.join(f"{vector_id}\n" for vector_id in new_ids))
+            self._write_meta()
+
+            if self.quantization and self.codec is None and len(self.positions) >= self.quantizer_train_size:
+                self.train_quantizer()
+
+            return len(rows)
+
+    def train_quantizer(self, quantization: Optional[str] = None) -> bool:
+        """
+        저장된 벡터 표본으로 코덱을 학습하고 모든 행의 코드 생성
+
+        Args:
+            quantization: 양자화 방식 (생략 시 생성 시 지정한 방식)
+
+        Returns:
+            bool: 학습 여부
+        """
+        with self._lock:
+            quantization = quantization or self.quantization
+            if not quantization or not self.positions:
+                return False
+
+            alive_positions = np.flatnonzero(self._alive[:self.count])
+            rng = np.random.default_rng(0)
+            sample = np.sort(rng.choice(alive_positions, min(len(alive_positions), QUANTIZER_TRAIN_SAMPLES),
+                                        replace=False))
+            codec = create_codec(quantization, self.dimensions, **self.quantization_params)
+            codec.train(np.asarray(self._vectors[sample]))
+
+            codes = np.memmap(self._path(CODES_FILE), dtype=np.uint8, mode='w+',
+                              shape=(self.capacity, codec.code_size))
+            for start in range(0, self.count, COPY_CHUNK_ROWS):
+                end = min(start + COPY_CHUNK_ROWS, self.count)
+                codes[start:end] = codec.encode(np.asarray(self._vectors[start:end]))
+            codes.flush()
+            del codes
+
+            save_codec(codec, self._path(CODEC_FILE))
+            self._close_maps()
+            self.codec = codec
+            self.quantization = codec.name
+            self._open_maps()
+            self._write_meta()
+
+            logger.info(f"로컬 벡터 저장소 양자화 학습 완료: {codec.name}, 행당 {codec.code_size}바이트")
+            return True
+
+    def delete(self, ids: Iterable[str]) -> int:
+        """벡터 삭제 (행 플래그만 tombstone으로 표시)"""
+        with self._lock:
+            positions = [self.positions.pop(vector_id) for vector_id in ids if vector_id in self.positions]
+            if positions:
+                self._alive[positions] = 0
+                self._alive.flush()
+                self._deleted_positions = None
+            return len(positions)
+
+    def get(self, vector_id: str) -> Optional[np.ndarray]:
+        """저장된 (정규화된) 벡터 조회"""
+        with self._lock:
+            position = self.positions.get(vector_id)
+            if position is None:
+                return None
+            return np.array(self._vectors[position])
+
+    def search(self, query_embedding: Sequence[float], top_k: int = 10,
+               filters: Optional[Dict] = None) -> List[Dict]:
+        """
+        코사인 유사도 상위 top_k 검색
+
+        Args:
+            query_embedding: 쿼리 벡터
+            top_k: 반환할 결과 수
+            filters: 메타데이터 필터 (MetadataIndex.mask 참고)
+
+        Returns:
+            List[Dict]: {'id', 'similarity'} 목록 (유사도 내림차순)
+        """
+        return self.search_batch([query_embedding], top_k, filters)[0]
+
+    def search_batch(self, query_embeddings: Sequence[Sequence[float]], top_k: int = 10,
+                     filters: Optional[Dict] = None) -> List[List[Dict]]:
+        """
+        여러 쿼리의 코사인 유사도 상위 top_k 검색
+
+        저장된 벡터가 정규화되어 있으므로 행 묶음마다 (쿼리 행렬 x 벡터 행렬) 곱 한 번으로 점수를 계산하고,
+        argpartition으로 묶음별 상위 top_k만 남긴 뒤 합쳐서 정렬합니다.
+        코덱이 있으면 코드로 근사 점수를 계산해 top_k x rerank_factor개 후보를 고르고,
+        후보만 float32 원본으로 다시 점수를 계산합니다.
+        필터가 있으면 조건에 맞지 않는 행의 점수를 제외하고, 남은 행이 적으면(FILTER_GATHER_FRACTION)
+        해당 행만 모아 float32로 바로 계산합니다.
+
+        Args:
+            query_embeddings: 쿼리 벡터 목록
+            top_k: 쿼리별 반환할 결과 수
+            filters: 메타데이터 필터 (MetadataIndex.mask 참고)
+
+        Returns:
+            List[List[Dict]]: 쿼리 순서와 같은 {'id', 'similarity'} 목록
+        """
+        with self._lock:
+            if not self.positions:
+                return [[] for _ in query_embeddings]
+
+            queries = self._normalize(query_embeddings)
+            allowed = self.metadata.mask(filters, self.count)
+            if allowed is not None:
+                allowed &= self._alive[:self.count] == 1
+                allowed_positions = np.flatnonzero(allowed)
+                if len(allowed_positions) == 0:
+                    return [[] for _ in query_embeddings]
+                if len(allowed_positions) <= min(SEARCH_CHUNK_ROWS, self.count * FILTER_GATHER_FRACTION):
+                    return self._search_positions(queries, allowed_positions, top_k)
+
+            top_k = min(top_k, len(self.positions))
+            candidate_count = min(top_k * self.rerank_factor, len(self.positions)) \
+                if self.codec is not None else top_k
+            deleted = self._get_deleted_positions()
+
+            candidate_scores = []
+            candidate_positions = []
+            for start in range(0, self.count, SEARCH_CHUNK_ROWS):
+                end = min(start + SEARCH_CHUNK_ROWS, self.count)
+                if allowed is not None and not allowed[start:end].any():
+                    continue
+                if self.codec is not None:
+                    scores = self.codec.scores(self._codes[start:end], queries)
+                else:
+                    scores = np.asarray(queries @ self._vectors[start:end].T)
+
+                if allowed is not None:
+                    scores[:, ~allowed[start:end]] = -np.inf
+                else:
+                    chunk_deleted = deleted[np.searchsorted(deleted, start):np.searchsorted(deleted, end)]
+                    if len(chunk_deleted):
+                        scores[:, chunk_deleted - start] = -np.inf
+
+                positions = self._top_k_indices(scores, candidate_count)
+                candidate_scores.append(np.take_along_axis(scores, positions, axis=1))
+                candidate_positions.append(positions + start)
+
+            scores = np.concatenate(candidate_scores, axis=1)
+            positions = np.concatenate(candidate_positions, axis=1)
+            if self.codec is not None:
+                scores, positions = self._rerank(queries, scores, positions, candidate_count)
+            return self._format_results(scores, positions, top_k)
+
+    def _search_positions(self, queries: np.ndarray, positions: np.ndarray, top_k: int) -> List[List[Dict]]:
+        """지정한 행 위치만 float32로 점수 계산"""
+        scores = np.asarray(queries @ np.asarray(self._vectors[positions]).T)
+        return self._format_results(scores, np.broadcast_to(positions, scores.shape), min(top_k, len(positions)))
+
+    def _format_results(self, scores: np.ndarray, positions: np.ndarray, top_k: int) -> List[List[Dict]]:
+        """쿼리별 점수 상위 top_k를 {'id', 'similarity'} 목록으로 변환"""
+        order = self._top_k_indices(scores, top_k)
+        order = np.take_along_axis(order, np.argsort(-np.take_along_axis(scores, order, axis=1), axis=1), axis=1)
+
+        return [
+            [
+                {'id': self.ids[positions[query, index]], 'similarity': float(scores[query, index])}
+                for index in order[query]
+                if scores[query, index] > -np.inf
+            ]
+            for query in range(len(scores))
+        ]
+
+    def _rerank(self, queries: np.ndarray, scores: np.ndarray, positions: np.ndarray, candidate_count: int):
+        """코드 점수 상위 후보를 float32 원본 점수로 교체"""
+        order = self._top_k_indices(scores, candidate_count)
+        positions = np.take_along_axis(positions, order, axis=1)
+        valid = np.take_along_axis(scores, order, axis=1) > -np.inf
+
+        exact = np.full(positions.shape, -np.inf, dtype=np.float32)
+        for query in range(len(queries)):
+            candidates = positions[query, valid[query]]
+            exact[query, valid[query]] = np.asarray(self._vectors[candidates]) @ queries[query]
+        return exact, positions
+
+    def _top_k_indices(self, scores: np.ndarray, top_k: int) -> np.ndarray:
+        """행별 상위 top_k 열 위치 (순서 없음)"""
+        if top_k >= scores.shape[1]:
+            return np.broadcast_to(np.arange(scores.shape[1]), scores.shape).copy()
+        return np.argpartition(-scores, top_k - 1, axis=1)[:, :top_k]
+
+    def _get_deleted_positions(self) -> np.ndarray:
+        """삭제된 행 위치 (정렬된 배열)"""
+        if self._deleted_positions is None:
+            self._deleted_positions = np.flatnonzero(self._alive[:self.count] == 0)
+        return self._deleted_positions
+
+    def compact(self) -> int:
+        """
+        삭제된 행을 제거해 파일 재작성
+
+        Returns:
+            int: 제거한 행 수
+        """
+        with self._lock:
+            if self._vectors is None:
+                return 0
+
+            removed = self.count - len(self.positions)
+            if removed == 0:
+                return 0
+
+            alive_positions = np.flatnonzero(self._alive[:self.count])
+            capacity = max(self.initial_capacity, len(alive_positions))
+            temp_vectors = np.memmap(self._path(VECTORS_FILE + '.tmp'), dtype=np.float32, mode='w+',
+                                     shape=(capacity, self.dimensions))
+            for start in range(0, len(alive_positions), COPY_CHUNK_ROWS):
+                chunk = alive_positions[start:start + COPY_CHUNK_ROWS]
+                temp_vectors[start:start + len(chunk)] = self._vectors[chunk]
+            temp_vectors.flush()
+            del temp_vectors
+
+            temp_alive = np.memmap(self._path(ALIVE_FILE + '.tmp'), dtype=np.uint8, mode='w+',
+                                   shape=(capacity,))
+            temp_alive[:len(alive_positions)] = 1
+            temp_alive.flush()
+            del temp_alive
+
+            names = [VECTORS_FILE, ALIVE_FILE, IDS_FILE]
+            if self._codes is not None:
+                temp_codes = np.memmap(self._path(CODES_FILE + '.tmp'), dtype=np.uint8, mode='w+',
+                                       shape=(capacity, self.codec.code_size))
+                for start in range(0, len(alive_positions), COPY_CHUNK_ROWS):
+                    chunk = alive_positions[start:start + COPY_CHUNK_ROWS]
+                    temp_codes[start:start + len(chunk)] = self._codes[chunk]
+                temp_codes.flush()
+                del temp_codes
+                names.append(CODES_FILE)
+
+            self.metadata.remap(alive_positions, self.count)
+
+            ids = [self.ids[position] for position in alive_positions]
+            with open(self._path(IDS_FILE + '.tmp'), 'w', encoding='utf-8') as f:
+                f.write(''.join(f"{vector_id}\n" for vector_id in ids))
+
+            self._close_maps()
+            for name in names:
+                os.replace(self._path(name + '.tmp'), self._path(name))
+
+            self.ids = ids
+            self.positions = {vector_id: position for position, vector_id in enumerate(ids)}
+            self.count = len(ids)
+            self.capacity = capacity
+            self._deleted_positions = None
+            self._open_maps()
+            self._write_meta()
+
+            logger.info(f"로컬 벡터 저장소 정리: 삭제된 행 {removed}개 제거")
+            return removed
+
+    def update_metadata(self, ids: Sequence[str], metadata: Sequence[Optional[Dict]]) -> int:
+        """
+        벡터는 그대로 두고 필터용 메타데이터만 교체
+
+        Returns:
+            int: 메타데이터를 교체한 행 수 (저장소에 없는 ID 제외)
+        """
+        with self._lock:
+            rows = [(self.positions[vector_id], row_metadata)
+                    for vector_id, row_metadata in zip(ids, metadata) if vector_id in self.positions]
+            if rows:
+                self.metadata.update([position for position, _ in rows], [row_metadata for _, row_metadata in rows])
+            return len(rows)
+
+    def ids_without_metadata(self) -> List[str]:
+        """필터용 메타데이터가 없는 벡터 ID (기존 JSON 가져오기 또는 메타데이터 없이 업서트한 행)"""
+        with self._lock:
+            if not self.positions:
+                return []
+            missing = (self._alive[:self.count] == 1) & ~self.metadata.covered_mask(self.count)
+            return [self.ids[position] for position in np.flatnonzero(missing)]
+
+    def import_json(self, json_path: str, batch_size: int = 10000) -> int:
+        """기존 vector_data.json 형식([{'id', 'embedding'}]) 파일 가져오기"""
+        with open(json_path, 'r', encoding='utf-8') as f:
+            vector_data = json.load(f)
+
+        imported = 0
+        for start in range(0, len(vector_data), batch_size):
+            batch = vector_data[start:start + batch_size]
+            imported += self.upsert([item['id'] for item in batch], [item['embedding'] for item in batch])
+        return imported
+
+    def get_stats(self) -> Dict:
+        """저장소 통계"""
+        with self._lock:
+            code_bytes = self.codec.code_size if self.codec is not None else 0
+            float32_bytes = (self.dimensions or 0) * 4
+            return {
+                'vectors': len(self.positions),
+                'deleted': self.count - len(self.positions),
+                'capacity': self.capacity,
+                'dimensions': self.dimensions,
+                'quantization': self.codec.name if self.codec is not None else None,
+                # 코드는 후보 검색용이고 다시 정렬용 float32 행렬도 함께 저장되므로 따로 보고
+                'code_bytes_per_vector': code_bytes,
+                'float32_bytes_per_vector': float32_bytes,
+                'bytes_per_vector': code_bytes + float32_bytes
+            }
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    def close(self):
+        """메모리 매핑 닫기"""
+        with self._lock:
+            self._close_maps()
@@ -0,0 +1,403 @@
+"""
+벡터 저장소 메타데이터 필터 인덱스
+
+LocalVectorStore의 행 위치별로 service_daytime, large_code_nm, stock_code, writers 값을 보관하고,
+검색 전에 필터 조건을 행 마스크로 바꿔 상위 top_k 계산에서 조건에 맞지 않는 행을 제외합니다.
+
+속성마다 (행 위치, 값, 순번) 레코드를 metadata_<속성>.bin 파일에 추가만 하고, 같은 행의 값은 가장 큰
+순번의 레코드만 유효합니다. 문자열 속성의 값은 metadata_<속성>.vocab 파일의 줄 번호이고,
+service_daytime은 1970-01-01 기준 초 단위 값입니다.
+"""
+import logging
+import os
+import re
+import threading
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Sequence, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+DATE_ATTRIBUTE = 'service_daytime'
+VALUE_ATTRIBUTES = ('large_code_nm', 'stock_code', 'writers')
+ATTRIBUTES = (DATE_ATTRIBUTE,) + VALUE_ATTRIBUTES
+
+# 필터 사전 키 (HybridRAGSystem 필터 형식) -> 속성
+FILTER_KEYS = {
+    'categories': 'large_code_nm',
+    'stock_codes': 'stock_code',
+    'writers': 'writers',
+}
+
+RECORD_DTYPE = np.dtype([('position', '<i8'), ('value', '<i8'), ('sequence', '<i8')])
+# 값이 없는 행 표시 (이전 값 무효화용)
+NO_VALUE = np.iinfo(np.int64).min
+EPOCH = datetime(1970, 1, 1)
+
+FILTER_CLAUSE_PATTERN = re.compile(r'^\s*(\w+)\s*(>=|<=|=)\s*(.+?)\s*$')
+
+
+def to_timestamp(value: Union[datetime, date, str, None]) -> Optional[int]:
+    """날짜시간 값을 1970-01-01 기준 초로 변환"""
+    if value is None or value == '':
+        return None
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.strip())
+    elif not isinstance(value, datetime):
+        value = datetime(value.year, value.month, value.day)
+    if value.tzinfo is not None:
+        value = value.replace(tzinfo=None)
+    return int((value - EPOCH).total_seconds())
+
+
+def end_timestamp(value: Union[datetime, date, str]) -> int:
+    """
+    end_date 필터의 상한 (이 값 미만만 포함)
+
+    날짜만 주면(date 또는 'YYYY-MM-DD') 그날 전체를 포함하도록 다음 날 0시를, 날짜시간을 주면
+    그 시각을 포함하도록 1초 뒤를 반환합니다.
+    """
+    if isinstance(value, str):
+        text = value.strip()
+        if ':' not in text and 'T' not in text and ' ' not in text:
+            value = date.fromisoformat(text)
+        else:
+            value = datetime.fromisoformat(text)
+    if not isinstance(value, datetime):
+        return to_timestamp(value + timedelta(days=1))
+    return to_timestamp(value) + 1
+
+
+def row_values(attribute: str, metadata: Dict) -> List:
+    """행 메타데이터에서 속성 값 목록 추출 (writers 문자열은 쉼표로 나눔)"""
+    value = metadata.get(attribute)
+    if value is None or value == '':
+        return []
+    if attribute == DATE_ATTRIBUTE:
+        return [to_timestamp(value)]
+    if isinstance(value, str):
+        items = value.split(',') if attribute == 'writers' else [value]
+    else:
+        items = value
+    return list(dict.fromkeys(str(item).replace('\n', ' ').strip() for item in items if item))
+
+
+def read_lines(path: str) -> List[str]:
+    """
+    '\n'으로 끝나는 줄 파일 읽기 (vocab, ids 파일)
+
+    줄 번호가 값 번호이므로 str.splitlines()처럼 '\r', '\x1c', '\u2028' 등에서 나누지 않고,
+    쓰기와 같은 '\n'에서만 나눕니다.
+    """
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        text = f.read()
+    if not text:
+        return []
+    lines = text.split('\n')
+    # 파일 끝 '\n' 뒤의 빈 문자열 제외
+    if lines[-1] == '':
+        lines.pop()
+    return lines
+
+
+def matches_filters(metadata: Optional[Dict], filters: Optional[Dict]) -> bool:
+    """메타데이터 사전 하나가 필터 조건에 맞는지 여부 (MetadataIndex.mask와 같은 기준)"""
+    if not filters:
+        return True
+    metadata = metadata or {}
+
+    if filters.get('start_date') or filters.get('end_date'):
+        timestamps = row_values(DATE_ATTRIBUTE, metadata)
+        if not timestamps:
+            return False
+        if filters.get('start_date') and timestamps[0] < to_timestamp(filters['start_date']):
+            return False
+        if filters.get('end_date') and timestamps[0] >= end_timestamp(filters['end_date']):
+            return False
+
+    for key, attribute in FILTER_KEYS.items():
+        wanted = filters.get(key)
+        if not wanted:
+            continue
+        if isinstance(wanted, str):
+            wanted = [wanted]
+        values = [value for value in row_values(attribute, metadata) if value]
+        if attribute == 'writers':
+            matched = any(needle.lower() in value.lower() for needle in wanted for value in values)
+        else:
+            matched = any(value in wanted for value in values)
+        if not matched:
+            return False
+    return True
+
+
+def parse_filter_expression(filter_expression: Union[str, Dict, None]) -> Dict:
+    """
+    필터 식을 필터 사전으로 변환
+
+    'service_daytime>=2024-01-01; large_code_nm=경제,증권; stock_code=005930; writers=홍길동'
+    처럼 ';' 또는 ' AND '로 구분한 조건을 받습니다. '='의 값은 쉼표로 여러 개를 줄 수 있고
+    그중 하나와 일치하면 됩니다. 사전을 주면 그대로 사용합니다.
+
+    Returns:
+        Dict: start_date, end_date, categories, stock_codes, writers 키를 가진 필터 사전
+    """
+    if not filter_expression:
+        return {}
+    if isinstance(filter_expression, dict):
+        return filter_expression
+
+    attribute_keys = {attribute: key for key, attribute in FILTER_KEYS.items()}
+    filters = {}
+    for clause in re.split(r';|\s+AND\s+', filter_expression):
+        if not clause.strip():
+            continue
+        match = FILTER_CLAUSE_PATTERN.match(clause)
+        if not match:
+            raise ValueError(f"필터 식을 해석할 수 없습니다: {clause}")
+        attribute, operator, value = match.groups()
+
+        if attribute == DATE_ATTRIBUTE and operator in ('>=', '<='):
+            filters['start_date' if operator == '>=' else 'end_date'] = value
+        elif attribute in attribute_keys and operator == '=':
+            filters.setdefault(attribute_keys[attribute], []).extend(
+                item.strip() for item in value.split(',') if item.strip()
+            )
+        else:
+            raise ValueError(f"지원하지 않는 필터 조건입니다: {clause}")
+    return filters
+
+
+class MetadataIndex:
+    """행 위치별 메타데이터 필터 인덱스"""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        # 속성별 레코드 버퍼 (앞 _counts개만 사용, 여유 공간을 두고 늘림)
+        self._records: Dict[str, np.ndarray] = {}
+        self._counts: Dict[str, int] = {}
+        # 속성별 행 위치 -> 가장 최근 레코드 순번 (-1이면 레코드 없음)
+        self._latest: Dict[str, np.ndarray] = {}
+        self._vocab: Dict[str, List[str]] = {}
+        self._vocab_ids: Dict[str, Dict[str, int]] = {}
+        self._sequence = 0
+        self._lock = threading.RLock()
+        self._load()
+
+    def _path(self, attribute: str, suffix: str) -> str:
+        return os.path.join(self.directory, f"metadata_{attribute}.{suffix}")
+
+    def _reset(self, attribute: str):
+        self._records[attribute] = np.empty(0, dtype=RECORD_DTYPE)
+        self._counts[attribute] = 0
+        self._latest[attribute] = np.empty(0, dtype=np.int64)
+        self._vocab[attribute] = []
+        self._vocab_ids[attribute] = {}
+
+    def _load(self):
+        """레코드 파일 읽기 (행마다 가장 큰 순번의 레코드만 유효)"""
+        for attribute in ATTRIBUTES:
+            self._reset(attribute)
+            if attribute in VALUE_ATTRIBUTES and os.path.exists(self._path(attribute, 'vocab')):
+                self._vocab[attribute] = read_lines(self._path(attribute, 'vocab'))
+                self._vocab_ids[attribute] = {value: i for i, value in enumerate(self._vocab[attribute])}
+
+            if not os.path.exists(self._path(attribute, 'bin')):
+                continue
+            records = np.fromfile(self._path(attribute, 'bin'), dtype=RECORD_DTYPE)
+            if len(records) == 0:
+                continue
+
+            self._append_records(attribute, records)
+            self._sequence = max(self._sequence, int(records['sequence'].max()) + 1)
+
+    def _append_records(self, attribute: str, records: np.ndarray):
+        """레코드를 버퍼에 추가하고 행별 최근 순번 갱신 (추가한 레코드 수에 비례)"""
+        count = self._counts[attribute]
+        needed = count + len(records)
+        if needed > len(self._records[attribute]):
+            grown = np.empty(max(needed, len(self._records[attribute]) * 2, 64), dtype=RECORD_DTYPE)
+            grown[:count] = self._records[attribute][:count]
+            self._records[attribute] = grown
+        self._records[attribute][count:needed] = records
+        self._counts[attribute] = needed
+
+        positions = records['position']
+        latest = self._latest[attribute]
+        if positions.max() >= len(latest):
+            grown = np.full(max(int(positions.max()) + 1, len(latest) * 2, 64), -1, dtype=np.int64)
+            grown[:len(latest)] = latest
+            self._latest[attribute] = latest = grown
+        np.maximum.at(latest, positions, records['sequence'])
+
+    def _active_records(self, attribute: str):
+        """(레코드, 유효 여부): 행별 최근 순번의 값 있는 레코드만 유효"""
+        records = self._records[attribute][:self._counts[attribute]]
+        valid = (records['sequence'] == self._latest[attribute][records['position']]) & \
+            (records['value'] != NO_VALUE)
+        return records, valid
+
+    def _value_id(self, attribute: str, value: str, new_values: List[str]) -> int:
+        """문자열 값 번호 (처음 보는 값은 사전에 추가)"""
+        value_id = self._vocab_ids[attribute].get(value)
+        if value_id is None:
+            value_id = len(self._vocab[attribute])
+            self._vocab[attribute].append(value)
+            self._vocab_ids[attribute][value] = value_id
+            new_values.append(value)
+        return value_id
+
+    def update(self, positions: Sequence[int], metadata: Sequence[Optional[Dict]]):
+        """
+        행 메타데이터 교체 (이전 값은 모두 무효화)
+
+        새 순번의 레코드를 추가만 하므로 비용은 전체 행 수가 아니라 배치 크기에 비례합니다.
+
+        Args:
+            positions: 행 위치 목록
+            metadata: positions와 같은 순서의 메타데이터 사전 목록
+        """
+        if len(positions) == 0:
+            return
+
+        with self._lock:
+            os.makedirs(self.directory, exist_ok=True)
+            sequence = self._sequence
+            self._sequence += 1
+
+            for attribute in ATTRIBUTES:
+                record_positions = []
+                record_values = []
+                new_values = []
+                for position, row in zip(positions, metadata):
+                    values = row_values(attribute, row or {})
+                    if attribute in VALUE_ATTRIBUTES:
+                        values = [self._value_id(attribute, value, new_values) for value in values if value]
+                    for value in values or [NO_VALUE]:
+                        record_positions.append(position)
+                        record_values.append(value)
+
+                records = np.empty(len(record_positions), dtype=RECORD_DTYPE)
+                records['position'] = record_positions
+                records['value'] = record_values
+                records['sequence'] = sequence
+
+                if new_values:
+                    with open(self._path(attribute, 'vocab'), 'a', encoding='utf-8', newline='') as f:
+                        f.write(''.join(f"{value}\n" for value in new_values))
+                with open(self._path(attribute, 'bin'), 'ab') as f:
+                    records.tofile(f)
+
+                self._append_records(attribute, records)
+
+    def remap(self, alive_positions: np.ndarray, count: int):
+        """
+        저장소 정리 후 행 위치 다시 매기기 (파일 재작성)
+
+        Args:
+            alive_positions: 정리 전 행 위치 중 남는 행 (새 위치 순서)
+            count: 정리 전 행 수
+        """
+        with self._lock:
+            mapping = np.full(count, -1, dtype=np.int64)
+            mapping[alive_positions] = np.arange(len(alive_positions))
+
+            covered = self.covered_mask(count) & (mapping >= 0)
+            for attribute in ATTRIBUTES:
+                records, keep = self._active_records(attribute)
+                positions = records['position']
+                keep &= positions < count
+                keep[keep] = mapping[positions[keep]] >= 0
+
+                # 값이 없는 행도 메타데이터를 받은 행으로 남도록 빈 값 레코드 유지
+                has_value = np.zeros(count, dtype=bool)
+                has_value[positions[keep]] = True
+                empty_positions = np.flatnonzero(covered & ~has_value)
+
+                remapped = np.empty(int(keep.sum()) + len(empty_positions), dtype=RECORD_DTYPE)
+                remapped['position'] = np.concatenate((mapping[positions[keep]], mapping[empty_positions]))
+                remapped['value'] = np.concatenate((
+                    records['value'][keep], np.full(len(empty_positions), NO_VALUE, dtype=np.int64)
+                ))
+                remapped['sequence'] = 0
+
+                temp_path = self._path(attribute, 'bin.tmp')
+                remapped.tofile(temp_path)
+                os.replace(temp_path, self._path(attribute, 'bin'))
+
+                self._records[attribute] = np.empty(0, dtype=RECORD_DTYPE)
+                self._counts[attribute] = 0
+                self._latest[attribute] = np.empty(0, dtype=np.int64)
+                if len(remapped):
+                    self._append_records(attribute, remapped)
+            self._sequence = 1
+
+    def covered_mask(self, count: int) -> np.ndarray:
+        """메타데이터를 한 번이라도 받은 행 마스크 (update는 모든 속성에 레코드를 남김)"""
+        with self._lock:
+            mask = np.zeros(count, dtype=bool)
+            latest = self._latest[DATE_ATTRIBUTE][:count]
+            mask[:len(latest)] = latest >= 0
+            return mask
+
+    def mask(self, filters: Optional[Dict], count: int) -> Optional[np.ndarray]:
+        """
+        필터 조건에 맞는 행 마스크
+
+        조건이 여러 개면 모두 만족해야 하고, 한 조건의 값 목록은 하나만 맞으면 됩니다.
+        writers는 기존 후처리 필터와 같이 대소문자를 무시한 부분 문자열로 비교합니다.
+        해당 속성 값이 없는 행은 그 속성 조건에 맞지 않는 것으로 봅니다.
+
+        Args:
+            filters: start_date, end_date, categories, stock_codes, writers 키를 가진 필터 사전
+            count: 저장소 행 수
+
+        Returns:
+            Optional[np.ndarray]: bool 마스크 (적용할 조건이 없으면 None)
+        """
+        if not filters:
+            return None
+
+        with self._lock:
+            result = None
+            if filters.get('start_date') or filters.get('end_date'):
+                records, valid = self._active_records(DATE_ATTRIBUTE)
+                values = records['value']
+                if filters.get('start_date'):
+                    valid &= values >= to_timestamp(filters['start_date'])
+                if filters.get('end_date'):
+                    valid &= values < end_timestamp(filters['end_date'])
+                result = self._positions_mask(records, valid, count)
+
+            for key, attribute in FILTER_KEYS.items():
+                wanted = filters.get(key)
+                if not wanted:
+                    continue
+                if isinstance(wanted, str):
+                    wanted = [wanted]
+                value_ids = self._matching_value_ids(attribute, wanted)
+                records, valid = self._active_records(attribute)
+                valid &= np.isin(records['value'], value_ids)
+                attribute_mask = self._positions_mask(records, valid, count)
+                result = attribute_mask if result is None else result & attribute_mask
+
+            return result
+
+    def _matching_value_ids(self, attribute: str, wanted: Iterable[str]) -> np.ndarray:
+        """필터 값과 맞는 문자열 값 번호"""
+        if attribute == 'writers':
+            needles = [writer.lower() for writer in wanted]
+            return np.array([
+                value_id for value_id, value in enumerate(self._vocab[attribute])
+                if any(needle in value.lower() for needle in needles)
+            ], dtype=np.int64)
+        ids = self._vocab_ids[attribute]
+        return np.array([ids[value] for value in wanted if value in ids], dtype=np.int64)
+
+    def _positions_mask(self, records: np.ndarray, valid: np.ndarray, count: int) -> np.ndarray:
+        """유효 레코드의 행 위치를 bool 마스크로 변환"""
+        mask = np.zeros(count, dtype=bool)
+        positions = records['position'][valid]
+        mask[positions[positions < count]] = True
+        return mask
@@ -0,0 +1,206 @@
+"""
+벡터 양자화 코덱
+
+LocalVectorStore가 float32 벡터 대신 작은 코드로 1차 점수를 계산할 때 사용합니다.
+- int8: 차원별 최솟값/간격으로 값 하나를 1바이트로 저장 (4배 축소)
+- pq: 벡터를 subspaces개 구간으로 나누고 구간마다 256개 중심점 번호 1바이트로 저장
+  (768차원, 96구간 기준 32배 축소)
+
+두 코덱 모두 쿼리는 float32 그대로 두고 코드와의 내적을 근사하는 비대칭 방식으로 점수를 계산합니다.
+"""
+from typing import Dict, Optional
+
+import numpy as np
+
+# 코드 묶음을 float32로 바꿔 점수를 계산할 때 한 번에 처리하는 행 수 (변환 버퍼가 캐시에 머무는 크기)
+SCORE_CHUNK_ROWS = 2048
+# pq 인코딩 시 한 번에 거리를 계산하는 행 수
+ENCODE_CHUNK_ROWS = 4096
+
+
+class ScalarQuantizer:
+    """차원별 int8 스칼라 양자화"""
+
+    name = 'int8'
+
+    def __init__(self, dimensions: int):
+        self.dimensions = dimensions
+        self.minimum: Optional[np.ndarray] = None
+        self.step: Optional[np.ndarray] = None
+
+    @property
+    def code_size(self) -> int:
+        return self.dimensions
+
+    def train(self, vectors: np.ndarray):
+        """차원별 값 범위 학습"""
+        self.minimum = vectors.min(axis=0).astype(np.float32)
+        step = (vectors.max(axis=0) - self.minimum) / 255.0
+        step[step == 0] = 1.0
+        self.step = step.astype(np.float32)
+
+    def encode(self, vectors: np.ndarray) -> np.ndarray:
+        """벡터를 uint8 코드로 변환 (학습 범위를 벗어난 값은 잘라냄)"""
+        codes = np.rint((vectors - self.minimum) / self.step)
+        return np.clip(codes, 0, 255).astype(np.uint8)
+
+    def decode(self, codes: np.ndarray) -> np.ndarray:
+        """코드를 근사 벡터로 복원"""
+        return codes.astype(np.float32) * self.step + self.minimum
+
+    def scores(self, codes: np.ndarray, queries: np.ndarray) -> np.ndarray:
+        """
+        쿼리와 코드의 근사 내적
+
+        q . (minimum + code * step) = q . minimum + (q * step) . code
+
+        Returns:
+            np.ndarray: (쿼리 수, 코드 수) 점수 행렬
+        """
+        scaled = (queries * self.step).T
+        offsets = (queries @ self.minimum)[:, None]
+        result = np.empty((len(queries), len(codes)), dtype=np.float32)
+        buffer = np.empty((min(SCORE_CHUNK_ROWS, len(codes)), self.dimensions), dtype=np.float32)
+        for start in range(0, len(codes), SCORE_CHUNK_ROWS):
+            chunk = buffer[:min(SCORE_CHUNK_ROWS, len(codes) - start)]
+            np.copyto(chunk, codes[start:start + len(chunk)])
+            result[:, start:start + len(chunk)] = (chunk @ scaled).T
+        return result + offsets
+
+    def to_arrays(self) -> Dict[str, np.ndarray]:
+        return {'minimum': self.minimum, 'step': self.step}
+
+    def load_arrays(self, arrays: Dict[str, np.ndarray]):
+        self.minimum = arrays['minimum']
+        self.step = arrays['step']
+
+
+class ProductQuantizer:
+    """구간별 k-means 곱 양자화 (구간당 중심점 256개, 코드 1바이트)"""
+
+    name = 'pq'
+
+    def __init__(self, dimensions: int, subspaces: int = 96, train_iterations: int = 10,
+                 max_train_samples: int = 10000, seed: int = 0):
+        if dimensions % subspaces:
+            raise ValueError(f"차원 {dimensions}이 구간 수 {subspaces}로 나누어지지 않습니다.")
+        self.dimensions = dimensions
+        self.subspaces = subspaces
+        self.subspace_dimensions = dimensions // subspaces
+        self.train_iterations = train_iterations
+        self.max_train_samples = max_train_samples
+        self.seed = seed
+        # (구간 수, 256, 구간 차원)
+        self.codebooks: Optional[np.ndarray] = None
+
+    @property
+    def code_size(self) -> int:
+        return self.subspaces
+
+    def _split(self, vectors: np.ndarray) -> np.ndarray:
+        """(행 수, 구간 수, 구간 차원) 형태로 변환"""
+        return np.asarray(vectors, dtype=np.float32).reshape(len(vectors), self.subspaces, self.subspace_dimensions)
+
+    def train(self, vectors: np.ndarray):
+        """구간별 k-means 코드북 학습"""
+        rng = np.random.default_rng(self.seed)
+        # 중심점 256개에 충분한 표본만 사용 (구간 수 x 반복 횟수만큼 k-means를 돌리므로)
+        if len(vectors) > self.max_train_samples:
+            vectors = vectors[np.sort(rng.choice(len(vectors), self.max_train_samples, replace=False))]
+        parts = self._split(vectors)
+        centroid_count = min(256, len(vectors))
+        codebooks = np.zeros((self.subspaces, 256, self.subspace_dimensions), dtype=np.float32)
+
+        for subspace in range(self.subspaces):
+            points = np.ascontiguousarray(parts[:, subspace])
+            centroids = points[rng.choice(len(points), centroid_count, replace=False)].copy()
+            for _ in range(self.train_iterations):
+                labels = self._nearest(points, centroids)
+                sums = np.stack([
+                    np.bincount(labels, weights=points[:, dimension], minlength=centroid_count)
+                    for dimension in range(self.subspace_dimensions)
+                ], axis=1).astype(np.float32)
+                counts = np.bincount(labels, minlength=centroid_count)
+                empty = counts == 0
+                # 빈 중심점은 임의의 점으로 다시 시작
+                sums[empty] = points[rng.choice(len(points), int(empty.sum()))]
+                counts[empty] = 1
+                centroids = sums / counts[:, None]
+            codebooks[subspace, :centroid_count] = centroids
+            # 표본이 256개보다 적으면 남는 중심점은 첫 중심점으로 채움
+            codebooks[subspace, centroid_count:] = centroids[0]
+
+        self.codebooks = codebooks
+
+    def _nearest(self, points: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+        """유클리드 거리가 가장 가까운 중심점 번호"""
+        distances = (centroids ** 2).sum(axis=1) - 2 * points @ centroids.T
+        return np.argmin(distances, axis=1)
+
+    def encode(self, vectors: np.ndarray) -> np.ndarray:
+        """벡터를 (행 수, 구간 수) uint8 코드로 변환"""
+        parts = self._split(vectors)
+        codes = np.empty((len(vectors), self.subspaces), dtype=np.uint8)
+        for start in range(0, len(vectors), ENCODE_CHUNK_ROWS):
+            chunk = parts[start:start + ENCODE_CHUNK_ROWS]
+            for subspace in range(self.subspaces):
+                codes[start:start + len(chunk), subspace] = self._nearest(chunk[:, subspace], self.codebooks[subspace])
+        return codes
+
+    def decode(self, codes: np.ndarray) -> np.ndarray:
+        """코드를 근사 벡터로 복원"""
+        parts = self.codebooks[np.arange(self.subspaces), codes.astype(np.intp)]
+        return parts.reshape(len(codes), self.dimensions)
+
+    def scores(self, codes: np.ndarray, queries: np.ndarray) -> np.ndarray:
+        """
+        쿼리와 코드의 근사 내적 (구간별 내적 조회표 합산)
+
+        Returns:
+            np.ndarray: (쿼리 수, 코드 수) 점수 행렬
+        """
+        # (쿼리 수, 구간 수, 256) 조회표
+        tables = np.einsum('qsd,scd->qsc', self._split(queries), self.codebooks)
+        result = np.zeros((len(queries), len(codes)), dtype=np.float32)
+        for start in range(0, len(codes), SCORE_CHUNK_ROWS):
+            chunk = np.asarray(codes[start:start + SCORE_CHUNK_ROWS])
+            view = result[:, start:start + len(chunk)]
+            for subspace in range(self.subspaces):
+                view += tables[:, subspace, chunk[:, subspace]]
+        return result
+
+    def to_arrays(self) -> Dict[str, np.ndarray]:
+        return {'codebooks': self.codebooks}
+
+    def load_arrays(self, arrays: Dict[str, np.ndarray]):
+        self.codebooks = arrays['codebooks']
+
+
+CODECS = {
+    ScalarQuantizer.name: ScalarQuantizer,
+    ProductQuantizer.name: ProductQuantizer,
+}
+
+
+def create_codec(name: str, dimensions: int, **kwargs):
+    """이름으로 코덱 생성"""
+    if name not in CODECS:
+        raise ValueError(f"지원하지 않는 양자화 방식입니다: {name}")
+    return CODECS[name](dimensions, **kwargs)
+
+
+def save_codec(codec, path: str):
+    """코덱 학습 결과 저장 (.npz)"""
+    params = {'subspaces': codec.subspaces} if codec.name == ProductQuantizer.name else {}
+    np.savez(path, name=codec.name, dimensions=codec.dimensions,
+             **{f"param_{key}": value for key, value in params.items()}, **codec.to_arrays())
+
+
+def load_codec(path: str):
+    """저장된 코덱 불러오기"""
+    with np.load(path) as data:
+        arrays = {key: data[key] for key in data.files}
+    params = {key[len('param_'):]: int(arrays.pop(key)) for key in list(arrays) if key.startswith('param_')}
+    codec = create_codec(str(arrays.pop('name')), int(arrays.pop('dimensions')), **params)
+    codec.load_arrays(arrays)
+    return codec
@@ -3,13 +3,15 @@
 """
 import os
 import logging
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Optional, Tuple, Union
 from datetime import datetime
 import json
 import asyncio
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from .vertex_ai_client import VertexAIVectorSearchClient
+from .article_hydrator import get_article_hydrator
+from .article_metadata import load_article_metadata
 from ..embedding.embedding_service import EmbeddingService
 from ..database.connection import get_db
 from ..database.models import Article, VectorIndex, ProcessingLog
@@ -27,6 +29,8 @@ class VectorIndexer:
         self.index_id = None
         self.endpoint_id = None
         self.deployed_index_id = None
+        # 같은 프로세스의 VectorIndexer끼리 카드 캐시를 공유 (한 곳의 무효화가 모두에 반영)
+        self.article_hydrator = get_article_hydrator()
     
     def create_vector_index(self, index_name: str = "mk-news-vector-index", 
                           dimensions: int = 768) -> Dict:
@@ -185,7 +189,8 @@ class VectorIndexer:
                     'title': article.title,
                     'body': article.body,
                     'summary': article.summary,
-                    'service_daytime': article.service_daytime
+                    'service_daytime': article.service_daytime,
+                    'writers': article.writers
                 }
                 for article in articles
             ]
@@ -193,18 +198,24 @@ class VectorIndexer:
         finally:
             db.close()
     
+    def _get_vector_metadata(self, articles: List[Dict]) -> Dict[str, Dict]:
+        """벡터 검색 필터용 메타데이터 (기사 ID별 service_daytime, large_code_nm, stock_code, writers)"""
+        return load_article_metadata([article['id'] for article in articles])
+    
     def _index_batch(self, articles: List[Dict]) -> Dict:
         """배치 기사 인덱싱"""
         try:
             # 임베딩 생성
             embeddings = self.embedding_service.batch_generate_embeddings(articles)
             
-            # 벡터 데이터 준비
+            # 벡터 데이터 준비 (필터용 메타데이터 포함)
+            metadata = self._get_vector_metadata(articles)
             vector_data = []
             for embedding_info in embeddings:
                 vector_data.append({
                     'id': embedding_info['article_id'],
-                    'embedding': embedding_info['embedding']
+                    'embedding': embedding_info['embedding'],
+                    'metadata': metadata.get(embedding_info['article_id'], {})
                 })
             
             # Vertex AI에 벡터 업서트
@@ -232,14 +243,23 @@ class VectorIndexer:
             }
     
     def search_similar_articles(self, query: str, top_k: int = 10, 
-                               filter_expression: Optional[str] = None) -> List[Dict]:
-        """유사 기사 검색"""
+                               filter_expression: Optional[Union[str, Dict]] = None,
+                               similarity_threshold: Optional[float] = None) -> List[Dict]:
+        """
+        유사 기사 검색
+
+        Args:
+            query: 검색어
+            top_k: 반환할 결과 수
+            filter_expression: 필터 식 또는 필터 사전 (검색 전에 적용)
+            similarity_threshold: 이 값보다 유사도가 낮은 결과 제외
+        """
         try:
             if not self.endpoint_id:
                 return []
             
             # 쿼리 임베딩 생성
-            query_embedding = self.embedding_service.generate_embeddings([query])[0]
+            query_embedding = self.embedding_service.generate_embeddings([query], use_cache=True)[0]
             
             # 벡터 검색
             search_results = self.vertex_ai_client.search_vectors(
@@ -249,14 +269,18 @@ class VectorIndexer:
                 filter_expression=filter_expression
             )
             
-            # 기사 정보 조회
-            article_ids = [result['id'] for result in search_results]
-            articles = self._get_articles_by_ids(article_ids)
+            if similarity_threshold is not None:
+                search_results = [
+                    result for result in search_results if result['similarity'] >= similarity_threshold
+                ]
+            
+            # 기사 카드 조회 (캐시에 없는 기사만 한 번에 조회)
+            articles = self.article_hydrator.hydrate(result['id'] for result in search_results)
             
             # 결과 구성
             results = []
             for i, result in enumerate(search_results):
-                article = next((a for a in articles if a['id'] == result['id']), None)
+                article = articles.get(result['id'])
                 if article:
                     results.append({
                         'article': article,
@@ -272,24 +296,8 @@ class VectorIndexer:
     
     def _get_articles_by_ids(self, article_ids: List[str]) -> List[Dict]:
         """ID로 기사 조회"""
-        db = next(get_db())
-        try:
-            articles = db.query(Article).filter(Article.id.in_(article_ids)).all()
-            
-            return [
-                {
-                    'id': article.id,
-                    'art_id': article.art_id,
-                    'title': article.title,
-                    'summary': article.summary,
-                    'service_daytime': article.service_daytime,
-                    'article_url': article.article_url
-                }
-                for article in articles
-            ]
-            
-        finally:
-            db.close()
+        articles = self.article_hydrator.hydrate(article_ids)
+        return [articles[article_id] for article_id in article_ids if article_id in articles]
     
     def _save_index_to_db(self, index_name: str, index_id: str, dimensions: int):
         """인덱스 정보를 데이터베이스에 저장"""
@@ -343,6 +351,8 @@ class VectorIndexer:
             })
             
             db.commit()
+            # 다시 인덱싱된 기사는 캐시된 카드가 오래되었을 수 있음
+            self.article_hydrator.invalidate(article_ids)
             
         except Exception as e:
             logger.error(f"기사 임베딩 상태 업데이트 중 오류 발생: {e}")
@@ -3,17 +3,28 @@ Vertex AI Vector Search 클라이언트
 """
 import os
 import logging
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Optional, Tuple, Union
 from datetime import datetime
-import json
 
 from google.cloud import aiplatform
 from google.cloud.aiplatform import gapic as aip
 from google.cloud.aiplatform.matching_engine import MatchingEngineIndex
 from google.cloud.aiplatform.matching_engine import MatchingEngineIndexEndpoint
 
+from .article_metadata import backfill_store_metadata
+from .delta_log import BufferedVectorIndex
+from .ivf_index import IVFIndex
+from .local_vector_store import LEGACY_JSON_FILE, LocalVectorStore
+from .metadata_index import parse_filter_expression
+
 logger = logging.getLogger(__name__)
 
+# tree-AH 설정 (Vertex AI 인덱스 생성과 로컬 IVF 인덱스가 같은 값을 사용)
+TREE_AH_CONFIG = {
+    "leaf_node_embedding_count": 500,
+    "leaf_nodes_to_search_percent": 7
+}
+
 class VertexAIVectorSearchClient:
     """Vertex AI Vector Search 클라이언트"""
     
@@ -22,6 +33,16 @@ class VertexAIVectorSearchClient:
         self.region = region
         self.client = None
         self.index_endpoint = None
+        # 개발용 로컬 벡터 저장소 (처음 사용할 때 열기)
+        self.local_store_dir = os.getenv('LOCAL_VECTOR_STORE_DIR', 'data/vectors')
+        # 로컬 저장소 양자화 방식 (int8, pq, 빈 값이면 float32만 사용)
+        self.local_store_quantization = os.getenv('LOCAL_VECTOR_QUANTIZATION') or None
+        self.local_store = None
+        # 로컬 검색 방식 (ivf: 근사 검색 인덱스, flat: 전체 검색)
+        self.local_index_type = os.getenv('LOCAL_VECTOR_INDEX', 'ivf').lower()
+        # 이 수만큼 델타 로그가 쌓이면 로컬 인덱스에 백그라운드 병합
+        self.local_delta_rows = int(os.getenv('LOCAL_VECTOR_DELTA_ROWS', '10000'))
+        self.local_index = None
         self._initialize_client()
     
     def _initialize_client(self):
@@ -68,10 +89,7 @@ class VertexAIVectorSearchClient:
                         "approximate_neighbors_count": 150,
                         "distance_measure_type": "DOT_PRODUCT_DISTANCE",
                         "algorithm_config": {
-                            "tree_ah_config": {
-                                "leaf_node_embedding_count": 500,
-                                "leaf_nodes_to_search_percent": 7
-                            }
+                            "tree_ah_config": dict(TREE_AH_CONFIG)
                         }
                     }
                 },
@@ -169,42 +187,70 @@ class VertexAIVectorSearchClient:
     def upsert_vectors(self, index_id: str, vectors: List[Dict]) -> bool:
         """벡터 데이터 업서트"""
         try:
-            # 벡터 데이터 준비
-            vector_data = []
-            for vector_info in vectors:
-                vector_data.append({
-                    "id": vector_info['id'],
-                    "embedding": vector_info['embedding']
-                })
-            
-            # 업서트 요청
+            # 업서트 요청 ({'id', 'embedding', 'metadata'(선택)} 목록을 그대로 사용)
             index_name = f"projects/{self.project_id}/locations/{self.region}/indexes/{index_id}"
             
             # 실제 구현에서는 Vertex AI의 업서트 API 사용
-            # 여기서는 로컬 저장으로 대체
-            self._save_vectors_locally(vector_data)
+            # 여기서는 로컬 델타 로그에 추가로 대체
+            self._save_vectors_locally(vectors)
             
-            logger.info(f"벡터 데이터 업서트 완료: {len(vector_data)}개")
+            logger.info(f"벡터 데이터 업서트 완료: {len(vectors)}개")
             return True
             
         except Exception as e:
             logger.error(f"벡터 데이터 업서트 중 오류 발생: {e}")
             return False
     
+    def _get_local_store(self) -> LocalVectorStore:
+        """
+        로컬 벡터 저장소
+
+        처음 열 때 기존 vector_data.json이 있으면 가져오고, 메타데이터가 없는 행(가져온 행, 필터 도입 전에
+        저장된 행)은 데이터베이스의 기사 메타데이터로 채워 필터 검색에서 빠지지 않게 합니다.
+        """
+        if self.local_store is None:
+            local_store = LocalVectorStore(self.local_store_dir, quantization=self.local_store_quantization)
+            legacy_path = os.path.join(self.local_store_dir, LEGACY_JSON_FILE)
+            if len(local_store) == 0 and os.path.exists(legacy_path):
+                imported = local_store.import_json(legacy_path)
+                logger.info(f"기존 로컬 벡터 데이터 가져오기 완료: {imported}개")
+            backfill_store_metadata(local_store)
+            self.local_store = local_store
+        return self.local_store
+    
+    def _get_local_index(self) -> BufferedVectorIndex:
+        """로컬 검색 인덱스 (델타 로그 + IVF 인덱스, LOCAL_VECTOR_INDEX=flat이면 저장소 전체 검색)"""
+        if self.local_index is None:
+            local_store = self._get_local_store()
+            if self.local_index_type == 'ivf':
+                base_index = IVFIndex.from_tree_ah_config(local_store, TREE_AH_CONFIG)
+            else:
+                base_index = local_store
+            self.local_index = BufferedVectorIndex(base_index, max_delta_rows=self.local_delta_rows)
+        return self.local_index
+    
     def _save_vectors_locally(self, vector_data: List[Dict]):
-        """벡터 데이터 로컬 저장 (개발용)"""
+        """벡터 데이터 로컬 저장 (개발용, 델타 로그에 추가하고 같은 ID는 최신 벡터로 검색)"""
         try:
-            os.makedirs("data/vectors", exist_ok=True)
-            
-            with open("data/vectors/vector_data.json", "w", encoding="utf-8") as f:
-                json.dump(vector_data, f, ensure_ascii=False, indent=2)
+            has_metadata = any('metadata' in vector_info for vector_info in vector_data)
+            self._get_local_index().upsert(
+                [vector_info['id'] for vector_info in vector_data],
+                [vector_info['embedding'] for vector_info in vector_data],
+                [vector_info.get('metadata') for vector_info in vector_data] if has_metadata else None
+            )
                 
         except Exception as e:
             logger.error(f"벡터 데이터 로컬 저장 중 오류 발생: {e}")
+            raise
     
     def search_vectors(self, endpoint_id: str, query_embedding: List[float], 
-                      top_k: int = 10, filter_expression: Optional[str] = None) -> List[Dict]:
-        """벡터 검색"""
+                      top_k: int = 10, filter_expression: Optional[Union[str, Dict]] = None) -> List[Dict]:
+        """
+        벡터 검색
+
+        filter_expression은 'service_daytime>=2024-01-01; large_code_nm=경제' 형식의 필터 식 또는
+        필터 사전이며, 로컬 검색에서는 top_k 계산 전에 메타데이터 마스크로 적용합니다.
+        """
         try:
             # 검색 요청 구성
             search_request = {
@@ -223,7 +269,9 @@ class VertexAIVectorSearchClient:
             
             # 실제 구현에서는 Vertex AI의 검색 API 사용
             # 여기서는 로컬 검색으로 대체
-            results = self._search_vectors_locally(query_embedding, top_k)
+            results = self._search_vectors_locally(
+                query_embedding, top_k, parse_filter_expression(filter_expression)
+            )
             
             logger.info(f"벡터 검색 완료: {len(results)}개 결과")
             return results
@@ -232,32 +280,11 @@ class VertexAIVectorSearchClient:
             logger.error(f"벡터 검색 중 오류 발생: {e}")
             return []
     
-    def _search_vectors_locally(self, query_embedding: List[float], top_k: int) -> List[Dict]:
+    def _search_vectors_locally(self, query_embedding: List[float], top_k: int,
+                                filters: Optional[Dict] = None) -> List[Dict]:
         """로컬 벡터 검색 (개발용)"""
         try:
-            # 로컬 벡터 데이터 로드
-            if not os.path.exists("data/vectors/vector_data.json"):
-                return []
-            
-            with open("data/vectors/vector_data.json", "r", encoding="utf-8") as f:
-                vector_data = json.load(f)
-            
-            # 유사도 계산
-            similarities = []
-            for vector_info in vector_data:
-                similarity = self._calculate_cosine_similarity(
-                    query_embedding, 
-                    vector_info['embedding']
-                )
-                similarities.append({
-                    'id': vector_info['id'],
-                    'similarity': similarity
-                })
-            
-            # 유사도 순으로 정렬
-            similarities.sort(key=lambda x: x['similarity'], reverse=True)
-            
-            return similarities[:top_k]
+            return self._get_local_index().search(query_embedding, top_k, filters or None)
             
         except Exception as e:
             logger.error(f"로컬 벡터 검색 중 오류 발생: {e}")
@@ -5,12 +5,128 @@ import xml.etree.ElementTree as ET
 import hashlib
 import re
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 import logging
 from pathlib import Path
 
+from .entity_extractor import EntityExtractor
+from .simhash import compute_simhash
+
 logger = logging.getLogger(__name__)
 
+# HTML 태그 제거 패턴
+HTML_TAG_PATTERN = re.compile(r'<[^>]+>')
+
+# 필드 변환 방식
+FIELD_TEXT = 0
+FIELD_CDATA = 1
+FIELD_INT = 2
+FIELD_DATETIME = 3
+
+# 섹션별 필드 스펙: 섹션 태그 -> {자식 태그: (결과 키, 변환 방식)}
+ARTICLE_FIELD_SPECS = {
+    'article': {
+        'action': ('action', FIELD_TEXT),
+        'article_url': ('article_url', FIELD_CDATA)
+    },
+    'wms_article': {
+        'art_id': ('art_id', FIELD_TEXT),
+        'art_year': ('art_year', FIELD_INT),
+        'art_no': ('art_no', FIELD_TEXT),
+        'gubun': ('gubun', FIELD_TEXT),
+        'service_daytime': ('service_daytime', FIELD_DATETIME),
+        'title': ('title', FIELD_CDATA),
+        'sub_title': ('sub_title', FIELD_CDATA),
+        'media_code': ('media_code', FIELD_TEXT),
+        'writers': ('writers', FIELD_CDATA),
+        'free_type': ('free_type', FIELD_TEXT),
+        'pub_div': ('pub_div', FIELD_TEXT),
+        'pub_date': ('pub_date', FIELD_TEXT),
+        'pub_edition': ('pub_edition', FIELD_TEXT),
+        'pub_section': ('pub_section', FIELD_TEXT),
+        'pub_page': ('pub_page', FIELD_TEXT),
+        'reg_dt': ('reg_dt', FIELD_DATETIME),
+        'mod_dt': ('mod_dt', FIELD_DATETIME),
+        'art_org_class': ('art_org_class', FIELD_TEXT)
+    },
+    'wms_article_body': {
+        'body': ('body', FIELD_CDATA)
+    },
+    'wms_article_summary': {
+        'summary': ('summary', FIELD_CDATA)
+    }
+}
+
+# 반복 항목 섹션 스펙: 섹션 태그 -> (항목 태그, 항목 필드 목록)
+REPEATED_SECTION_SPECS = {
+    'wms_code_classes': ('wms_code_class', (
+        'code_id', 'code_nm', 'large_code_id', 'large_code_nm',
+        'middle_code_id', 'middle_code_nm', 'small_code_id', 'small_code_nm'
+    )),
+    'wms_article_images': ('wms_article_image', ('image_url', 'image_caption'))
+}
+
+# article_data 키 순서 (기존 추출 결과와 동일)
+ARTICLE_DATA_KEYS = (
+    'action', 'art_id', 'art_year', 'art_no', 'gubun', 'service_daytime',
+    'title', 'sub_title', 'media_code', 'writers', 'free_type', 'pub_div',
+    'pub_date', 'pub_edition', 'pub_section', 'pub_page', 'reg_dt', 'mod_dt',
+    'art_org_class', 'body', 'summary', 'article_url',
+    'categories', 'images', 'stock_codes', 'keywords'
+)
+
+# 날짜시간 형식 (strptime 대체 경로)
+DATETIME_FORMATS = (
+    '%Y-%m-%d %H:%M:%S',
+    '%Y-%m-%d',
+    '%Y%m%d%H%M%S'
+)
+
+
+def _decode_dashed_datetime(text: str) -> Optional[datetime]:
+    """YYYY-MM-DD HH:MM:SS 형식 디코딩"""
+    if len(text) != 19:
+        return None
+    if (text[4] != '-' or text[7] != '-' or text[10] != ' '
+            or text[13] != ':' or text[16] != ':'):
+        return None
+    try:
+        # 구분자 위치를 확인했으므로 C 구현 ISO 파서로 바로 변환 (숫자 검증 포함)
+        return datetime.fromisoformat(text)
+    except ValueError:
+        return None
+
+
+def _decode_compact_datetime(text: str) -> Optional[datetime]:
+    """YYYYMMDDHHMMSS 형식 디코딩"""
+    if len(text) != 14 or not (text.isascii() and text.isdigit()):
+        return None
+    try:
+        return datetime(int(text[0:4]), int(text[4:6]), int(text[6:8]),
+                        int(text[8:10]), int(text[10:12]), int(text[12:14]))
+    except ValueError:
+        return None
+
+
+def _decode_dashed_date(text: str) -> Optional[datetime]:
+    """YYYY-MM-DD 형식 디코딩"""
+    if len(text) != 10:
+        return None
+    if text[4] != '-' or text[7] != '-':
+        return None
+    try:
+        return datetime.fromisoformat(text)
+    except ValueError:
+        return None
+
+
+# 문자열 길이 -> 고정 폭 날짜 형식 디코더
+FIXED_WIDTH_DATETIME_DECODERS = {
+    19: _decode_dashed_datetime,
+    14: _decode_compact_datetime,
+    10: _decode_dashed_date
+}
+
 class XMLParser:
     """XML 파일 파서"""
     
@@ -18,6 +134,10 @@ class XMLParser:
         self.namespaces = {
             'saltlux': 'http://www.saltlux.com/schema'
         }
+        # 키 순서가 고정된 기사 데이터 템플릿 (dict 복사로 초기화)
+        self._article_template = dict.fromkeys(ARTICLE_DATA_KEYS)
+        self._section_tags = tuple(tag for tag in ARTICLE_FIELD_SPECS if tag != 'article')
+        self.entity_extractor = EntityExtractor()
     
     def parse_xml_file(self, xml_file_path: str) -> Optional[Dict]:
         """XML 파일 파싱"""
@@ -31,24 +151,86 @@ class XMLParser:
                 logger.warning(f"기사 데이터를 추출할 수 없습니다: {xml_file_path}")
                 return None
             
-            # 메타정보 추출
-            metadata = self._extract_metadata(article_data)
-            
-            # 중복 체크용 해시 생성
-            content_hash = self._generate_content_hash(article_data)
-            
-            return {
-                'article_data': article_data,
-                'metadata': metadata,
-                'content_hash': content_hash,
-                'file_path': xml_file_path,
-                'parsed_at': datetime.utcnow()
-            }
+            return self._build_parsed_record(article_data, xml_file_path)
             
         except Exception as e:
             logger.error(f"XML 파싱 중 오류 발생: {xml_file_path}, {e}")
             return None
     
+    def iter_articles(self, xml_file_path: str) -> Iterator[Dict]:
+        """
+        XML 파일 스트리밍 파싱
+        
+        ET.parse로 전체 트리를 만들지 않고 iterparse로 <article> 요소가 닫히는 즉시
+        기사 데이터를 반환한 뒤 요소를 비우고 부모에서 떼어내, 파일 크기와 무관하게 메모리 사용량을
+        일정하게 유지합니다.
+        
+        Args:
+            xml_file_path: XML 파일 경로
+            
+        Yields:
+            Dict: _extract_article_data와 동일한 형태의 기사 데이터
+        """
+        # 열린 요소 경로 (처리가 끝난 요소를 실제 부모에서 떼어내기 위해 추적)
+        open_elements = []
+        open_articles = 0
+        try:
+            for event, element in ET.iterparse(xml_file_path, events=('start', 'end')):
+                if event == 'start':
+                    open_elements.append(element)
+                    if element.tag == 'article':
+                        open_articles += 1
+                    continue
+                
+                open_elements.pop()
+                parent = open_elements[-1] if open_elements else None
+                if element.tag != 'article':
+                    # 기사 밖의 요소(중간 컨테이너 등)도 닫히면 부모에서 제거
+                    if open_articles == 0 and parent is not None:
+                        parent.remove(element)
+                    continue
+                
+                open_articles -= 1
+                article_data = self._extract_article_element(element)
+                
+                # 처리한 요소 정리 (root > items > article처럼 중첩되어도 실제 부모에서 제거)
+                element.clear()
+                if parent is not None:
+                    parent.remove(element)
+                
+                if article_data:
+                    yield article_data
+                else:
+                    logger.warning(f"기사 데이터를 추출할 수 없습니다: {xml_file_path}")
+                    
+        except Exception as e:
+            logger.error(f"XML 스트리밍 파싱 중 오류 발생: {xml_file_path}, {e}")
+    
+    def iterparse_xml_file(self, xml_file_path: str) -> Iterator[Dict]:
+        """XML 파일 스트리밍 파싱 (parse_xml_file과 동일한 형태의 결과를 기사별로 반환)"""
+        for article_data in self.iter_articles(xml_file_path):
+            try:
+                yield self._build_parsed_record(article_data, xml_file_path)
+            except Exception as e:
+                logger.error(f"기사 메타정보 추출 중 오류 발생: {xml_file_path}, {e}")
+    
+    def _build_parsed_record(self, article_data: Dict, xml_file_path: str) -> Dict:
+        """파싱 결과 구성 (메타정보 및 중복 체크용 해시 포함)"""
+        # 메타정보 추출
+        metadata = self._extract_metadata(article_data)
+        
+        # 중복 체크용 해시 생성
+        content_hash = self._generate_content_hash(article_data)
+        
+        return {
+            'article_data': article_data,
+            'metadata': metadata,
+            'content_hash': content_hash,
+            'simhash': self._generate_simhash(article_data),
+            'file_path': xml_file_path,
+            'parsed_at': datetime.utcnow()
+        }
+    
     def _extract_article_data(self, root) -> Optional[Dict]:
         """기사 데이터 추출"""
         try:
@@ -56,6 +238,87 @@ class XMLParser:
             if article is None:
                 return None
             
+            return self._extract_article_element(article)
+            
+        except Exception as e:
+            logger.error(f"기사 데이터 추출 중 오류 발생: {e}")
+            return None
+    
+    def _extract_article_element(self, article) -> Optional[Dict]:
+        """
+        <article> 요소에서 기사 데이터 추출
+        
+        각 섹션의 자식 요소를 한 번씩만 순회하면서 필드 스펙 테이블로 태그별 변환 방식을 찾아 적용합니다.
+        자식 요소를 역순으로 순회하므로 같은 태그가 여러 번 나오면 find()와 마찬가지로 첫 번째 요소가 남습니다.
+        """
+        try:
+            values = self._article_template.copy()
+            sections = {}
+            
+            for child in reversed(article):
+                sections[child.tag] = child
+            
+            self._apply_field_specs(article, ARTICLE_FIELD_SPECS['article'], values)
+            for section_tag in self._section_tags:
+                section = sections.get(section_tag)
+                if section is not None:
+                    self._apply_field_specs(section, ARTICLE_FIELD_SPECS[section_tag], values)
+            
+            values['categories'] = self._collect_repeated_section(sections.get('wms_code_classes'), 'wms_code_classes')
+            values['images'] = self._collect_repeated_section(sections.get('wms_article_images'), 'wms_article_images')
+            values['stock_codes'] = self._extract_stock_codes(sections.get('stock_codes'))
+            values['keywords'] = self._extract_keywords(sections.get('wms_article_keywords'))
+            
+            return values
+            
+        except Exception as e:
+            logger.error(f"기사 데이터 추출 중 오류 발생: {e}")
+            return None
+    
+    def _apply_field_specs(self, section, field_specs: Dict, values: Dict):
+        """섹션의 자식 요소를 한 번 순회하며 필드 스펙에 따라 값을 변환하여 저장"""
+        for child in reversed(section):
+            spec = field_specs.get(child.tag)
+            if spec is None:
+                continue
+            
+            key, kind = spec
+            text = child.text
+            if kind == FIELD_TEXT:
+                values[key] = text
+            elif kind == FIELD_CDATA:
+                values[key] = self._clean_cdata(text)
+            elif kind == FIELD_INT:
+                try:
+                    values[key] = int(text) if text else None
+                except ValueError:
+                    values[key] = None
+            else:
+                values[key] = self._parse_datetime(text)
+    
+    def _collect_repeated_section(self, section, section_tag: str) -> List[Dict]:
+        """반복 항목 섹션(분류, 이미지)의 자식 요소를 한 번씩 순회하여 추출"""
+        if section is None:
+            return []
+        
+        item_tag, item_fields = REPEATED_SECTION_SPECS[section_tag]
+        template = dict.fromkeys(item_fields)
+        items = []
+        for item in section:
+            if item.tag != item_tag:
+                continue
+            
+            values = template.copy()
+            for child in reversed(item):
+                if child.tag in values:
+                    values[child.tag] = self._clean_cdata(child.text)
+            items.append(values)
+        
+        return items
+    
+    def _extract_article_element_with_find(self, article) -> Optional[Dict]:
+        """<article> 요소에서 기사 데이터 추출 (필드별 find() 방식, 벤치마크 및 결과 검증용)"""
+        try:
             wms_article = article.find('wms_article')
             wms_article_body = article.find('wms_article_body')
             wms_article_summary = article.find('wms_article_summary')
@@ -117,6 +380,11 @@ class XMLParser:
     def _extract_entities(self, article_data: Dict) -> Dict:
         """엔티티 추출 (기본적인 패턴 매칭)"""
         text = f"{article_data.get('title', '')} {article_data.get('body', '')}"
+        return self.entity_extractor.extract(text)
+    
+    def _extract_entities_with_patterns(self, article_data: Dict) -> Dict:
+        """엔티티 추출 (패턴별 re.findall 방식, EntityExtractor 결과 검증용)"""
+        text = f"{article_data.get('title', '')} {article_data.get('body', '')}"
         
         entities = {
             'persons': self._extract_persons(text),
@@ -276,6 +544,11 @@ class XMLParser:
         content = f"{article_data.get('title', '')}{article_data.get('body', '')}"
         return hashlib.md5(content.encode('utf-8')).hexdigest()
     
+    def _generate_simhash(self, article_data: Dict) -> Optional[int]:
+        """SimHash 지문 생성 (유사 중복 조회용, 제목과 본문이 모두 비어 있으면 None)"""
+        content = f"{article_data.get('title') or ''} {article_data.get('body') or ''}"
+        return compute_simhash(content) or None
+    
     def _get_text(self, element, tag: str) -> Optional[str]:
         """XML 요소에서 텍스트 추출"""
         if element is None:
@@ -292,10 +565,7 @@ class XMLParser:
             return None
         
         # CDATA 섹션 처리
-        text = child.text or ''
-        # HTML 태그 제거
-        text = re.sub(r'<[^>]+>', '', text)
-        return text.strip()
+        return self._clean_cdata(child.text)
     
     def _get_int(self, element, tag: str) -> Optional[int]:
         """XML 요소에서 정수 추출"""
@@ -307,19 +577,44 @@ class XMLParser:
     
     def _get_datetime(self, element, tag: str) -> Optional[datetime]:
         """XML 요소에서 날짜시간 추출"""
-        text = self._get_text(element, tag)
+        return self._parse_datetime(self._get_text(element, tag))
+    
+    def _clean_cdata(self, text: Optional[str]) -> str:
+        """CDATA 텍스트 정리 (HTML 태그 제거 및 앞뒤 공백 제거)"""
+        if not text:
+            return ''
+        # HTML 태그 제거
+        if '<' in text:
+            text = HTML_TAG_PATTERN.sub('', text)
+        return text.strip()
+    
+    def _parse_datetime(self, text: Optional[str]) -> Optional[datetime]:
+        """
+        날짜시간 문자열 파싱
+        
+        Saltlux 고정 폭 형식(YYYY-MM-DD HH:MM:SS, YYYYMMDDHHMMSS, YYYY-MM-DD)은 길이로 판별해
+        strptime 없이 바로 datetime으로 변환합니다. 같은 태그에 날짜와 날짜시간이 섞일 수 있으므로
+        태그가 아니라 값마다 길이로 디코더를 고르고, 인식하지 못한 값은 기존 strptime 방식으로 처리합니다.
+        """
+        if not text:
+            return None
+        
+        decoder = FIXED_WIDTH_DATETIME_DECODERS.get(len(text))
+        if decoder is not None:
+            value = decoder(text)
+            if value is not None:
+                return value
+        
+        return self._parse_datetime_with_strptime(text)
+    
+    def _parse_datetime_with_strptime(self, text: Optional[str]) -> Optional[datetime]:
+        """날짜시간 문자열 파싱 (strptime 방식)"""
         if not text:
             return None
         
         try:
             # 다양한 날짜 형식 처리
-            formats = [
-                '%Y-%m-%d %H:%M:%S',
-                '%Y-%m-%d',
-                '%Y%m%d%H%M%S'
-            ]
-            
-            for fmt in formats:
+            for fmt in DATETIME_FORMATS:
                 try:
                     return datetime.strptime(text, fmt)
                 except ValueError:
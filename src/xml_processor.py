@@ -3,13 +3,22 @@ XML 파일 처리 및 데이터베이스 저장 시스템
 """
 import os
 import logging
-from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Iterable, Iterator, Tuple
 from datetime import datetime
+from itertools import islice
 import asyncio
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import uuid
+from concurrent.futures import (
+    ThreadPoolExecutor, ProcessPoolExecutor, as_completed, wait, FIRST_COMPLETED
+)
+from concurrent.futures.process import BrokenProcessPool
+
+from sqlalchemy import insert
 
 from .xml_parser import XMLParser
+from .simhash import (
+    SimHashIndex, compute_simhash, find_similar_article, find_similar_articles, simhash_columns
+)
 from .database.connection import get_db, init_database
 from .database.models import (
     Article, ArticleCategory, ArticleImage, ArticleKeyword, 
@@ -18,25 +27,106 @@ from .database.models import (
 
 logger = logging.getLogger(__name__)
 
+# 파일 탐색 진행 상황 로그 간격 (발견한 파일 수)
+SCAN_LOG_INTERVAL = 10000
+
+# IN (...) 조회 시 한 번에 넘기는 값 수 (SQLite 바인드 변수 제한 고려)
+IN_QUERY_CHUNK_SIZE = 500
+
+# 프로세스 풀 워커별 XML 파서 (워커 초기화 시 한 번 생성하여 재사용)
+_worker_parser: Optional[XMLParser] = None
+
+
+def _init_parse_worker():
+    """파싱 워커 프로세스 초기화"""
+    global _worker_parser
+    _worker_parser = XMLParser()
+
+
+def _parse_file_chunk(xml_files: List[str]) -> List[Tuple[str, Optional[Dict]]]:
+    """
+    워커 프로세스에서 파일 묶음 파싱
+    
+    부모 프로세스로 보내는 데이터를 줄이기 위해 DB 저장에 필요한 필드만 남긴 레코드를 반환합니다.
+    """
+    parser = _worker_parser or XMLParser()
+    records = []
+    
+    for xml_file in xml_files:
+        parsed_data = parser.parse_xml_file(xml_file)
+        if parsed_data:
+            parsed_data = {
+                'article_data': parsed_data['article_data'],
+                'metadata': {
+                    'extracted_entities': parsed_data['metadata'].get('extracted_entities', {})
+                },
+                'content_hash': parsed_data['content_hash'],
+                'simhash': parsed_data.get('simhash'),
+                'file_path': xml_file
+            }
+        records.append((xml_file, parsed_data))
+    
+    return records
+
+
 class XMLProcessor:
     """XML 파일 처리기"""
     
-    def __init__(self, max_workers: int = 4):
+    def __init__(self, max_workers: int = 4, parse_workers: Optional[int] = None,
+                 parse_chunk_size: int = 32, near_duplicate_distance: Optional[int] = None):
+        """
+        초기화
+        
+        Args:
+            max_workers: 스레드 풀 워커 수
+            parse_workers: 파싱 프로세스 풀 워커 수 (0이면 스레드 풀 사용, 기본값은 XML_PARSE_WORKERS 환경 변수)
+            parse_chunk_size: 파싱 워커에 한 번에 전달할 파일 수
+            near_duplicate_distance: 저장된 기사와 SimHash 해밍 거리가 이 값 이하이면 중복으로 처리
+                (None이면 사용 안 함, 기본값은 SIMHASH_NEAR_DUPLICATE_DISTANCE 환경 변수)
+        """
         self.xml_parser = XMLParser()
         self.max_workers = max_workers
+        if parse_workers is None:
+            parse_workers = int(os.getenv('XML_PARSE_WORKERS', '0'))
+        self.parse_workers = parse_workers
+        self.parse_chunk_size = parse_chunk_size
+        if near_duplicate_distance is None and os.getenv('SIMHASH_NEAR_DUPLICATE_DISTANCE'):
+            near_duplicate_distance = int(os.getenv('SIMHASH_NEAR_DUPLICATE_DISTANCE'))
+        self.near_duplicate_distance = near_duplicate_distance
         self.processed_count = 0
         self.error_count = 0
         self.duplicate_count = 0
+        # 현재 탐색 중인 디렉토리에서 지금까지 발견한 XML 파일 수
+        self.files_discovered = 0
     
-    def process_xml_files(self, xml_directory: str, batch_size: int = 100) -> Dict:
-        """XML 파일들을 배치로 처리"""
-        xml_files = self._get_xml_files(xml_directory)
-        total_files = len(xml_files)
+    def process_xml_files(self, xml_directory: str, batch_size: int = 100,
+                          recursive: bool = False, sort_by_mtime: bool = False) -> Dict:
+        """
+        XML 파일들을 배치로 처리
+        
+        디렉토리를 탐색하면서 발견한 파일을 batch_size 단위로 바로 처리하므로
+        전체 파일 목록을 미리 만들지 않습니다.
+        
+        Args:
+            xml_directory: XML 디렉토리 경로
+            batch_size: 배치 크기
+            recursive: 하위 디렉토리(날짜별 파티션 등)까지 탐색 여부
+            sort_by_mtime: 디렉토리별로 수정 시간 순 처리 여부
+            
+        Returns:
+            Dict: 처리 결과
+        """
+        if self.parse_workers > 0:
+            return self.process_xml_files_parallel(
+                xml_directory, batch_size, recursive=recursive, sort_by_mtime=sort_by_mtime
+            )
+        
+        file_iter = self._iter_xml_files(xml_directory, recursive, sort_by_mtime)
         
-        logger.info(f"총 {total_files}개의 XML 파일을 처리합니다.")
+        logger.info(f"XML 파일 처리를 시작합니다: {xml_directory}")
         
         results = {
-            'total_files': total_files,
+            'total_files': 0,
             'processed': 0,
             'errors': 0,
             'duplicates': 0,
@@ -45,16 +135,22 @@ class XMLProcessor:
         }
         
         # 배치별로 처리
-        for i in range(0, total_files, batch_size):
-            batch_files = xml_files[i:i + batch_size]
+        batch_number = 0
+        while True:
+            batch_files = list(islice(file_iter, batch_size))
+            if not batch_files:
+                break
+            
             batch_results = self._process_batch(batch_files)
             
             # 결과 누적
+            results['total_files'] += len(batch_files)
             results['processed'] += batch_results['processed']
             results['errors'] += batch_results['errors']
             results['duplicates'] += batch_results['duplicates']
             
-            logger.info(f"배치 {i//batch_size + 1} 완료: {batch_results}")
+            batch_number += 1
+            logger.info(f"배치 {batch_number} 완료 (발견한 파일 {self.files_discovered}개): {batch_results}")
         
         results['end_time'] = datetime.utcnow()
         results['processing_time'] = (results['end_time'] - results['start_time']).total_seconds()
@@ -62,46 +158,249 @@ class XMLProcessor:
         logger.info(f"XML 처리 완료: {results}")
         return results
     
-    def _get_xml_files(self, xml_directory: str) -> List[str]:
-        """XML 파일 목록 가져오기"""
-        xml_path = Path(xml_directory)
-        if not xml_path.exists():
-            raise FileNotFoundError(f"XML 디렉토리를 찾을 수 없습니다: {xml_directory}")
+    def process_xml_files_parallel(self, xml_directory: str, batch_size: int = 100,
+                                   parse_workers: Optional[int] = None,
+                                   chunk_size: Optional[int] = None,
+                                   recursive: bool = False, sort_by_mtime: bool = False) -> Dict:
+        """
+        프로세스 풀로 XML 파일을 파싱하고 부모 프로세스에서 배치 단위로 저장
+        
+        파싱과 엔티티 추출은 CPU 작업이라 스레드로는 GIL에 묶이므로, 워커 프로세스가
+        파일 묶음을 파싱해 간결한 레코드로 돌려주고 부모 프로세스가 batch_size 단위로 DB에 저장합니다.
+        
+        Args:
+            xml_directory: XML 디렉토리 경로
+            batch_size: DB 저장 배치 크기
+            parse_workers: 파싱 워커 프로세스 수 (기본값: 설정값 또는 CPU 수)
+            chunk_size: 워커에 한 번에 전달할 파일 수
+            recursive: 하위 디렉토리(날짜별 파티션 등)까지 탐색 여부
+            sort_by_mtime: 디렉토리별로 수정 시간 순 처리 여부
+            
+        Returns:
+            Dict: 처리 결과
+        """
+        parse_workers = parse_workers or self.parse_workers or os.cpu_count() or 1
+        chunk_size = chunk_size or self.parse_chunk_size
+        
+        file_iter = self._iter_xml_files(xml_directory, recursive, sort_by_mtime)
+        
+        logger.info(f"XML 파일을 {parse_workers}개 프로세스로 처리합니다: {xml_directory}")
+        
+        results = {
+            'total_files': 0,
+            'processed': 0,
+            'errors': 0,
+            'duplicates': 0,
+            'parse_workers': parse_workers,
+            'chunk_size': chunk_size,
+            'start_time': datetime.utcnow(),
+            'end_time': None
+        }
+        
+        batch_number = 0
+        for parsed_batch in self.iter_parsed_batches(file_iter, batch_size, parse_workers, chunk_size):
+            batch_results = self._save_parsed_batch(parsed_batch)
+            
+            # 결과 누적
+            results['total_files'] += len(parsed_batch)
+            results['processed'] += batch_results['processed']
+            results['errors'] += batch_results['errors']
+            results['duplicates'] += batch_results['duplicates']
+            
+            batch_number += 1
+            logger.info(f"배치 {batch_number} 완료 (발견한 파일 {self.files_discovered}개): {batch_results}")
         
-        xml_files = list(xml_path.glob("*.xml"))
-        return [str(f) for f in xml_files]
+        results['end_time'] = datetime.utcnow()
+        results['processing_time'] = (results['end_time'] - results['start_time']).total_seconds()
+        results['files_per_second'] = (
+            results['total_files'] / results['processing_time'] if results['processing_time'] > 0 else 0.0
+        )
+        
+        logger.info(f"XML 병렬 처리 완료: {results}")
+        return results
     
-    def _process_batch(self, xml_files: List[str]) -> Dict:
-        """배치 파일 처리"""
+    def iter_parsed_batches(self, xml_files: Iterable[str], batch_size: int = 100,
+                            parse_workers: Optional[int] = None,
+                            chunk_size: Optional[int] = None) -> Iterator[List[Tuple[str, Optional[Dict]]]]:
+        """
+        프로세스 풀로 파일을 파싱하여 (파일 경로, 파싱 레코드) 배치를 순서대로 생성
+        
+        입력은 지연 이터러블이어도 되며, 동시에 처리 중인 묶음 수를 워커 수의 2배로 제한해
+        파일 목록 전체를 미리 제출하지 않습니다. 파싱 실패 파일은 레코드가 None입니다.
+        워커 오류로 묶음 전체가 실패하면 묶음의 모든 파일을 실패로 내보내고, 워커 프로세스가
+        비정상 종료(메모리 부족 등)해 풀이 중단되면 새 풀을 만들어 남은 파일을 계속 처리합니다.
+        """
+        parse_workers = parse_workers or self.parse_workers or os.cpu_count() or 1
+        chunk_size = chunk_size or self.parse_chunk_size
+        max_in_flight = parse_workers * 2
+        
+        file_iter = iter(xml_files)
+        pending_batch = []
+        
+        def create_executor() -> ProcessPoolExecutor:
+            return ProcessPoolExecutor(max_workers=parse_workers, initializer=_init_parse_worker)
+        
+        executor = create_executor()
+        # 처리 중인 묶음: future -> 파일 경로 목록
+        in_flight = {}
+        
+        def submit_next() -> bool:
+            nonlocal executor
+            chunk = []
+            for xml_file in file_iter:
+                chunk.append(xml_file)
+                if len(chunk) >= chunk_size:
+                    break
+            if not chunk:
+                return False
+            try:
+                future = executor.submit(_parse_file_chunk, chunk)
+            except BrokenProcessPool:
+                logger.warning("파싱 프로세스 풀이 중단되어 새로 생성합니다.")
+                executor.shutdown(wait=False, cancel_futures=True)
+                executor = create_executor()
+                future = executor.submit(_parse_file_chunk, chunk)
+            in_flight[future] = chunk
+            return True
+        
+        try:
+            while len(in_flight) < max_in_flight and submit_next():
+                pass
+            
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    chunk = in_flight.pop(future)
+                    try:
+                        pending_batch.extend(future.result())
+                    except Exception as e:
+                        logger.error(f"파싱 워커 처리 중 오류 발생 (파일 {len(chunk)}개 실패 처리): {e}")
+                        pending_batch.extend((xml_file, None) for xml_file in chunk)
+                    
+                    submit_next()
+                
+                while len(pending_batch) >= batch_size:
+                    yield pending_batch[:batch_size]
+                    pending_batch = pending_batch[batch_size:]
+        finally:
+            executor.shutdown()
+        
+        if pending_batch:
+            yield pending_batch
+    
+    def _save_parsed_batch(self, parsed_batch: List[Tuple[str, Optional[Dict]]]) -> Dict:
+        """파싱된 레코드 배치 저장"""
         batch_results = {
             'processed': 0,
             'errors': 0,
             'duplicates': 0
         }
         
-        # 멀티스레딩으로 병렬 처리
+        records = []
+        for xml_file, parsed_data in parsed_batch:
+            if parsed_data:
+                records.append(parsed_data)
+            else:
+                logger.warning(f"XML 파싱 실패: {xml_file}")
+                batch_results['errors'] += 1
+        
+        for result in self._save_batch_to_database(records):
+            if result['status'] == 'success':
+                batch_results['processed'] += 1
+            elif result['status'] == 'duplicate':
+                batch_results['duplicates'] += 1
+            else:
+                batch_results['errors'] += 1
+        
+        return batch_results
+    
+    def _get_xml_files(self, xml_directory: str) -> List[str]:
+        """XML 파일 목록 가져오기"""
+        return list(self._iter_xml_files(xml_directory))
+    
+    def _iter_xml_files(self, xml_directory: str, recursive: bool = False,
+                        sort_by_mtime: bool = False) -> Iterator[str]:
+        """
+        XML 파일 경로를 발견하는 대로 생성
+        
+        os.scandir로 디렉토리를 한 번에 하나씩 읽으며, 하위 디렉토리는 이름 순
+        (날짜별 파티션이면 날짜 순)으로 탐색합니다. sort_by_mtime이면 디렉토리별로
+        수정 시간 순으로 정렬하므로 메모리는 가장 큰 디렉토리 하나만큼만 사용합니다.
+        탐색 중 self.files_discovered가 갱신됩니다.
+        
+        Args:
+            xml_directory: XML 디렉토리 경로
+            recursive: 하위 디렉토리까지 탐색 여부
+            sort_by_mtime: 디렉토리별 수정 시간 순 정렬 여부
+            
+        Returns:
+            Iterator[str]: XML 파일 경로
+        """
+        if not os.path.isdir(xml_directory):
+            raise FileNotFoundError(f"XML 디렉토리를 찾을 수 없습니다: {xml_directory}")
+        
+        self.files_discovered = 0
+        return self._scan_xml_directory(xml_directory, recursive, sort_by_mtime)
+    
+    def _scan_xml_directory(self, directory: str, recursive: bool,
+                            sort_by_mtime: bool) -> Iterator[str]:
+        """디렉토리 하나를 탐색하여 XML 파일 경로 생성 (하위 디렉토리는 재귀 탐색)"""
+        subdirectories = []
+        
+        try:
+            with os.scandir(directory) as entries:
+                if sort_by_mtime:
+                    file_entries = []
+                    for entry in entries:
+                        if entry.name.endswith('.xml') and entry.is_file():
+                            file_entries.append((entry.stat().st_mtime_ns, entry.path))
+                        elif recursive and entry.is_dir():
+                            subdirectories.append(entry.path)
+                    file_entries.sort()
+                    file_paths = (path for _, path in file_entries)
+                else:
+                    file_paths = self._scan_entries(entries, recursive, subdirectories)
+                
+                for file_path in file_paths:
+                    self.files_discovered += 1
+                    if self.files_discovered % SCAN_LOG_INTERVAL == 0:
+                        logger.info(f"XML 파일 탐색 중: {self.files_discovered}개 발견")
+                    yield file_path
+                    
+        except OSError as e:
+            logger.error(f"디렉토리 탐색 중 오류 발생: {directory}, {e}")
+        
+        for subdirectory in sorted(subdirectories):
+            yield from self._scan_xml_directory(subdirectory, recursive, sort_by_mtime)
+    
+    def _scan_entries(self, entries, recursive: bool, subdirectories: List[str]) -> Iterator[str]:
+        """scandir 항목 중 XML 파일 경로 생성 (하위 디렉토리는 subdirectories에 수집)"""
+        for entry in entries:
+            if entry.name.endswith('.xml') and entry.is_file():
+                yield entry.path
+            elif recursive and entry.is_dir():
+                subdirectories.append(entry.path)
+    
+    def _process_batch(self, xml_files: List[str]) -> Dict:
+        """배치 파일 처리"""
+        parsed_batch = []
+        
+        # 멀티스레딩으로 파싱한 뒤 배치 단위로 한 번에 저장
         with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
             future_to_file = {
-                executor.submit(self._process_single_xml, xml_file): xml_file 
+                executor.submit(self.xml_parser.parse_xml_file, xml_file): xml_file 
                 for xml_file in xml_files
             }
             
             for future in as_completed(future_to_file):
                 xml_file = future_to_file[future]
                 try:
-                    result = future.result()
-                    if result['status'] == 'success':
-                        batch_results['processed'] += 1
-                    elif result['status'] == 'duplicate':
-                        batch_results['duplicates'] += 1
-                    else:
-                        batch_results['errors'] += 1
-                        
+                    parsed_batch.append((xml_file, future.result()))
                 except Exception as e:
                     logger.error(f"파일 처리 중 오류 발생: {xml_file}, {e}")
-                    batch_results['errors'] += 1
+                    parsed_batch.append((xml_file, None))
         
-        return batch_results
+        return self._save_parsed_batch(parsed_batch)
     
     def _process_single_xml(self, xml_file: str) -> Dict:
         """단일 XML 파일 처리"""
@@ -165,6 +464,16 @@ class XMLProcessor:
                     'message': '이미 존재하는 기사입니다.'
                 }
             
+            # 유사 중복 체크 (SimHash 해밍 거리)
+            simhash = parsed_data.get('simhash')
+            if self.near_duplicate_distance is not None and simhash is not None:
+                near_duplicates = find_similar_article(db, simhash, self.near_duplicate_distance)
+                if near_duplicates:
+                    return {
+                        'status': 'duplicate',
+                        'message': f'유사한 기사가 이미 존재합니다: {near_duplicates[0][0]}'
+                    }
+            
             # 기사 정보 저장
             article = Article(
                 art_id=article_data['art_id'],
@@ -185,6 +494,7 @@ class XMLProcessor:
                 body=article_data['body'],
                 summary=article_data['summary'],
                 content_hash=content_hash,
+                **simhash_columns(simhash),
                 is_processed=True
             )
             
@@ -261,6 +571,282 @@ class XMLProcessor:
         finally:
             db.close()
     
+    def _save_batch_to_database(self, parsed_records: List[Dict]) -> List[Dict]:
+        """
+        파싱된 기사 배치를 한 트랜잭션으로 저장
+        
+        중복 체크는 content_hash/art_id/SimHash 블록 IN (...) 조회로 한 번에 처리하고, 기사와 분류/이미지/
+        키워드/주식 코드/처리 로그 행은 테이블별 bulk insert로 저장합니다.
+        배치 저장이 실패하면 기사별 저장(_save_to_database)으로 다시 시도합니다.
+        
+        Args:
+            parsed_records: parse_xml_file 결과 목록
+            
+        Returns:
+            List[Dict]: 입력 순서와 같은 기사별 저장 결과 (_save_to_database와 같은 형식)
+        """
+        if not parsed_records:
+            return []
+        
+        start_time = datetime.utcnow()
+        db = next(get_db())
+        
+        try:
+            existing_hashes = self._query_existing_values(
+                db, Article.content_hash, {record['content_hash'] for record in parsed_records}
+            )
+            existing_art_ids = self._query_existing_values(
+                db, Article.art_id, {record['article_data'].get('art_id') for record in parsed_records}
+            )
+            
+            # 유사 중복 체크용 SimHash 조회 (DB 저장 기사 및 같은 배치 안의 앞선 기사)
+            near_duplicate_gate = self.near_duplicate_distance is not None
+            if near_duplicate_gate:
+                stored_near_duplicates = find_similar_articles(db, {
+                    position: record['simhash']
+                    for position, record in enumerate(parsed_records)
+                    if record.get('simhash') is not None
+                }, self.near_duplicate_distance)
+                batch_simhashes = SimHashIndex(self.near_duplicate_distance)
+            
+            results = []
+            rows = {
+                Article: [],
+                ArticleCategory: [],
+                ArticleImage: [],
+                ArticleKeyword: [],
+                ArticleStockCode: []
+            }
+            
+            for position, record in enumerate(parsed_records):
+                content_hash = record['content_hash']
+                art_id = record['article_data'].get('art_id')
+                simhash = record.get('simhash')
+                
+                # 중복 체크 (DB 및 같은 배치 안의 앞선 기사)
+                if content_hash in existing_hashes:
+                    results.append({
+                        'status': 'duplicate',
+                        'message': '이미 존재하는 기사입니다.'
+                    })
+                    continue
+                
+                if near_duplicate_gate and simhash is not None:
+                    near_duplicates = (
+                        stored_near_duplicates.get(position)
+                        or batch_simhashes.query(simhash)
+                    )
+                    if near_duplicates:
+                        results.append({
+                            'status': 'duplicate',
+                            'message': f'유사한 기사가 이미 존재합니다: {near_duplicates[0][0]}'
+                        })
+                        continue
+                
+                if art_id in existing_art_ids:
+                    results.append({
+                        'status': 'error',
+                        'message': f'데이터베이스 저장 실패: 이미 존재하는 art_id입니다: {art_id}'
+                    })
+                    continue
+                
+                article_id = str(uuid.uuid4())
+                self._append_article_rows(rows, article_id, record)
+                existing_hashes.add(content_hash)
+                if art_id is not None:
+                    existing_art_ids.add(art_id)
+                if near_duplicate_gate and simhash is not None:
+                    batch_simhashes.add(article_id, simhash)
+                
+                results.append({
+                    'status': 'success',
+                    'message': '기사가 성공적으로 저장되었습니다.',
+                    'article_id': article_id
+                })
+            
+            # 처리 로그 (배치 처리 시간을 기사 수로 나눈 값 기록)
+            processing_time = (datetime.utcnow() - start_time).total_seconds() / len(parsed_records)
+            log_rows = [
+                {
+                    'id': str(uuid.uuid4()),
+                    'article_id': record['article_data'].get('art_id') or 'unknown',
+                    'process_type': 'xml_parse',
+                    'status': result['status'],
+                    'message': result['message'],
+                    'processing_time': processing_time
+                }
+                for record, result in zip(parsed_records, results)
+            ]
+            
+            # ORM bulk 경로를 거치지 않도록 Core insert를 세션 트랜잭션의 커넥션에서 실행
+            connection = db.connection()
+            for model, model_rows in rows.items():
+                if model_rows:
+                    connection.execute(insert(model.__table__), model_rows)
+            connection.execute(insert(ProcessingLog.__table__), log_rows)
+            db.commit()
+            
+            return results
+            
+        except Exception as e:
+            db.rollback()
+            logger.error(f"배치 데이터베이스 저장 중 오류 발생: {e}")
+        finally:
+            db.close()
+        
+        # 배치 저장 실패 시 기사별 저장으로 재시도
+        results = []
+        for record in parsed_records:
+            record_start = datetime.utcnow()
+            result = self._save_to_database(record)
+            self._log_processing(
+                record['article_data'].get('art_id'),
+                'xml_parse',
+                result['status'],
+                result.get('message', ''),
+                (datetime.utcnow() - record_start).total_seconds()
+            )
+            results.append(result)
+        
+        return results
+    
+    def _query_existing_values(self, db, column, values) -> set:
+        """column 값 중 DB에 이미 존재하는 값 조회 (IN 쿼리를 나눠서 실행)"""
+        values = [value for value in values if value is not None]
+        existing = set()
+        
+        for i in range(0, len(values), IN_QUERY_CHUNK_SIZE):
+            chunk = values[i:i + IN_QUERY_CHUNK_SIZE]
+            existing.update(row[0] for row in db.query(column).filter(column.in_(chunk)))
+        
+        return existing
+    
+    def _append_article_rows(self, rows: Dict, article_id: str, parsed_data: Dict):
+        """기사 한 건의 테이블별 insert 행 추가"""
+        article_data = parsed_data['article_data']
+        metadata = parsed_data['metadata']
+        
+        rows[Article].append({
+            'id': article_id,
+            'art_id': article_data['art_id'],
+            'art_year': article_data['art_year'],
+            'art_no': article_data['art_no'],
+            'title': article_data['title'],
+            'sub_title': article_data['sub_title'],
+            'writers': article_data['writers'],
+            'service_daytime': article_data['service_daytime'],
+            'reg_dt': article_data['reg_dt'],
+            'mod_dt': article_data['mod_dt'],
+            'article_url': article_data['article_url'],
+            'media_code': article_data['media_code'],
+            'gubun': article_data['gubun'],
+            'free_type': article_data['free_type'],
+            'pub_div': article_data['pub_div'],
+            'art_org_class': article_data['art_org_class'],
+            'body': article_data['body'],
+            'summary': article_data['summary'],
+            'content_hash': parsed_data['content_hash'],
+            **simhash_columns(parsed_data.get('simhash')),
+            'is_processed': True
+        })
+        
+        # 분류 정보
+        for category_data in article_data.get('categories', []):
+            rows[ArticleCategory].append({
+                'id': str(uuid.uuid4()),
+                'article_id': article_id,
+                'code_id': category_data.get('code_id'),
+                'code_nm': category_data.get('code_nm'),
+                'large_code_id': category_data.get('large_code_id'),
+                'large_code_nm': category_data.get('large_code_nm'),
+                'middle_code_id': category_data.get('middle_code_id'),
+                'middle_code_nm': category_data.get('middle_code_nm'),
+                'small_code_id': category_data.get('small_code_id'),
+                'small_code_nm': category_data.get('small_code_nm')
+            })
+        
+        # 이미지 정보
+        for image_data in article_data.get('images', []):
+            rows[ArticleImage].append({
+                'id': str(uuid.uuid4()),
+                'article_id': article_id,
+                'image_url': image_data.get('image_url'),
+                'image_caption': image_data.get('image_caption')
+            })
+        
+        # 키워드 및 추출된 엔티티
+        for keyword in article_data.get('keywords', []):
+            rows[ArticleKeyword].append({
+                'id': str(uuid.uuid4()),
+                'article_id': article_id,
+                'keyword': keyword,
+                'keyword_type': 'general'
+            })
+        
+        for entity_type, entities_list in metadata.get('extracted_entities', {}).items():
+            for entity in entities_list:
+                rows[ArticleKeyword].append({
+                    'id': str(uuid.uuid4()),
+                    'article_id': article_id,
+                    'keyword': entity,
+                    'keyword_type': entity_type
+                })
+        
+        # 주식 코드
+        for stock_code in article_data.get('stock_codes', []):
+            rows[ArticleStockCode].append({
+                'id': str(uuid.uuid4()),
+                'article_id': article_id,
+                'stock_code': stock_code
+            })
+    
+    def backfill_simhashes(self, batch_size: int = 1000) -> int:
+        """
+        SimHash가 없는 기존 기사의 지문 계산 및 저장
+        
+        Args:
+            batch_size: 한 번에 읽고 갱신할 기사 수
+            
+        Returns:
+            int: 갱신한 기사 수
+        """
+        updated = 0
+        last_id = ''
+        db = next(get_db())
+        try:
+            while True:
+                # 빈 기사는 NULL로 남으므로 다시 조회되지 않도록 ID 순으로 넘어감
+                articles = db.query(Article.id, Article.title, Article.body).filter(
+                    Article.simhash.is_(None),
+                    Article.id > last_id
+                ).order_by(Article.id).limit(batch_size).all()
+                if not articles:
+                    break
+                last_id = articles[-1][0]
+                
+                mappings = []
+                for article_id, title, body in articles:
+                    # 파싱 시(_generate_simhash)와 같이 제목과 본문이 모두 비어 있으면 NULL로 둠
+                    # (0으로 저장하면 빈 기사끼리 블록 조회에서 서로 일치)
+                    simhash = compute_simhash(f"{title or ''} {body or ''}") or None
+                    if simhash is not None:
+                        mappings.append({'id': article_id, **simhash_columns(simhash)})
+                
+                if mappings:
+                    db.bulk_update_mappings(Article, mappings)
+                    db.commit()
+                updated += len(mappings)
+                logger.info(f"SimHash 갱신: {updated}건")
+            
+            return updated
+            
+        except Exception as e:
+            db.rollback()
+            logger.error(f"SimHash 갱신 중 오류 발생: {e}")
+            return updated
+        finally:
+            db.close()
+    
     def _log_processing(self, art_id: str, process_type: str, status: str, 
                        message: str, processing_time: float):
         """처리 로그 저장"""
@@ -340,5 +926,3 @@ class XMLProcessor:
             ]
         finally:
             db.close()
-
-
@@ -0,0 +1,98 @@
+"""
+기사 카드 조회 단위 테스트
+"""
+from datetime import datetime
+
+import src.vector_search.article_hydrator as article_hydrator_module
+from src.database.models import Article
+from src.vector_search.article_hydrator import ArticleHydrator, get_article_hydrator
+
+
+def _bind_temp_database(db_path, monkeypatch, article_count=5):
+    """ArticleHydrator가 db_path의 SQLite 데이터베이스를 사용하도록 설정하고 조회 횟수를 기록"""
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+    from src.database.models import Base
+
+    engine = create_engine(f"sqlite:///{db_path}")
+    Base.metadata.create_all(bind=engine)
+    session_factory = sessionmaker(bind=engine, autocommit=False, autoflush=False)
+
+    db = session_factory()
+    db.add_all([
+        Article(id=f"id-{i}", art_id=f"art-{i}", art_year=2024, title=f"제목 {i}",
+                summary=f"요약 {i}", body="본문" * 100, service_daytime=datetime(2024, 1, 1 + i),
+                article_url=f"https://mk.co.kr/{i}")
+        for i in range(article_count)
+    ])
+    db.commit()
+    db.close()
+
+    sessions = []
+
+    def get_db():
+        sessions.append(1)
+        session = session_factory()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    monkeypatch.setattr(article_hydrator_module, 'get_db', get_db)
+    return sessions
+
+
+def test_hydrate_returns_cards_by_id(tmp_path, monkeypatch):
+    """카드 컬럼만 ID별 사전으로 반환하고 없는 ID는 제외하는지 테스트"""
+    _bind_temp_database(tmp_path / 'test.db', monkeypatch)
+    hydrator = ArticleHydrator(cache_size=10)
+
+    cards = hydrator.hydrate(['id-3', 'missing', 'id-1'])
+
+    assert set(cards) == {'id-1', 'id-3'}
+    assert cards['id-3'] == {
+        'id': 'id-3', 'art_id': 'art-3', 'title': '제목 3', 'summary': '요약 3',
+        'service_daytime': datetime(2024, 1, 4), 'article_url': 'https://mk.co.kr/3'
+    }
+
+
+def test_repeated_hydrate_skips_database(tmp_path, monkeypatch):
+    """캐시된 카드는 데이터베이스를 조회하지 않고, 무효화하거나 밀려난 카드만 다시 조회하는지 테스트"""
+    sessions = _bind_temp_database(tmp_path / 'test.db', monkeypatch)
+    hydrator = ArticleHydrator(cache_size=3)
+
+    hydrator.hydrate(['id-0', 'id-1', 'id-2'])
+    cards = hydrator.hydrate(['id-2', 'id-0'])
+    cards['id-0']['title'] = '변경'
+    assert len(sessions) == 1
+    assert hydrator.hydrate(['id-0'])['id-0']['title'] == '제목 0'
+
+    hydrator.hydrate(['id-3'])  # id-1 밀려남
+    assert len(sessions) == 2
+    hydrator.invalidate(['id-0'])
+    hydrator.hydrate(['id-1', 'id-2'])
+    hydrator.hydrate(['id-0'])
+    assert len(sessions) == 4
+
+    stats = hydrator.get_stats()
+    assert stats['cached'] == 3
+    assert stats['hits'] == 4
+    assert stats['misses'] == 6
+
+
+def test_cards_expire_after_ttl(tmp_path, monkeypatch):
+    """TTL이 지난 카드는 다시 조회하고, get_article_hydrator()는 프로세스당 한 인스턴스를 반환하는지 테스트"""
+    sessions = _bind_temp_database(tmp_path / 'test.db', monkeypatch)
+    clock = [100.0]
+    monkeypatch.setattr(article_hydrator_module.time, 'monotonic', lambda: clock[0])
+    hydrator = ArticleHydrator(cache_size=10, ttl=60)
+
+    hydrator.hydrate(['id-0'])
+    clock[0] += 30
+    hydrator.hydrate(['id-0'])
+    assert len(sessions) == 1
+    clock[0] += 31
+    hydrator.hydrate(['id-0'])
+    assert len(sessions) == 2
+
+    assert get_article_hydrator() is get_article_hydrator()
@@ -0,0 +1,75 @@
+"""
+벡터 필터용 기사 메타데이터 조회 단위 테스트
+"""
+from datetime import datetime
+
+import numpy as np
+
+import src.vector_search.article_metadata as article_metadata_module
+from src.database.models import Article, ArticleCategory, ArticleStockCode
+from src.vector_search.article_metadata import backfill_store_metadata, load_article_metadata
+from src.vector_search.local_vector_store import LocalVectorStore
+
+
+def _bind_temp_database(db_path, monkeypatch):
+    """article_metadata가 db_path의 SQLite 데이터베이스를 사용하도록 설정하고 기사 3건 저장"""
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+    from src.database.models import Base
+
+    engine = create_engine(f"sqlite:///{db_path}")
+    Base.metadata.create_all(bind=engine)
+    session_factory = sessionmaker(bind=engine, autocommit=False, autoflush=False)
+
+    db = session_factory()
+    db.add_all([
+        Article(id=f"id-{i}", art_id=f"art-{i}", art_year=2026, title=f"제목 {i}",
+                service_daytime=datetime(2026, 10, 15 + i, 9), writers=f"기자{i}")
+        for i in range(3)
+    ])
+    db.add_all([
+        ArticleCategory(article_id='id-0', large_code_nm='경제'),
+        ArticleCategory(article_id='id-2', large_code_nm='경제'),
+        ArticleStockCode(article_id='id-2', stock_code='005930')
+    ])
+    db.commit()
+    db.close()
+
+    def get_db():
+        session = session_factory()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    monkeypatch.setattr(article_metadata_module, 'get_db', get_db)
+
+
+def test_load_article_metadata(tmp_path, monkeypatch):
+    """기사 ID별 메타데이터를 조회하고 없는 ID는 제외하는지 테스트"""
+    _bind_temp_database(tmp_path / 'test.db', monkeypatch)
+
+    metadata = load_article_metadata(['id-2', 'missing'])
+
+    assert metadata == {'id-2': {'service_daytime': datetime(2026, 10, 17, 9), 'writers': '기자2',
+                                 'large_code_nm': ['경제'], 'stock_code': ['005930']}}
+
+
+def test_backfill_rows_without_metadata(tmp_path, monkeypatch):
+    """메타데이터 없이 저장된 행이 채워진 뒤 필터 검색에 포함되고, 정리 후에도 다시 채우지 않는지 테스트"""
+    _bind_temp_database(tmp_path / 'test.db', monkeypatch)
+    vectors = np.eye(4, dtype=np.float32)
+    store = LocalVectorStore(str(tmp_path / 'store'))
+    store.upsert(['id-0', 'id-1', 'id-2', 'unknown'], vectors)
+    filters = {'start_date': '2026-10-15', 'categories': ['경제']}
+    assert store.search(vectors[0], top_k=4, filters=filters) == []
+
+    assert backfill_store_metadata(store) == 3
+    assert sorted(r['id'] for r in store.search(vectors[0], top_k=4, filters=filters)) == ['id-0', 'id-2']
+    assert store.ids_without_metadata() == ['unknown']
+
+    store.delete(['id-0'])
+    store.compact()
+    reopened = LocalVectorStore(str(tmp_path / 'store'))
+    assert reopened.ids_without_metadata() == ['unknown']
+    assert [r['id'] for r in reopened.search(vectors[2], top_k=4, filters={'stock_codes': ['005930']})] == ['id-2']
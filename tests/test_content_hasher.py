@@ -0,0 +1,41 @@
+"""
+ContentHasher 단위 테스트
+"""
+import hashlib
+
+import pytest
+
+from src.incremental.content_hasher import ContentHasher, FILE_HASH_BLOCK_SIZE
+
+
+def test_file_hashes_match_whole_file_digest(tmp_path):
+    """블록 단위 해시 및 배치 해시가 파일 전체 해시와 같은지 테스트"""
+    contents = [b'', b'<article/>', b'x' * (FILE_HASH_BLOCK_SIZE * 2 + 7)]
+    file_paths = []
+    for i, content in enumerate(contents):
+        file_path = tmp_path / f"{i}.xml"
+        file_path.write_bytes(content)
+        file_paths.append(str(file_path))
+
+    hasher = ContentHasher()
+
+    for file_path, content in zip(file_paths, contents):
+        assert hasher.calculate_file_hash(file_path) == hashlib.md5(content).hexdigest()
+        assert hasher.calculate_file_hash(file_path, 'blake2b') == \
+            hashlib.blake2b(content, digest_size=16).hexdigest()
+
+    missing = str(tmp_path / 'missing.xml')
+    batch = hasher.calculate_file_hashes(file_paths * 3 + [missing], 'sha256', max_workers=4)
+    assert batch == [hashlib.sha256(content).hexdigest() for content in contents] * 3 + ['']
+
+
+def test_unknown_file_hash_algorithm_is_rejected(tmp_path):
+    """잘못된 알고리즘 이름을 md5로 대신하지 않고 오류로 처리하는지 테스트"""
+    file_path = tmp_path / 'a.xml'
+    file_path.write_bytes(b'<article/>')
+    hasher = ContentHasher()
+
+    with pytest.raises(ValueError):
+        hasher.calculate_file_hash(str(file_path), 'blake2')
+    with pytest.raises(ValueError):
+        hasher.calculate_file_hashes([str(file_path)] * 4, 'sha-256', max_workers=2)
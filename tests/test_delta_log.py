@@ -0,0 +1,131 @@
+"""
+벡터 델타 로그 단위 테스트
+"""
+import os
+
+import numpy as np
+
+from src.vector_search.delta_log import DELTA_LOG_FILE, BufferedVectorIndex
+from src.vector_search.local_vector_store import LocalVectorStore
+
+
+def _vectors(count, dimensions=8, seed=0):
+    return np.random.RandomState(seed).randn(count, dimensions).astype(np.float32)
+
+
+def test_search_sees_deltas_before_merge(tmp_path):
+    """병합 전에도 델타의 추가/교체/삭제가 검색에 반영되는지 테스트"""
+    store = LocalVectorStore(str(tmp_path))
+    vectors = _vectors(12)
+    store.upsert([f"id-{i}" for i in range(10)], vectors[:10])
+    index = BufferedVectorIndex(store, max_delta_rows=100)
+
+    index.upsert(['new'], [vectors[10]])
+    index.upsert(['id-2'], [vectors[11]])
+    index.delete(['id-5'])
+
+    assert len(store) == 10
+    assert len(index) == 10
+    assert index.search(vectors[10], top_k=1)[0]['id'] == 'new'
+    assert index.search(vectors[11], top_k=1)[0]['id'] == 'id-2'
+    assert 'id-2' not in {r['id'] for r in index.search(vectors[2], top_k=3)}
+    assert 'id-5' not in {r['id'] for r in index.search(vectors[5], top_k=10)}
+    assert len(index.search(vectors[0], top_k=20)) == 10
+
+
+def test_replay_and_merge(tmp_path):
+    """다시 열면 로그를 다시 읽고(잘린 레코드 제외) 병합 후 기본 저장소에 반영되는지 테스트"""
+    vectors = _vectors(5)
+    index = BufferedVectorIndex(LocalVectorStore(str(tmp_path)), max_delta_rows=100)
+    index.upsert([f"id-{i}" for i in range(4)], vectors[:4],
+                 [{'large_code_nm': '경제' if i % 2 else '스포츠'} for i in range(4)])
+    index.delete(['id-0'])
+    log_path = os.path.join(str(tmp_path), DELTA_LOG_FILE)
+    with open(log_path, 'ab') as f:
+        f.write(b'\x01\x05\x00')
+
+    reopened = BufferedVectorIndex(LocalVectorStore(str(tmp_path)), max_delta_rows=100)
+    assert len(reopened) == 3
+    assert [r['id'] for r in reopened.search(vectors[1], top_k=5, filters={'categories': ['경제']})] == \
+        ['id-1', 'id-3']
+
+    assert reopened.compact() == 4
+    assert not os.path.exists(log_path) or os.path.getsize(log_path) == 0
+    assert sorted(reopened.store.positions) == ['id-1', 'id-2', 'id-3']
+    assert [r['id'] for r in reopened.search(vectors[1], top_k=5, filters={'categories': ['경제']})] == \
+        ['id-1', 'id-3']
+
+    # 메타데이터 없이 교체한 벡터는 기존 메타데이터로 필터 판단
+    reopened.upsert(['id-3'], [vectors[4]])
+    assert reopened.search(vectors[4], top_k=1, filters={'categories': ['경제']})[0]['id'] == 'id-3'
+
+
+def test_background_merge(tmp_path):
+    """델타가 쌓이면 백그라운드 병합 후 검색 결과가 같은지 테스트"""
+    store = LocalVectorStore(str(tmp_path))
+    index = BufferedVectorIndex(store, max_delta_rows=20)
+    vectors = _vectors(50, seed=1)
+    for start in range(0, 50, 10):
+        index.upsert([f"id-{i}" for i in range(start, start + 10)], vectors[start:start + 10])
+        assert index.search(vectors[start], top_k=1)[0]['id'] == f"id-{start}"
+
+    index.wait_for_merge()
+    index.compact()
+    assert len(store) == 50
+    assert index.get_stats()['delta_rows'] == 0
+    assert index.search(vectors[42], top_k=1)[0]['id'] == 'id-42'
+
+
+def test_base_overfetch_counts_only_shadowed_base_ids(tmp_path):
+    """델타의 새 ID는 기본 인덱스 요청 수를 늘리지 않고, 교체/삭제된 기존 ID만큼만 더 가져오는지 테스트"""
+    store = LocalVectorStore(str(tmp_path))
+    vectors = _vectors(60)
+    store.upsert([f"id-{i}" for i in range(10)], vectors[:10])
+    index = BufferedVectorIndex(store, max_delta_rows=1000)
+    index.upsert([f"new-{i}" for i in range(40)], vectors[10:50])
+    index.upsert(['id-0', 'id-1'], vectors[50:52])
+    index.delete(['id-2'])
+
+    requested = []
+    original = store.search
+
+    def counting(query_embedding, top_k=10, filters=None):
+        requested.append(top_k)
+        return original(query_embedding, top_k, filters)
+
+    store.search = counting
+    results = index.search(vectors[3], top_k=5)
+
+    assert requested == [5 + 3]
+    assert results[0]['id'] == 'id-3'
+    assert 'id-2' not in {r['id'] for r in index.search(vectors[2], top_k=10)}
+    assert len(index.search(vectors[0], top_k=100)) == 49
+
+
+def test_failed_merge_is_retried_without_losing_deltas(tmp_path):
+    """기본 인덱스 업서트가 실패해도 다음 병합이 남은 델타를 덮어쓰지 않고 다시 병합하는지 테스트"""
+    store = LocalVectorStore(str(tmp_path))
+    vectors = _vectors(20, seed=2)
+    index = BufferedVectorIndex(store, max_delta_rows=1000, background=False)
+    index.upsert([f"id-{i}" for i in range(10)], vectors[:10])
+
+    def failing_upsert(*args, **kwargs):
+        raise OSError('disk full')
+
+    original = store.upsert
+    store.upsert = failing_upsert
+    index.compact()
+    assert index.get_stats()['merging_rows'] == 10
+
+    index.upsert([f"id-{i}" for i in range(10, 20)], vectors[10:])
+    index.compact()
+    assert index.search(vectors[3], top_k=1)[0]['id'] == 'id-3'
+    assert len(index) == 20
+
+    store.upsert = original
+    assert index.compact() == 10
+    assert len(store) == 10
+    assert index.compact() == 10
+    assert len(store) == 20
+    assert not os.path.exists(tmp_path / 'deltas.merging.log')
+    assert BufferedVectorIndex(LocalVectorStore(str(tmp_path))).search(vectors[15], top_k=1)[0]['id'] == 'id-15'
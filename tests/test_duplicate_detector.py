@@ -0,0 +1,62 @@
+"""
+DuplicateDetector 중복 그룹 필터링 단위 테스트
+"""
+from src.incremental.duplicate_detector import DuplicateDetector, UnionFind
+
+
+def _article(article_id, body, created_at):
+    return {'id': article_id, 'title': article_id, 'summary': '', 'body': body, 'created_at': created_at}
+
+
+def test_union_find_groups():
+    """연결된 항목이 한 그룹으로 묶이는지 테스트"""
+    clusters = UnionFind(6)
+    clusters.union(0, 3)
+    clusters.union(3, 5)
+    clusters.union(1, 2)
+    clusters.union(5, 0)
+
+    assert clusters.groups() == [[0, 3, 5], [1, 2], [4]]
+
+
+def test_filter_duplicates_keeps_one_per_chain():
+    """세 건 이상 연결된 중복 그룹에서 한 건만 남기는지 테스트"""
+    articles = [
+        _article('a', 'a', '2024-01-02'),
+        _article('b', 'b', '2024-01-03'),
+        _article('c', 'c', '2024-01-01'),
+        _article('d', 'd', '2024-01-01'),
+    ]
+    detector = DuplicateDetector()
+    # a-b, b-c만 유사하고 a-c는 직접 비교 시 임계값 미만인 경우
+    detector._detect_similar_duplicates = lambda items: [
+        {'article1': items[0], 'article2': items[1], 'similarity': 0.9, 'type': 'similar'},
+        {'article1': items[1], 'article2': items[2], 'similarity': 0.9, 'type': 'similar'},
+    ]
+
+    assert [a['id'] for a in detector.filter_duplicates(articles, 'latest')] == ['b', 'd']
+    assert [a['id'] for a in detector.filter_duplicates(articles, 'first')] == ['a', 'd']
+    assert [[a['id'] for a in group] for group in detector.cluster_duplicates(articles)] == [
+        ['a', 'b', 'c'], ['d']
+    ]
+
+
+def test_filter_duplicates_runs_selected_detectors_only():
+    """선택하지 않은 감지기는 실행하지 않는지 테스트"""
+    articles = [
+        _article('a', '같은 본문', '2024-01-01'),
+        _article('b', '같은 본문', '2024-01-02'),
+        _article('c', '다른 본문', '2024-01-03'),
+    ]
+    articles[1]['title'] = 'a'
+    detector = DuplicateDetector()
+
+    def fail(items):
+        raise AssertionError("선택하지 않은 감지기 실행")
+
+    detector._detect_similar_duplicates = fail
+    detector._detect_content_duplicates = fail
+
+    assert [a['id'] for a in detector.filter_duplicates(articles, detectors=('exact',))] == ['b', 'c']
+    assert [a['id'] for a in detector.filter_duplicates(articles, 'first', detectors=('title',))] == \
+        ['a', 'c']
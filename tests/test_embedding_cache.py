@@ -0,0 +1,59 @@
+"""
+영구 임베딩 캐시 단위 테스트
+"""
+import numpy as np
+
+from src.embedding.embedding_cache import PersistentEmbeddingCache
+
+
+def test_persist_and_invalidate_on_version_change(tmp_path):
+    """다시 열어도 임베딩이 남아 있고, 모델 버전이 바뀌면 해당 모델만 삭제되는지 테스트"""
+    db_path = str(tmp_path / 'cache' / 'embeddings.db')
+    cache = PersistentEmbeddingCache(db_path)
+    cache.put_many('multilingual', 'v1', ['a', 'b'], [[1.0, 2.0], [3.0, 4.0]])
+    cache.put_many('korean', 'k1', ['a'], [[5.0, 6.0]])
+    cache.close()
+
+    cache = PersistentEmbeddingCache(db_path)
+    found = cache.get_many('multilingual', 'v1', ['b', 'c', 'a'])
+    assert set(found) == {'a', 'b'}
+    assert found['b'].dtype == np.float32
+    np.testing.assert_array_equal(found['b'], [3.0, 4.0])
+
+    assert cache.get_many('multilingual', 'v2', ['a', 'b']) == {}
+    assert cache.get_stats()['entries'] == {'korean': 1}
+    assert set(cache.get_many('korean', 'k1', ['a'])) == {'a'}
+    cache.close()
+
+
+def test_batch_generate_embeddings_skips_unchanged_text(tmp_path, monkeypatch):
+    """같은 기사를 다시 처리하면 바뀐 텍스트만 인코딩하고 모델 버전이 바뀌면 다시 인코딩하는지 테스트"""
+    monkeypatch.setenv('EMBEDDING_CACHE_PATH', str(tmp_path / 'embeddings.db'))
+    from src.embedding.embedding_service import EmbeddingService
+
+    service = EmbeddingService()
+    encoded = []
+    original = service._generate_multilingual_embeddings
+
+    def counting(texts):
+        encoded.extend(texts)
+        return original(texts)
+
+    monkeypatch.setattr(service, '_generate_multilingual_embeddings', counting)
+    articles = [
+        {'id': f"id-{i}", 'art_id': f"art-{i}", 'title': f"제목 {i}", 'body': f"본문 {i}", 'summary': ''}
+        for i in range(4)
+    ]
+
+    first = service.batch_generate_embeddings(articles, batch_size=3)
+    assert len(encoded) == 4
+
+    articles[1]['body'] = '수정된 본문'
+    second = service.batch_generate_embeddings(articles, batch_size=3)
+    assert len(encoded) == 5
+    assert [r['text_hash'] for r in second] != [r['text_hash'] for r in first]
+    np.testing.assert_allclose(second[0]['embedding'], first[0]['embedding'], rtol=1e-6)
+
+    monkeypatch.setenv('EMBEDDING_MODEL_REVISION', '2')
+    service.batch_generate_embeddings(articles, batch_size=3)
+    assert len(encoded) == 9
@@ -0,0 +1,42 @@
+"""
+EntityExtractor 단위 테스트
+"""
+import glob
+import os
+
+import pytest
+from src.entity_extractor import EntityExtractor
+from src.xml_parser import XMLParser
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SAMPLE_FILES = sorted(glob.glob(os.path.join(ROOT_DIR, 'saltlux_T_*.xml')))[:200]
+
+
+def _as_sets(entities):
+    """엔티티 목록 순서와 무관하게 비교하기 위한 변환"""
+    return {key: set(values) for key, values in entities.items()}
+
+
+@pytest.mark.parametrize('text', [
+    '삼성전자(주)와 현대자동차㈜, 그리고 신한금융그룹 계열 신한은행',
+    '매일경제 홍길동 기자 = 서울 강남구에서 1조 2억 3만 규모 투자, 지분 12.5% 인수',
+    'KB금융그룹 KB증권 KB손해보험 KB국민카드 미래에셋인베스트먼트',
+    '2024년 3월 5일 2024-03-05 03/05/2024 2024.03.05 5만 원',
+    '접미사가 전혀 없는 아주 긴 문장이 계속 이어지는 경우에도 결과는 같아야 한다',
+    '',
+])
+def test_extract_matches_pattern_findall(text):
+    """EntityExtractor 결과가 패턴별 findall 결과와 동일한지 테스트"""
+    parser = XMLParser()
+    expected = parser._extract_entities_with_patterns({'title': '', 'body': text})
+    assert _as_sets(EntityExtractor().extract(f" {text}")) == _as_sets(expected)
+
+
+@pytest.mark.skipif(not SAMPLE_FILES, reason="샘플 XML 파일 없음")
+def test_extract_matches_pattern_findall_on_samples():
+    """샘플 기사에서 두 추출 방식의 결과가 동일한지 테스트"""
+    parser = XMLParser()
+    for xml_file in SAMPLE_FILES:
+        article_data = parser.parse_xml_file(xml_file)['article_data']
+        assert _as_sets(parser._extract_entities(article_data)) == \
+            _as_sets(parser._extract_entities_with_patterns(article_data))
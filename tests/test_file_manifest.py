@@ -0,0 +1,74 @@
+"""
+FileManifestManager 단위 테스트
+"""
+import os
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+import src.incremental.file_manifest as file_manifest_module
+from src.database.models import Base
+from src.incremental.file_manifest import FileManifestManager
+
+
+@pytest.fixture
+def manifest(tmp_path, monkeypatch):
+    """임시 SQLite 데이터베이스를 사용하는 manifest"""
+    engine = create_engine(f"sqlite:///{tmp_path / 'manifest.db'}")
+    Base.metadata.create_all(bind=engine)
+    session_factory = sessionmaker(bind=engine, autocommit=False, autoflush=False)
+
+    def get_db():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    monkeypatch.setattr(file_manifest_module, 'get_db', get_db)
+    yield FileManifestManager(flush_size=2)
+    engine.dispose()
+
+
+def test_rescan_skips_unchanged_files(manifest, tmp_path):
+    """기록된 파일은 크기와 수정 시간이 바뀐 경우만 다시 감지되는지 테스트"""
+    xml_dir = tmp_path / 'xml'
+    xml_dir.mkdir()
+    for name in ('a.xml', 'b.xml', 'c.xml'):
+        (xml_dir / name).write_text(name, encoding='utf-8')
+    (xml_dir / 'notes.txt').write_text('skip', encoding='utf-8')
+
+    changed = manifest.scan_changed_files(str(xml_dir))
+    assert sorted(os.path.basename(path) for path in changed) == ['a.xml', 'b.xml', 'c.xml']
+
+    for file_path in changed:
+        manifest.set_pending_hash(file_path, f"hash-{os.path.basename(file_path)}")
+        manifest.record(file_path)
+    manifest.flush()
+
+    assert manifest.scan_changed_files(str(xml_dir)) == []
+
+    stat = os.stat(xml_dir / 'b.xml')
+    os.utime(xml_dir / 'b.xml', ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    assert manifest.scan_changed_files(str(xml_dir)) == [str(xml_dir / 'b.xml')]
+
+    # 같은 경로를 다시 기록하면 항목이 교체됨
+    manifest.record(str(xml_dir / 'b.xml'), 'hash-b-2')
+    manifest.flush()
+    assert manifest.scan_changed_files(str(xml_dir)) == []
+    assert manifest.find_known_hashes(['hash-a.xml', 'hash-b-2', 'hash-b.xml', 'other']) == \
+        {'hash-a.xml', 'hash-b-2'}
+
+
+def test_unrecorded_files_respect_min_mtime(manifest, tmp_path):
+    """manifest에 없는 파일은 min_mtime_ns 이후 수정된 경우만 감지되는지 테스트"""
+    old_file = tmp_path / 'old.xml'
+    new_file = tmp_path / 'new.xml'
+    old_file.write_text('old', encoding='utf-8')
+    new_file.write_text('new', encoding='utf-8')
+    os.utime(old_file, ns=(1_000, 1_000))
+    os.utime(new_file, ns=(3_000, 3_000))
+
+    assert manifest.scan_changed_files(str(tmp_path), min_mtime_ns=2_000) == [str(new_file)]
+    assert manifest.find_known_hashes(['anything']) == set()
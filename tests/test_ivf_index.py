@@ -0,0 +1,107 @@
+"""
+IVFIndex 단위 테스트
+"""
+import threading
+
+import numpy as np
+
+from src.vector_search.ivf_index import IVFIndex
+from src.vector_search.local_vector_store import LocalVectorStore
+
+
+def _clustered_vectors(count, dimensions=16, clusters=20, seed=0):
+    rng = np.random.RandomState(seed)
+    centers = rng.randn(clusters, dimensions)
+    return (centers[rng.randint(clusters, size=count)] + 0.1 * rng.randn(count, dimensions)).astype(np.float32)
+
+
+def test_train_search_and_config_mapping(tmp_path):
+    """tree-AH 설정값이 리스트 수와 nprobe로 바뀌고 근사 검색 결과가 전체 검색과 맞는지 테스트"""
+    store = LocalVectorStore(str(tmp_path))
+    index = IVFIndex.from_tree_ah_config(
+        store, {'leaf_node_embedding_count': 50, 'leaf_nodes_to_search_percent': 20}, min_train_size=500
+    )
+    vectors = _clustered_vectors(1000)
+    ids = [f"id-{i}" for i in range(1000)]
+
+    index.upsert(ids[:400], vectors[:400])
+    assert not index.is_trained
+    assert index.search(vectors[0], top_k=1)[0]['id'] == 'id-0'
+
+    index.upsert(ids[400:], vectors[400:])
+    index.wait_for_training()
+    results = index.search(vectors[5], top_k=10)
+    assert index.is_trained
+    assert index.n_lists == 20
+    assert index.nprobe == 4
+    assert results[0]['id'] == 'id-5'
+
+    hits = 0
+    for query in vectors[:50]:
+        exact = {r['id'] for r in store.search(query, top_k=10)}
+        hits += len(exact & {r['id'] for r in index.search(query, top_k=10)})
+    assert hits / 500 >= 0.9
+    store.close()
+
+
+def test_incremental_upsert_delete_and_reload(tmp_path):
+    """학습 후 추가/교체/삭제가 검색에 반영되고 다시 열어도 유지되는지 테스트"""
+    store = LocalVectorStore(str(tmp_path))
+    index = IVFIndex(store, leaf_node_embedding_count=50, leaf_nodes_to_search_percent=20, min_train_size=500)
+    vectors = _clustered_vectors(600, seed=1)
+    index.upsert([f"id-{i}" for i in range(600)], vectors)
+    index.train()
+
+    new_vector = _clustered_vectors(1, seed=2)[0]
+    index.upsert(['new'], [new_vector])
+    index.upsert(['id-3'], [vectors[10]])
+    index.delete(['id-10'])
+
+    assert index.search(new_vector, top_k=1)[0]['id'] == 'new'
+    assert index.search(vectors[10], top_k=1)[0]['id'] == 'id-3'
+    assert 'id-10' not in {r['id'] for r in index.search(vectors[10], top_k=20)}
+    store.close()
+
+    reopened_store = LocalVectorStore(str(tmp_path))
+    reopened = IVFIndex(reopened_store, leaf_node_embedding_count=50, leaf_nodes_to_search_percent=20,
+                        min_train_size=500)
+    assert reopened.is_trained
+    np.testing.assert_array_equal(reopened.centroids, index.centroids)
+    assert reopened.search(new_vector, top_k=1)[0]['id'] == 'new'
+
+    assert reopened.compact() == 1
+    assert reopened.search(vectors[10], top_k=1)[0]['id'] == 'id-3'
+    reopened_store.close()
+
+
+def test_background_training_does_not_block_search(tmp_path, monkeypatch):
+    """학습 중에도 저장소 검색으로 응답하고, 학습 중 업서트된 행이 새 중심점으로 배정되는지 테스트"""
+    store = LocalVectorStore(str(tmp_path))
+    index = IVFIndex(store, leaf_node_embedding_count=50, leaf_nodes_to_search_percent=20, min_train_size=500)
+    vectors = _clustered_vectors(700, seed=3)
+    started = threading.Event()
+    release = threading.Event()
+    kmeans = index._kmeans
+
+    def blocking_kmeans(*args):
+        started.set()
+        release.wait(10)
+        return kmeans(*args)
+
+    monkeypatch.setattr(index, '_kmeans', blocking_kmeans)
+    index.upsert([f"id-{i}" for i in range(600)], vectors[:600])
+    assert started.wait(10)
+
+    assert index.search(vectors[7], top_k=1)[0]['id'] == 'id-7'
+    index.upsert([f"id-{i}" for i in range(600, 700)], vectors[600:])
+    index.upsert(['id-1'], [vectors[650]])
+    assert not index.is_trained
+
+    release.set()
+    index.wait_for_training()
+    assert index.is_trained
+    assert (index.assignments[:store.count] >= 0).all()
+    assert np.array_equal(index.assignments[store.positions['id-1']],
+                          index._nearest_centroids(store._vectors[[store.positions['id-1']]], index.centroids)[0])
+    assert index.search(vectors[680], top_k=1)[0]['id'] == 'id-680'
+    store.close()
@@ -0,0 +1,62 @@
+"""
+KoreanEmbeddingModel 배치 인코딩 단위 테스트
+"""
+import numpy as np
+import pytest
+
+torch = pytest.importorskip('torch')
+transformers = pytest.importorskip('transformers')
+
+from src.embedding.korean_embedding_model import KoreanEmbeddingModel
+
+
+def _tiny_model(tmp_path, batch_size):
+    """작은 임의 BERT 모델을 사용하는 KoreanEmbeddingModel"""
+    words = ['삼성전자', '실적', '금리', '인상', '환율', '하락', '코스피', '상승']
+    vocab_file = tmp_path / 'vocab.txt'
+    vocab_file.write_text('\n'.join(['[PAD]', '[UNK]', '[CLS]', '[SEP]', '[MASK]'] + words), encoding='utf-8')
+
+    torch.manual_seed(0)
+    config = transformers.BertConfig(vocab_size=len(words) + 5, hidden_size=16, num_hidden_layers=1,
+                                     num_attention_heads=2, intermediate_size=32)
+    model = KoreanEmbeddingModel.__new__(KoreanEmbeddingModel)
+    model.model_name = 'tiny-bert'
+    model.batch_size = batch_size
+    model.num_threads = 1
+    model.tokenizer = transformers.BertTokenizer(str(vocab_file))
+    model.model = transformers.BertModel(config).eval()
+    return model
+
+
+def test_batched_encoding_matches_single_text_encoding(tmp_path):
+    """길이순 배치 인코딩 결과가 입력 순서를 유지하고 한 건씩 인코딩한 결과와 같은지 테스트"""
+    model = _tiny_model(tmp_path, batch_size=2)
+    texts = ['삼성전자 실적 코스피 상승 금리 인상', '환율', '금리 인상', '코스피 하락 환율 상승', '실적']
+
+    batched = model._encode_with_korean_model(texts)
+    single = [model._encode_with_korean_model([text])[0] for text in texts]
+
+    assert len(batched) == len(texts)
+    np.testing.assert_allclose(np.array(batched), np.array(single), atol=1e-5)
+
+
+def test_thread_count_is_only_set_when_configured(monkeypatch):
+    """스레드 수를 지정하지 않으면 프로세스 전역 torch 스레드 설정을 바꾸지 않는지 테스트"""
+    import src.embedding.korean_embedding_model as korean_embedding_module
+
+    calls = []
+    monkeypatch.setattr(korean_embedding_module.torch, 'set_num_threads', calls.append)
+    monkeypatch.setattr(korean_embedding_module.AutoTokenizer, 'from_pretrained', lambda name: None)
+    monkeypatch.setattr(korean_embedding_module.AutoModel, 'from_pretrained',
+                        lambda name: transformers.BertModel(transformers.BertConfig(
+                            vocab_size=10, hidden_size=8, num_hidden_layers=1,
+                            num_attention_heads=2, intermediate_size=16)))
+    monkeypatch.delenv('KOREAN_EMBEDDING_THREADS', raising=False)
+
+    assert KoreanEmbeddingModel('tiny').num_threads is None
+    assert calls == []
+
+    monkeypatch.setenv('KOREAN_EMBEDDING_THREADS', '2')
+    KoreanEmbeddingModel('tiny')
+    KoreanEmbeddingModel('tiny', num_threads=3)
+    assert calls == [2, 3]
@@ -0,0 +1,140 @@
+"""
+LocalVectorStore 단위 테스트
+"""
+import json
+
+import numpy as np
+import pytest
+
+from src.vector_search.local_vector_store import LocalVectorStore
+
+
+def _vectors(count, dimensions=8, seed=0):
+    return np.random.RandomState(seed).randn(count, dimensions).astype(np.float32)
+
+
+def test_upsert_search_and_reopen(tmp_path):
+    """업서트가 기존 벡터를 유지하고 다시 열어도 같은 결과를 주는지 테스트"""
+    store = LocalVectorStore(str(tmp_path), initial_capacity=4)
+    vectors = _vectors(10)
+    store.upsert([f"id-{i}" for i in range(6)], vectors[:6])
+    store.upsert([f"id-{i}" for i in range(6, 10)], vectors[6:])
+
+    assert len(store) == 10
+    assert store.capacity >= 10
+    results = store.search(vectors[7], top_k=3)
+    assert results[0]['id'] == 'id-7'
+    assert results[0]['similarity'] == pytest.approx(1.0, abs=1e-5)
+    assert [r['similarity'] for r in results] == sorted((r['similarity'] for r in results), reverse=True)
+
+    # 같은 ID 업서트는 행을 교체
+    store.upsert(['id-7'], [vectors[0]])
+    assert len(store) == 10
+    assert store.search(vectors[0], top_k=2)[1]['id'] in ('id-0', 'id-7')
+    store.close()
+
+    reopened = LocalVectorStore(str(tmp_path))
+    assert len(reopened) == 10
+    assert reopened.dimensions == 8
+    np.testing.assert_allclose(reopened.get('id-3'), vectors[3] / np.linalg.norm(vectors[3]), rtol=1e-5)
+    reopened.close()
+
+
+def test_delete_and_compact(tmp_path):
+    """tombstone 삭제 후 검색에서 제외되고 compact에서 행이 정리되는지 테스트"""
+    store = LocalVectorStore(str(tmp_path))
+    vectors = _vectors(5)
+    store.upsert([f"id-{i}" for i in range(5)], vectors)
+
+    assert store.delete(['id-1', 'id-3', 'missing']) == 2
+    assert 'id-1' not in {r['id'] for r in store.search(vectors[1], top_k=5)}
+    assert store.get_stats()['deleted'] == 2
+
+    assert store.compact() == 2
+    assert store.get_stats() == {'vectors': 3, 'deleted': 0, 'capacity': 1024, 'dimensions': 8,
+                                 'quantization': None, 'code_bytes_per_vector': 0,
+                                 'float32_bytes_per_vector': 32, 'bytes_per_vector': 32}
+    assert store.search(vectors[4], top_k=1)[0]['id'] == 'id-4'
+    store.close()
+
+    reopened = LocalVectorStore(str(tmp_path))
+    assert sorted(reopened.positions) == ['id-0', 'id-2', 'id-4']
+    reopened.close()
+
+
+def test_import_legacy_json_and_dimension_check(tmp_path):
+    """기존 vector_data.json 가져오기 및 차원 검사 테스트"""
+    legacy_path = tmp_path / 'vector_data.json'
+    legacy_path.write_text(json.dumps([
+        {'id': 'a', 'embedding': [1.0, 0.0, 0.0]},
+        {'id': 'b', 'embedding': [0.0, 1.0, 0.0]},
+    ]), encoding='utf-8')
+
+    store = LocalVectorStore(str(tmp_path / 'store'))
+    assert store.import_json(str(legacy_path)) == 2
+    assert store.search([0.1, 0.9, 0.0], top_k=1)[0]['id'] == 'b'
+    with pytest.raises(ValueError):
+        store.upsert(['c'], [[1.0, 2.0]])
+    store.close()
+
+
+def test_search_batch_matches_brute_force(tmp_path, monkeypatch):
+    """행 묶음별 argpartition 검색이 전체 정렬 결과와 같은지 테스트"""
+    import src.vector_search.local_vector_store as store_module
+    monkeypatch.setattr(store_module, 'SEARCH_CHUNK_ROWS', 7)
+
+    store = LocalVectorStore(str(tmp_path))
+    vectors = _vectors(50, dimensions=16, seed=1)
+    ids = [f"id-{i}" for i in range(50)]
+    store.upsert(ids, vectors)
+    store.delete(['id-3', 'id-20', 'id-21'])
+
+    normalized = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    queries = _vectors(4, dimensions=16, seed=2)
+    results = store.search_batch(queries, top_k=5)
+
+    for query, result in zip(queries, results):
+        scores = normalized @ (query / np.linalg.norm(query))
+        scores[[3, 20, 21]] = -np.inf
+        expected = [ids[i] for i in np.argsort(-scores)[:5]]
+        assert [r['id'] for r in result] == expected
+
+    assert len(store.search(queries[0], top_k=100)) == 47
+    store.close()
+
+
+@pytest.mark.parametrize('quantization, params, code_size', [('int8', {}, 16), ('pq', {'subspaces': 4}, 4)])
+def test_quantized_search_reranks_with_float32(tmp_path, quantization, params, code_size):
+    """학습 크기에 도달하면 코드를 만들고, 코드 후보를 float32로 다시 정렬하는지 테스트"""
+    store = LocalVectorStore(str(tmp_path), quantization=quantization, quantization_params=params,
+                             quantizer_train_size=300)
+    vectors = _vectors(400, dimensions=16, seed=3)
+    ids = [f"id-{i}" for i in range(400)]
+    store.upsert(ids[:200], vectors[:200])
+    assert store.codec is None
+
+    store.upsert(ids[200:], vectors[200:])
+    stats = store.get_stats()
+    assert stats['code_bytes_per_vector'] == code_size
+    assert stats['bytes_per_vector'] == code_size + 16 * 4
+    store.upsert(['extra'], [vectors[0]])
+    store.delete(['id-1'])
+
+    normalized = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    hits = 0
+    for position in range(2, 22):
+        result = store.search(vectors[position], top_k=10)
+        # 다시 정렬한 점수는 float32 원본 점수
+        assert result[0]['id'] == ids[position]
+        assert result[0]['similarity'] == pytest.approx(1.0, abs=1e-5)
+        exact = np.argsort(-(normalized @ normalized[position]))[:10]
+        hits += len({r['id'] for r in result} & {ids[i] for i in exact})
+    assert hits / 200 >= 0.9
+    assert 'id-1' not in {r['id'] for r in store.search(vectors[1], top_k=10)}
+
+    assert store.compact() == 1
+    store.close()
+    reopened = LocalVectorStore(str(tmp_path))
+    assert reopened.codec.name == quantization
+    assert reopened.search(vectors[7], top_k=1)[0]['id'] == 'id-7'
+    reopened.close()
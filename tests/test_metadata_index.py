@@ -0,0 +1,119 @@
+"""
+메타데이터 필터 벡터 검색 단위 테스트
+"""
+from datetime import date, datetime
+
+import numpy as np
+import pytest
+
+from src.vector_search.ivf_index import IVFIndex
+from src.vector_search.local_vector_store import LocalVectorStore
+from src.vector_search.metadata_index import MetadataIndex, matches_filters, parse_filter_expression
+
+
+def _metadata(i):
+    return {
+        'service_daytime': datetime(2024, 1, 1 + i % 28),
+        'large_code_nm': ['경제'] if i % 3 == 0 else ['스포츠'],
+        'stock_code': ['005930'] if i % 10 == 0 else [],
+        'writers': '홍길동 기자(hong@mk.co.kr)' if i % 2 else '김철수 기자, 이영희 기자',
+    }
+
+
+def test_parse_filter_expression():
+    """필터 식이 필터 사전으로 바뀌는지 테스트"""
+    assert parse_filter_expression(
+        'service_daytime>=2024-01-01; large_code_nm=경제, 증권 AND stock_code=005930; writers=홍길동'
+    ) == {'start_date': '2024-01-01', 'categories': ['경제', '증권'], 'stock_codes': ['005930'],
+          'writers': ['홍길동']}
+    assert parse_filter_expression({'categories': ['경제']}) == {'categories': ['경제']}
+    with pytest.raises(ValueError):
+        parse_filter_expression('title=삼성')
+
+
+def test_mask_update_and_remap(tmp_path):
+    """교체된 값만 유효하고 다시 열거나 정리해도 마스크가 유지되는지 테스트"""
+    index = MetadataIndex(str(tmp_path))
+    index.update([0, 1, 2, 3], [_metadata(i) for i in range(4)])
+    index.update([3], [{'large_code_nm': '경제'}])
+
+    assert np.flatnonzero(index.mask({'categories': ['경제']}, 4)).tolist() == [0, 3]
+    assert np.flatnonzero(index.mask({'writers': ['이영희']}, 4)).tolist() == [0, 2]
+    assert np.flatnonzero(index.mask({'start_date': '2024-01-02', 'end_date': datetime(2024, 1, 3)}, 4)).tolist() == \
+        [1, 2]
+    assert np.flatnonzero(index.mask({'stock_codes': ['005930'], 'writers': ['김철수']}, 4)).tolist() == [0]
+    assert index.mask({}, 4) is None
+
+    reopened = MetadataIndex(str(tmp_path))
+    assert np.flatnonzero(reopened.mask({'categories': ['경제']}, 4)).tolist() == [0, 3]
+    reopened.remap(np.array([1, 3]), 4)
+    assert np.flatnonzero(reopened.mask({'categories': ['경제']}, 2)).tolist() == [1]
+    assert np.flatnonzero(MetadataIndex(str(tmp_path)).mask({'writers': ['홍길동']}, 2)).tolist() == [0]
+
+
+def test_vocab_survives_line_separator_characters(tmp_path):
+    """'\\r', '\\x1c', '\\u2028'가 들어간 값이 있어도 다시 연 뒤 값 번호가 밀리지 않는지 테스트"""
+    index = MetadataIndex(str(tmp_path))
+    index.update([0, 1, 2], [{'large_code_nm': name} for name in ('경제\r증권', '문화\x1c연예', '국제\u2028정치')])
+    index.update([3], [{'large_code_nm': '스포츠'}])
+
+    reopened = MetadataIndex(str(tmp_path))
+    assert np.flatnonzero(reopened.mask({'categories': ['스포츠']}, 4)).tolist() == [3]
+    assert np.flatnonzero(reopened.mask({'categories': ['문화\x1c연예']}, 4)).tolist() == [1]
+
+
+@pytest.mark.parametrize('end_date', [date(2026, 10, 17), '2026-10-17'])
+def test_date_only_end_date_includes_whole_day(tmp_path, end_date):
+    """날짜만 준 end_date는 그날 전체를 포함하고 날짜시간 end_date는 그 시각까지만 포함하는지 테스트"""
+    times = [datetime(2026, 10, 16, 23, 59), datetime(2026, 10, 17, 0, 0), datetime(2026, 10, 17, 9, 30),
+             datetime(2026, 10, 17, 23, 59, 59), datetime(2026, 10, 18, 0, 0)]
+    index = MetadataIndex(str(tmp_path))
+    index.update(list(range(5)), [{'service_daytime': value} for value in times])
+
+    filters = {'start_date': date(2026, 10, 17), 'end_date': end_date}
+    assert np.flatnonzero(index.mask(filters, 5)).tolist() == [1, 2, 3]
+    assert [matches_filters({'service_daytime': value}, filters) for value in times] == \
+        [False, True, True, True, False]
+
+    filters = {'end_date': datetime(2026, 10, 17, 9, 30)}
+    assert np.flatnonzero(index.mask(filters, 5)).tolist() == [0, 1, 2]
+    assert matches_filters({'service_daytime': times[2]}, filters)
+    assert not matches_filters({'service_daytime': times[3]}, filters)
+
+
+@pytest.mark.parametrize('chunk_rows, gather_fraction', [(7, 0.0), (1000, 0.1)])
+def test_filtered_search_returns_full_top_k(tmp_path, monkeypatch, chunk_rows, gather_fraction):
+    """선택도가 높은 필터에서도 조건에 맞는 행 중 상위 top_k를 채우는지 테스트 (마스크/행 모으기)"""
+    import src.vector_search.local_vector_store as store_module
+    monkeypatch.setattr(store_module, 'SEARCH_CHUNK_ROWS', chunk_rows)
+    monkeypatch.setattr(store_module, 'FILTER_GATHER_FRACTION', gather_fraction)
+
+    store = LocalVectorStore(str(tmp_path))
+    vectors = np.random.RandomState(0).randn(200, 16).astype(np.float32)
+    ids = [f"id-{i}" for i in range(200)]
+    store.upsert(ids, vectors, [_metadata(i) for i in range(200)])
+    store.delete(['id-10'])
+
+    filters = {'stock_codes': ['005930'], 'categories': ['경제']}
+    results = store.search(vectors[0], top_k=5, filters=filters)
+    expected = [i for i in range(0, 200, 30) if i != 10]
+    normalized = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    expected.sort(key=lambda i: -float(normalized[i] @ normalized[0]))
+    assert [r['id'] for r in results] == [ids[i] for i in expected[:5]]
+    assert store.search(vectors[0], top_k=5, filters={'writers': ['없는기자']}) == []
+    store.close()
+
+
+def test_ivf_filtered_search_falls_back_to_store(tmp_path):
+    """IVF 후보가 부족하면 필터 조건 전체에서 검색하는지 테스트"""
+    store = LocalVectorStore(str(tmp_path))
+    index = IVFIndex(store, leaf_node_embedding_count=20, leaf_nodes_to_search_percent=5, min_train_size=100)
+    vectors = np.random.RandomState(1).randn(300, 16).astype(np.float32)
+    index.upsert([f"id-{i}" for i in range(300)], vectors, [_metadata(i) for i in range(300)])
+    index.train()
+
+    results = index.search(vectors[0], top_k=10, filters={'stock_codes': ['005930']})
+    assert len(results) == 10
+    assert results[0]['id'] == 'id-0'
+    assert all(int(r['id'].split('-')[1]) % 10 == 0 for r in results)
+    store.close()
@@ -0,0 +1,115 @@
+"""
+MinHash/LSH 유사 중복 탐지 단위 테스트
+"""
+import pytest
+
+from src.incremental.duplicate_detector import DuplicateDetector
+from src.incremental.minhash_lsh import MinHasher, MinHashLSHIndex, estimate_jaccard
+
+BASE_BODY = (
+    "한국은행 금융통화위원회는 기준금리를 연 3.50%로 동결했다고 밝혔다. "
+    "물가 상승률이 둔화되고 있지만 가계부채 증가세와 환율 변동성을 고려해 "
+    "당분간 긴축 기조를 유지하겠다는 입장이다. 시장에서는 하반기 인하 가능성을 점치고 있다."
+)
+
+
+def _article(article_id, title, body, created_at='2024-01-01'):
+    return {'id': article_id, 'title': title, 'summary': '', 'body': body, 'created_at': created_at}
+
+
+def test_signature_estimates_shingle_jaccard():
+    """서명 일치 비율이 shingle 집합의 실제 Jaccard 유사도에 가까운지 테스트"""
+    hasher = MinHasher(num_perm=256)
+    text1 = BASE_BODY
+    text2 = BASE_BODY.replace('동결했다고', '유지했다고')
+
+    shingles1 = set(hasher.shingle_hashes(text1).tolist())
+    shingles2 = set(hasher.shingle_hashes(text2).tolist())
+    actual = len(shingles1 & shingles2) / len(shingles1 | shingles2)
+
+    estimated = estimate_jaccard(hasher.signature(text1), hasher.signature(text2))
+    assert abs(estimated - actual) < 0.1
+    assert estimate_jaccard(hasher.signature(text1), hasher.signature(text1)) == 1.0
+
+
+def test_lsh_index_skips_empty_signatures():
+    """빈 텍스트는 후보 쌍을 만들지 않는지 테스트"""
+    hasher = MinHasher()
+    index = MinHashLSHIndex(threshold=0.8)
+    index.add('a', hasher.signature(''))
+    index.add('b', hasher.signature(''))
+    index.add('c', hasher.signature(BASE_BODY))
+
+    assert index.candidate_pairs() == set()
+    assert index.query(hasher.signature(BASE_BODY)) == {'c'}
+
+
+def test_minhash_detection_keeps_result_shape():
+    """LSH 후보 쌍 감지 결과가 기존 결과 형식과 같은지 테스트"""
+    articles = [
+        _article('a1', '기준금리 동결', BASE_BODY),
+        _article('a2', '삼성전자 신제품 공개', '삼성전자가 새 스마트폰을 공개했다. ' * 5),
+        _article('a3', '기준금리 동결', BASE_BODY + ' 매일경제'),
+    ]
+    detector = DuplicateDetector(similarity_threshold=0.8)
+    duplicates = detector.detect_duplicates(articles)
+
+    assert set(duplicates) == {
+        'exact_duplicates', 'similar_duplicates', 'title_duplicates', 'content_duplicates'
+    }
+    for key, duplicate_type in (('similar_duplicates', 'similar'), ('content_duplicates', 'content')):
+        assert len(duplicates[key]) == 1
+        pair = duplicates[key][0]
+        assert pair['article1']['id'] == 'a1'
+        assert pair['article2']['id'] == 'a3'
+        assert pair['type'] == duplicate_type
+        assert 0.8 <= pair['similarity'] <= 1.0
+
+
+@pytest.fixture
+def temp_minhash_database(tmp_path, monkeypatch):
+    """MinHash 저장소가 임시 SQLite 데이터베이스를 사용하도록 설정"""
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+    import src.incremental.minhash_lsh as minhash_module
+    from src.database.models import Base
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'minhash.db'}")
+    Base.metadata.create_all(bind=engine)
+    session_factory = sessionmaker(bind=engine, autocommit=False, autoflush=False)
+
+    def get_db():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    monkeypatch.setattr(minhash_module, 'get_db', get_db)
+    yield session_factory
+    engine.dispose()
+
+
+def test_archive_lookup_finds_stored_near_duplicates(temp_minhash_database):
+    """저장된 서명으로 이전 배치의 유사 기사를 찾는지 테스트"""
+    detector = DuplicateDetector(similarity_threshold=0.8)
+    archived = [
+        _article('old-1', '기준금리 동결', BASE_BODY),
+        _article('old-2', '삼성전자 신제품 공개', '삼성전자가 새 스마트폰을 공개했다. ' * 5),
+    ]
+    assert detector.index_articles(archived) == 2
+    # 같은 기사를 다시 저장하면 기존 서명과 버킷을 교체
+    assert detector.index_articles(archived[:1]) == 1
+
+    incoming = [
+        _article('new-1', '기준금리 동결', BASE_BODY + ' 매일경제'),
+        _article('new-2', '반도체 수출 회복', '반도체 수출이 석 달 연속 증가했다. ' * 5),
+        _article('old-1', '기준금리 동결', BASE_BODY),
+    ]
+    matches = detector.find_archive_duplicates(incoming)
+
+    assert [(match['article']['id'], match['archived_article_id']) for match in matches] == [
+        ('new-1', 'old-1')
+    ]
+    assert matches[0]['type'] == 'archive'
+    assert matches[0]['similarity'] >= 0.8
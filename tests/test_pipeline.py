@@ -0,0 +1,71 @@
+"""
+StagedPipeline 단위 테스트
+"""
+import threading
+import time
+
+from src.incremental.pipeline import PipelineStage, StagedPipeline
+
+
+def test_pipeline_runs_stages_in_order_with_batches():
+    """단계 순서, 배치 크기 및 결과 통계 테스트"""
+    collected = []
+    lock = threading.Lock()
+
+    def double(batch):
+        return [item * 2 for item in batch]
+
+    def drop_multiples_of_three(batch):
+        return [item for item in batch if item % 3]
+
+    def collect(batch):
+        assert len(batch) <= 4
+        with lock:
+            collected.extend(batch)
+
+    pipeline = StagedPipeline([
+        PipelineStage('double', double, workers=3, queue_size=5),
+        PipelineStage('filter', drop_multiples_of_three, batch_size=10, queue_size=5),
+        PipelineStage('collect', collect, batch_size=4, queue_size=5),
+    ], batch_timeout=0.05)
+    stats = pipeline.run(iter(range(100)))
+
+    expected = [item * 2 for item in range(100) if (item * 2) % 3]
+    assert sorted(collected) == expected
+    assert stats['stages']['double']['items_in'] == 100
+    assert stats['stages']['filter']['items_out'] == len(expected)
+    assert stats['stages']['collect']['items_in'] == len(expected)
+    assert stats['bottleneck'] in stats['stages']
+
+
+def test_pipeline_backpressure_and_error_isolation():
+    """느린 단계 앞의 큐 크기 제한과 단계 오류 처리 테스트"""
+    consumed = []
+    produced = []
+
+    def source():
+        for item in range(30):
+            produced.append(item)
+            yield item
+
+    def slow_sink(batch):
+        time.sleep(0.005)
+        # 입력은 큐 크기(1 + 3)와 단계별 처리 중인 항목, 실패한 항목 수 이상 앞서 나가지 않아야 함
+        assert len(produced) - len(consumed) <= (1 + 3) + 3 + 1
+        consumed.extend(batch)
+
+    def fail_on_seven(batch):
+        if 7 in batch:
+            raise ValueError("실패")
+        return batch
+
+    pipeline = StagedPipeline([
+        PipelineStage('fail', fail_on_seven, queue_size=1),
+        PipelineStage('sink', slow_sink, queue_size=3),
+    ])
+    stats = pipeline.run(source())
+
+    assert consumed == [item for item in range(30) if item != 7]
+    assert stats['stages']['fail']['errors'] == 1
+    assert stats['stages']['sink']['max_queue_depth'] <= 3
+    assert stats['bottleneck'] == 'sink'
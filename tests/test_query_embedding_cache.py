@@ -0,0 +1,101 @@
+"""
+검색어 임베딩 캐시 단위 테스트
+"""
+import os
+import time
+
+import numpy as np
+
+from src.embedding.query_embedding_cache import QueryEmbeddingCache
+
+
+def test_lru_and_ttl():
+    """최근 사용하지 않은 벡터와 만료된 벡터가 제외되는지 테스트"""
+    cache = QueryEmbeddingCache(max_entries=2, ttl_seconds=60)
+    cache.put_many('multilingual', 'v1', ['삼성전자 실적', '금리 인상'], [[1.0, 0.0], [0.0, 1.0]])
+
+    assert cache.get_many('multilingual', 'v1', ['삼성전자 실적'])[0].dtype == np.float32
+    assert cache.get_many('korean', 'v1', ['삼성전자 실적']) == [None]
+
+    cache.put_many('multilingual', 'v1', ['환율'], [[0.5, 0.5]])
+    hits = cache.get_many('multilingual', 'v1', ['삼성전자 실적', '금리 인상', '환율'])
+    assert [hit is not None for hit in hits] == [True, False, True]
+
+    cache._entries[('multilingual', 'v1', '환율')] = (hits[2], time.time() - 120)
+    assert cache.get_many('multilingual', 'v1', ['환율']) == [None]
+
+    stats = cache.get_stats()
+    assert stats['hits'] == 3
+    assert stats['misses'] == 3
+
+
+def test_disk_tier_survives_restart(tmp_path):
+    """디스크 캐시가 새 인스턴스에서 읽히고 만료 파일은 정리되는지 테스트"""
+    QueryEmbeddingCache(cache_dir=str(tmp_path)).put_many('multilingual', 'v1', ['금리 인상'], [[0.1, 0.2, 0.3]])
+
+    cache = QueryEmbeddingCache(cache_dir=str(tmp_path))
+    vector = cache.get_many('multilingual', 'v1', ['금리 인상'])[0]
+    np.testing.assert_allclose(vector, [0.1, 0.2, 0.3], rtol=1e-6)
+    assert cache.get_stats()['disk_hits'] == 1
+
+    for name in os.listdir(tmp_path):
+        os.utime(tmp_path / name, (time.time() - 7200, time.time() - 7200))
+    QueryEmbeddingCache(ttl_seconds=3600, cache_dir=str(tmp_path))
+    assert os.listdir(tmp_path) == []
+
+
+def test_model_version_change_misses_both_tiers(tmp_path):
+    """모델 버전이 바뀌면 메모리와 디스크에 남은 이전 모델의 벡터를 사용하지 않는지 테스트"""
+    cache = QueryEmbeddingCache(cache_dir=str(tmp_path))
+    cache.put_many('multilingual', 'model-a', ['금리 인상'], [[0.1, 0.2]])
+
+    assert cache.get_many('multilingual', 'model-b', ['금리 인상']) == [None]
+    assert QueryEmbeddingCache(cache_dir=str(tmp_path)).get_many('multilingual', 'model-b', ['금리 인상']) == [None]
+    assert cache.get_many('multilingual', 'model-a', ['금리 인상'])[0] is not None
+
+
+def test_disk_io_runs_outside_lock(tmp_path, monkeypatch):
+    """디스크 읽기와 쓰기 중에는 잠금을 잡지 않아 다른 조회가 기다리지 않는지 테스트"""
+    cache = QueryEmbeddingCache(cache_dir=str(tmp_path))
+    locked_during_io = []
+    read_disk, write_disk = cache._read_disk, cache._write_disk
+
+    def checking_read(*args):
+        locked_during_io.append(cache._lock.locked())
+        return read_disk(*args)
+
+    def checking_write(*args):
+        locked_during_io.append(cache._lock.locked())
+        return write_disk(*args)
+
+    monkeypatch.setattr(cache, '_read_disk', checking_read)
+    monkeypatch.setattr(cache, '_write_disk', checking_write)
+    cache.put_many('multilingual', 'v1', ['금리 인상'], [[0.1, 0.2]])
+    cache.clear()
+    assert cache.get_many('multilingual', 'v1', ['금리 인상', '환율'])[1] is None
+
+    assert locked_during_io == [False, False, False]
+    assert cache.get_stats()['disk_hits'] == 1
+
+
+def test_generate_embeddings_uses_cache(monkeypatch):
+    """같은 검색어(공백만 다른 경우 포함)는 한 번만 인코딩되는지 테스트"""
+    from src.embedding.embedding_service import EmbeddingService
+
+    service = EmbeddingService()
+    encoded = []
+    original = service._generate_embeddings_by_type
+
+    def counting(texts, model_type):
+        encoded.extend(texts)
+        return original(texts, model_type)
+
+    monkeypatch.setattr(service, '_generate_embeddings_by_type', counting)
+
+    first = service.generate_embeddings(['삼성전자  실적', '금리 인상'], use_cache=True)
+    second = service.generate_embeddings([' 삼성전자 실적', '삼성전자 실적'], use_cache=True)
+
+    assert encoded == ['삼성전자 실적', '금리 인상']
+    np.testing.assert_allclose(second[0], first[0], rtol=1e-6)
+    np.testing.assert_allclose(second[1], first[0], rtol=1e-6)
+    assert service.query_cache.get_stats()['hits'] == 2
@@ -0,0 +1,179 @@
+"""
+SimHash 지문 및 유사 중복 게이트 단위 테스트
+"""
+import random
+
+import pytest
+
+from src.incremental.content_hasher import ContentHasher
+from src.simhash import (
+    SimHashIndex, compute_simhash, hamming_distance, simhash_columns, to_unsigned64
+)
+
+BASE_BODY = (
+    "한국은행 금융통화위원회는 기준금리를 연 3.50%로 동결했다고 밝혔다. "
+    "물가 상승률이 둔화되고 있지만 가계부채 증가세와 환율 변동성을 고려해 "
+    "당분간 긴축 기조를 유지하겠다는 입장이다. 시장에서는 하반기 인하 가능성을 점치고 있다. "
+    "이창용 총재는 기자간담회에서 물가 목표 수렴을 확신하기 이르다고 말했다."
+)
+OTHER_BODY = (
+    "삼성전자가 차세대 반도체 공정을 적용한 스마트폰용 프로세서를 공개했다. "
+    "전력 효율을 크게 높였으며 내년 상반기부터 양산에 들어갈 계획이다."
+)
+
+
+def test_simhash_distance_reflects_similarity():
+    """유사한 텍스트는 해밍 거리가 작고 다른 텍스트는 큰지 테스트"""
+    base = compute_simhash(BASE_BODY)
+    near = compute_simhash(BASE_BODY + ' 매일경제')
+    other = compute_simhash(OTHER_BODY)
+
+    assert 0 <= base < 2 ** 64
+    assert compute_simhash('') == 0
+    assert hamming_distance(base, near) <= 3
+    assert hamming_distance(base, other) > 10
+    assert to_unsigned64(simhash_columns(base)['simhash']) == base
+
+
+def test_simhash_index_finds_all_within_distance():
+    """블록 테이블 조회가 거리 3 이내 지문을 빠짐없이 찾는지 테스트"""
+    rng = random.Random(7)
+    index = SimHashIndex(max_distance=3)
+    target = rng.getrandbits(64)
+    expected = set()
+
+    for key in range(200):
+        flipped = rng.sample(range(64), rng.randint(0, 6))
+        fingerprint = target
+        for bit in flipped:
+            fingerprint ^= 1 << bit
+        index.add(key, fingerprint)
+        if len(flipped) <= 3:
+            expected.add(key)
+
+    matches = index.query(target)
+    assert {key for key, _ in matches} == expected
+    assert [distance for _, distance in matches] == sorted(distance for _, distance in matches)
+
+
+def test_find_similar_hashes_uses_hamming_similarity():
+    """SimHash 지문으로 유사한 해시를 찾는지 테스트"""
+    hasher = ContentHasher()
+    base = hasher.calculate_simhash(BASE_BODY)
+    near = hasher.calculate_simhash(BASE_BODY + ' 매일경제')
+    other = hasher.calculate_simhash(OTHER_BODY)
+
+    similar = hasher.find_similar_hashes(base, [other, near], threshold=0.9)
+    assert [value for value, _ in similar] == [near]
+    assert hasher._calculate_hash_similarity('ff', '7f') == 1.0 - 1 / 8
+
+
+@pytest.fixture
+def simhash_processor(tmp_path, monkeypatch):
+    """임시 SQLite 데이터베이스를 사용하는 유사 중복 게이트 XMLProcessor"""
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+    import src.xml_processor as xml_processor_module
+    from src.database.models import Base
+    from src.xml_processor import XMLProcessor
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'simhash.db'}")
+    Base.metadata.create_all(bind=engine)
+    session_factory = sessionmaker(bind=engine, autocommit=False, autoflush=False)
+
+    def get_db():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    monkeypatch.setattr(xml_processor_module, 'get_db', get_db)
+    yield XMLProcessor(near_duplicate_distance=3)
+    engine.dispose()
+
+
+def _record(art_id, body):
+    """저장용 파싱 결과"""
+    article_data = {
+        'art_id': art_id, 'art_year': 2024, 'art_no': art_id, 'title': '기준금리 동결',
+        'sub_title': None, 'writers': None, 'service_daytime': None, 'reg_dt': None,
+        'mod_dt': None, 'article_url': None, 'media_code': None, 'gubun': None,
+        'free_type': None, 'pub_div': None, 'art_org_class': None, 'body': body,
+        'summary': None
+    }
+    return {
+        'article_data': article_data,
+        'metadata': {'extracted_entities': {}},
+        'content_hash': f'hash-{art_id}',
+        'simhash': compute_simhash(f"기준금리 동결 {body}")
+    }
+
+
+def test_save_gate_rejects_near_duplicates(simhash_processor):
+    """저장된 기사 및 같은 배치 기사와 유사한 기사를 중복으로 처리하는지 테스트"""
+    processor = simhash_processor
+    assert processor._save_to_database(_record('1', BASE_BODY))['status'] == 'success'
+    assert processor._save_to_database(_record('2', BASE_BODY + ' 매일경제'))['status'] == 'duplicate'
+
+    results = processor._save_batch_to_database([
+        _record('3', BASE_BODY + ' 연합뉴스'),
+        _record('4', OTHER_BODY),
+        _record('5', OTHER_BODY + ' 매일경제'),
+    ])
+    assert [result['status'] for result in results] == ['duplicate', 'success', 'duplicate']
+
+
+def test_create_tables_adds_missing_columns(tmp_path, monkeypatch, caplog):
+    """기존 articles 테이블에 SimHash 컬럼과 인덱스를 추가하는지 테스트"""
+    from sqlalchemy import create_engine, inspect, text
+    from src.database.connection import DatabaseManager
+
+    db_path = tmp_path / 'legacy.db'
+    engine = create_engine(f"sqlite:///{db_path}")
+    with engine.begin() as connection:
+        connection.execute(text(
+            "CREATE TABLE articles (id VARCHAR PRIMARY KEY, art_id VARCHAR NOT NULL, "
+            "art_year INTEGER NOT NULL, title TEXT NOT NULL)"
+        ))
+    engine.dispose()
+
+    monkeypatch.setenv('DATABASE_URL', f"sqlite:///{db_path}")
+    manager = DatabaseManager()
+    with caplog.at_level('INFO', logger='src.database.connection'):
+        manager.create_tables()
+
+    inspector = inspect(manager.engine)
+    columns = {column['name'] for column in inspector.get_columns('articles')}
+    indexes = {index['name'] for index in inspector.get_indexes('articles')}
+    assert {'simhash', 'simhash_block0', 'simhash_block3', 'content_hash'} <= columns
+    assert 'ix_articles_simhash_block0' in indexes
+    assert '컬럼 추가: articles.simhash BIGINT' in caplog.text
+
+    # 이미 컬럼이 있으면 다시 추가하지 않음
+    caplog.clear()
+    with caplog.at_level('INFO', logger='src.database.connection'):
+        manager.create_tables()
+    assert '테이블이 성공적으로 생성' in caplog.text
+    assert '컬럼 추가' not in caplog.text
+    manager.close()
+
+
+def test_backfill_leaves_empty_articles_null(simhash_processor):
+    """빈 기사는 파싱 시와 같이 NULL로 남기고 나머지 기사만 지문을 채우는지 테스트"""
+    import src.xml_processor as xml_processor_module
+    from src.database.models import Article
+
+    db = next(xml_processor_module.get_db())
+    db.add_all([
+        Article(id='a', art_id='a', art_year=2024, title='', body=''),
+        Article(id='b', art_id='b', art_year=2024, title='기준금리 동결', body=BASE_BODY),
+        Article(id='c', art_id='c', art_year=2024, title=' ', body=None),
+    ])
+    db.commit()
+
+    assert simhash_processor.backfill_simhashes(batch_size=1) == 1
+    simhashes = dict(db.query(Article.id, Article.simhash).all())
+    assert simhashes['a'] is None and simhashes['c'] is None
+    assert to_unsigned64(simhashes['b']) == compute_simhash(f"기준금리 동결 {BASE_BODY}")
+    db.close()
@@ -0,0 +1,70 @@
+"""
+공통 텍스트 정규화 단위 테스트
+"""
+import glob
+import os
+import re
+
+import pytest
+from src.incremental.content_hasher import ContentHasher
+from src.text_normalizer import (
+    clean_text, normalize_batch, normalize_for_comparison, normalize_for_hash
+)
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SAMPLE_FILES = sorted(glob.glob(os.path.join(ROOT_DIR, 'saltlux_T_*.xml')))[:100]
+
+TEXTS = [
+    '',
+    '   ',
+    '<p>삼성전자(주)</p>가 <b>3.5%</b> 상승… "AI 반도체" - 매일경제',
+    ' - 앞뒤 특수문자와\t\n공백 - ',
+    'a -\n- b   C_D  ',
+    'İSTANBUL Ω ΟΔΟΣ ＡＢＣ ①②   non breaking',
+    '<unclosed tag 와 >닫힘< 괄호',
+]
+
+
+def _comparison_reference(text):
+    """DuplicateDetector._normalize_text 기존 구현"""
+    text = re.sub(r'<[^>]+>', '', text)
+    text = re.sub(r'[^\w\s가-힣]', ' ', text)
+    text = re.sub(r'\s+', ' ', text)
+    return text.lower().strip()
+
+
+def _clean_reference(text):
+    """EmbeddingService/KoreanEmbeddingModel 기존 구현"""
+    text = re.sub(r'<[^>]+>', '', text)
+    text = re.sub(r'[^\w\s가-힣]', ' ', text)
+    return ' '.join(text.split())
+
+
+def _sample_texts():
+    from src.xml_parser import XMLParser
+    parser = XMLParser()
+    texts = list(TEXTS)
+    for xml_file in SAMPLE_FILES:
+        article_data = parser.parse_xml_file(xml_file)['article_data']
+        texts.extend([article_data['title'], article_data['body'] or ''])
+    return texts
+
+
+@pytest.mark.parametrize('text', TEXTS)
+def test_normalizers_match_previous_implementations(text):
+    """공통 정규화 결과가 기존 호출 위치의 결과와 같은지 테스트"""
+    hasher = ContentHasher()
+    assert normalize_for_hash(text) == hasher._normalize_content_with_rules(text)
+    assert normalize_for_comparison(text) == _comparison_reference(text)
+    assert clean_text(text) == _clean_reference(text)
+    assert clean_text(text, max_length=5) == _clean_reference(text)[:5]
+
+
+def test_normalize_batch_on_samples():
+    """샘플 기사 일괄 정규화 결과 테스트"""
+    texts = _sample_texts()
+    hasher = ContentHasher()
+
+    assert normalize_batch(texts, 'hash') == [hasher._normalize_content_with_rules(t) for t in texts]
+    assert normalize_batch(texts, 'comparison') == [_comparison_reference(t) for t in texts]
+    assert normalize_batch(texts, 'clean') == [_clean_reference(t) for t in texts]
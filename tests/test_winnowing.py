@@ -0,0 +1,59 @@
+"""
+Winnowing 포함도 단위 테스트
+"""
+from src.incremental.duplicate_detector import DuplicateDetector
+from src.incremental.winnowing import mutual_containment, winnow_fingerprints
+
+SENTENCES = [
+    "한국은행 금융통화위원회는 기준금리를 연 3.50%로 동결했다",
+    "물가 상승률이 둔화되고 있지만 가계부채 증가세와 환율 변동성을 고려했다",
+    "당분간 긴축 기조를 유지하겠다는 입장이다",
+    "시장에서는 하반기 인하 가능성을 점치고 있다",
+    "이창용 총재는 물가 목표 수렴을 확신하기 이르다고 말했다",
+] * 8
+BODY = '. '.join(SENTENCES)
+OTHER_BODY = "삼성전자가 차세대 반도체 공정을 적용한 스마트폰용 프로세서를 공개했다. " * 20
+
+
+def test_containment_scores():
+    """전재 기사는 포함도가 1에 가깝고 다른 기사는 낮은지 테스트"""
+    detector = DuplicateDetector()
+    body = winnow_fingerprints(detector._normalize_text(BODY))
+    wire_copy = winnow_fingerprints(detector._normalize_text(
+        "[서울=연합뉴스] 통신사 제공 원문입니다. " + BODY + " 무단 전재 금지."
+    ))
+    other = winnow_fingerprints(detector._normalize_text(OTHER_BODY))
+
+    assert mutual_containment(body, body) == 1.0
+    assert mutual_containment(body, wire_copy) >= 0.85
+    assert mutual_containment(body, other) < 0.2
+    assert mutual_containment(body, winnow_fingerprints('')) == 0.0
+
+
+def test_chunk_similarity_modes():
+    """긴 본문 비교가 선택한 방식으로 계산되는지 테스트"""
+    edited = '. '.join(sentence for i, sentence in enumerate(SENTENCES) if i % 5 != 2)
+    winnowing = DuplicateDetector(method='pairwise')
+    sequence_matcher = DuplicateDetector(method='pairwise', chunk_similarity='sequence_matcher')
+
+    assert len(winnowing._normalize_text(BODY)) > 1000
+    assert winnowing._calculate_content_similarity(BODY, edited) >= 0.8
+    assert sequence_matcher._calculate_content_similarity(BODY, edited) == \
+        sequence_matcher._calculate_chunk_similarity_with_sequence_matcher(
+            sequence_matcher._normalize_text(BODY), sequence_matcher._normalize_text(edited)
+        )
+    assert winnowing._calculate_content_similarity(BODY, OTHER_BODY) < 0.2
+
+
+def test_short_excerpt_of_long_body_is_not_duplicate():
+    """긴 기사에 들어 있는 짧은 발췌문은 포함되어 있어도 길이 비율만큼만 유사한지 테스트"""
+    detector = DuplicateDetector(method='pairwise')
+    long_body = ' '.join(
+        f"{i}번째 거래일 코스피는 {i * 7 % 13}포인트 움직였고 외국인은 {i * 31 % 97}억원을 순매수했다."
+        for i in range(40)
+    )
+    excerpt = long_body[:60]
+
+    assert len(detector._normalize_text(long_body)) > 1000
+    assert detector._calculate_content_similarity(excerpt, long_body) < 0.1
+    assert detector._calculate_content_similarity(long_body, excerpt) < 0.1
@@ -0,0 +1,143 @@
+"""
+XMLParser 단위 테스트
+"""
+import glob
+import os
+from datetime import datetime
+
+import pytest
+from src.xml_parser import XMLParser
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SAMPLE_FILES = sorted(glob.glob(os.path.join(ROOT_DIR, 'saltlux_T_*.xml')))[:20]
+
+
+def _read_article_block(xml_file_path):
+    """샘플 파일에서 <article> ... </article> 블록 추출"""
+    with open(xml_file_path, encoding='utf-8') as f:
+        content = f.read()
+    start = content.index('<article>')
+    end = content.rindex('</article>') + len('</article>')
+    return content[start:end]
+
+
+@pytest.mark.skipif(not SAMPLE_FILES, reason="샘플 XML 파일 없음")
+def test_iter_articles_matches_parse_xml_file():
+    """스트리밍 파싱 결과가 기존 파싱 결과와 동일한지 테스트"""
+    parser = XMLParser()
+    for xml_file in SAMPLE_FILES:
+        parsed = parser.parse_xml_file(xml_file)
+        streamed = list(parser.iter_articles(xml_file))
+        
+        assert parsed is not None
+        assert len(streamed) == 1
+        assert streamed[0] == parsed['article_data']
+
+
+@pytest.mark.skipif(not SAMPLE_FILES, reason="샘플 XML 파일 없음")
+def test_iter_articles_multiple_articles(tmp_path):
+    """여러 <article>이 묶인 파일 스트리밍 파싱 테스트"""
+    parser = XMLParser()
+    blocks = [_read_article_block(xml_file) for xml_file in SAMPLE_FILES[:5]]
+    bundle = tmp_path / 'bundle.xml'
+    bundle.write_text(
+        '<?xml version="1.0" encoding="utf-8" ?>\n<saltlux>\n' + '\n'.join(blocks) + '\n</saltlux>',
+        encoding='utf-8'
+    )
+    
+    streamed = list(parser.iter_articles(str(bundle)))
+    expected = [parser.parse_xml_file(xml_file)['article_data'] for xml_file in SAMPLE_FILES[:5]]
+    
+    assert streamed == expected
+    
+    records = list(parser.iterparse_xml_file(str(bundle)))
+    assert [record['article_data']['art_id'] for record in records] == [a['art_id'] for a in expected]
+    assert all(record['content_hash'] for record in records)
+
+
+@pytest.mark.skipif(not SAMPLE_FILES, reason="샘플 XML 파일 없음")
+@pytest.mark.parametrize("wrap", [
+    lambda blocks: '<saltlux>' + blocks + '</saltlux>',
+    lambda blocks: '<saltlux><header>배포</header><items>' + blocks + '</items><items></items></saltlux>',
+])
+def test_iter_articles_keeps_tree_flat(tmp_path, monkeypatch, wrap):
+    """중첩된 묶음 파일에서도 처리한 기사 요소가 트리에 쌓이지 않는지 테스트"""
+    import src.xml_parser as xml_parser_module
+
+    parser = XMLParser()
+    bundle = tmp_path / 'bundle.xml'
+    bundle.write_text(wrap(_read_article_block(SAMPLE_FILES[0]) * 200), encoding='utf-8')
+
+    containers = []
+    iterparse = xml_parser_module.ET.iterparse
+
+    def recording_iterparse(source, events=None):
+        for event, element in iterparse(source, events):
+            if event == 'start' and element.tag in ('saltlux', 'items'):
+                containers.append(element)
+            yield event, element
+
+    monkeypatch.setattr(xml_parser_module.ET, 'iterparse', recording_iterparse)
+    count = 0
+    for article_data in parser.iter_articles(str(bundle)):
+        count += 1
+        # 컨테이너에는 파서가 미리 읽은 몇 개 기사만 남아야 함 (처리한 기사 껍데기가 쌓이지 않음)
+        assert max(len(container) for container in containers) <= 10
+        assert article_data['art_id']
+
+    assert count == 200
+
+
+def test_iter_articles_invalid_file(tmp_path):
+    """잘못된 XML 파일 스트리밍 파싱 테스트"""
+    parser = XMLParser()
+    broken = tmp_path / 'broken.xml'
+    broken.write_text('<saltlux><article><wms_article>', encoding='utf-8')
+    
+    assert list(parser.iter_articles(str(broken))) == []
+
+
+@pytest.mark.skipif(not SAMPLE_FILES, reason="샘플 XML 파일 없음")
+def test_field_spec_extraction_matches_find():
+    """필드 스펙 테이블 추출 결과가 find() 방식과 동일한지 테스트"""
+    import xml.etree.ElementTree as ET
+    
+    parser = XMLParser()
+    for xml_file in SAMPLE_FILES:
+        article = ET.parse(xml_file).getroot().find('article')
+        table_result = parser._extract_article_element(article)
+        
+        assert table_result == parser._extract_article_element_with_find(article)
+        assert list(table_result.keys())[:3] == ['action', 'art_id', 'art_year']
+
+
+@pytest.mark.parametrize("text", [
+    '2025-08-02 09:00:00',
+    '20250802090000',
+    '2025-08-02',
+    '2024-02-29 23:59:59',
+    '2025-02-29',
+    '2025-13-02 00:00:00',
+    '2025-08-02 24:00:00',
+    '2025-08-02T09:00:00',
+    '2025-8-2 9:00:00',
+    '２０２５-08-02',
+    '2025080209000a',
+    '',
+    'invalid'
+])
+def test_fast_datetime_matches_strptime(text):
+    """고정 폭 날짜 디코더 결과가 strptime 방식과 동일한지 테스트"""
+    parser = XMLParser()
+    
+    assert parser._parse_datetime(text) == parser._parse_datetime_with_strptime(text)
+
+
+def test_datetime_with_mixed_lengths():
+    """길이가 다른 날짜 형식이 번갈아 나와도 모두 파싱되는지 테스트"""
+    parser = XMLParser()
+
+    assert parser._parse_datetime('2025-07-29 10:20:30') == datetime(2025, 7, 29, 10, 20, 30)
+    assert parser._parse_datetime('2025-07-29') == datetime(2025, 7, 29)
+    assert parser._parse_datetime('20250729102030') == datetime(2025, 7, 29, 10, 20, 30)
+    assert parser._parse_datetime('2025-07-29 10:20:30') == datetime(2025, 7, 29, 10, 20, 30)
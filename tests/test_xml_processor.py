@@ -0,0 +1,203 @@
+"""
+XMLProcessor 단위 테스트
+"""
+import glob
+import os
+
+import pytest
+from src.xml_parser import XMLParser
+from src.xml_processor import XMLProcessor
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SAMPLE_FILES = sorted(glob.glob(os.path.join(ROOT_DIR, 'saltlux_T_*.xml')))[:12]
+
+
+@pytest.mark.skipif(not SAMPLE_FILES, reason="샘플 XML 파일 없음")
+def test_iter_parsed_batches_matches_sequential_parse(tmp_path):
+    """프로세스 풀 파싱 결과가 순차 파싱 결과와 동일한지 테스트"""
+    broken_file = tmp_path / 'broken.xml'
+    broken_file.write_text('<article><title>', encoding='utf-8')
+    xml_files = SAMPLE_FILES + [str(broken_file)]
+
+    processor = XMLProcessor(parse_workers=2, parse_chunk_size=3)
+    batches = list(processor.iter_parsed_batches(iter(xml_files), batch_size=5))
+
+    assert [len(batch) for batch in batches] == [5, 5, 3]
+    records = dict(record for batch in batches for record in batch)
+    assert set(records) == set(xml_files)
+    assert records[str(broken_file)] is None
+
+    parser = XMLParser()
+    for xml_file in SAMPLE_FILES:
+        expected = parser.parse_xml_file(xml_file)
+        assert records[xml_file]['article_data'] == expected['article_data']
+        assert records[xml_file]['content_hash'] == expected['content_hash']
+        assert records[xml_file]['metadata']['extracted_entities'] == \
+            expected['metadata']['extracted_entities']
+
+
+def _failing_parse_chunk(xml_files):
+    """워커 오류(bad)와 워커 프로세스 비정상 종료(crash)를 흉내 내는 파싱 함수"""
+    if any('crash' in xml_file for xml_file in xml_files):
+        os._exit(1)
+    if any('bad' in xml_file for xml_file in xml_files):
+        raise ValueError('parse failed')
+    return [(xml_file, {'path': xml_file}) for xml_file in xml_files]
+
+
+def test_iter_parsed_batches_reports_failed_chunks(monkeypatch):
+    """실패한 묶음의 파일도 모두 None으로 내보내고 풀이 중단된 뒤에도 남은 파일을 처리하는지 테스트"""
+    import src.xml_processor as xml_processor_module
+    monkeypatch.setattr(xml_processor_module, '_parse_file_chunk', _failing_parse_chunk)
+    xml_files = ['ok0', 'ok1', 'bad0', 'bad1', 'crash0', 'crash1'] + [f"ok{i}" for i in range(2, 12)]
+
+    processor = XMLProcessor(parse_workers=1, parse_chunk_size=2)
+    records = [record for batch in processor.iter_parsed_batches(iter(xml_files), batch_size=4)
+               for record in batch]
+
+    assert sorted(xml_file for xml_file, _ in records) == sorted(xml_files)
+    records = dict(records)
+    assert all(records[xml_file] is None for xml_file in ('bad0', 'bad1', 'crash0', 'crash1'))
+    assert records['ok0'] == {'path': 'ok0'}
+    assert records['ok11'] == {'path': 'ok11'}
+
+
+def _bind_temp_database(db_path, monkeypatch):
+    """XMLProcessor가 db_path의 SQLite 데이터베이스를 사용하도록 설정"""
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+    import src.xml_processor as xml_processor_module
+    from src.database.models import Base
+
+    engine = create_engine(f"sqlite:///{db_path}")
+    Base.metadata.create_all(bind=engine)
+    session_factory = sessionmaker(bind=engine, autocommit=False, autoflush=False)
+
+    def get_db():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    monkeypatch.setattr(xml_processor_module, 'get_db', get_db)
+    return session_factory
+
+
+@pytest.fixture
+def temp_database(tmp_path, monkeypatch):
+    """임시 SQLite 데이터베이스 세션 팩토리"""
+    session_factory = _bind_temp_database(tmp_path / 'test.db', monkeypatch)
+    yield session_factory
+    session_factory.kw['bind'].dispose()
+
+
+def _table_counts(session_factory):
+    """테이블별 행 수"""
+    from src.database.models import (
+        Article, ArticleCategory, ArticleImage, ArticleKeyword, ArticleStockCode, ProcessingLog
+    )
+    db = session_factory()
+    try:
+        return {
+            model.__tablename__: db.query(model).count()
+            for model in (Article, ArticleCategory, ArticleImage, ArticleKeyword,
+                          ArticleStockCode, ProcessingLog)
+        }
+    finally:
+        db.close()
+
+
+@pytest.mark.skipif(len(SAMPLE_FILES) < 4, reason="샘플 XML 파일 없음")
+def test_save_batch_matches_single_saves(tmp_path, monkeypatch):
+    """배치 저장 결과가 기사별 저장 결과와 같은지 테스트"""
+    parser = XMLParser()
+    records = [parser.parse_xml_file(xml_file) for xml_file in SAMPLE_FILES[:4]]
+    processor = XMLProcessor()
+
+    single_db = _bind_temp_database(tmp_path / 'single.db', monkeypatch)
+    for record in records:
+        result = processor._save_to_database(record)
+        processor._log_processing(record['article_data']['art_id'], 'xml_parse',
+                                  result['status'], result['message'], 0.0)
+
+    batch_db = _bind_temp_database(tmp_path / 'batch.db', monkeypatch)
+    results = processor._save_batch_to_database(records)
+
+    assert [result['status'] for result in results] == ['success'] * 4
+    assert _table_counts(batch_db) == _table_counts(single_db)
+
+
+@pytest.mark.skipif(len(SAMPLE_FILES) < 3, reason="샘플 XML 파일 없음")
+def test_save_batch_resolves_duplicates(temp_database):
+    """DB 및 배치 내부 중복, art_id 충돌 처리 테스트"""
+    parser = XMLParser()
+    first, second, third = [parser.parse_xml_file(xml_file) for xml_file in SAMPLE_FILES[:3]]
+    processor = XMLProcessor()
+
+    assert processor._save_batch_to_database([first])[0]['status'] == 'success'
+
+    conflicting = dict(third, content_hash='different-hash')
+    conflicting['article_data'] = dict(third['article_data'], art_id=first['article_data']['art_id'])
+
+    results = processor._save_batch_to_database([first, second, second, conflicting])
+
+    assert [result['status'] for result in results] == ['duplicate', 'success', 'duplicate', 'error']
+    counts = _table_counts(temp_database)
+    assert counts['articles'] == 2
+    assert counts['processing_logs'] == 5
+
+
+def test_iter_xml_files_streams_date_partitions(tmp_path):
+    """날짜별 하위 디렉토리 탐색, 수정 시간 정렬, 발견 파일 수 테스트"""
+    for relative_path, mtime in [
+        ('root_b.xml', 300), ('root_a.xml', 100), ('notes.txt', 100),
+        ('2024/02/01/c.xml', 200), ('2024/01/31/b.xml', 200), ('2024/01/31/a.xml', 100),
+    ]:
+        path = tmp_path / relative_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text('<article/>', encoding='utf-8')
+        os.utime(path, (mtime, mtime))
+
+    processor = XMLProcessor()
+
+    flat = processor._iter_xml_files(str(tmp_path))
+    assert sorted(os.path.basename(path) for path in flat) == ['root_a.xml', 'root_b.xml']
+    assert processor.files_discovered == 2
+
+    ordered = [
+        os.path.relpath(path, tmp_path)
+        for path in processor._iter_xml_files(str(tmp_path), recursive=True, sort_by_mtime=True)
+    ]
+    assert ordered == [
+        'root_a.xml', 'root_b.xml',
+        os.path.join('2024', '01', '31', 'a.xml'), os.path.join('2024', '01', '31', 'b.xml'),
+        os.path.join('2024', '02', '01', 'c.xml'),
+    ]
+    assert processor.files_discovered == 5
+
+    with pytest.raises(FileNotFoundError):
+        processor._iter_xml_files(str(tmp_path / 'missing'))
+
+
+@pytest.mark.skipif(len(SAMPLE_FILES) < 3, reason="샘플 XML 파일 없음")
+def test_save_batch_records_without_art_id(temp_database, monkeypatch):
+    """art_id 없는 기사끼리 art_id 충돌로 처리하지 않고 기사별 저장과 같은 결과를 내는지 테스트"""
+    parser = XMLParser()
+    records = [parser.parse_xml_file(xml_file) for xml_file in SAMPLE_FILES[:3]]
+    for record in records[1:]:
+        record['article_data']['art_id'] = None
+    processor = XMLProcessor()
+    appended = []
+    original = processor._append_article_rows
+
+    def recording(rows, article_id, parsed_data):
+        appended.append(parsed_data['content_hash'])
+        return original(rows, article_id, parsed_data)
+
+    monkeypatch.setattr(processor, '_append_article_rows', recording)
+    results = processor._save_batch_to_database(records)
+
+    assert appended == [record['content_hash'] for record in records]
+    assert [result['status'] for result in results] == ['success', 'error', 'error']
+    assert all('이미 존재하는 art_id' not in result['message'] for result in results)